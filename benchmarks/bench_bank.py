@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+    Custo de :func:`pyboleto.bank.get_class_for_codigo` por chamada.
+
+    ``anterior`` reproduz a implementação que fazia ``split`` e
+    ``__import__`` a cada chamada. A medição usa os códigos de um lote
+    misto, como o :class:`pyboleto.batch.BoletoBatch` ou quem chama a função
+    uma vez por registro.
+
+    Uso::
+
+        $ python benchmarks/bench_bank.py [N]
+
+    Medido com CPython 3.11, N = 100.000, ns por chamada (melhor de 3
+    rodadas):
+
+    ==========  ==========
+    Anterior    Cache
+    ==========  ==========
+    2.350       60
+    ==========  ==========
+
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.bank import (BANCOS_IMPLEMENTADOS, carrega_bancos,  # noqa
+                           get_class_for_codigo)
+
+CODIGOS = ['001', '237', '341', '033', '104', '756', '748', '041']
+
+
+def anterior(banco_codigo):
+    banco = BANCOS_IMPLEMENTADOS[banco_codigo].split('.')
+    mod = __import__('pyboleto.bank.' + banco[0],
+                     globals(), locals(), [banco[1]])
+    return getattr(mod, banco[1])
+
+
+def mede(func, n):
+    codigos = (CODIGOS * (n // len(CODIGOS) + 1))[:n]
+
+    def roda():
+        for codigo in codigos:
+            func(codigo)
+    return min(timeit.repeat(roda, number=1, repeat=3)) / n * 1e9
+
+
+def main(n):
+    carrega_bancos()
+    print('%-10s %10s' % ('Anterior', 'Cache'))
+    print('%-10.0f %10.0f' % (mede(anterior, n),
+                              mede(get_class_for_codigo, n)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
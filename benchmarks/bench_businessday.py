@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+    Próximo dia útil e contagem de dias úteis de muitas datas.
+
+    ``Laço`` é o jeito direto: feriados do ano num ``set`` (calculados uma
+    vez por ano) e avançar um dia de cada vez até achar um dia útil; para
+    contar, percorrer os dias entre as datas. ``Tabela`` usa
+    :class:`pyboleto.businessday.Calendario`, com listas e ``datetime.date``,
+    e ``NumPy`` o mesmo calendário com arrays ``datetime64``. As tabelas já
+    estão montadas (cerca de 10 ms, uma vez por calendário).
+
+    Uso::
+
+        $ python benchmarks/bench_businessday.py [N]
+
+    Medido com CPython 3.11, NumPy 2, N = 100.000 datas entre 1997 e 2097,
+    contagens até uma data a 60 dias da data inicial, µs por data (menor
+    valor de três execuções):
+
+    ====================  ==========  ==========  ==========
+    Operação              Laço        Tabela      NumPy
+    ====================  ==========  ==========  ==========
+    Próximo dia útil      0,39        0,40        0,02
+    Dias úteis            10          0,15        0,01
+    ====================  ==========  ==========  ==========
+
+    Para o próximo dia útil o laço já é rápido: cerca de 70% das datas são
+    dias úteis e os feriados ficam num ``set``. O ganho está na contagem,
+    que no laço cresce com o prazo, e na versão vetorizada.
+
+"""
+import datetime
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.businessday import NACIONAL, feriados_nacionais  # noqa
+
+UM_DIA = datetime.timedelta(days=1)
+PRAZO = 60
+
+_FERIADOS = {}
+
+
+def util(data):
+    try:
+        feriados = _FERIADOS[data.year]
+    except KeyError:
+        feriados = _FERIADOS[data.year] = set(feriados_nacionais(data.year))
+    return data.weekday() < 5 and data not in feriados
+
+
+def laco_proximo(datas):
+    resultado = []
+    for data in datas:
+        while not util(data):
+            data += UM_DIA
+        resultado.append(data)
+    return resultado
+
+
+def laco_contagem(datas, fim):
+    resultado = []
+    for data in datas:
+        contagem = 0
+        while data < fim:
+            data += UM_DIA
+            contagem += util(data)
+        resultado.append(contagem)
+    return resultado
+
+
+def mede(func):
+    return min(timeit.repeat(func, number=1, repeat=3))
+
+
+def main(n):
+    rnd = random.Random(1)
+    datas = [datetime.date(1997, 2, 1) +
+             datetime.timedelta(days=rnd.randrange(36500))
+             for _ in range(n)]
+    NACIONAL.tabelas()
+    # Contagem com o mesmo prazo para todas as datas, a partir de um
+    # ponto comum: todas até a data mais distante menos o prazo
+    inicio = max(datas) - datetime.timedelta(days=PRAZO)
+    inicios = [inicio + datetime.timedelta(days=rnd.randrange(PRAZO))
+               for _ in range(n)]
+    fim = max(datas)
+    assert laco_proximo(datas) == NACIONAL.proximos_dias_uteis(datas)
+    assert laco_contagem(inicios, fim) == \
+        NACIONAL.contagens_dias_uteis(inicios, fim)
+
+    linhas = [
+        ('Próximo dia útil',
+         lambda: laco_proximo(datas),
+         lambda: NACIONAL.proximos_dias_uteis(datas)),
+        ('Dias úteis',
+         lambda: laco_contagem(inicios, fim),
+         lambda: NACIONAL.contagens_dias_uteis(inicios, fim)),
+    ]
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    else:
+        array_datas = numpy.array(datas, dtype='datetime64[D]')
+        array_inicios = numpy.array(inicios, dtype='datetime64[D]')
+        vetoriais = [lambda: NACIONAL.proximos_dias_uteis(array_datas),
+                     lambda: NACIONAL.contagens_dias_uteis(array_inicios,
+                                                           fim)]
+
+    print('%-20s %10s %10s %10s' % ('Operação', 'Laço', 'Tabela', 'NumPy'))
+    for i, (nome, laco, tabela) in enumerate(linhas):
+        tempos = [mede(laco), mede(tabela)]
+        if numpy is not None:
+            tempos.append(mede(vetoriais[i]))
+        print('%-20s %s' % (nome, ' '.join(
+            '%10.2f' % (t / n * 1e6) for t in tempos)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+    Custo por DV, antes e depois de :mod:`pyboleto.checksum`.
+
+    As funções ``*_anterior`` reproduzem as implementações que existiam em
+    :mod:`pyboleto.data` e nos módulos dos bancos antes das tabelas
+    pré-calculadas.
+
+    Uso::
+
+        $ python benchmarks/bench_checksum.py
+
+    Medido com CPython 3.11 (ns por DV, melhor de 3 rodadas):
+
+    ==========================  ========  ========
+    DV                          Anterior  Tabela
+    ==========================  ========  ========
+    Barcode (43 dígitos)        12.800    3.300
+    Linha digitável (mod 10)    4.850     2.000
+    Itaú nosso número           6.750     1.750
+    Santander nosso número      2.850     1.400
+    Banco do Brasil             4.050     1.850
+    Bradesco                    4.350     1.500
+    Caixa                       2.750     1.500
+    HSBC com registro           3.300     1.550
+    Sicoob                      11.900    2.400
+    ==========================  ========  ========
+
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.bank.bancodobrasil import DV_NOSSO_NUMERO as DV_BB  # noqa
+from pyboleto.bank.bradesco import DV_NOSSO_NUMERO as DV_BRADESCO  # noqa
+from pyboleto.bank.caixa import DV_NOSSO_NUMERO as DV_CAIXA  # noqa
+from pyboleto.bank.hsbc import DV_NOSSO_NUMERO_REGISTRO as DV_HSBC  # noqa
+from pyboleto.bank.sicoob import DV_NOSSO_NUMERO as DV_SICOOB  # noqa
+from pyboleto.checksum import DV_BARCODE, MODULO10, modulo11  # noqa
+
+
+def modulo10_anterior(num):
+    soma = 0
+    peso = 2
+    for c in reversed(num):
+        parcial = int(c) * peso
+        if parcial > 9:
+            s = str(parcial)
+            parcial = int(s[0]) + int(s[1])
+        soma += parcial
+        if peso == 2:
+            peso = 1
+        else:
+            peso = 2
+    resto10 = soma % 10
+    if resto10 == 0:
+        return 0
+    return 10 - resto10
+
+
+def modulo11_anterior(num, base=9, r=0):
+    soma = 0
+    fator = 2
+    for c in reversed(num):
+        soma += int(c) * fator
+        if fator == base:
+            fator = 1
+        fator += 1
+    if r == 0:
+        soma = soma * 10
+        digito = soma % 11
+        if digito == 10:
+            digito = 0
+        return digito
+    if r == 1:
+        return soma % 11
+
+
+def barcode_anterior(line):
+    resto2 = modulo11_anterior(line, 9, 1)
+    if resto2 in [0, 1, 10]:
+        return 1
+    return 11 - resto2
+
+
+def bb_anterior(num):
+    base = 2
+    fator = 9
+    soma = 0
+    for c in reversed(num):
+        soma += int(c) * fator
+        if fator == base:
+            fator = 10
+        fator -= 1
+    r = soma % 11
+    if r == 10:
+        return 'X'
+    return r
+
+
+def bradesco_anterior(num):
+    digito = 11 - modulo11_anterior(num, 7, 1)
+    if digito == 10:
+        return 'P'
+    elif digito == 11:
+        return 0
+    return digito
+
+
+def caixa_anterior(num):
+    digito = 11 - modulo11_anterior(num, 9, 1)
+    if digito == 10 or digito == 11:
+        return 0
+    return digito
+
+
+def hsbc_anterior(num):
+    resto = modulo11_anterior(num, 7, 1)
+    if resto == 0 or resto == 1:
+        return 0
+    return 11 - resto
+
+
+def sicoob_anterior(composto):
+    constante = '319731973197319731973'
+    soma = 0
+    for i in range(21):
+        soma += int(composto[i]) * int(constante[i])
+    resto = soma % 11
+    return '0' if (resto == 1 or resto == 0) else 11 - resto
+
+
+CASOS = [
+    ('Barcode (43 dígitos)', barcode_anterior, DV_BARCODE,
+     '0019373700000001000500940144816060680935031'),
+    ('Linha digitável (mod 10)', modulo10_anterior, MODULO10, '0019050095'),
+    ('Itaú nosso número', modulo10_anterior, MODULO10,
+     '02930132810900000157'),
+    ('Santander nosso número', modulo11_anterior, modulo11(9, 0),
+     '000001234567'),
+    ('Banco do Brasil', bb_anterior, DV_BB, '77777770000087654'),
+    ('Bradesco', bradesco_anterior, DV_BRADESCO, '0600000004321'),
+    ('Caixa', caixa_anterior, DV_CAIXA, '8019525086'),
+    ('HSBC com registro', hsbc_anterior, DV_HSBC, '0100010203'),
+    ('Sicoob', sicoob_anterior, DV_SICOOB, '306900000002250000003'),
+]
+
+
+def ns_por_chamada(func, arg, number=100000):
+    tempo = min(timeit.repeat(lambda: func(arg), number=number, repeat=3))
+    return tempo / number * 1e9
+
+
+def main():
+    print('%-26s  %8s  %8s' % ('DV', 'Anterior', 'Tabela'))
+    for nome, anterior, tabela, num in CASOS:
+        assert anterior(num) == tabela(num), nome
+        print('%-26s  %8.0f  %8.0f' % (nome, ns_por_chamada(anterior, num),
+                                       ns_por_chamada(tabela, num)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+    Custo de desenhar o código de barras de um boleto.
+
+    Compara, por código de barras, o ``I2of5`` do ReportLab como o
+    :class:`pyboleto.pdf.BoletoPDF` usava antes (um widget para medir a
+    largura, um segundo ``__init__`` com a barra estreita ajustada e um
+    ``rect`` por barra) com :mod:`pyboleto.codigobarras` (larguras
+    calculadas dos dígitos e um único caminho), nos dois canvas, e a
+    geração do HTML.
+
+    Uso::
+
+        $ python benchmarks/bench_codigobarras.py [N]
+
+    Medido com CPython 3.11 e ReportLab 5.0, N = 20.000 (2.000 para o
+    ``I2of5``), menor tempo de três execuções, microssegundos por código de
+    barras:
+
+    ===================================  ===========
+    Desenho                              µs/código
+    ===================================  ===========
+    ReportLab, ``I2of5`` (antes)         810
+    ReportLab, caminho único             24
+    :class:`CanvasPDF`, caminho único    16
+    HTML                                 8,5
+    ===================================  ===========
+
+    No ``BoletoPDF`` isso é cerca de 0,8 ms a menos por boleto, quase
+    metade do tempo de desenhar uma página.
+
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.codigobarras import (ALTURA, largura_estreita,  # noqa
+                                   operadores_pdf)
+from pyboleto.html import BoletoHTML  # noqa
+from pyboleto.pdf import mm  # noqa
+from pyboleto.pdfdireto import CanvasPDF  # noqa
+
+
+def codigos(quantidade):
+    return ['2379%040d' % (i * 7919) for i in range(quantidade)]
+
+
+def i2of5(canvas, num):
+    """O ``_codigoBarraI25`` anterior do BoletoPDF"""
+    from reportlab.graphics.barcode.common import I2of5
+
+    thin_bar = 0.254320987654 * mm
+    bc = I2of5(num, barWidth=thin_bar, ratio=3, barHeight=13 * mm,
+               bearers=0, quiet=0, checksum=0)
+    thin_bar = (thin_bar * 103 * mm) / bc.width
+    bc.__init__(num, barWidth=thin_bar)
+    bc.drawOn(canvas, 0, 0)
+
+
+def caminho(canvas, num):
+    canvas.saveState()
+    canvas.transform(largura_estreita(num) * mm, 0, 0, ALTURA * mm, 0, 0)
+    canvas.addLiteral(operadores_pdf(num))
+    canvas.restoreState()
+
+
+def mede(funcao, canvas, lista, repeticoes=3):
+    """Menor tempo por código, em microssegundos"""
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for num in lista:
+            funcao(canvas, num)
+        tempo = time.perf_counter() - inicio
+        melhor = tempo if melhor is None else min(melhor, tempo)
+    return melhor / len(lista) * 1e6
+
+
+def main(quantidade):
+    from reportlab.pdfgen.canvas import Canvas
+
+    lista = codigos(quantidade)
+    html = BoletoHTML(io.StringIO())
+    medidas = [
+        ('ReportLab, I2of5 (antes)',
+         mede(i2of5, Canvas(io.BytesIO()), lista[:quantidade // 10])),
+        ('ReportLab, caminho único',
+         mede(caminho, Canvas(io.BytesIO()), lista)),
+        ('CanvasPDF, caminho único',
+         mede(caminho, CanvasPDF(io.BytesIO(), (595, 842)), lista)),
+        ('HTML', mede(lambda _, num: html._codigoBarraI25(num), None,
+                      lista)),
+    ]
+    for nome, tempo in medidas:
+        print('%-26s %8.1f µs/código' % (nome, tempo))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if sys.argv[1:] else 20000)
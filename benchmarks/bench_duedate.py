@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+    Conversão entre datas e fatores de vencimento.
+
+    Compara o cálculo que ficava dentro de ``BoletoData.barcode`` com a
+    tabela de :mod:`pyboleto.duedate` e com a versão NumPy, para ``N`` datas
+    e de volta.
+
+    Uso::
+
+        $ python benchmarks/bench_duedate.py [N]
+
+    Medido com CPython 3.11 e NumPy 2.4, N = 1.000.000:
+
+    ==========================  ================
+    Conversão                   ns por item
+    ==========================  ================
+    data -> fator (antigo)      460 - 485
+    data -> fator (tabela)      263 - 295
+    fator -> data               506
+    data -> fator (NumPy)       20 - 24
+    fator -> data (NumPy)       17 - 18
+    ==========================  ================
+
+"""
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto import duedate  # noqa
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_EPOCH = datetime.date(1997, 10, 7)
+
+
+def fator_antigo(data_vencimento):
+    # Cálculo feito por BoletoData.barcode antes do pyboleto.duedate
+    due_date_days = (data_vencimento - _EPOCH).days
+    if due_date_days < 0:
+        raise TypeError("Invalid date")
+    if due_date_days > 9999:
+        minimal_limit = 999
+        due_date_days = int(minimal_limit + (due_date_days - minimal_limit) %
+                            (9999 - minimal_limit))
+    return due_date_days
+
+
+def cronometra(nome, n, func, *args):
+    inicio = time.perf_counter()
+    resultado = func(*args)
+    tempo = time.perf_counter() - inicio
+    print('%-32s %8.1f ns por item' % (nome, tempo * 1e9 / n))
+    return resultado
+
+
+def main(n):
+    rnd = random.Random(1)
+    datas = [_EPOCH + datetime.timedelta(rnd.randrange(1, 18000))
+             for _ in range(n)]
+    referencia = datetime.date(2025, 3, 1)
+
+    antigo = cronometra('data -> fator (antigo)', n,
+                        lambda: [fator_antigo(d) for d in datas])
+    fatores = cronometra('data -> fator (tabela)', n,
+                         duedate.fatores_vencimento, datas)
+    assert antigo == fatores
+    cronometra('fator -> data', n, duedate.datas_vencimento, fatores,
+               referencia)
+
+    if numpy is not None:
+        array = numpy.array(datas, dtype='datetime64[D]')
+        vetorial = cronometra('data -> fator (numpy)', n,
+                              duedate.fatores_vencimento, array)
+        assert vetorial.tolist() == fatores
+        cronometra('fator -> data (numpy)', n, duedate.datas_vencimento,
+                   vetorial, referencia)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+    Tempo de importação (cold start) dos módulos do pyboleto.
+
+    Cada módulo é importado em um processo novo do Python e o tempo do
+    ``import`` é medido dentro do processo, sem contar a inicialização do
+    interpretador. Os ``.pyc`` são gerados antes da medição. A última coluna
+    indica quais dependências pesadas foram importadas junto.
+
+    Uso::
+
+        $ python benchmarks/bench_import.py [N]
+
+    Medido com CPython 3.11, N = 10, ms (menor valor; ReportLab, Pillow e
+    NumPy instalados). Nenhum módulo importa dependências pesadas agora; a
+    coluna "Importava" mostra as que eram importadas antes:
+
+    =================  ==========  ==========  ==========================
+    Módulo             Anterior    Atual       Importava
+    =================  ==========  ==========  ==========================
+    ``pyboleto``       0,2         0,2         nenhuma
+    ``pyboleto.data``  138         12          NumPy
+    ``pyboleto.html``  126         18          NumPy
+    ``pyboleto.pdf``   278         20          ReportLab, Pillow, NumPy
+    =================  ==========  ==========  ==========================
+
+    Antes o :mod:`pyboleto.pdf` importava ReportLab e Pillow, e todos os
+    módulos que usam :mod:`pyboleto.data` importavam o NumPy. Agora o
+    ReportLab e o Pillow só são importados ao gerar um PDF e o NumPy só
+    quando é usado (:mod:`pyboleto.batch`, :mod:`pyboleto.decoder` ou
+    arrays passados para :mod:`pyboleto.duedate`).
+
+"""
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+MODULOS = ['pyboleto', 'pyboleto.data', 'pyboleto.html', 'pyboleto.pdf']
+
+PESADOS = ['reportlab', 'PIL', 'numpy']
+
+CODIGO = '''
+import sys, time
+inicio = time.perf_counter()
+import %s
+fim = time.perf_counter()
+pesados = [m for m in %r if m in sys.modules]
+print('%%f %%s' %% ((fim - inicio) * 1e3, ','.join(pesados) or '-'))
+'''
+
+
+def importa(modulo):
+    ambiente = dict(os.environ, PYTHONPATH=RAIZ)
+    ambiente.pop('PYTHONDONTWRITEBYTECODE', None)
+    saida = subprocess.check_output(
+        [sys.executable, '-c', CODIGO % (modulo, PESADOS)],
+        env=ambiente, cwd=RAIZ)
+    tempo, pesados = saida.decode().split()
+    return float(tempo), pesados
+
+
+def main(n):
+    print('%-16s %10s   %s' % ('Módulo', 'ms', 'Importa'))
+    for modulo in MODULOS:
+        # Gera os .pyc
+        importa(modulo)
+        tempos = []
+        for _ in range(n):
+            tempo, pesados = importa(modulo)
+            tempos.append(tempo)
+        print('%-16s %10.1f   %s' % (modulo, min(tempos), pesados))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
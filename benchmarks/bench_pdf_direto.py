@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+    Páginas por segundo do :class:`pyboleto.pdfdireto.BoletoPDFDireto`
+    comparado ao :class:`pyboleto.pdf.BoletoPDF`.
+
+    Os dois desenham o mesmo layout; o ``BoletoPDFDireto`` escreve os
+    operadores do PDF sem passar pelo canvas do ReportLab. Mede N boletos,
+    metade com logotipo, em página inteira e em carnê.
+
+    Uso::
+
+        $ python benchmarks/bench_pdf_direto.py [N]
+
+    Meta: pelo menos dez vezes mais páginas por segundo.
+
+    Medido com CPython 3.11 e ReportLab 5.0, N = 2.000, menor tempo de três
+    execuções, páginas por segundo:
+
+    ===============  =========  ===============  ==========
+    Saída            BoletoPDF  BoletoPDFDireto  Aceleração
+    ===============  =========  ===============  ==========
+    drawBoleto       765        4.880            6,4x
+    Carnê (2/pág.)   570        3.190            5,6x
+    ===============  =========  ===============  ==========
+
+    A meta foi atingida contra o ``BoletoPDF`` que desenhava o código de
+    barras com o ``I2of5`` do ReportLab (405 e 315 páginas por segundo, 12x
+    e 11x). Com :mod:`pyboleto.codigobarras`, usado pelos dois, o
+    ``BoletoPDF`` ficou quase duas vezes mais rápido e a diferença caiu.
+
+    O arquivo também fica menor (1,35 KiB por página contra 1,79 na folha
+    inteira): sem ASCII85 nos streams.
+
+"""
+import datetime
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.bank.itau import BoletoItau  # noqa
+from pyboleto.pdf import BoletoPDF  # noqa
+from pyboleto.pdfdireto import BoletoPDFDireto  # noqa
+
+
+def cria_boleto(i):
+    d = BoletoItau()
+    d.carteira = '109'
+    d.agencia_cedente = '0293'
+    d.conta_cedente = '01328'
+    d.data_vencimento = datetime.date(2012, 7, 22)
+    d.data_documento = datetime.date(2012, 7, 17)
+    d.data_processamento = datetime.date(2012, 7, 17)
+    d.valor_documento = 2952.95
+    d.nosso_numero = str(157 + i)
+    d.numero_documento = str(12345 + i)
+    d.cedente = 'Empresa ACME LTDA'
+    d.cedente_documento = '11.222.333/0001-81'
+    d.cedente_endereco = 'Rua Acme, 123 - Centro - Sao Paulo/SP'
+    d.sacado = ['Cliente Teste %d' % i, 'Rua Desconhecida, 00/0000',
+                'Qualquer Lugar - Estado']
+    d.instrucoes = ['Não receber após o vencimento']
+    d.demonstrativo = ['Mensalidade %d' % i]
+    d.logo_image = 'logo_itau.jpg' if i % 2 else ''
+    return d
+
+
+def mede(classe, boletos, carne, repeticoes=3):
+    """Menor tempo por página e tamanho por página"""
+    tempos = []
+    for _ in range(repeticoes):
+        arquivo = io.BytesIO()
+        inicio = time.perf_counter()
+        pdf = classe(arquivo, landscape=carne)
+        paginas = pdf.drawBoletos(boletos, carne=carne)
+        pdf.save()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos) / paginas, len(arquivo.getvalue()) / 1024.0 / paginas
+
+
+def main(n):
+    boletos = [cria_boleto(i) for i in range(n)]
+    print('%-14s  %10s  %16s  %10s' % (
+        'saída', 'BoletoPDF', 'BoletoPDFDireto', 'aceleração'))
+    for nome, carne in (('drawBoleto', False), ('Carnê (2/pág.)', True)):
+        reportlab, tamanho_reportlab = mede(BoletoPDF, boletos, carne)
+        direto, tamanho_direto = mede(BoletoPDFDireto, boletos, carne)
+        print('%-14s  %6.0f pág/s  %12.0f pág/s  %9.1fx   '
+              '(%.2f / %.2f KiB por página)' % (
+                  nome, 1 / reportlab, 1 / direto, reportlab / direto,
+                  tamanho_reportlab, tamanho_direto))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
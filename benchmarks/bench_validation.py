@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+    Conferência de um lote com :class:`pyboleto.validation.Validador`.
+
+    ``Exceções`` é o laço que se usava antes: cria cada boleto dentro de um
+    ``try`` e gera a linha digitável para descobrir o primeiro erro do
+    registro. ``Validador`` confere os mesmos registros e lista todos os
+    erros. Um em cada 100 registros tem um campo inválido.
+
+    Uso::
+
+        $ python benchmarks/bench_validation.py [N]
+
+    Medido com CPython 3.11, N = 100.000, µs por registro (máquina com
+    bastante ruído, menor valor de três execuções):
+
+    ==================  ==========  ==========
+    Banco               Exceções    Validador
+    ==================  ==========  ==========
+    Banco do Brasil     48          7,1
+    Itaú                56          9,8
+    ==================  ==========  ==========
+
+"""
+import datetime
+import os
+import sys
+import timeit
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.bank.bancodobrasil import BoletoBB  # noqa
+from pyboleto.bank.itau import BoletoItau  # noqa
+from pyboleto.validation import Validador  # noqa
+
+BANCOS = [
+    ('Banco do Brasil', lambda: BoletoBB(7, 2),
+     dict(convenio='1234567', carteira='18', agencia_cedente='1172',
+          conta_cedente='403005')),
+    ('Itaú', BoletoItau,
+     dict(carteira='109', agencia_cedente='0293', conta_cedente='01328')),
+]
+
+
+def registros(conta, n):
+    dados = []
+    for i in range(n):
+        registro = dict(conta)
+        registro.update({
+            'nosso_numero': str(i % 10000000),
+            'numero_documento': str(i),
+            'data_vencimento': datetime.date(2012, 7, 22),
+            'data_documento': datetime.date(2012, 7, 1),
+            'valor_documento': Decimal('2952.95'),
+            'sacado': ['Cliente %d' % i, 'Rua 1', 'São Paulo - SP'],
+        })
+        if i % 100 == 99:
+            registro['nosso_numero'] = '1%sx' % i
+        dados.append(registro)
+    return dados
+
+
+def excecoes(classe, dados):
+    erros = 0
+    for registro in dados:
+        try:
+            boleto = classe()
+            for nome, valor in registro.items():
+                setattr(boleto, nome, valor)
+            boleto.linha_digitavel
+        except Exception:
+            erros += 1
+    return erros
+
+
+def validador(classe, dados):
+    return len(Validador(classe()).valida_lote(dados))
+
+
+def main(n):
+    print('%-18s %10s %10s' % ('Banco', 'Exceções', 'Validador'))
+    for nome, classe, conta in BANCOS:
+        dados = registros(conta, n)
+        assert excecoes(classe, dados) == validador(classe, dados)
+        tempos = [min(timeit.repeat(lambda: func(classe, dados),
+                                    number=1, repeat=3)) / n * 1e6
+                  for func in (excecoes, validador)]
+        print('%-18s %10.1f %10.1f' % (nome, tempos[0], tempos[1]))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+r"""
+    Valores em Decimal e em centavos.
+
+    Mede, por boleto, o caminho dos valores: atribuir ``valor`` e
+    ``valor_documento``, ler o texto de ``valor_documento``, montar a parte
+    de valor do código de barras e formatar o valor para exibição. O modo
+    padrão (:class:`Decimal`, formatação pelo ``locale``) é comparado com
+    ``valor_em_centavos = True`` e :func:`pyboleto.data.formata_centavos`.
+
+    Uso::
+
+        $ python benchmarks/bench_valor.py [N]
+
+    Medido com CPython 3.11, N = 200.000, ns por boleto (máquina com
+    bastante ruído, valores da primeira de três execuções):
+
+    ============================  ==========  ==========
+    Operação                      Decimal     Centavos
+    ============================  ==========  ==========
+    Atribuir a partir de float    4.600       4.700
+    Atribuir ``*_centavos``       2.700       2.000
+    Ler ``valor_documento``       830         760
+    Valor do código de barras     1.600       380
+    Formatar para exibição        \-          1.300
+    ============================  ==========  ==========
+
+    A formatação ``Decimal`` usa ``locale.format_string`` como os
+    renderizadores faziam antes e só é medida se o locale ``pt_BR.UTF-8``
+    existir (não existia na máquina da tabela). Atribuir floats em centavos
+    custa um ``quantize`` a mais, mas as leituras deixam de converter.
+
+"""
+import locale
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto.bank.santander import BoletoSantander  # noqa
+from pyboleto.data import formata_centavos  # noqa
+
+
+class BoletoCentavos(BoletoSantander):
+    valor_em_centavos = True
+
+
+def mede(nome, func, n):
+    inicio = time.perf_counter()
+    func(n)
+    return (time.perf_counter() - inicio) / n * 1e9
+
+
+def atribui_float(classe):
+    boleto = classe()
+
+    def func(n):
+        for i in range(n):
+            boleto.valor_documento = 2952.95
+            boleto.valor = 10.5
+    return func
+
+
+def atribui_centavos(classe):
+    boleto = classe()
+
+    def func(n):
+        for i in range(n):
+            boleto.valor_documento_centavos = 295295
+            boleto.valor_centavos = 1050
+    return func
+
+
+def le_texto(classe):
+    boleto = classe()
+    boleto.valor_documento = 2952.95
+
+    def func(n):
+        for i in range(n):
+            boleto.valor_documento
+    return func
+
+
+def le_barcode(classe):
+    boleto = classe()
+    boleto.valor_documento = 2952.95
+
+    def func(n):
+        for i in range(n):
+            '%010d' % boleto.valor_documento_centavos
+    return func
+
+
+def formata_locale(n):
+    boleto = BoletoSantander()
+    boleto.valor_documento = 2952.95
+    for i in range(n):
+        locale.format_string('%.2f', float(boleto.valor_documento),
+                             grouping=True)
+
+
+def formata_novo(n):
+    boleto = BoletoCentavos()
+    boleto.valor_documento = 2952.95
+    for i in range(n):
+        formata_centavos(boleto.valor_documento_centavos)
+
+
+def main(n):
+    linhas = [
+        ('Atribuir a partir de float', atribui_float),
+        ('Atribuir *_centavos', atribui_centavos),
+        ('Ler valor_documento', le_texto),
+        ('Valor do código de barras', le_barcode),
+    ]
+    print('%-28s %10s %10s' % ('Operação', 'Decimal', 'Centavos'))
+    for nome, fabrica in linhas:
+        print('%-28s %10.0f %10.0f' % (
+            nome, mede(nome, fabrica(BoletoSantander), n),
+            mede(nome, fabrica(BoletoCentavos), n)))
+
+    try:
+        locale.setlocale(locale.LC_ALL, 'pt_BR.UTF-8')
+    except locale.Error:
+        decimal = float('nan')
+    else:
+        decimal = mede('locale', formata_locale, n)
+    print('%-28s %10.0f %10.0f' % ('Formatar para exibição', decimal,
+                                   mede('formata', formata_novo, n)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+    DVs em lote: laço escalar contra :mod:`pyboleto.vectorized`.
+
+    Calcula o DV geral do código de barras e os três DVs da linha digitável
+    de ``N`` códigos de barras. O tempo da versão vetorizada inclui a
+    conversão das strings para matriz e de volta.
+
+    Uso::
+
+        $ python benchmarks/bench_vectorized.py [N]
+
+    Medido com CPython 3.11 e NumPy 2.4, N = 1.000.000:
+
+    ===========================  ==========  ==========
+    Cálculo                      Escalar     NumPy
+    ===========================  ==========  ==========
+    DV do código de barras       3,6 s       0,34 s
+    DVs da linha digitável       7,0 s       1,4 s
+    ===========================  ==========  ==========
+
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pyboleto import vectorized  # noqa
+from pyboleto.checksum import DV_BARCODE, MODULO10  # noqa
+
+
+def cronometra(nome, func):
+    inicio = time.perf_counter()
+    resultado = func()
+    print('%-28s %6.2f s' % (nome, time.perf_counter() - inicio))
+    return resultado
+
+
+def main(n):
+    rnd = random.Random(1)
+    sem_dv = ['%043d' % rnd.randrange(10 ** 43) for _ in range(n)]
+    barcodes = [num[:4] + '0' + num[4:] for num in sem_dv]
+
+    escalar = cronometra('DV barcode (escalar)',
+                         lambda: [DV_BARCODE(num) for num in sem_dv])
+    vetorial = cronometra('DV barcode (numpy)', lambda: (
+        vectorized.dv_barcode(vectorized.digitos(sem_dv, 43)).tolist()))
+    assert escalar == vetorial
+
+    escalar = cronometra('DVs linha (escalar)', lambda: [
+        [MODULO10(b[0:4] + b[19:24]), MODULO10(b[24:34]), MODULO10(b[34:44])]
+        for b in barcodes])
+    vetorial = cronometra('DVs linha (numpy)', lambda: (
+        vectorized.dvs_linha_digitavel(
+            vectorized.digitos(barcodes, 44)).tolist()))
+    assert escalar == vetorial
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
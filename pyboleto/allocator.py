@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.allocator
+    ~~~~~~~~~~~~~~~~~~
+
+    Alocação local de nosso número, sem repetição entre processos.
+
+    O :class:`AlocadorNossoNumero` guarda em um arquivo SQLite o próximo
+    nosso número livre de cada cedente e carteira. Cada processo reserva
+    uma faixa contígua de números (``tamanho_lote``) em uma única transação
+    e distribui os números da faixa sem acessar o arquivo. Uma faixa
+    reservada nunca é entregue de novo: se o processo terminar antes de
+    usar todos os números da faixa, os que sobraram são perdidos, mas não
+    há duplicados.
+
+    O tamanho do nosso número vem do layout do banco (ex. 8 dígitos no
+    Itaú, 11 no Bradesco, 17 no BB com convênio de 6 dígitos e nosso
+    número de 17) e o DV é calculado pelo próprio boleto.
+
+    eg::
+
+        perfil = CedenteProfile(BoletoItau, carteira='109',
+                                agencia_cedente='0293',
+                                conta_cedente='01328')
+        alocador = AlocadorNossoNumero('nosso_numero.db', perfil.prototipo)
+        numero = alocador.proximo()
+        boleto = perfil.boleto(nosso_numero=numero.nosso_numero, ...)
+
+    Cada processo deve usar o seu alocador. Um alocador herdado por
+    ``fork`` descarta a faixa do processo pai e abre uma conexão nova.
+
+"""
+import copy
+import os
+import sqlite3
+from collections import namedtuple
+
+from .data import BoletoException, CustomProperty
+from .layout import Campo
+from .validation import Validador
+
+NossoNumero = namedtuple('NossoNumero', ['nosso_numero', 'dv'])
+"""Nosso número já formatado e o seu DV (``None`` se o banco não tiver DV
+ou se ele depender de campos que o modelo não tem)"""
+
+_TABELA = ('CREATE TABLE IF NOT EXISTS nosso_numero '
+           '(chave TEXT PRIMARY KEY, proximo INTEGER NOT NULL)')
+
+
+def tamanho_nosso_numero(boleto):
+    """Número de dígitos do nosso número de ``boleto``
+
+    :exception BoletoException: Se o tamanho não puder ser determinado.
+    """
+    layout = boleto.layout
+    if layout is not None:
+        tamanho = sum(item.tamanho for item in layout.itens
+                      if isinstance(item, Campo) and
+                      item.atributo == 'nosso_numero')
+        if tamanho:
+            return tamanho
+    propriedade = getattr(type(boleto), 'nosso_numero', None)
+    if isinstance(propriedade, CustomProperty):
+        return propriedade.length
+    raise BoletoException(
+        'Unable to find the nosso_numero width of %s' % (
+            type(boleto).__name__, ))
+
+
+def chave_cedente(boleto):
+    """Chave do contador: banco, agência, conta, convênio e carteira"""
+    return '/'.join(str(getattr(boleto, nome, '') or '') for nome in (
+        'codigo_banco', 'agencia_cedente', 'conta_cedente', 'convenio',
+        'carteira'))
+
+
+class AlocadorNossoNumero(object):
+    """Distribui nossos números a partir de faixas reservadas no SQLite
+
+    :param caminho: Arquivo SQLite, compartilhado pelos processos.
+    :param boleto: Boleto modelo com os dados do cedente (ex.
+        :attr:`pyboleto.cedente.CedenteProfile.prototipo`). Não é alterado.
+    :param tamanho_lote: Quantidade de números reservados por transação.
+    :param inicio: Primeiro número, usado se o cedente ainda não tiver
+        contador.
+    :param prefixo: Dígitos fixos no início do nosso número (ex. tipo de
+        cobrança e emissão da Caixa SIGCB).
+    :param tamanho: Número de dígitos. Padrão: o do layout do banco.
+    :param chave: Chave do contador. Padrão: :func:`chave_cedente`.
+    :param timeout: Segundos de espera pelo arquivo bloqueado por outro
+        processo.
+    :exception BoletoException: Se o maior número possível não for aceito
+        pelo banco.
+
+    """
+
+    def __init__(self, caminho, boleto, tamanho_lote=1000, inicio=1,
+                 prefixo='', tamanho=None, chave=None, timeout=30.0):
+        if tamanho_lote < 1:
+            raise ValueError('tamanho_lote must be at least 1')
+        if tamanho is None:
+            tamanho = tamanho_nosso_numero(boleto)
+        if not 0 <= len(prefixo) < tamanho:
+            raise BoletoException(
+                'prefixo must be shorter than %d digits' % tamanho)
+        self.caminho = caminho
+        self.prefixo = prefixo
+        self.tamanho_lote = tamanho_lote
+        self.inicio = inicio
+        self.timeout = timeout
+        self.chave = chave_cedente(boleto) if chave is None else chave
+        self.chave += '/' + prefixo
+        self._digitos = tamanho - len(prefixo)
+        self.maximo = 10 ** self._digitos - 1
+        self._formato = '%s%%0%dd' % (prefixo.replace('%', '%%'),
+                                      self._digitos)
+
+        erros = Validador(boleto).valida(
+            {'nosso_numero': self._formato % self.maximo})
+        if erros:
+            raise BoletoException(erros[0].mensagem)
+        self._rascunho = copy.copy(boleto)
+        self._com_dv = hasattr(type(boleto), 'dv_nosso_numero')
+
+        self._pid = None
+        self._conexao = None
+        self._proximo = self._fim = 0
+
+    def _conecta(self):
+        if self._pid != os.getpid():
+            # Conexão e faixa do processo pai não podem ser usadas
+            self._pid = os.getpid()
+            self._conexao = None
+            self._proximo = self._fim = 0
+        if self._conexao is None:
+            self._conexao = sqlite3.connect(
+                self.caminho, timeout=self.timeout, isolation_level=None)
+            self._conexao.execute(_TABELA)
+        return self._conexao
+
+    def reserva(self, quantidade):
+        """Reserva uma faixa de até ``quantidade`` números no arquivo
+
+        :return: ``(inicio, fim)``, com ``fim`` fora da faixa.
+        :exception BoletoException: Se os números do cedente acabaram.
+        """
+        conexao = self._conecta()
+        conexao.execute('BEGIN IMMEDIATE')
+        try:
+            linha = conexao.execute(
+                'SELECT proximo FROM nosso_numero WHERE chave = ?',
+                (self.chave, )).fetchone()
+            inicio = self.inicio if linha is None else linha[0]
+            if inicio > self.maximo:
+                raise BoletoException(
+                    'No nosso_numero left for %s' % self.chave)
+            fim = min(inicio + quantidade, self.maximo + 1)
+            conexao.execute(
+                'INSERT OR REPLACE INTO nosso_numero (chave, proximo) '
+                'VALUES (?, ?)', (self.chave, fim))
+        except BaseException:
+            conexao.execute('ROLLBACK')
+            raise
+        conexao.execute('COMMIT')
+        return inicio, fim
+
+    def proximo(self):
+        """Próximo nosso número livre
+
+        :rtype: :class:`NossoNumero`
+        """
+        if self._pid != os.getpid() or self._proximo >= self._fim:
+            self._proximo, self._fim = self.reserva(self.tamanho_lote)
+        numero = self._formato % self._proximo
+        self._proximo += 1
+        return NossoNumero(numero, self._dv(numero))
+
+    def _dv(self, numero):
+        if not self._com_dv:
+            return None
+        rascunho = self._rascunho
+        try:
+            rascunho.nosso_numero = numero
+            return rascunho.dv_nosso_numero
+        except (TypeError, ValueError, AttributeError, BoletoException):
+            return None
+
+    def close(self):
+        """Fecha a conexão. Os números restantes da faixa são perdidos."""
+        if self._conexao is not None and self._pid == os.getpid():
+            self._conexao.close()
+        self._conexao = None
+        self._proximo = self._fim = 0
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.arrays
+    ~~~~~~~~~~~~~~~
+
+    Escolha entre a versão escalar e a vetorizada de um cálculo.
+
+    As funções que aceitam sequências (:mod:`pyboleto.duedate`,
+    :mod:`pyboleto.businessday`, :mod:`pyboleto.interest`,
+    :mod:`pyboleto.taxid`) usam :mod:`pyboleto.vectorized` quando recebem um
+    array do NumPy. Este módulo não importa o NumPy nem o
+    :mod:`pyboleto.vectorized`, para que importar essas funções continue
+    rápido para quem não usa o NumPy.
+
+"""
+import sys
+
+
+def vetorizado(valores):
+    """:mod:`pyboleto.vectorized` se ``valores`` for um array do NumPy
+
+    O NumPy não é importado aqui: se ele ainda não foi importado,
+    ``valores`` não pode ser um array.
+
+    eg::
+
+        vectorized = vetorizado(datas)
+        if vectorized is not None:
+            return vectorized.fatores_vencimento(datas)
+        return [fator_vencimento(data) for data in datas]
+
+    :return: O módulo :mod:`pyboleto.vectorized` ou ``None``.
+    """
+    numpy = sys.modules.get('numpy')
+    if numpy is None or not isinstance(valores, numpy.ndarray):
+        return None
+    from . import vectorized
+    return vectorized
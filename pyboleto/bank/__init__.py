@@ -1,18 +1,106 @@
 # -*- coding: utf-8 -*-
+"""
+    pyboleto.bank
+    ~~~~~~~~~~~~~
+
+    Implementações de cada banco e registro das classes por código.
+
+    :func:`get_class_for_codigo` importa o módulo do banco só na primeira
+    vez em que o código é pedido; depois a classe vem de um cache. Para
+    processos que fazem ``fork`` (ex. workers) :func:`carrega_bancos`
+    importa todos os bancos de uma vez no processo pai.
+
+    Bancos de outros pacotes são encontrados pelo entry point
+    ``pyboleto.bank``, com o código do banco como nome::
+
+        # setup.py do outro pacote
+        entry_points={
+            'pyboleto.bank': ['077 = meupacote.inter:BoletoInter'],
+        }
+
+    Os bancos de :data:`BANCOS_IMPLEMENTADOS` têm precedência sobre os
+    entry points. Para substituir um deles use :func:`registra_banco`.
+
+"""
+import importlib
+
 from ..data import BoletoException
+
 BANCOS_IMPLEMENTADOS = {
     '001': 'bancodobrasil.BoletoBB',
     '041': 'banrisul.BoletoBanrisul',
     '237': 'bradesco.BoletoBradesco',
     '104': 'caixa.BoletoCaixa',
+    '104-sigcb': 'caixa_sigcb.BoletoCaixaSigcb',
     '399': 'hsbc.BoletoHsbc',
+    '399-registro': 'hsbc.BoletoHsbcComRegistro',
     '341': 'itau.BoletoItau',
-    '356': 'real.BoletoReal',
     '033': 'santander.BoletoSantander',
     '748': 'sicredi.BoletoSicredi',
     '756': 'sicoob.BoletoSicoob',
+    '085': 'cecred.BoletoCecred',
     '0851': 'cecred.BoletoCecred',
 }
+"""Classes dos bancos, indexadas pelo código
+
+Os códigos com sufixo são outras implementações do mesmo banco (ex.
+``'104-sigcb'``). ``'0851'`` é mantido por compatibilidade e equivale a
+``'085'``.
+"""
+
+GRUPO_ENTRY_POINTS = 'pyboleto.bank'
+"""Grupo de entry points com bancos de outros pacotes"""
+
+_CLASSES = {}
+_ENTRY_POINTS = None
+
+
+def _entry_points():
+    """Entry points do grupo :data:`GRUPO_ENTRY_POINTS`, pelo nome"""
+    global _ENTRY_POINTS
+    if _ENTRY_POINTS is not None:
+        return _ENTRY_POINTS
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        try:
+            import pkg_resources
+        except ImportError:
+            pontos = []
+        else:
+            pontos = pkg_resources.iter_entry_points(GRUPO_ENTRY_POINTS)
+    else:
+        pontos = entry_points()
+        if hasattr(pontos, 'select'):
+            pontos = pontos.select(group=GRUPO_ENTRY_POINTS)
+        else:
+            pontos = pontos.get(GRUPO_ENTRY_POINTS, [])
+    _ENTRY_POINTS = {ponto.name: ponto for ponto in pontos}
+    return _ENTRY_POINTS
+
+
+def _importa(banco_codigo, caminho):
+    modulo, classe = caminho.rsplit('.', 1)
+    try:
+        mod = importlib.import_module('pyboleto.bank.' + modulo)
+    except ImportError as erro:
+        raise BoletoException(
+            "Banco %s: não foi possível importar pyboleto.bank.%s (%s)" % (
+                banco_codigo, modulo, erro))
+    try:
+        return getattr(mod, classe)
+    except AttributeError:
+        raise BoletoException("Banco %s: pyboleto.bank.%s não tem a "
+                              "classe %s" % (banco_codigo, modulo, classe))
+
+
+def _carrega_entry_point(banco_codigo, ponto):
+    try:
+        return ponto.load()
+    except Exception as erro:
+        raise BoletoException(
+            "Banco %s: não foi possível carregar o entry point %r (%s: %s)" %
+            (banco_codigo, ponto.name, type(erro).__name__, erro))
 
 
 def get_class_for_codigo(banco_codigo):
@@ -22,13 +110,46 @@ def get_class_for_codigo(banco_codigo):
     :type banco_codigo: string
     :return: Classo do Banco subclasse de :class:`pyboleto.data.BoletoData`
     :rtype: :class:`pyboleto.data.BoletoData`
+    :exception BoletoException: Se o banco não for implementado ou se o
+        módulo do banco não puder ser importado.
     """
     try:
-        banco = BANCOS_IMPLEMENTADOS[banco_codigo].split('.')
+        return _CLASSES[banco_codigo]
     except KeyError:
-        raise BoletoException
+        pass
+    if banco_codigo in BANCOS_IMPLEMENTADOS:
+        classe = _importa(banco_codigo, BANCOS_IMPLEMENTADOS[banco_codigo])
+    else:
+        ponto = _entry_points().get(banco_codigo)
+        if ponto is None:
+            raise BoletoException("Banco não implementado: %r" % (
+                banco_codigo, ))
+        classe = _carrega_entry_point(banco_codigo, ponto)
+    _CLASSES[banco_codigo] = classe
+    return classe
 
-    mod = __import__('pyboleto.bank.' + banco[0],
-                     globals(), locals(), [banco[1]])
 
-    return getattr(mod, banco[1])
+def registra_banco(banco_codigo, classe):
+    """Usa ``classe`` para ``banco_codigo`` em :func:`get_class_for_codigo`
+
+    Substitui o banco implementado ou o entry point com o mesmo código.
+    """
+    _CLASSES[banco_codigo] = classe
+
+
+def carrega_bancos(codigos=None):
+    """Importa os bancos antes de serem usados
+
+    Útil antes de criar processos com ``fork``, para que os módulos sejam
+    importados uma única vez no processo pai, e para descobrir na
+    inicialização bancos que não podem ser importados.
+
+    :param codigos: Códigos a carregar. Padrão: todos os de
+        :data:`BANCOS_IMPLEMENTADOS` e dos entry points.
+    :return: Dicionário ``{codigo: classe}``.
+    :exception BoletoException: No primeiro banco que não puder ser
+        carregado.
+    """
+    if codigos is None:
+        codigos = sorted(set(BANCOS_IMPLEMENTADOS) | set(_entry_points()))
+    return {codigo: get_class_for_codigo(codigo) for codigo in codigos}
@@ -3,7 +3,10 @@
     Boleto for Banco do Brasil
 """
 # -*- coding: utf-8 -*-
-from pyboleto.data import BoletoData, CustomProperty
+from pyboleto.checksum import Checksum
+from pyboleto.data import (BoletoData, BoletoException, CustomProperty,
+                           memoized, memoized_property)
+from pyboleto.layout import ESQUERDA, Campo, Fixo, Layout
 
 '''
 /*
@@ -22,12 +25,53 @@ from pyboleto.data import BoletoData, CustomProperty
 */
 '''
 
+#: DV do nosso número: módulo 11 com pesos de 9 a 2, resto 10 vira 'X'
+DV_NOSSO_NUMERO = Checksum(range(9, 1, -1), 11, list(range(10)) + ['X'])
+
+
+def _layout_agencia_conta(convenio, nosso_numero):
+    return Layout([
+        Campo('convenio', convenio),
+        Campo('nosso_numero', nosso_numero),
+        Campo('agencia_cedente', 4),
+        Campo('conta_cedente', 8),
+        # Apenas a carteira, sem a variação (ex. '18' de '18-019')
+        Campo('carteira', 2, ajuste=ESQUERDA),
+    ])
+
+
+def _layout_convenio_longo(convenio, nosso_numero):
+    return Layout([
+        Fixo('000000'),
+        Campo('convenio', convenio),
+        Campo('nosso_numero', nosso_numero),
+        Campo('carteira', 2, ajuste=ESQUERDA),
+    ])
+
+
+#: Layouts indexados por ``(format_convenio, format_nnumero)``
+LAYOUTS = {
+    (6, 1): _layout_agencia_conta(6, 5),
+    (6, 2): Layout([
+        Campo('convenio', 6),
+        Campo('nosso_numero', 17),
+        Fixo('21', 'servico'),
+    ]),
+}
+for _format_nnumero in (1, 2):
+    LAYOUTS[4, _format_nnumero] = _layout_agencia_conta(4, 7)
+    LAYOUTS[7, _format_nnumero] = _layout_convenio_longo(7, 10)
+    LAYOUTS[8, _format_nnumero] = _layout_convenio_longo(8, 9)
+
 
 class BoletoBB(BoletoData):
     '''
         Gera Dados necessários para criação de boleto para o Banco do Brasil
     '''
 
+    __slots__ = ('format_convenio', 'format_nnumero', '_convenio',
+                 '_nosso_numero')
+
     agencia_cedente = CustomProperty('agencia_cedente', 4)
     conta_cedente = CustomProperty('conta_cedente', 8)
 
@@ -58,6 +102,7 @@ class BoletoBB(BoletoData):
         self._convenio = ""
         self._nosso_numero = ""
 
+    @memoized
     def format_nosso_numero(self):
         if self.format_convenio == 7:
             return '{:.7}'.format(self.convenio.zfill(7)) + '{:.10}'.format(
@@ -98,6 +143,15 @@ class BoletoBB(BoletoData):
     convenio = property(_get_convenio, _set_convenio)
 
     @property
+    def layout(self):
+        try:
+            return LAYOUTS[self.format_convenio, self.format_nnumero]
+        except KeyError:
+            raise BoletoException(
+                "Convênio de %r dígitos com nosso número no formato %r não "
+                "suportado" % (self.format_convenio, self.format_nnumero))
+
+    @memoized_property
     def agencia_conta_cedente(self):
         return "%s-%s / %s-%s" % (
             self.agencia_cedente,
@@ -106,47 +160,9 @@ class BoletoBB(BoletoData):
             self.modulo11(self.conta_cedente)
         )
 
-    @property
+    @memoized_property
     def dv_nosso_numero(self):
         '''
             This function uses a modified version of modulo11
         '''
-        num = self.convenio + self.nosso_numero
-        base = 2
-        fator = 9
-        soma = 0
-        for c in reversed(num):
-            soma += int(c) * fator
-            if fator == base:
-                fator = 10
-            fator -= 1
-        r = soma % 11
-        if r == 10:
-            return 'X'
-        return r
-
-    @property
-    def campo_livre(self):
-        if self.format_convenio == 4:
-            content = "%s%s%s%s%s" % (self.convenio,
-                                      self.nosso_numero,
-                                      self.agencia_cedente,
-                                      self.conta_cedente,
-                                      self.carteira[:2])
-        elif self.format_convenio in (7, 8):
-            content = "000000%s%s%s" % (self.convenio,
-                                        self.nosso_numero,
-                                        self.carteira[:2])
-        elif self.format_convenio == 6:
-            if self.format_nnumero == 1:
-                content = "%s%s%s%s%s" % (self.convenio,
-                                          self.nosso_numero,
-                                          self.agencia_cedente,
-                                          self.conta_cedente,
-                                          self.carteira[:2])
-            if self.format_nnumero == 2:
-                content = "%s%s%s" % (self.convenio,
-                                      self.nosso_numero,
-                                      '21')  # numero do serviço
-
-        return content
+        return DV_NOSSO_NUMERO(self.convenio + self.nosso_numero)
@@ -1,32 +1,44 @@
 # -*- coding: utf-8 -*-
+from pyboleto.checksum import MODULO10, modulo11
 from pyboleto.data import BoletoData, CustomProperty
+from pyboleto.layout import DV, ZEROS, Campo, Fixo, Layout
+
+_RESTO11 = modulo11(7, 1)
+
+
+# From http://jrimum.org/bopepo/browser/trunk/src/br/com/nordestefomento/
+# jrimum/bopepo/campolivre/AbstractCLBanrisul.java
+def dv_campo_livre(campo_livre):
+    """Duplo DV do campo livre (módulo 10 e módulo 11 base 7)"""
+    dv = MODULO10(campo_livre)
+    while True:
+        restoMod11 = _RESTO11(campo_livre + str(dv))
+        if restoMod11 != 1:
+            break
+        dv += 1
+        dv %= 10
+
+    # Resto 0 corresponde ao dígito 0
+    return str(dv) + str((11 - restoMod11) % 11)
+
+
+LAYOUT = Layout([
+    Fixo('21'),
+    Campo('agencia_cedente', 4, ajuste=ZEROS),
+    Campo('conta_cedente', 7, ajuste=ZEROS),
+    Campo('nosso_numero', 8, ajuste=ZEROS),
+    Fixo('40'),
+    DV('dv_campo_livre', dv_campo_livre, tamanho=2),
+])
 
 
 class BoletoBanrisul(BoletoData):
     conta_cedente = CustomProperty('conta_cedente', 6)
     nosso_numero = CustomProperty('nosso_numero', 8)
+    layout = LAYOUT
+    _dv_campo_livre = staticmethod(dv_campo_livre)
 
     def __init__(self):
         BoletoData.__init__(self)
         self.codigo_banco = "041"
         self.logo_image = "logo_banrisul.jpg"
-
-    @property
-    def campo_livre(self):
-        content = '21%04d%07d%08d40' % (int(self.agencia_cedente),
-                                        int(self.conta_cedente),
-                                        int(self.nosso_numero))
-        return '%s%s' % (content, self._dv_campo_livre(content))
-
-    # From http://jrimum.org/bopepo/browser/trunk/src/br/com/nordestefomento/
-    # jrimum/bopepo/campolivre/AbstractCLBanrisul.java
-    def _dv_campo_livre(self, campo_livre):
-        dv = self.modulo10(campo_livre)
-        while True:
-            restoMod11 = self.modulo11(campo_livre + str(dv), 7, 1)
-            if restoMod11 != 1:
-                break
-            dv += 1
-            dv %= 10
-
-        return str(dv) + str(11 - restoMod11)
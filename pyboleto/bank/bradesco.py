@@ -9,7 +9,22 @@
     :license: BSD, see LICENSE for more details.
 
 """
-from pyboleto.data import BoletoData, CustomProperty
+from pyboleto.checksum import Checksum
+from pyboleto.data import (BoletoData, CustomProperty, memoized,
+                           memoized_property)
+from pyboleto.layout import ZEROS, Campo, Fixo, Layout
+
+#: DV do nosso número: módulo 11 base 7, 10 vira 'P' e 11 vira 0
+DV_NOSSO_NUMERO = Checksum(
+    range(2, 8), 11, [0, 'P'] + [11 - resto for resto in range(2, 11)])
+
+LAYOUT = Layout([
+    Campo('agencia_cedente', 4, sem_dv=True),
+    Campo('carteira', 2, ajuste=ZEROS),
+    Campo('nosso_numero', 11, ajuste=ZEROS),
+    Campo('conta_cedente', 7, sem_dv=True),
+    Fixo('0'),
+])
 
 
 class BoletoBradesco(BoletoData):
@@ -20,6 +35,7 @@ class BoletoBradesco(BoletoData):
     nosso_numero = CustomProperty('nosso_numero', 11)
     agencia_cedente = CustomProperty('agencia_cedente', 4)
     conta_cedente = CustomProperty('conta_cedente', 7)
+    layout = LAYOUT
 
     def __init__(self):
         super(BoletoBradesco, self).__init__()
@@ -30,6 +46,7 @@ class BoletoBradesco(BoletoData):
         self.local_pagamento = 'Pagável Preferencialmente ' +\
             'na Rede Bradesco ou Bradesco Expresso.'
 
+    @memoized
     def format_nosso_numero(self):
         return "%s/%s-%s" % (
             self.carteira,
@@ -37,25 +54,6 @@ class BoletoBradesco(BoletoData):
             self.dv_nosso_numero
         )
 
-    @property
+    @memoized_property
     def dv_nosso_numero(self):
-        resto2 = self.modulo11(self.carteira + self.nosso_numero, 7, 1)
-        digito = 11 - resto2
-        if digito == 10:
-            dv = 'P'
-        elif digito == 11:
-            dv = 0
-        else:
-            dv = digito
-        return dv
-
-    @property
-    def campo_livre(self):
-        content = '{0:.4}{1:.2}{2:.11}{3:.7}{4:.1}'.format(
-            self.agencia_cedente.split('-')[0],
-            self.carteira.zfill(2),
-            self.nosso_numero.zfill(11),
-            self.conta_cedente.split('-')[0],
-            '0'
-            )
-        return content
+        return DV_NOSSO_NUMERO(self.carteira + self.nosso_numero)
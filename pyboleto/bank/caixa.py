@@ -1,5 +1,18 @@
 # -*- coding: utf-8 -*-
-from pyboleto.data import BoletoData, CustomProperty
+from pyboleto.checksum import Checksum
+from pyboleto.data import (BoletoData, CustomProperty, memoized,
+                           memoized_property)
+from pyboleto.layout import Campo, Layout
+
+#: DV do nosso número: módulo 11 base 9, 10 e 11 viram 0
+DV_NOSSO_NUMERO = Checksum(
+    range(2, 10), 11, [0, 0] + [11 - resto for resto in range(2, 11)])
+
+LAYOUT = Layout([
+    Campo('nosso_numero', 10),
+    Campo('agencia_cedente', 4),
+    Campo('conta_cedente', 11, sem_dv=True),
+])
 
 
 class BoletoCaixa(BoletoData):
@@ -17,6 +30,7 @@ class BoletoCaixa(BoletoData):
 
     '''
     nosso_numero = CustomProperty('nosso_numero', 10)
+    layout = LAYOUT
 
     def __init__(self):
         super(BoletoCaixa, self).__init__()
@@ -26,22 +40,10 @@ class BoletoCaixa(BoletoData):
 Agências da Caixa"
         self.logo_image = "logo_bancocaixa.jpg"
 
-    @property
+    @memoized_property
     def dv_nosso_numero(self):
-        resto2 = self.modulo11(self.nosso_numero.split('-')[0], 9, 1)
-        digito = 11 - resto2
-        if digito == 10 or digito == 11:
-            dv = 0
-        else:
-            dv = digito
-        return dv
-
-    @property
-    def campo_livre(self):
-        content = "%10s%4s%11s" % (self.nosso_numero,
-                                   self.agencia_cedente,
-                                   self.conta_cedente.split('-')[0])
-        return content
+        return DV_NOSSO_NUMERO(self.nosso_numero.split('-')[0])
 
+    @memoized
     def format_nosso_numero(self):
         return self.nosso_numero + '-' + str(self.dv_nosso_numero)
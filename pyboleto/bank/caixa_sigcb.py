@@ -1,5 +1,24 @@
 # -*- coding: utf-8 -*-
-from pyboleto.data import BoletoData, CustomProperty
+from pyboleto.checksum import modulo11
+from pyboleto.data import BoletoData, CustomProperty, memoized
+from pyboleto.layout import DV, Campo, Layout
+
+
+def _nosso_numero(inicio, fim):
+    return lambda boleto: boleto.nosso_numero[inicio:fim]
+
+
+# O nosso número de 17 dígitos é distribuído em partes pelo campo livre
+LAYOUT = Layout([
+    Campo('conta_cedente', 6, sem_dv=True),
+    DV('dv_conta_cedente', modulo11(9, 0), ['conta_cedente']),
+    Campo('nosso_numero_3_5', 3, atributo=_nosso_numero(2, 5)),
+    Campo('tipo_cobranca', 1, atributo=_nosso_numero(0, 1)),
+    Campo('nosso_numero_6_8', 3, atributo=_nosso_numero(5, 8)),
+    Campo('emissao', 1, atributo=_nosso_numero(1, 2)),
+    Campo('nosso_numero_9_17', 9, atributo=_nosso_numero(8, 17)),
+    DV('dv_campo_livre', modulo11(9, 0)),
+])
 
 
 class BoletoCaixaSigcb(BoletoData):
@@ -11,6 +30,7 @@ class BoletoCaixaSigcb(BoletoData):
     agencia_cedente = CustomProperty('agencia_cedente', 4)
     conta_cedente = CustomProperty('conta_cedente', 6)
     nosso_numero = CustomProperty('nosso_numero', 17)
+    layout = LAYOUT
 
     def __init__(self):
         super(BoletoCaixaSigcb, self).__init__()
@@ -20,20 +40,6 @@ class BoletoCaixaSigcb(BoletoData):
                                 "Agências da Caixa")
         self.logo_image = "logo_bancocaixa.jpg"
 
-    @property
-    def campo_livre(self):  # 24 digits
-        content = "%6s%1s%3s%1s%3s%1s%9s" % (
-            self.conta_cedente.split('-')[0],
-            self.modulo11(self.conta_cedente.split('-')[0]),
-            self.nosso_numero[2:5],
-            self.nosso_numero[0:1],
-            self.nosso_numero[5:8],
-            self.nosso_numero[1:2],
-            self.nosso_numero[8:17]
-        )
-        dv_content = self.modulo11(content)
-
-        return "%24s%1s" % (content, dv_content)
-
+    @memoized
     def format_nosso_numero(self):
         return self.nosso_numero
@@ -1,7 +1,16 @@
 # -*- coding: utf-8 -*-
 
 import re
-from pyboleto.data import BoletoData, CustomProperty
+from pyboleto.data import (BoletoData, CustomProperty, memoized,
+                           memoized_property)
+from pyboleto.layout import DIREITA, ZEROS, Campo, Layout
+
+LAYOUT = Layout([
+    Campo('codigo_beneficiario', 6, ajuste=ZEROS),
+    Campo('conta_cedente', 8, ajuste=ZEROS, somente_digitos=True),
+    Campo('nosso_numero', 9, ajuste=DIREITA),
+    Campo('carteira', 2, ajuste=ZEROS),
+])
 
 
 class BoletoCecred(BoletoData):
@@ -16,6 +25,7 @@ class BoletoCecred(BoletoData):
     nosso_numero = CustomProperty('nosso_numero', 9)
 
     carteira = CustomProperty('carteira', 1)
+    layout = LAYOUT
 
     def __init__(self):
         super(BoletoCecred, self).__init__()
@@ -27,20 +37,11 @@ class BoletoCecred(BoletoData):
         self.local_pagamento = 'Pagável Preferencialmente nas Cooperativas '\
             'do sistema Cecred. Após venc. somente na cooperativa'
 
-    @property
+    @memoized_property
     def codigo_dv_banco(self):
         return self.codigo_banco + '-1'
 
+    @memoized
     def format_nosso_numero(self):
         return "%s%s" % (re.sub('[^0-9]', '', self.conta_cedente),
                           self.nosso_numero)
-
-    @property
-    def campo_livre(self):
-        content = "%6s%8s%9s%2s" % (self.codigo_beneficiario.zfill(6),
-                                    re.sub('[^0-9]', '', self.conta_cedente),
-                                    self.nosso_numero[
-                                        len(
-                                            self.nosso_numero.zfill(9)) - 9:],
-                                    self.carteira.zfill(2))
-        return content
@@ -1,5 +1,29 @@
 # -*- coding: utf-8 -*-
-from pyboleto.data import BoletoData, CustomProperty
+from pyboleto.checksum import Checksum
+from pyboleto.data import (BoletoData, CustomProperty, memoized,
+                           memoized_property)
+from pyboleto.layout import DV, Campo, Fixo, Layout
+
+#: DV do nosso número com registro: módulo 11 base 7, restos 0 e 1 viram 0
+DV_NOSSO_NUMERO_REGISTRO = Checksum(
+    range(2, 8), 11, [0, 0] + [11 - resto for resto in range(2, 11)])
+
+#: Cobrança não registrada (CNR)
+LAYOUT_CNR = Layout([
+    Campo('conta_cedente', 7),
+    Campo('nosso_numero', 13),
+    Campo('data_vencimento_juliano', 4),
+    Fixo('2'),
+])
+
+#: Cobrança registrada
+LAYOUT_REGISTRO = Layout([
+    Campo('nosso_numero', 10),
+    DV('dv_nosso_numero', DV_NOSSO_NUMERO_REGISTRO, ['nosso_numero']),
+    Campo('agencia_cedente', 4, sem_dv=True),
+    Campo('conta_cedente', 7, sem_dv=True),
+    Fixo('001'),
+])
 
 
 class BoletoHsbc(BoletoData):
@@ -8,6 +32,9 @@ class BoletoHsbc(BoletoData):
     '''
 
     numero_documento = CustomProperty('numero_documento', 13)
+    layout = LAYOUT_CNR
+    # O vencimento está no campo livre e no segundo DV do nosso número
+    derivados_reemissao = ()
 
     def __init__(self):
         super(BoletoHsbc, self).__init__()
@@ -16,6 +43,7 @@ class BoletoHsbc(BoletoData):
         self.logo_image = "logo_bancohsbc.jpg"
         self.carteira = 'CNR'
 
+    @memoized
     def format_nosso_numero(self):
         nosso_numero = self.nosso_numero
         # Primeiro DV
@@ -29,19 +57,12 @@ class BoletoHsbc(BoletoData):
         nosso_numero += str(self.modulo11(sum_params))
         return nosso_numero
 
-    @property
+    @memoized_property
     def data_vencimento_juliano(self):
         data_vencimento = str(self.data_vencimento.timetuple().tm_yday)
         data_vencimento += str(self.data_vencimento.year)[-1:]
         return data_vencimento.zfill(4)
 
-    @property
-    def campo_livre(self):
-        content = "%7s%13s%4s2" % (self.conta_cedente,
-                                   self.nosso_numero,
-                                   self.data_vencimento_juliano)
-        return content
-
 
 class BoletoHsbcComRegistro(BoletoData):
     '''
@@ -50,6 +71,7 @@ class BoletoHsbcComRegistro(BoletoData):
     '''
     # Nosso numero (sem dv) sao 10 digitos
     nosso_numero = CustomProperty('nosso_numero', 10)
+    layout = LAYOUT_REGISTRO
 
     def __init__(self):
         super(BoletoHsbcComRegistro, self).__init__()
@@ -59,18 +81,6 @@ class BoletoHsbcComRegistro(BoletoData):
         self.carteira = 'CSB'
         self.especie_documento = 'PD'
 
-    @property
+    @memoized_property
     def dv_nosso_numero(self):
-        resto = self.modulo11(self.nosso_numero, 7, 1)
-        if resto == 0 or resto == 1:
-            return 0
-        else:
-            return 11 - resto
-
-    @property
-    def campo_livre(self):
-        content = "%10s%1s%4s%7s001" % (self.nosso_numero,
-                                        self.dv_nosso_numero,
-                                        self.agencia_cedente.split('-')[0],
-                                        self.conta_cedente.split('-')[0])
-        return content
+        return self.campos_campo_livre['dv_nosso_numero']
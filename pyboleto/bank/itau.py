@@ -1,13 +1,47 @@
 # -*- coding: utf-8 -*-
-from pyboleto.data import BoletoData, CustomProperty
+from pyboleto.checksum import MODULO10
+from pyboleto.data import (BoletoData, CustomProperty, memoized,
+                           memoized_property)
+from pyboleto.layout import DV, ZEROS, Campo, Fixo, Layout
+
+LAYOUT = Layout([
+    Campo('carteira', 3),
+    Campo('nosso_numero', 8),
+    DV('dv_nosso_numero', MODULO10, ['agencia_cedente', 'conta_cedente',
+                                     'carteira', 'nosso_numero']),
+    Campo('agencia_cedente', 4),
+    Campo('conta_cedente', 5),
+    DV('dv_agencia_conta_cedente', MODULO10, ['agencia_cedente',
+                                              'conta_cedente']),
+    Fixo('000'),
+])
+"""Campo livre das carteiras com nosso número de 8 dígitos"""
+
+LAYOUT_15_DIGITOS = Layout([
+    Campo('carteira', 3),
+    Campo('nosso_numero', 8),
+    Campo('seu_numero', 7, atributo='numero_documento', ajuste=ZEROS),
+    Campo('codigo_cliente', 5),
+    DV('dv_campo_livre', MODULO10, ['carteira', 'nosso_numero',
+                                    'seu_numero', 'codigo_cliente']),
+    Fixo('0'),
+])
+"""Campo livre das carteiras que usam 15 dígitos (nosso número, seu número
+e código do cliente)"""
+
+LAYOUTS = dict.fromkeys(['106', '107', '122', '142', '143', '195', '196',
+                         '198'], LAYOUT_15_DIGITOS)
+"""Layouts diferentes de :data:`LAYOUT`, indexados pela carteira"""
 
 
 class BoletoItau(BoletoData):
     '''Implementa Boleto Itaú
 
         Gera Dados necessários para criação de boleto para o banco Itau
-        Todas as carteiras com excessão das que utilizam 15 dígitos: (106,107,
-        195,196,198)
+
+        As carteiras que utilizam 15 dígitos (106, 107, 122, 142, 143, 195,
+        196 e 198) usam :data:`LAYOUT_15_DIGITOS`, com o ``numero_documento``
+        como seu número e o ``codigo_cliente`` informado pelo banco.
     '''
 
     # Nosso numero (sem dv) com 8 digitos
@@ -17,7 +51,11 @@ class BoletoItau(BoletoData):
     #  Agência (sem dv) com 4 digitos
     agencia_cedente = CustomProperty('agencia_cedente', 4)
     carteira = CustomProperty('carteira', 3)
+    # Código do cliente, usado pelas carteiras de 15 dígitos
+    codigo_cliente = CustomProperty('codigo_cliente', 5)
     codigo_barras = ''
+    derivados_cedente = BoletoData.derivados_cedente + (
+        'dv_agencia_conta_cedente', )
 
     def __init__(self):
         super(BoletoItau, self).__init__()
@@ -29,37 +67,36 @@ class BoletoItau(BoletoData):
                 'Após o vencimento, somente no Itaú '
 
     @property
+    def layout(self):
+        return LAYOUTS.get(self.carteira, LAYOUT)
+
+    @memoized_property
     def dv_nosso_numero(self):
+        if self.layout is LAYOUT:
+            return self.campos_campo_livre['dv_nosso_numero']
         composto = "%4s%5s%3s%8s" % (self.agencia_cedente, self.conta_cedente,
                                      self.carteira, self.nosso_numero)
         return self.modulo10(composto)
 
-    @property
+    @memoized_property
     def dv_agencia_conta_cedente(self):
+        # Só depende do cedente: não lê o campo livre, que também depende
+        # do nosso número
         agencia_conta = "%s%s" % (self.agencia_cedente, self.conta_cedente)
         return self.modulo10(agencia_conta)
 
-    @property
+    @memoized_property
     def agencia_conta_cedente(self):
         return "%s/%s-%s" % (self.agencia_cedente, self.conta_cedente,
                              self.dv_agencia_conta_cedente)
 
+    @memoized
     def format_nosso_numero(self):
         return "%3s/%8s-%1s" % (self.carteira, self.nosso_numero,
                                 self.dv_nosso_numero)
 
-    @property
-    def campo_livre(self):
-        content = "%3s%8s%1s%4s%5s%1s%3s" % (self.carteira,
-                                             self.nosso_numero,
-                                             self.dv_nosso_numero,
-                                             self.agencia_cedente,
-                                             self.conta_cedente,
-                                             self.dv_agencia_conta_cedente,
-                                             '000'
-                                             )
-        return content
-
     @property
     def barcode(self):
-        return self.codigo_barras
+        if self.codigo_barras:
+            return self.codigo_barras
+        return super(BoletoItau, self).barcode
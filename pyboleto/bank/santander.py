@@ -14,7 +14,20 @@
     :license: BSD, see LICENSE for more details.
 
 """
-from pyboleto.data import BoletoData, CustomProperty
+from pyboleto.checksum import modulo11
+from pyboleto.data import (BoletoData, CustomProperty, memoized,
+                           memoized_property)
+from pyboleto.layout import DIREITA, DV, Campo, Fixo, Layout
+
+LAYOUT = Layout([
+    Fixo('9'),
+    # Contas de 9 dígitos: os 2 primeiros são ignorados
+    Campo('conta_cedente', 7, ajuste=DIREITA),
+    Campo('nosso_numero', 12),
+    DV('dv_nosso_numero', modulo11(9, 0), ['nosso_numero']),
+    Campo('ios', 1),
+    Campo('carteira', 3),
+])
 
 
 class BoletoSantander(BoletoData):
@@ -23,6 +36,8 @@ class BoletoSantander(BoletoData):
         Gera Dados necessários para criação de boleto para o banco Santander
     '''
 
+    __slots__ = ('ios', )
+
     nosso_numero = CustomProperty('nosso_numero', 12)
 
     #: Também chamado de "ponto de venda"
@@ -32,6 +47,8 @@ class BoletoSantander(BoletoData):
     #: ignorar os 2 primeiros
     conta_cedente = CustomProperty('conta_cedente', 7)
 
+    layout = LAYOUT
+
     def __init__(self):
         super(BoletoSantander, self).__init__()
 
@@ -42,27 +59,17 @@ class BoletoSantander(BoletoData):
         # Demais clientes usar 0 (zero)
         self.ios = "0"
 
+    @memoized
     def format_nosso_numero(self):
         return "%s-%s" % (
             self.nosso_numero,
             self._dv_nosso_numero()
         )
 
+    @memoized
     def _dv_nosso_numero(self):
-        return str(self.modulo11(self.nosso_numero, 9, 0))
-
-    @property
-    def campo_livre(self):
-        content = "".join([
-            '9',
-            self.conta_cedente[-7:],
-            self.nosso_numero,
-            self._dv_nosso_numero(),
-            self.ios,
-            self.carteira,
-        ])
-        return content
+        return str(self.campos_campo_livre['dv_nosso_numero'])
 
-    @property
+    @memoized_property
     def agencia_conta_cedente(self):
         return "%s/%s" % (self.agencia_cedente, self.conta_cedente[-7:])
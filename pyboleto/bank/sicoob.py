@@ -1,5 +1,25 @@
 # -*- coding: utf-8 -*-
-from pyboleto.data import BoletoData, CustomProperty
+from pyboleto.checksum import Checksum
+from pyboleto.data import (BoletoData, CustomProperty, memoized,
+                           memoized_property)
+from pyboleto.layout import Campo, Fixo, Layout
+
+#: DV do nosso número: constante '3197' aplicada da esquerda para a direita
+#: nos 21 dígitos, ou seja, ciclo 3, 7, 9, 1 a partir da direita
+DV_NOSSO_NUMERO = Checksum(
+    (3, 7, 9, 1), 11, ['0', '0'] + [11 - resto for resto in range(2, 11)])
+
+LAYOUT = Layout([
+    Campo('carteira', 1),
+    Campo('agencia_cedente', 4),
+    Campo('modalidade', 2),
+    Campo('codigo_beneficiario', 7),
+    Campo('nosso_numero', 7),
+    # O DV usa o código do beneficiário com 10 dígitos, então é calculado
+    # pelo boleto
+    Campo('dv_nosso_numero', 1),
+    Fixo('001', 'parcela'),
+])
 
 
 class BoletoSicoob(BoletoData):
@@ -14,6 +34,7 @@ class BoletoSicoob(BoletoData):
     nosso_numero = CustomProperty('nosso_numero', 7)
 
     carteira = CustomProperty('carteira', 1)
+    layout = LAYOUT
 
     def __init__(self):
         super(BoletoSicoob, self).__init__()
@@ -29,37 +50,22 @@ class BoletoSicoob(BoletoData):
     def modalidade(self):
         return '01' if self.carteira == '1' else '03'
 
-    @property
+    @memoized_property
     def dv_nosso_numero(self):
         composto = "%4s%10s%7s" % (self.agencia_cedente,
                                    self.codigo_beneficiario.zfill(10),
                                    self.nosso_numero)
-        constante = '319731973197319731973'
-        soma = 0
-        for i in range(21):
-            soma += int(composto[i]) * int(constante[i])
-        resto = soma % 11
-        return '0' if (resto == 1 or resto == 0) else 11 - resto
+        return DV_NOSSO_NUMERO(composto[:21])
 
-    @property
+    @memoized_property
     def agencia_conta_cedente(self):
         return "%s/%s" % (self.agencia_cedente, self.codigo_beneficiario)
 
+    @memoized
     def format_nosso_numero(self):
         return "%8s-%1s" % (self.nosso_numero,
                             self.dv_nosso_numero)
 
-    @property
+    @memoized_property
     def codigo_dv_banco(self):
         return self.codigo_banco
-
-    @property
-    def campo_livre(self):
-        content = "%1s%4s%2s%7s%7s%1s%3s" % (self.carteira,
-                                             self.agencia_cedente.strip(),
-                                             self.modalidade,
-                                             self.codigo_beneficiario,
-                                             self.nosso_numero[:7],
-                                             self.dv_nosso_numero,
-                                             '001')
-        return content
@@ -1,17 +1,43 @@
 # -*- coding: utf-8 -*-
-from pyboleto.data import BoletoData, CustomProperty
+from pyboleto.checksum import modulo11
+from pyboleto.data import (BoletoData, CustomProperty, memoized,
+                           memoized_property)
+from pyboleto.layout import DV, Campo, Fixo, Layout
+
+# Nosso Número no formato AA/BXXXXX-D: ano, byte de geração (2) e
+# sequencial de 5 dígitos
+LAYOUT = Layout([
+    Campo('tipo_cobranca', 1, atributo='carteira'),
+    Fixo('1', 'carteira'),
+    Campo('ano', 2, atributo=lambda boleto: boleto.format_ano()),
+    Fixo('2'),
+    Campo('nosso_numero', 5),
+    # O DV usa os campos em outra ordem, então é calculado pelo boleto
+    Campo('dv_nosso_numero', 1),
+    Campo('agencia_cedente', 4),
+    Campo('posto', 2),
+    Campo('convenio', 5),
+    Fixo('10'),
+    DV('dv_campo_livre', modulo11(9, 0)),
+])
 
 
 class BoletoSicredi(BoletoData):
     '''
         Gera Dados necessários para criação de boleto para o Banco Sicredi
     '''
+    __slots__ = ('format_convenio', 'format_nnumero', '_convenio',
+                 '_nosso_numero')
+
     agencia_cedente = CustomProperty('agencia_cedente', 4)
     conta_cedente = CustomProperty('conta_cedente', 8)
     posto = CustomProperty('posto', 2)
     convenio = CustomProperty('convenio', 4)
     # Nosso numero (sem dv) com 8 digitos
     nosso_numero = CustomProperty('nosso_numero', 8)
+    layout = LAYOUT
+    # O ano do vencimento está no nosso número e no seu DV
+    derivados_reemissao = ()
 
     def __init__(self):
         '''
@@ -36,11 +62,13 @@ class BoletoSicredi(BoletoData):
         #  2: Nosso Numero with 17 positions
         self.format_nnumero = 1  # self.nosso_numero
 
+    @memoized
     def format_ano(self):
         ano = str(self.data_vencimento.strftime('%y'))
         ano = ano.zfill(2)
         return ano
 
+    @memoized
     def format_nosso_numero(self):
 
         # 14 ano + 2 : Nosso Número deve ser apresentado no formato
@@ -77,7 +105,7 @@ class BoletoSicredi(BoletoData):
         self._convenio = str(val).rjust(self.format_convenio, '0')
     convenio = property(_get_convenio, _set_convenio)
 
-    @property
+    @memoized_property
     def agencia_conta_cedente(self):
         return "%s.%s.%s" % (
             self.agencia_cedente,
@@ -85,7 +113,7 @@ class BoletoSicredi(BoletoData):
             self.convenio
         )
 
-    @property
+    @memoized_property
     def dv_nosso_numero(self):
         dv = "%s%s%s%s2%s" % (self.agencia_cedente,
                               self.posto,
@@ -96,28 +124,14 @@ class BoletoSicredi(BoletoData):
         dv = self.modulo11(dv)
         return dv
 
-    @property
+    @memoized_property
     def campo_livre(self):
-        content = str("")
+        # Só o nosso número de 5 dígitos tem o campo livre definido
         if self.format_nnumero == 1:
-            #        "3027050000414205586")
-            # 14 ano + 2 : Nosso Número deve ser apresentado no formato
-            # AA/BXXXXX-D, onde:
-            content = "%s1%s2%s%s%s%s%s10" % (self.carteira,
-                                              self.format_ano(),
-                                              self.nosso_numero,
-                                              self.dv_nosso_numero,
-                                              self.agencia_cedente,
-                                              self.posto,
-                                              self.convenio
-                                              )
-            n = self.modulo11(content)
-            if n > 9:
-                n = 1
-            content += str(n)
-        return str(content)
-
-    @property
+            return self.layout.formata(self)
+        return ''
+
+    @memoized_property
     def codigo_dv_banco(self):
         cod = "%s-X" % (self.codigo_banco)
         return cod
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.batch
+    ~~~~~~~~~~~~~~
+
+    Geração em lote de códigos de barras e linhas digitáveis.
+
+    Para pré-calcular os códigos de pagamento de muitos títulos não é
+    necessário criar um :class:`pyboleto.data.BoletoData` por registro. O
+    :class:`BoletoBatch` recebe os dados em colunas, agrupa os registros por
+    banco e reaproveita uma única instância de cada banco para calcular o
+    campo livre com as regras do próprio módulo do banco. O restante do
+    código de barras e a linha digitável são montados diretamente.
+
+    Se o NumPy estiver instalado os DVs do código de barras e da linha
+    digitável são calculados de uma vez com :mod:`pyboleto.vectorized`.
+
+    O resultado é idêntico ao de
+    :attr:`pyboleto.data.BoletoData.barcode` e
+    :attr:`pyboleto.data.BoletoData.linha_digitavel`.
+
+    :func:`reemite` gera a segunda via de vários boletos com novo vencimento
+    e valor.
+
+"""
+import copy
+import numbers
+
+from .bank import get_class_for_codigo
+from .checksum import DV_BARCODE, MODULO10
+from .data import VALOR_MAXIMO_CENTAVOS
+from .duedate import fator_vencimento
+
+try:
+    from . import vectorized
+except ImportError:
+    vectorized = None
+
+
+def _formata_linha(barcode, dv1, dv2, dv3):
+    return '%s.%s%d %s.%s%d %s.%s%d %s %s' % (
+        barcode[0:4] + barcode[19], barcode[20:24], dv1,
+        barcode[24:29], barcode[29:34], dv2,
+        barcode[34:39], barcode[39:44], dv3,
+        barcode[4], barcode[5:19])
+
+
+def linha_digitavel(barcode):
+    """Monta a linha digitável a partir de um código de barras de 44 dígitos
+
+    Mesmo resultado de :attr:`pyboleto.data.BoletoData.linha_digitavel`.
+    """
+    return _formata_linha(barcode,
+                          MODULO10(barcode[0:4] + barcode[19:24]),
+                          MODULO10(barcode[24:34]),
+                          MODULO10(barcode[34:44]))
+
+
+def _coluna(valores, tamanho, nome):
+    if not isinstance(valores, (list, tuple)):
+        return [valores] * tamanho
+    if len(valores) != tamanho:
+        raise ValueError("column %s must have %d values, got %d" % (
+            nome, tamanho, len(valores)))
+    return valores
+
+
+def reemite(boletos, data_vencimento, valor_documento=None, calendario=None,
+            **campos):
+    """Segunda via de vários boletos
+
+    Cada boleto é copiado com :meth:`pyboleto.data.BoletoData.copy`, que
+    reaproveita os valores já calculados que não dependem do vencimento nem
+    do valor. Os boletos originais não são alterados.
+
+    eg::
+
+        segundas_vias = reemite(vencidos, date(2012, 8, 10),
+                                [Decimal('30.12'), Decimal('12.50')],
+                                data_processamento=date(2012, 8, 1))
+
+    :param boletos: Sequência de :class:`pyboleto.data.BoletoData`.
+    :param data_vencimento: Novo vencimento, um para todos ou uma lista com
+        um por boleto.
+    :param valor_documento: Opcional. Novo valor, um para todos ou uma
+        lista com um por boleto.
+    :param calendario: Opcional. :class:`pyboleto.businessday.Calendario`
+        usado para levar os novos vencimentos para o próximo dia útil.
+    :param campos: Outros campos, iguais em todas as cópias.
+    :return: Lista com as cópias, na ordem de ``boletos``.
+    """
+    boletos = list(boletos)
+    tamanho = len(boletos)
+    vencimentos = _coluna(data_vencimento, tamanho, 'data_vencimento')
+    if calendario is not None:
+        vencimentos = calendario.proximos_dias_uteis(vencimentos)
+    if valor_documento is None:
+        return [boleto.copy(data_vencimento=vencimento, **campos)
+                for boleto, vencimento in zip(boletos, vencimentos)]
+    valores = _coluna(valor_documento, tamanho, 'valor_documento')
+    return [boleto.copy(data_vencimento=vencimento, valor_documento=valor,
+                        **campos)
+            for boleto, vencimento, valor in zip(boletos, vencimentos,
+                                                 valores)]
+
+
+class BoletoBatch(object):
+    """Lote de boletos armazenado em colunas
+
+    eg::
+
+        lote = BoletoBatch(
+            codigo_banco=['033', '033'],
+            agencia_cedente=['1333', '1333'],
+            conta_cedente=['0707077', '0707077'],
+            nosso_numero=['000000000123', '000000000124'],
+            data_vencimento=[date(2012, 7, 22), date(2012, 7, 23)],
+            valor_centavos=[295295, 100],
+            carteira=['102', '102'])
+        barcodes, linhas = lote.calcula()
+
+    Todas as colunas devem ter o mesmo tamanho.
+
+    :param valor_centavos: Valores dos documentos em centavos (``int``,
+        inclusive os inteiros do NumPy).
+    :param carteira: Opcional. Se omitida vale a carteira do protótipo.
+    :param colunas: Dicionário com colunas adicionais, atribuídas a cada
+        registro com o nome da chave (ex. ``codigo_beneficiario`` do Sicoob).
+    :param prototipos: Dicionário ``{codigo_banco: boleto}`` com a instância
+        usada como modelo para cada banco, já com os campos fixos do cedente
+        (ex. ``BoletoBB(7, 2)`` com o convênio). Os protótipos não são
+        alterados. Bancos sem protótipo usam
+        :func:`pyboleto.bank.get_class_for_codigo`.
+
+    """
+
+    def __init__(self, codigo_banco, agencia_cedente, conta_cedente,
+                 nosso_numero, data_vencimento, valor_centavos,
+                 carteira=None, colunas=None, prototipos=None):
+        self.codigo_banco = list(codigo_banco)
+        self.valor_centavos = list(valor_centavos)
+        self.data_vencimento = list(data_vencimento)
+
+        campos = [('agencia_cedente', agencia_cedente),
+                  ('conta_cedente', conta_cedente),
+                  ('nosso_numero', nosso_numero)]
+        if carteira is not None:
+            campos.append(('carteira', carteira))
+        campos.extend(sorted((colunas or {}).items()))
+        self.campos = [(nome, list(valores)) for nome, valores in campos]
+        self.prototipos = dict(prototipos or {})
+
+        tamanho = len(self.codigo_banco)
+        for nome, valores in [('valor_centavos', self.valor_centavos),
+                              ('data_vencimento', self.data_vencimento)
+                              ] + self.campos:
+            if len(valores) != tamanho:
+                raise ValueError(
+                    "column %s must have %d values, got %d" % (
+                        nome, tamanho, len(valores)))
+
+    def __len__(self):
+        return len(self.codigo_banco)
+
+    def _prototipo(self, codigo_banco):
+        try:
+            boleto = self.prototipos[codigo_banco]
+        except KeyError:
+            boleto = get_class_for_codigo(codigo_banco)()
+        return copy.copy(boleto)
+
+    def _campos_livres(self, codigo_banco, indices, resultado):
+        boleto = self._prototipo(codigo_banco)
+        classe = boleto.__class__.__name__
+        campos = self.campos
+        datas = self.data_vencimento
+        for i in indices:
+            for nome, valores in campos:
+                setattr(boleto, nome, valores[i])
+            # Alguns bancos usam o vencimento no campo livre
+            boleto.data_vencimento = datas[i]
+            campo_livre = boleto.campo_livre
+            if not isinstance(campo_livre, str):
+                raise TypeError(
+                    "record %d: %s.campo_livre must be a str, got %r "
+                    "(type %s)" % (i, classe, campo_livre,
+                                   type(campo_livre).__name__))
+            if len(campo_livre) != 25:
+                raise ValueError(
+                    "record %d: %s.campo_livre must have a length of 25, "
+                    "not %r (len: %d)" % (i, classe, campo_livre,
+                                          len(campo_livre)))
+            resultado[i] = boleto.codigo_banco + boleto.moeda, campo_livre
+
+    def _sem_dv(self):
+        """Códigos de barras sem o DV geral (43 dígitos), na ordem do lote"""
+        grupos = {}
+        for i, codigo in enumerate(self.codigo_banco):
+            grupos.setdefault(codigo, []).append(i)
+
+        prefixos = [None] * len(self)
+        for codigo, indices in grupos.items():
+            self._campos_livres(codigo, indices, prefixos)
+
+        nums = []
+        for i, ((prefixo, campo_livre), data, valor) in enumerate(zip(
+                prefixos, self.data_vencimento, self.valor_centavos)):
+            fator = fator_vencimento(data)
+            if (not isinstance(valor, numbers.Integral) or
+                    isinstance(valor, bool)):
+                raise TypeError(
+                    "record %d: valor_centavos must be an int, got %r "
+                    "(type %s)" % (i, valor, type(valor).__name__))
+            if not 0 <= valor <= VALOR_MAXIMO_CENTAVOS:
+                raise ValueError(
+                    "record %d: valor_centavos must be between 0 and %d, "
+                    "got %r" % (i, VALOR_MAXIMO_CENTAVOS, valor))
+            nums.append("%s%04d%010d%s" % (prefixo, fator, valor, campo_livre))
+        return nums
+
+    def _matriz(self):
+        return vectorized.insere_dv_barcode(
+            vectorized.digitos(self._sem_dv(), 43))
+
+    def barcodes(self):
+        """Lista com o código de barras de cada registro, na ordem do lote"""
+        if vectorized is not None:
+            return vectorized.texto(self._matriz())
+        return ["%s%s%s" % (num[:4], DV_BARCODE(num), num[4:])
+                for num in self._sem_dv()]
+
+    def calcula(self):
+        """Calcula códigos de barras e linhas digitáveis do lote
+
+        :return: Tupla ``(barcodes, linhas_digitaveis)``, na ordem do lote.
+        """
+        if vectorized is None:
+            barcodes = self.barcodes()
+            return barcodes, [linha_digitavel(b) for b in barcodes]
+
+        matriz = self._matriz()
+        barcodes = vectorized.texto(matriz)
+        dvs = vectorized.dvs_linha_digitavel(matriz).tolist()
+        return barcodes, [_formata_linha(b, *dv)
+                          for b, dv in zip(barcodes, dvs)]
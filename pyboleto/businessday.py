@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.businessday
+    ~~~~~~~~~~~~~~~~~~~~
+
+    Calendário de dias úteis bancários.
+
+    Um boleto que vence num sábado, domingo ou feriado bancário pode ser pago
+    sem encargos no dia útil seguinte. :class:`Calendario` responde em tempo
+    constante se uma data é dia útil, qual o próximo dia útil e quantos dias
+    úteis há entre duas datas: as respostas vêm de tabelas com um item por
+    dia, montadas no primeiro uso para todo o período do calendário.
+
+    Os feriados nacionais são os do calendário da Febraban
+    (:func:`feriados_nacionais`). Feriados estaduais e municipais são
+    informados ao criar o calendário, como datas avulsas, pares
+    ``(mes, dia)`` repetidos todo ano ou funções ``ano -> datas``.
+
+    eg::
+
+        sao_paulo = Calendario(feriados=[(1, 25), (7, 9)])
+        sao_paulo.proximo_dia_util(date(2025, 1, 25))   # 27/01/2025
+
+    Se as datas forem um array ``datetime64`` do NumPy as versões em lote
+    (:meth:`Calendario.proximos_dias_uteis` e
+    :meth:`Calendario.contagens_dias_uteis`) são vetorizadas e retornam
+    arrays.
+
+"""
+import datetime
+
+from .arrays import vetorizado
+
+ANO_INICIAL = 1997
+"""Primeiro ano das tabelas (ano da data base do fator de vencimento)"""
+
+ANO_FINAL = 2099
+"""Último ano das tabelas"""
+
+
+def pascoa(ano):
+    """Domingo de Páscoa de ``ano`` (calendário gregoriano)"""
+    a = ano % 19
+    b, c = divmod(ano, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa
+    m = (a + 11 * h + 22 * l) // 451
+    mes, dia = divmod(h + l - 7 * m + 114, 31)
+    return datetime.date(ano, mes, dia + 1)
+
+
+def feriados_nacionais(ano):
+    """Dias sem expediente bancário em todo o país
+
+    Confraternização Universal, segunda e terça de Carnaval, Sexta-feira
+    da Paixão, Tiradentes, Dia do Trabalho, Corpus Christi, Independência,
+    Nossa Senhora Aparecida, Finados, Proclamação da República, Consciência
+    Negra (a partir de 2024), Natal e 31 de dezembro, que não tem
+    expediente bancário ao público.
+
+    :rtype: ``list`` de :class:`datetime.date`, em ordem
+    """
+    domingo = pascoa(ano)
+    moveis = [domingo + datetime.timedelta(days=dias)
+              for dias in (-48, -47, -2, 60)]
+    fixos = [(1, 1), (4, 21), (5, 1), (9, 7), (10, 12), (11, 2), (11, 15),
+             (12, 25), (12, 31)]
+    if ano >= 2024:
+        fixos.append((11, 20))
+    return sorted(moveis + [datetime.date(ano, mes, dia)
+                            for mes, dia in fixos])
+
+
+class Calendario(object):
+    """Dias úteis bancários entre :data:`ANO_INICIAL` e :data:`ANO_FINAL`
+
+    :param feriados: Feriados além dos nacionais. Cada item pode ser uma
+        :class:`datetime.date`, um par ``(mes, dia)`` que se repete todo
+        ano ou uma função que recebe o ano e retorna as datas.
+    :param nacionais: Se ``False`` não inclui :func:`feriados_nacionais`.
+    :param inicio: Primeiro ano do calendário.
+    :param fim: Último ano do calendário.
+
+    Datas fora do período levantam ``ValueError``.
+
+    """
+
+    def __init__(self, feriados=(), nacionais=True, inicio=ANO_INICIAL,
+                 fim=ANO_FINAL):
+        if inicio > fim:
+            raise ValueError("inicio must not be after fim, got %r > %r" % (
+                inicio, fim))
+        self.feriados = tuple(feriados)
+        self.nacionais = nacionais
+        self.inicio = inicio
+        self.fim = fim
+        self._base = datetime.date(inicio, 1, 1).toordinal()
+        self._dias = datetime.date(fim, 12, 31).toordinal() - self._base + 1
+        self._tabelas = None
+        # Cópia das tabelas em arrays, usada por pyboleto.vectorized
+        self._arrays = None
+
+    def com_feriados(self, *feriados):
+        """Novo calendário com os feriados deste e mais ``feriados``"""
+        return self.__class__(self.feriados + feriados, self.nacionais,
+                              self.inicio, self.fim)
+
+    def datas_feriados(self, ano):
+        """Feriados de ``ano`` que caem em dias de semana, em ordem"""
+        datas = set(feriados_nacionais(ano)) if self.nacionais else set()
+        for feriado in self.feriados:
+            if isinstance(feriado, datetime.date):
+                if feriado.year == ano:
+                    datas.add(feriado)
+            elif callable(feriado):
+                datas.update(feriado(ano))
+            else:
+                mes, dia = feriado
+                datas.add(datetime.date(ano, mes, dia))
+        return sorted(data for data in datas if data.weekday() < 5)
+
+    def tabelas(self):
+        """Tabelas do calendário, montadas no primeiro uso
+
+        :return: Tupla ``(proximo, acumulado, uteis)``: para o dia ``i``
+            (dias desde 1º de janeiro de ``inicio``) ``proximo[i]`` é o
+            primeiro dia útil a partir de ``i`` e ``acumulado[i]`` quantos
+            dias úteis há antes de ``i``; ``uteis`` tem os dias úteis em
+            ordem. As listas têm um item a mais, para o dia seguinte ao
+            fim do calendário.
+        """
+        if self._tabelas is not None:
+            return self._tabelas
+        base, dias = self._base, self._dias
+        util = bytearray(b'\x01') * (dias + 1)
+        semana = datetime.date.fromordinal(base).weekday()
+        for fim_de_semana in (5, 6):
+            primeiro = (fim_de_semana - semana) % 7
+            util[primeiro:dias:7] = bytes(len(range(primeiro, dias, 7)))
+        for ano in range(self.inicio, self.fim + 1):
+            for data in self.datas_feriados(ano):
+                util[data.toordinal() - base] = 0
+        # O dia seguinte ao fim conta como útil, para fechar as tabelas
+        util[dias] = 1
+
+        uteis = [i for i in range(dias + 1) if util[i]]
+        acumulado = []
+        proximo = []
+        contagem = 0
+        for i in range(dias + 1):
+            acumulado.append(contagem)
+            proximo.append(uteis[contagem])
+            contagem += util[i]
+        self._tabelas = proximo, acumulado, uteis
+        return self._tabelas
+
+    def _indice(self, data):
+        i = data.toordinal() - self._base
+        if not 0 <= i < self._dias:
+            raise ValueError("%s is outside the calendar (%d to %d)" % (
+                data, self.inicio, self.fim))
+        return i
+
+    def dia_util(self, data):
+        """``True`` se ``data`` for dia útil"""
+        i = self._indice(data)
+        return self.tabelas()[0][i] == i
+
+    def proximo_dia_util(self, data):
+        """``data``, se for dia útil, ou o primeiro dia útil depois dela
+
+        O dia seguinte ao fim do calendário é considerado útil.
+        """
+        i = self._indice(data)
+        return datetime.date.fromordinal(self.tabelas()[0][i] + self._base)
+
+    def dias_uteis(self, inicio, fim):
+        """Dias úteis depois de ``inicio`` até ``fim``, inclusive
+
+        Negativo se ``fim`` for anterior a ``inicio``.
+        """
+        acumulado = self.tabelas()[1]
+        return (acumulado[self._indice(fim) + 1] -
+                acumulado[self._indice(inicio) + 1])
+
+    def soma_dias_uteis(self, data, dias):
+        """Data ``dias`` dias úteis depois de ``data``
+
+        Com ``dias = 0`` é o próprio :meth:`proximo_dia_util`.
+
+        :exception ValueError: Se o resultado passar do fim do calendário.
+        """
+        i = self._indice(data)
+        acumulado, uteis = self.tabelas()[1:]
+        if dias > 0:
+            j = acumulado[i + 1] + dias - 1
+        else:
+            j = acumulado[i] + dias
+        if not 0 <= j < len(uteis) - 1:
+            raise ValueError("%d business days from %s is outside the "
+                             "calendar" % (dias, data))
+        return datetime.date.fromordinal(uteis[j] + self._base)
+
+    def proximos_dias_uteis(self, datas):
+        """:meth:`proximo_dia_util` de cada data
+
+        Se ``datas`` for um array ``datetime64`` o resultado é um array
+        ``datetime64[D]`` (:func:`pyboleto.vectorized.proximos_dias_uteis`).
+        """
+        vectorized = vetorizado(datas)
+        if vectorized is not None:
+            return vectorized.proximos_dias_uteis(self, datas)
+        proximo = self.tabelas()[0]
+        base, dias = self._base, self._dias
+        fromordinal = datetime.date.fromordinal
+        resultado = []
+        for data in datas:
+            i = data.toordinal() - base
+            if not 0 <= i < dias:
+                self._indice(data)
+            j = proximo[i]
+            # Dia útil: a própria data, sem criar outra
+            resultado.append(data if j == i else fromordinal(j + base))
+        return resultado
+
+    def contagens_dias_uteis(self, inicios, fim):
+        """:meth:`dias_uteis` de cada data de ``inicios`` até ``fim``
+
+        Se ``inicios`` for um array ``datetime64`` o resultado é um array
+        ``int64`` (:func:`pyboleto.vectorized.contagens_dias_uteis`).
+        """
+        vectorized = vetorizado(inicios)
+        if vectorized is not None:
+            return vectorized.contagens_dias_uteis(self, inicios, fim)
+        acumulado = self.tabelas()[1]
+        final = acumulado[self._indice(fim) + 1]
+        indice = self._indice
+        return [final - acumulado[indice(data) + 1] for data in inicios]
+
+    def __repr__(self):
+        return '%s(feriados=%r, nacionais=%r, inicio=%r, fim=%r)' % (
+            self.__class__.__name__, self.feriados, self.nacionais,
+            self.inicio, self.fim)
+
+
+NACIONAL = Calendario()
+"""Calendário só com os feriados nacionais"""
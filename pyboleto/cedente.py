@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.cedente
+    ~~~~~~~~~~~~~~~~
+
+    Perfis de cedente para emitir muitos boletos da mesma conta.
+
+    Os dados da conta (agência, conta, convênio, carteira, nome e endereço
+    do cedente, ...) são iguais em todos os boletos de um cedente. Um
+    :class:`CedenteProfile` confere e formata esses dados uma única vez e
+    calcula os valores derivados da conta, listados em
+    :attr:`pyboleto.data.BoletoData.derivados_cedente` (DVs de agência e
+    conta, ``agencia_conta_cedente``, ``codigo_dv_banco``, ...). Os boletos
+    criados pelo perfil não passam pelo construtor da classe: recebem o
+    estado já pronto do perfil e só os campos variáveis são atribuídos.
+
+    eg::
+
+        perfil = CedenteProfile(BoletoItau, carteira='109',
+                                agencia_cedente='0293',
+                                conta_cedente='01328',
+                                cedente='Empresa Ltda')
+        boleto = perfil.boleto(nosso_numero='157',
+                               data_vencimento=date(2012, 7, 22),
+                               valor_documento=Decimal('2952.95'))
+
+"""
+import copy
+
+from .data import BoletoException, _slots
+from .layout import Campo
+
+CAMPOS_VARIAVEIS = frozenset([
+    'nosso_numero', 'numero_documento', 'data_documento',
+    'data_processamento', 'data_vencimento', 'valor', 'valor_centavos',
+    'valor_documento', 'valor_documento_centavos', 'quantidade',
+    'sacado', 'sacado_nome', 'sacado_documento', 'sacado_cidade',
+    'sacado_uf', 'sacado_endereco', 'sacado_bairro', 'sacado_cep',
+    'instrucoes', 'demonstrativo',
+])
+"""Campos de cada boleto, que não alteram os valores derivados da conta"""
+
+
+class CedenteProfile(object):
+    """Dados fixos de uma conta de cedente
+
+    :param boleto: Classe do banco ou um boleto já configurado (ex.
+        ``BoletoBB(7, 2)``), usado como modelo. O boleto não é alterado.
+    :param campos: Dados da conta atribuídos ao modelo.
+    :exception BoletoException: Se algum dos ``campos`` não couber no campo
+        livre do banco.
+
+    .. attribute:: prototipo
+
+        Boleto modelo, já com os dados da conta. Não deve ser alterado.
+
+    """
+
+    def __init__(self, boleto, **campos):
+        if isinstance(boleto, type):
+            boleto = boleto()
+        else:
+            boleto = copy.copy(boleto)
+        for nome, valor in campos.items():
+            setattr(boleto, nome, valor)
+        self.campos = campos
+        self.classe = type(boleto)
+
+        erros = self._confere(boleto)
+        if erros:
+            raise BoletoException('%s: %s' % (self.classe.__name__,
+                                              '; '.join(erros)))
+
+        self.derivados = {nome: getattr(boleto, nome)
+                          for nome in boleto.derivados_cedente}
+        boleto._cache.clear()
+        self.prototipo = boleto
+        # Mesmo estado do __getstate__, com os setters dos slots já
+        # resolvidos
+        self._slots = []
+        for slot in _slots(self.classe):
+            try:
+                self._slots.append((slot.__set__, slot.__get__(boleto)))
+            except AttributeError:
+                pass
+        self._atributos = dict(boleto.__dict__)
+
+    def _confere(self, boleto):
+        layout = boleto.layout
+        if layout is None:
+            return []
+        erros = []
+        for item in layout.itens:
+            # Só os campos informados no perfil, os outros dependem dos
+            # campos variáveis e são conferidos em cada boleto
+            if not isinstance(item, Campo) or \
+                    not isinstance(item.atributo, str) or \
+                    item.atributo not in self.campos:
+                continue
+            try:
+                item.ajusta(getattr(boleto, item.atributo))
+            except ValueError as erro:
+                erros.append(str(erro))
+        return erros
+
+    def boleto(self, **campos):
+        """Cria um boleto da conta com os campos variáveis
+
+        Os valores derivados da conta já vêm calculados, a menos que
+        ``campos`` altere algum dado da conta (qualquer campo fora de
+        :data:`CAMPOS_VARIAVEIS`). Alterar o boleto depois de criado
+        descarta esses valores, como acontece com qualquer boleto.
+
+        :param campos: Campos do boleto, atribuídos na ordem em que são
+            passados.
+        """
+        classe = self.classe
+        boleto = classe.__new__(classe)
+        object.__setattr__(boleto, '_cache', {})
+        for setter, valor in self._slots:
+            setter(boleto, valor)
+        boleto.__dict__.update(self._atributos)
+        # As listas não podem ser compartilhadas entre os boletos
+        object.__setattr__(boleto, '_demonstrativo',
+                           list(boleto._demonstrativo))
+        object.__setattr__(boleto, '_instrucoes', list(boleto._instrucoes))
+        if boleto._sacado is not None:
+            object.__setattr__(boleto, '_sacado', list(boleto._sacado))
+        for nome, valor in campos.items():
+            setattr(boleto, nome, valor)
+        if CAMPOS_VARIAVEIS.issuperset(campos):
+            boleto._cache.update(self.derivados)
+        return boleto
+
+    def __repr__(self):
+        return '%s(%s, %s)' % (
+            self.__class__.__name__, self.classe.__name__,
+            ', '.join('%s=%r' % item for item in sorted(self.campos.items())))
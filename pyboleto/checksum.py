@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.checksum
+    ~~~~~~~~~~~~~~~~~
+
+    Cálculo de dígitos verificadores por soma ponderada.
+
+    Todos os DVs usados nos boletos (módulo 10, módulo 11 e as variações de
+    cada banco) são somas ponderadas dos dígitos, lidas da direita para a
+    esquerda, seguidas de uma regra aplicada ao resto da divisão. A classe
+    :class:`Checksum` recebe esses três parâmetros e pré-calcula uma tabela
+    com o produto de cada dígito por cada peso, de forma que o cálculo do DV
+    é apenas uma soma de consultas em tabela.
+
+"""
+from operator import getitem
+
+DIGITOS = '0123456789'
+
+
+class Checksum(object):
+    """Soma ponderada de dígitos com tabelas pré-calculadas
+
+    eg::
+
+        >>> resto11 = Checksum(range(2, 10), 11)
+        >>> resto11('0019373700000001000500940144816060680935031')
+        8
+
+    :param pesos: Ciclo de pesos aplicado a partir do dígito mais à direita.
+    :param modulo: Divisor aplicado à soma.
+    :param regra: Sequência indexada pelo resto da divisão que contém o DV
+        correspondente. Se for ``None`` o próprio resto é retornado.
+    :param soma_digitos: Se ``True`` os produtos maiores que 9 são
+        substituídos pela soma dos seus dígitos, como no módulo 10.
+    :param caracteres: Caracteres aceitos. O valor de cada um é o código
+        ASCII menos o de ``'0'`` (``'A'`` vale 17), a regra do CNPJ
+        alfanumérico. Padrão: só dígitos.
+
+    """
+
+    def __init__(self, pesos, modulo, regra=None, soma_digitos=False,
+                 caracteres=DIGITOS):
+        self.pesos = tuple(pesos)
+        self.modulo = modulo
+        self.regra = tuple(regra) if regra is not None else None
+        self.soma_digitos = soma_digitos
+        self.caracteres = caracteres
+
+        tabelas = {}
+        for peso in set(self.pesos):
+            tabela = [None] * 256
+            for caractere in caracteres:
+                produto = (ord(caractere) - ord('0')) * peso
+                if soma_digitos and produto > 9:
+                    produto = produto // 10 + produto % 10
+                tabela[ord(caractere)] = produto
+            tabelas[peso] = tabela
+        self._tabelas = tabelas
+        # Tabela a ser usada em cada posição, a partir da direita
+        self._posicoes = []
+        self._estende(48)
+
+    def _estende(self, tamanho):
+        pesos = self.pesos
+        posicoes = self._posicoes
+        for i in range(len(posicoes), tamanho):
+            posicoes.append(self._tabelas[pesos[i % len(pesos)]])
+
+    def posicoes(self, largura):
+        """Tabelas de cada posição de um número com ``largura`` caracteres
+
+        Da esquerda para a direita: ``sum(map(getitem, posicoes, codigos))``
+        é a :meth:`soma` dos códigos ASCII ``codigos`` do número, sem as
+        conferências de tipo. Se ``codigos`` for maior que ``largura`` só os
+        primeiros ``largura`` entram na soma. Caracteres inválidos levantam
+        ``TypeError``.
+        """
+        if largura > len(self._posicoes):
+            self._estende(largura)
+        return self._posicoes[largura - 1::-1] if largura else []
+
+    def soma(self, num):
+        """Soma ponderada dos dígitos de ``num``
+
+        :param num: String contendo apenas dígitos (ou os ``caracteres``
+            do checksum).
+        :exception TypeError: Se ``num`` não for uma string.
+        :exception ValueError: Se ``num`` contiver algo além de dígitos.
+        """
+        if not isinstance(num, str):
+            raise TypeError("num must be a str, got %r" % (num, ))
+        try:
+            codigos = num.encode('ascii')
+        except UnicodeEncodeError:
+            codigos = None
+        if codigos is not None:
+            if len(codigos) > len(self._posicoes):
+                self._estende(len(codigos))
+            try:
+                return sum(map(getitem, self._posicoes, reversed(codigos)))
+            except TypeError:
+                pass
+        if self.caracteres == DIGITOS:
+            raise ValueError("num must contain only digits, got %r" % (
+                num, ))
+        raise ValueError("num must contain only %s, got %r" % (
+            self.caracteres, num))
+
+    def resto(self, num):
+        """Resto da divisão da soma ponderada pelo módulo"""
+        return self.soma(num) % self.modulo
+
+    def __call__(self, num):
+        """Calcula o DV de ``num`` aplicando a regra ao resto"""
+        resto = self.soma(num) % self.modulo
+        if self.regra is None:
+            return resto
+        return self.regra[resto]
+
+    def __repr__(self):
+        return '%s(pesos=%r, modulo=%r)' % (
+            self.__class__.__name__, self.pesos, self.modulo)
+
+
+def _regra_modulo10():
+    return [0] + [10 - resto for resto in range(1, 10)]
+
+
+def _regra_modulo11():
+    regra = []
+    for resto in range(11):
+        digito = (resto * 10) % 11
+        regra.append(0 if digito == 10 else digito)
+    return regra
+
+
+MODULO10 = Checksum((2, 1), 10, _regra_modulo10(), soma_digitos=True)
+"""Módulo 10 da FEBRABAN, usado na linha digitável"""
+
+DV_BARCODE = Checksum(
+    range(2, 10), 11,
+    [1 if resto in (0, 1, 10) else 11 - resto for resto in range(11)])
+"""DV geral do código de barras (posição 5)"""
+
+_MODULO11 = {}
+
+
+def modulo11(base=9, r=0):
+    """Retorna o :class:`Checksum` de módulo 11 equivalente a
+    :meth:`pyboleto.data.BoletoData.modulo11`
+
+    :param base: Maior peso do ciclo, que começa em 2.
+    :param r: ``0`` para o DV (soma * 10 % 11, com 10 virando 0) ou ``1``
+        para retornar o resto da divisão por 11.
+    """
+    try:
+        return _MODULO11[base, r]
+    except KeyError:
+        pass
+    if r == 0:
+        regra = _regra_modulo11()
+    elif r == 1:
+        regra = None
+    else:
+        raise ValueError("r must be 0 or 1, got %r" % (r, ))
+    checksum = _MODULO11[base, r] = Checksum(range(2, base + 1), 11, regra)
+    return checksum
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.codigobarras
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    Geometria do código de barras Interleaved 2 of 5 dos boletos.
+
+    As larguras saem direto da quantidade de dígitos, sem gerar o código
+    com uma largura de teste para depois ajustá-la. Com barras e espaços
+    largos de :data:`RAZAO` estreitas, cada dígito tem dois elementos
+    largos e três estreitos (9 estreitas), o início tem 4 e o fim 5: os 44
+    dígitos do boleto ocupam 405 estreitas, e a estreita mede
+    ``103 mm / 405``.
+
+    Os elementos de cada um dos 100 pares de dígitos ficam em uma tabela
+    (:data:`PARES`) montada na importação. A mesma tabela é usada no PDF
+    (:func:`operadores_pdf`, por :class:`pyboleto.pdf.BoletoPDF` e
+    :class:`pyboleto.pdfdireto.BoletoPDFDireto`) e no HTML, onde
+    :class:`pyboleto.html.BoletoHTML` monta os ``span`` de cada par uma
+    única vez.
+
+"""
+
+COMPRIMENTO = 103.0
+"""Comprimento do código de barras do boleto, em milímetros"""
+
+ALTURA = 13.0
+"""Altura do código de barras do boleto, em milímetros"""
+
+ESTREITA_MINIMA = 0.25
+"""Largura mínima da barra estreita, em milímetros"""
+
+RAZAO = 3
+"""Largura de uma barra ou espaço largo, em estreitas"""
+
+PADROES = ('nnwwn', 'wnnnw', 'nwnnw', 'wwnnn', 'nnwnw',
+           'wnwnn', 'nwwnn', 'nnnww', 'wnnwn', 'nwnwn')
+"""Elementos de cada dígito: ``n`` estreito, ``w`` largo"""
+
+INICIO = (1, 1, 1, 1)
+"""Larguras do início: barra, espaço, barra e espaço estreitos"""
+
+FIM = (RAZAO, 1, 1)
+"""Larguras do fim: barra larga, espaço e barra estreitos"""
+
+
+def _par(par):
+    # As barras são do primeiro dígito e os espaços do segundo
+    larguras = []
+    for barra, espaco in zip(PADROES[par // 10], PADROES[par % 10]):
+        larguras.append(RAZAO if barra == 'w' else 1)
+        larguras.append(RAZAO if espaco == 'w' else 1)
+    return tuple(larguras)
+
+
+PARES = tuple(_par(par) for par in range(100))
+"""Larguras, em estreitas, dos 10 elementos de cada par de dígitos,
+alternando barra e espaço"""
+
+# Estreitas ocupadas por um par: dois elementos largos em cada dígito
+_ESTREITAS_PAR = 2 * (2 * RAZAO + 3)
+
+
+def _barras(larguras):
+    # (início, largura) de cada barra, a partir do início do par
+    barras = []
+    x = 0
+    for i, largura in enumerate(larguras):
+        if i % 2 == 0:
+            barras.append((x, largura))
+        x += largura
+    return tuple(barras)
+
+
+_BARRAS = tuple(_barras(larguras) for larguras in PARES)
+
+# Retângulos de um par em uma posição, já como operadores do PDF; a chave é
+# (posição, par). Com os 44 dígitos do boleto são no máximo 22 * 100.
+_RETANGULOS = {}
+
+
+def pares(codigo):
+    """Pares de dígitos do código, como índices de :data:`PARES`
+
+    :param codigo: Dígitos do código; um ``0`` é incluído à esquerda se a
+        quantidade for ímpar.
+    :return: Lista de inteiros de 0 a 99.
+    """
+    if len(codigo) % 2:
+        codigo = '0' + codigo
+    return [int(codigo[i:i + 2]) for i in range(0, len(codigo), 2)]
+
+
+def estreitas(codigo):
+    """Comprimento do código em larguras da barra estreita
+
+    :param codigo: Dígitos do código; um ``0`` é incluído à esquerda se a
+        quantidade for ímpar.
+    """
+    return sum(INICIO) + sum(FIM) + _ESTREITAS_PAR * ((len(codigo) + 1) // 2)
+
+
+def largura_estreita(codigo, comprimento=COMPRIMENTO):
+    """Largura da barra estreita para o código ter ``comprimento``
+
+    :param codigo: Dígitos do código.
+    :param comprimento: Comprimento do código, em milímetros.
+    :return: Largura da barra estreita, em milímetros.
+    :exception ValueError: Se a barra estreita ficar menor que
+        :data:`ESTREITA_MINIMA`.
+    """
+    estreita = float(comprimento) / estreitas(codigo)
+    if estreita < ESTREITA_MINIMA:
+        raise ValueError(
+            'Narrow bar of %.3f mm is below the minimum of %.2f mm' % (
+                estreita, ESTREITA_MINIMA))
+    return estreita
+
+
+def elementos(codigo):
+    """Larguras de todos os elementos do código, em estreitas
+
+    Alternam barra e espaço, começando e terminando por uma barra.
+
+    :param codigo: Dígitos do código; um ``0`` é incluído à esquerda se a
+        quantidade for ímpar.
+    :return: Lista de inteiros, ``1`` ou :data:`RAZAO`.
+    """
+    resultado = list(INICIO)
+    for par in pares(codigo):
+        resultado.extend(PARES[par])
+    resultado.extend(FIM)
+    return resultado
+
+
+def operadores_pdf(codigo):
+    """Barras do código como um único caminho do PDF, preenchido com ``f``
+
+    Um retângulo ``re`` por barra, em larguras da barra estreita e com
+    altura 1: quem desenha ajusta a escala e a posição antes, com ``cm``.
+
+    eg::
+
+        canvas.saveState()
+        canvas.transform(largura_estreita(codigo) * mm, 0, 0,
+                         ALTURA * mm, x, y)
+        canvas.addLiteral(operadores_pdf(codigo))
+        canvas.restoreState()
+
+    :param codigo: Dígitos do código; um ``0`` é incluído à esquerda se a
+        quantidade for ímpar.
+    :return: ``str`` com os operadores.
+    """
+    partes = ['0 0 1 1 re\n2 0 1 1 re\n']
+    x = sum(INICIO)
+    for par in pares(codigo):
+        retangulos = _RETANGULOS.get((x, par))
+        if retangulos is None:
+            retangulos = _RETANGULOS[x, par] = ''.join(
+                '%d 0 %d 1 re\n' % (x + inicio, largura)
+                for inicio, largura in _BARRAS[par])
+        partes.append(retangulos)
+        x += _ESTREITAS_PAR
+    partes.append('%d 0 %d 1 re\n%d 0 1 1 re\nf' % (x, RAZAO, x + RAZAO + 1))
+    return ''.join(partes)
@@ -11,14 +11,150 @@
 
 """
 import datetime
-from decimal import Decimal
+import functools
+import operator
+from decimal import ROUND_HALF_UP, Decimal
+
+from .checksum import DV_BARCODE, MODULO10, modulo11
+from .duedate import fator_vencimento
 
 
 class BoletoException(Exception):
     pass
 
 
-_EPOCH = datetime.date(1997, 10, 7)
+VALOR_MAXIMO_CENTAVOS = 9999999999
+"""Maior valor que cabe nas 10 posições do código de barras"""
+
+CAMPOS_REEMISSAO = frozenset([
+    'data_vencimento', 'data_processamento', 'valor', 'valor_centavos',
+    'valor_documento', 'valor_documento_centavos', 'instrucoes',
+    'demonstrativo', 'quantidade',
+])
+"""Campos alterados na segunda via, veja :meth:`BoletoData.copy`"""
+
+LINHAS_INSTRUCOES = 7
+"""Máximo de linhas de :attr:`BoletoData.instrucoes`"""
+
+LINHAS_DEMONSTRATIVO = 12
+"""Máximo de linhas de :attr:`BoletoData.demonstrativo`"""
+
+LINHAS_SACADO = 3
+"""Máximo de linhas de :attr:`BoletoData.sacado`"""
+
+TAMANHO_LINHA = 90
+"""Máximo de caracteres por linha das instruções e do demonstrativo"""
+
+TAMANHO_ENDERECO = 80
+"""Máximo de caracteres de :attr:`BoletoData.cedente_endereco`"""
+
+_CENTAVO = Decimal('0.01')
+
+_SLOTS_CACHE = {}
+
+_COPIADORES_CACHE = {}
+
+
+def _valor_para_str(valor):
+    # Os valores são guardados como Decimal ou como centavos (int)
+    if valor is None:
+        return None
+    if type(valor) is int:
+        sinal = '-' if valor < 0 else ''
+        return '%s%d.%02d' % ((sinal, ) + divmod(abs(valor), 100))
+    # Mesmo arredondamento de _converte_valor no modo em centavos, sem
+    # passar por float
+    return str(valor.quantize(_CENTAVO, ROUND_HALF_UP))
+
+
+def _valor_para_centavos(valor):
+    if valor is None or type(valor) is int:
+        return valor
+    return int(valor.quantize(_CENTAVO, ROUND_HALF_UP).scaleb(2))
+
+
+def formata_centavos(centavos):
+    """Formata um valor em centavos para exibição, como no locale pt_BR
+
+    eg::
+
+        >>> formata_centavos(295295)
+        '2.952,95'
+
+    """
+    sinal = '-' if centavos < 0 else ''
+    reais, centavos = divmod(abs(centavos), 100)
+    return '%s%s,%02d' % (sinal, '{:,}'.format(reais).replace(',', '.'),
+                          centavos)
+
+
+def _erro_linhas(linhas, maximo, descricao):
+    """Mensagem de erro das instruções ou do demonstrativo, ou ``None``"""
+    if len(linhas) > maximo:
+        return 'Número de linhas de %s maior que %d' % (descricao, maximo)
+    for line in linhas:
+        if len(line) > TAMANHO_LINHA:
+            return 'Linha de %s possui mais que %d caracteres' % (
+                descricao, TAMANHO_LINHA)
+    return None
+
+
+def _slots(cls):
+    """Retorna os descriptors de todos os slots de ``cls`` na ordem do MRO"""
+    try:
+        return _SLOTS_CACHE[cls]
+    except KeyError:
+        pass
+    slots = []
+    for klass in reversed(cls.__mro__):
+        for name in klass.__dict__.get('__slots__', ()):
+            if name not in ('__dict__', '__weakref__', '_cache'):
+                slots.append(klass.__dict__[name])
+    slots = _SLOTS_CACHE[cls] = tuple(slots)
+    return slots
+
+
+def _copiadores(cls):
+    """Lê todos os slots de uma vez e os setters de cada slot de ``cls``"""
+    try:
+        return _COPIADORES_CACHE[cls]
+    except KeyError:
+        pass
+    slots = _slots(cls)
+    copiadores = _COPIADORES_CACHE[cls] = (
+        operator.attrgetter(*[slot.__name__ for slot in slots]),
+        tuple([slot.__set__ for slot in slots]))
+    return copiadores
+
+
+def memoized(func):
+    """Guarda o resultado de um método sem argumentos no cache do boleto
+
+    O cache é descartado sempre que qualquer atributo do boleto é alterado,
+    veja :meth:`BoletoData.__setattr__`. Exceções não são guardadas.
+
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        cache = self._cache
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = func(self)
+            return value
+    return wrapper
+
+
+def memoized_property(func):
+    """Como ``property``, mas o valor é calculado uma vez por boleto
+
+    Usado pelos campos derivados (``campo_livre``, ``barcode``, DVs, ...)
+    que os renderizadores leem várias vezes.
+
+    """
+    return property(memoized(func), doc=func.__doc__)
 
 
 class CustomProperty(object):
@@ -35,6 +171,9 @@ class CustomProperty(object):
     ao entrar valores no pyboleto. De preferência o pyboleto vai calcular
     todos os DVs quando necessário.
 
+    O valor é guardado no ``__dict__`` do próprio boleto, portanto é liberado
+    junto com ele.
+
     :param name: O nome da propriedade.
     :type name: string
     :param length: Tamanho para preencher com '0' na frente.
@@ -44,7 +183,7 @@ class CustomProperty(object):
     def __init__(self, name, length):
         self.name = name
         self.length = length
-        self._instance_state = {}
+        self.default = '0' * length
 
     def __set__(self, instance, value):
         if instance is None:
@@ -55,12 +194,15 @@ class CustomProperty(object):
             value = '-'.join(values)
         else:
             value = value.zfill(self.length)
-        self._instance_state[instance] = value
+        # O valor fica no próprio boleto. Como este descriptor define
+        # __set__ ele tem precedência sobre o __dict__ da instância, então
+        # podemos usar a mesma chave sem conflito.
+        instance.__dict__[self.name] = value
 
     def __get__(self, instance, class_):
         if instance is None:
             return self
-        return self._instance_state.get(instance, '0' * self.length)
+        return instance.__dict__.get(self.name, self.default)
 
 
 class BoletoData(object):
@@ -126,7 +268,24 @@ class BoletoData(object):
 
     """
 
+    # Os campos comuns a todos os bancos ficam em slots. O ``__dict__`` é
+    # mantido para os campos de :class:`CustomProperty` e para atributos
+    # específicos de cada banco.
+    __slots__ = (
+        'aceite', 'carteira', 'cedente', 'cedente_cidade', 'cedente_uf',
+        'cedente_logradouro', 'cedente_bairro', 'cedente_cep',
+        'cedente_documento', 'codigo_banco', 'data_documento',
+        'data_processamento', 'data_vencimento', 'especie',
+        'especie_documento', 'local_pagamento', 'logo_image', 'moeda',
+        'numero_documento', 'quantidade', 'sacado_nome', 'sacado_documento',
+        'sacado_cidade', 'sacado_uf', 'sacado_endereco', 'sacado_bairro',
+        'sacado_cep', 'label_cedente', '_cedente_endereco', '_demonstrativo',
+        '_instrucoes', '_sacado', '_valor', '_valor_documento', '_cache',
+        '__dict__', '__weakref__',
+    )
+
     def __init__(self, **kwargs):
+        object.__setattr__(self, '_cache', {})
         #        otherwise the printed value might diffent from the value in
         #        the barcode.
         self.aceite = kwargs.pop('aceite', "N")
@@ -170,7 +329,55 @@ class BoletoData(object):
         self._valor_documento = None
         self.label_cedente = 'Agência/Código beneficiário'
 
-    @property
+    def __getstate__(self):
+        """Estado compacto usado pelo :mod:`pickle` e pelo :mod:`copy`
+
+        Os slots são serializados como uma tupla na ordem em que são
+        declarados, sem repetir o nome de cada campo. Os campos de
+        :class:`CustomProperty` e os atributos específicos de cada banco vão
+        no ``__dict__``. O formato serve para enviar boletos entre processos
+        da mesma versão do pyboleto, não para armazenamento permanente.
+
+        """
+        slots = _slots(type(self))
+        try:
+            values = tuple([slot.__get__(self) for slot in slots])
+        except AttributeError:
+            # Algum slot não foi preenchido, usa o formato com nomes
+            values = {}
+            for slot in slots:
+                try:
+                    values[slot.__name__] = slot.__get__(self)
+                except AttributeError:
+                    pass
+        return values, self.__dict__ or None
+
+    def __setstate__(self, state):
+        values, attrs = state
+        slots = _slots(type(self))
+        if isinstance(values, dict):
+            for slot in slots:
+                if slot.__name__ in values:
+                    slot.__set__(self, values[slot.__name__])
+        else:
+            for slot, value in zip(slots, values):
+                slot.__set__(self, value)
+        if attrs:
+            self.__dict__.update(attrs)
+        object.__setattr__(self, '_cache', {})
+
+    def __setattr__(self, name, value):
+        """Descarta os campos derivados sempre que um atributo muda"""
+        object.__setattr__(self, name, value)
+        if self._cache:
+            self._cache.clear()
+
+    def __delattr__(self, name):
+        object.__delattr__(self, name)
+        if self._cache:
+            self._cache.clear()
+
+    @memoized_property
     def barcode(self):
         """Essa função sempre é a mesma para todos os bancos. Então basta
         implementar o método :func:`barcode` para o pyboleto calcular a linha
@@ -211,21 +418,16 @@ class BoletoData(object):
                      value,
                      len(value)))
 
-        due_date_days = (self.data_vencimento - _EPOCH).days
-
-        if due_date_days < 0:
-            raise TypeError("Invalid date, must be between 1997/07/01 and now")  # noqa
-
-        # the due_date_days reset to 1000 after 9999
-        if due_date_days > 9999:
-            minimal_limit = 999
-
-            due_date_days = int(minimal_limit + (due_date_days - minimal_limit) % (9999 - minimal_limit))  # noqa
+        centavos = self.valor_documento_centavos
+        if not 0 <= centavos <= VALOR_MAXIMO_CENTAVOS:
+            raise BoletoException(
+                '%s.valor_documento must be between 0.00 and 99999999.99, '
+                'got %s' % (self.__class__.__name__, self.valor_documento))
 
         num = "%s%1s%04d%010d%24s" % (self.codigo_banco,
                                       self.moeda,
-                                      due_date_days,
-                                      Decimal(self.valor_documento) * 100,
+                                      fator_vencimento(self.data_vencimento),
+                                      centavos,
                                       self.campo_livre)
         dv = self.calculate_dv_barcode(num)
 
@@ -236,16 +438,42 @@ class BoletoData(object):
                 len(barcode))
         return barcode
 
-    @property
+    layout = None
+    """:class:`pyboleto.layout.Layout` do campo livre
+
+    Definido por cada banco, como atributo da classe ou como propriedade
+    quando o layout depende da carteira.
+    """
+
+    @memoized_property
+    def campos_campo_livre(self):
+        """Valores de cada campo do :attr:`layout`, indexados pelo nome
+
+        Os DVs calculados para o campo livre ficam aqui e são reaproveitados
+        pelas propriedades do banco que os exibem.
+        """
+        if self.layout is None:
+            raise NotImplementedError(
+                'This method has not been implemented by this class'
+            )
+        return self.layout.valores(self)
+
+    @memoized_property
     def campo_livre(self):
-        """Must be overriden by child class property
+        """Campo livre montado com o :attr:`layout` do banco
 
-        :exception NotImplementedError: Needs to be implemented by derived
-            class
+        :exception NotImplementedError: Se a classe não definir um layout
+            nem sobrescrever esta propriedade.
         """
-        raise NotImplementedError(
-            'This method has not been implemented by this class'
-        )
+        layout = self.layout
+        if layout is None:
+            raise NotImplementedError(
+                'This method has not been implemented by this class'
+            )
+        valores = self._cache.get('campos_campo_livre')
+        if valores is None:
+            return layout.formata(self)
+        return layout.junta(valores)
 
     def calculate_dv_barcode(self, line):
         """Calcula DV para código de barras
@@ -255,12 +483,7 @@ class BoletoData(object):
         é implementado pela classe derivada.
 
         """
-        resto2 = self.modulo11(line, 9, 1)
-        if resto2 in [0, 1, 10]:
-            dv = 1
-        else:
-            dv = 11 - resto2
-        return dv
+        return DV_BARCODE(line)
 
     def format_nosso_numero(self):
         """
@@ -294,32 +517,72 @@ class BoletoData(object):
 
     def _cedente_endereco_get(self):
         if self._cedente_endereco is None:
-            self._cedente_endereco = '%s - %s - %s - %s - %s' % (
+            endereco = '%s - %s - %s - %s - %s' % (
                 self.cedente_logradouro,
                 self.cedente_bairro,
                 self.cedente_cidade,
                 self.cedente_uf,
                 self.cedente_cep
             )
+            # Valor derivado, não deve descartar o cache dos outros campos
+            object.__setattr__(self, '_cedente_endereco', endereco)
         return self._cedente_endereco
 
     def _cedente_endereco_set(self, endereco):
-        if len(endereco) > 80:
+        if len(endereco) > TAMANHO_ENDERECO:
             raise BoletoException(
-                'Linha de endereço possui mais que 80 caracteres')
+                'Linha de endereço possui mais que %d caracteres' %
+                TAMANHO_ENDERECO)
         self._cedente_endereco = endereco
     cedente_endereco = property(_cedente_endereco_get, _cedente_endereco_set)
     """Endereço do Cedente com no máximo 80 caracteres"""
 
+    valor_em_centavos = False
+    """Guarda ``valor`` e ``valor_documento`` como inteiros em centavos
+
+    Por padrão os valores são guardados como :class:`Decimal`. Com
+    ``valor_em_centavos = True`` (na subclasse ou no boleto, antes de
+    atribuir os valores) eles são convertidos uma única vez para centavos,
+    e as leituras e o código de barras não fazem mais conversões. Nos dois
+    modos meio centavo é arredondado para cima. ``valor_documento`` passa a
+    ser conferido contra o limite do código de barras já ao ser atribuído.
+
+    Os campos ``valor_centavos`` e ``valor_documento_centavos`` funcionam
+    nos dois modos e são a forma mais rápida de atribuir valores.
+
+    """
+
+    def _converte_valor(self, val):
+        if self.valor_em_centavos:
+            if type(val) is int:
+                return val * 100
+            if type(val) is not Decimal:
+                val = Decimal(str(val))
+            return int(val.quantize(_CENTAVO, ROUND_HALF_UP) * 100)
+        if type(val) is Decimal:
+            return val
+        return Decimal(str(val))
+
+    def _converte_centavos(self, centavos):
+        if type(centavos) is not int:
+            raise TypeError("centavos must be an int, got %r" % (centavos, ))
+        if self.valor_em_centavos:
+            return centavos
+        return Decimal(centavos).scaleb(-2)
+
+    @staticmethod
+    def _confere_limite(valor):
+        # Só os valores em centavos são conferidos ao serem atribuídos
+        if type(valor) is int and not 0 <= valor <= VALOR_MAXIMO_CENTAVOS:
+            raise BoletoException(
+                'valor_documento must be between 0 and %d cents, got %d' % (
+                    VALOR_MAXIMO_CENTAVOS, valor))
+
     def _get_valor(self):
-        if self._valor is not None:
-            return "%.2f" % self._valor
+        return _valor_para_str(self._valor)
 
     def _set_valor(self, val):
-        if type(val) is Decimal:
-            self._valor = val
-        else:
-            self._valor = Decimal(str(val))
+        self._valor = self._converte_valor(val)
     valor = property(_get_valor, _set_valor)
     """Valor convertido para :class:`Decimal`.
 
@@ -329,15 +592,25 @@ class BoletoData(object):
 
     """
 
+    def _get_valor_centavos(self):
+        return _valor_para_centavos(self._valor)
+
+    def _set_valor_centavos(self, centavos):
+        self._valor = self._converte_centavos(centavos)
+    valor_centavos = property(_get_valor_centavos, _set_valor_centavos)
+    """``valor`` em centavos
+
+    :type: int
+
+    """
+
     def _get_valor_documento(self):
-        if self._valor_documento is not None:
-            return "%.2f" % self._valor_documento
+        return _valor_para_str(self._valor_documento)
 
     def _set_valor_documento(self, val):
-        if type(val) is Decimal:
-            self._valor_documento = val
-        else:
-            self._valor_documento = Decimal(str(val))
+        valor = self._converte_valor(val)
+        self._confere_limite(valor)
+        self._valor_documento = valor
     valor_documento = property(_get_valor_documento, _set_valor_documento)
     """Valor do Documento convertido para :class:`Decimal`.
 
@@ -346,6 +619,21 @@ class BoletoData(object):
 
     """
 
+    def _get_valor_documento_centavos(self):
+        return _valor_para_centavos(self._valor_documento)
+
+    def _set_valor_documento_centavos(self, centavos):
+        valor = self._converte_centavos(centavos)
+        self._confere_limite(valor)
+        self._valor_documento = valor
+    valor_documento_centavos = property(_get_valor_documento_centavos,
+                                        _set_valor_documento_centavos)
+    """``valor_documento`` em centavos, como vai no código de barras
+
+    :type: int
+
+    """
+
     def _instrucoes_get(self):
         return self._instrucoes
 
@@ -353,13 +641,9 @@ class BoletoData(object):
         if isinstance(list_inst, str):
             list_inst = list_inst.splitlines()
 
-        if len(list_inst) > 7:
-            raise BoletoException(
-                'Número de linhas de instruções maior que 7')
-        for line in list_inst:
-            if len(line) > 90:
-                raise BoletoException(
-                    'Linha de instruções possui mais que 90 caracteres')
+        erro = _erro_linhas(list_inst, LINHAS_INSTRUCOES, 'instruções')
+        if erro is not None:
+            raise BoletoException(erro)
         self._instrucoes = list_inst
     instrucoes = property(_instrucoes_get, _instrucoes_set)
     """Instruções para o caixa do banco que recebe o bilhete
@@ -377,13 +661,9 @@ class BoletoData(object):
         if isinstance(list_dem, str):
             list_dem = list_dem.splitlines()
 
-        if len(list_dem) > 12:
-            raise BoletoException(
-                'Número de linhas de demonstrativo maior que 12')
-        for line in list_dem:
-            if len(line) > 90:
-                raise BoletoException(
-                    'Linha de demonstrativo possui mais que 90 caracteres')
+        erro = _erro_linhas(list_dem, LINHAS_DEMONSTRATIVO, 'demonstrativo')
+        if erro is not None:
+            raise BoletoException(erro)
         self._demonstrativo = list_dem
     demonstrativo = property(_demonstrativo_get, _demonstrativo_set)
     """Texto que vai impresso no corpo do Recibo do Sacado
@@ -402,7 +682,7 @@ class BoletoData(object):
 
         """
         if self._sacado is None:
-            self.sacado = [
+            sacado = [
                 '%s - CPF/CNPJ: %s' % (self.sacado_nome,
                                        self.sacado_documento),
                 self.sacado_endereco,
@@ -413,11 +693,14 @@ class BoletoData(object):
                     self.sacado_cep
                 )
             ]
+            # Valor derivado, não deve descartar o cache dos outros campos
+            object.__setattr__(self, '_sacado', sacado)
         return self._sacado
 
     def _sacado_set(self, list_sacado):
-        if len(list_sacado) > 3:
-            raise BoletoException('Número de linhas do sacado maior que 3')
+        if len(list_sacado) > LINHAS_SACADO:
+            raise BoletoException('Número de linhas do sacado maior que %d' %
+                                  LINHAS_SACADO)
         self._sacado = list_sacado
     sacado = property(_sacado_get, _sacado_set)
     """Campo sacado composto por até 3 linhas.
@@ -427,16 +710,80 @@ class BoletoData(object):
 
     """
 
-    @property
+    derivados_cedente = ('agencia_conta_cedente', 'codigo_dv_banco')
+    """Propriedades memoizadas que só dependem dos dados da conta do cedente
+
+    São calculadas uma única vez por :class:`pyboleto.cedente.CedenteProfile`
+    e reaproveitadas pelos boletos criados a partir dele. Os bancos que têm
+    outros valores fixos por conta acrescentam os nomes aqui.
+
+    """
+
+    derivados_reemissao = ('campos_campo_livre', 'campo_livre',
+                           'dv_nosso_numero', 'format_nosso_numero')
+    """Propriedades memoizadas que não dependem de :data:`CAMPOS_REEMISSAO`
+
+    Junto com :attr:`derivados_cedente` são reaproveitadas por
+    :meth:`copy` na segunda via. Os bancos em que o campo livre ou o nosso
+    número dependem do vencimento retiram os nomes daqui.
+
+    """
+
+    def copy(self, **campos):
+        """Cópia do boleto com ``campos`` alterados
+
+        Usada para emitir a segunda via com novo vencimento e valor. A
+        cópia não passa pelo construtor e, se todos os ``campos`` estiverem
+        em :data:`CAMPOS_REEMISSAO`, reaproveita os valores já calculados
+        do boleto que não dependem deles (:attr:`derivados_cedente` e
+        :attr:`derivados_reemissao`); só o código de barras, a linha
+        digitável e a view são calculados de novo.
+
+        :param campos: Campos da cópia, atribuídos na ordem em que são
+            passados.
+        """
+        classe = type(self)
+        boleto = classe.__new__(classe)
+        object.__setattr__(boleto, '_cache', {})
+        leitor, setters = _copiadores(classe)
+        try:
+            valores = leitor(self)
+        except AttributeError:
+            # Algum slot não foi preenchido
+            for slot in _slots(classe):
+                try:
+                    slot.__set__(boleto, slot.__get__(self))
+                except AttributeError:
+                    pass
+        else:
+            for setter, valor in zip(setters, valores):
+                setter(boleto, valor)
+        boleto.__dict__.update(self.__dict__)
+        # As listas não podem ser compartilhadas entre os boletos
+        object.__setattr__(boleto, '_demonstrativo', list(self._demonstrativo))
+        object.__setattr__(boleto, '_instrucoes', list(self._instrucoes))
+        if self._sacado is not None:
+            object.__setattr__(boleto, '_sacado', list(self._sacado))
+        for nome, valor in campos.items():
+            setattr(boleto, nome, valor)
+        cache = self._cache
+        if cache and CAMPOS_REEMISSAO.issuperset(campos):
+            copia = boleto._cache
+            for nome in self.derivados_cedente + self.derivados_reemissao:
+                if nome in cache:
+                    copia[nome] = cache[nome]
+        return boleto
+
+    @memoized_property
     def agencia_conta_cedente(self):
         return "%s/%s" % (self.agencia_cedente, self.conta_cedente)
 
-    @property
+    @memoized_property
     def codigo_dv_banco(self):
         cod = "%s-%s" % (self.codigo_banco, self.modulo11(self.codigo_banco))
         return cod
 
-    @property
+    @memoized_property
     def linha_digitavel(self):
         """Monta a linha digitável a partir do barcode
 
@@ -457,48 +804,36 @@ class BoletoData(object):
                          linha[4],
                          linha[5:19]])
 
+    @property
+    def view(self):
+        """Campos formatados para exibição
+
+        A view fica no cache do boleto, mas ``sacado``, ``demonstrativo`` e
+        ``instrucoes`` são conferidos a cada leitura: as listas podem ser
+        alteradas sem passar pelo boleto (ex. ``instrucoes.append(...)``).
+
+        :rtype: :class:`pyboleto.view.BoletoView`
+        """
+        cache = self._cache
+        view = cache.get('view')
+        if view is None:
+            from .view import BoletoView
+            view = cache['view'] = BoletoView.de_boleto(self)
+            return view
+        sacado = tuple(self.sacado or ())
+        demonstrativo = tuple(self.demonstrativo)
+        instrucoes = tuple(self.instrucoes)
+        if (sacado, demonstrativo, instrucoes) != (
+                view.sacado, view.demonstrativo, view.instrucoes):
+            view = cache['view'] = view._replace(
+                sacado=sacado, demonstrativo=demonstrativo,
+                instrucoes=instrucoes)
+        return view
+
     @staticmethod
     def modulo10(num):
-        if not isinstance(num, str):
-            raise TypeError
-        soma = 0
-        peso = 2
-        for c in reversed(num):
-            parcial = int(c) * peso
-            if parcial > 9:
-                s = str(parcial)
-                parcial = int(s[0]) + int(s[1])
-            soma += parcial
-            if peso == 2:
-                peso = 1
-            else:
-                peso = 2
-
-        resto10 = soma % 10
-        if resto10 == 0:
-            modulo10 = 0
-        else:
-            modulo10 = 10 - resto10
-
-        return modulo10
+        return MODULO10(num)
 
     @staticmethod
     def modulo11(num, base=9, r=0):
-        if not isinstance(num, str):
-            raise TypeError
-        soma = 0
-        fator = 2
-        for c in reversed(num):
-            soma += int(c) * fator
-            if fator == base:
-                fator = 1
-            fator += 1
-        if r == 0:
-            soma = soma * 10
-            digito = soma % 11
-            if digito == 10:
-                digito = 0
-            return digito
-        if r == 1:
-            resto = soma % 11
-            return resto
+        return modulo11(base, r)(num)
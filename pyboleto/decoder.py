@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.decoder
+    ~~~~~~~~~~~~~~~~
+
+    Leitura e validação de códigos de barras e linhas digitáveis.
+
+    Faz o caminho inverso de :attr:`pyboleto.data.BoletoData.barcode` e
+    :attr:`pyboleto.data.BoletoData.linha_digitavel`: confere os DVs e separa
+    banco, moeda, vencimento, valor e campo livre. Quando o banco é
+    conhecido o campo livre também é separado nos campos do banco.
+
+    Em lote (:func:`decodifica_lote`) os códigos são processados em blocos e,
+    se o NumPy estiver instalado, os DVs de cada bloco são conferidos de uma
+    vez com :mod:`pyboleto.vectorized`.
+
+"""
+import datetime
+import re
+from collections import namedtuple
+
+from .bank import BANCOS_IMPLEMENTADOS
+from .bank import (banrisul, bradesco, caixa, cecred, hsbc, itau, santander,
+                   sicoob, sicredi)
+from .checksum import DV_BARCODE, MODULO10
+from .data import BoletoException
+from .duedate import data_vencimento
+from .layout import Campo, Fixo, Layout
+
+try:
+    from . import vectorized
+except ImportError:
+    vectorized = None
+
+
+BoletoDecodificado = namedtuple('BoletoDecodificado', [
+    'barcode', 'codigo_banco', 'banco', 'moeda', 'fator_vencimento',
+    'data_vencimento', 'valor_centavos', 'campo_livre', 'campos'])
+"""Resultado da decodificação
+
+:param barcode: Código de barras com 44 dígitos.
+:param banco: Classe que implementa o banco, como em
+    :data:`pyboleto.bank.BANCOS_IMPLEMENTADOS` (ex. ``'itau.BoletoItau'``),
+    ou ``None`` se o banco não for suportado.
+:param fator_vencimento: ``int``. Zero indica boleto sem vencimento.
+:param data_vencimento: :class:`datetime.date` obtida do fator com
+    :func:`pyboleto.duedate.data_vencimento`, ou ``None`` para o fator zero.
+:param valor_centavos: ``int``.
+:param campos: Dicionário com os campos do campo livre, ou ``None`` se o
+    layout do banco não for conhecido.
+"""
+
+_SEPARADORES = str.maketrans('', '', ' .-')
+_DIGITOS = re.compile(r'[0-9]*\Z')
+
+
+def _bancodobrasil(campo_livre):
+    # Convênios de 7 e 8 dígitos começam com 6 zeros. Como não é possível
+    # saber qual dos dois foi usado o convênio e o nosso número ficam juntos.
+    if campo_livre.startswith('000000'):
+        return _BB_CONVENIO_7_8(campo_livre)
+    return None
+
+
+def _hsbc(campo_livre):
+    if campo_livre.endswith('2'):
+        return hsbc.LAYOUT_CNR.separa(campo_livre)
+    return hsbc.LAYOUT_REGISTRO.separa(campo_livre)
+
+
+def _itau(campo_livre):
+    return itau.LAYOUTS.get(campo_livre[:3], itau.LAYOUT).separa(campo_livre)
+
+
+_BB_CONVENIO_7_8 = Layout([Fixo('000000'),
+                           Campo('convenio_nosso_numero', 17),
+                           Campo('carteira', 2)]).separa
+
+CAMPOS_LIVRES = {
+    '001': _bancodobrasil,
+    '041': banrisul.LAYOUT.separa,
+    '085': cecred.LAYOUT.separa,
+    '104': caixa.LAYOUT.separa,
+    '237': bradesco.LAYOUT.separa,
+    '033': santander.LAYOUT.separa,
+    '341': _itau,
+    '399': _hsbc,
+    '748': sicredi.LAYOUT.separa,
+    '756': sicoob.LAYOUT.separa,
+}
+"""Separação do campo livre de cada banco, indexada pelo código do banco
+
+Cada valor recebe o campo livre (25 dígitos) e retorna um dicionário com os
+campos ou ``None`` se o layout não puder ser identificado. Os campos são os
+do :mod:`pyboleto.layout` de cada banco. Como em
+:data:`pyboleto.bank.BANCOS_IMPLEMENTADOS` o código ``104`` usa o layout de
+:class:`pyboleto.bank.caixa.BoletoCaixa`.
+"""
+
+
+def _normaliza(codigo):
+    if not isinstance(codigo, str):
+        raise TypeError("codigo must be a str, got %r" % (codigo, ))
+    return codigo.translate(_SEPARADORES)
+
+
+def _linha_para_barcode(linha):
+    return linha[0:4] + linha[32:47] + linha[4:9] + linha[10:20] + \
+        linha[21:31]
+
+
+def _confere_campos(linha):
+    for n, (inicio, fim) in enumerate(((0, 9), (10, 20), (21, 31)), 1):
+        try:
+            dv = MODULO10(linha[inicio:fim])
+        except ValueError:
+            raise BoletoException("Linha digitável contém caracteres "
+                                  "inválidos: %r" % (linha, ))
+        if str(dv) != linha[fim]:
+            raise BoletoException("DV do campo %d da linha digitável não "
+                                  "confere: %r" % (n, linha))
+
+
+def _confere_barcode(barcode):
+    try:
+        dv = DV_BARCODE(barcode[:4] + barcode[5:])
+    except ValueError:
+        raise BoletoException("Código de barras contém caracteres "
+                              "inválidos: %r" % (barcode, ))
+    if str(dv) != barcode[4]:
+        raise BoletoException("DV do código de barras não confere: %r" % (
+            barcode, ))
+
+
+def _monta(barcode, detalha, referencia):
+    codigo_banco = barcode[0:3]
+    campo_livre = barcode[19:44]
+    campos = None
+    if detalha:
+        separa = CAMPOS_LIVRES.get(codigo_banco)
+        if separa is not None:
+            campos = separa(campo_livre)
+    fator = int(barcode[5:9])
+    return BoletoDecodificado(
+        barcode, codigo_banco, BANCOS_IMPLEMENTADOS.get(codigo_banco),
+        barcode[3], fator, data_vencimento(fator, referencia),
+        int(barcode[9:19]), campo_livre, campos)
+
+
+def decodifica_barcode(barcode, detalha=True, referencia=None):
+    """Decodifica e valida um código de barras de 44 dígitos
+
+    :param detalha: Se ``False`` o campo livre não é separado.
+    :param referencia: Data usada para escolher o ciclo do fator de
+        vencimento, veja :func:`pyboleto.duedate.data_vencimento`.
+    :rtype: :class:`BoletoDecodificado`
+    :exception BoletoException: Se o código for inválido ou o DV não
+        conferir.
+    """
+    barcode = _normaliza(barcode)
+    if len(barcode) != 44:
+        raise BoletoException("O código de barras deve ter 44 dígitos, "
+                              "encontrados %d" % (len(barcode), ))
+    _confere_barcode(barcode)
+    return _monta(barcode, detalha, referencia)
+
+
+def decodifica_linha(linha, detalha=True, referencia=None):
+    """Decodifica e valida uma linha digitável de 47 dígitos
+
+    Pontos e espaços são ignorados. Os DVs dos três campos e o DV geral são
+    conferidos.
+
+    :rtype: :class:`BoletoDecodificado`
+    :exception BoletoException: Se a linha for inválida ou algum DV não
+        conferir.
+    """
+    linha = _normaliza(linha)
+    if len(linha) != 47:
+        raise BoletoException("A linha digitável deve ter 47 dígitos, "
+                              "encontrados %d" % (len(linha), ))
+    _confere_campos(linha)
+    barcode = _linha_para_barcode(linha)
+    _confere_barcode(barcode)
+    return _monta(barcode, detalha, referencia)
+
+
+def decodifica(codigo, detalha=True, referencia=None):
+    """Decodifica um código de barras ou uma linha digitável
+
+    O tipo é identificado pela quantidade de dígitos (44 ou 47).
+    """
+    if len(_normaliza(codigo)) == 47:
+        return decodifica_linha(codigo, detalha, referencia)
+    return decodifica_barcode(codigo, detalha, referencia)
+
+
+def _decodifica(codigo, detalha, referencia):
+    try:
+        return codigo, decodifica(codigo, detalha, referencia), None
+    except (BoletoException, TypeError) as erro:
+        return codigo, None, erro
+
+
+def _decodifica_bloco(bloco, detalha, referencia):
+    resultados = [None] * len(bloco)
+
+    # Confere de uma vez os DVs dos códigos que têm apenas dígitos
+    candidatos = []
+    for i, codigo in enumerate(bloco):
+        if not isinstance(codigo, str):
+            continue
+        codigo = codigo.translate(_SEPARADORES)
+        if not _DIGITOS.match(codigo):
+            continue
+        if len(codigo) == 44:
+            candidatos.append((i, codigo, None))
+        elif len(codigo) == 47:
+            candidatos.append((i, _linha_para_barcode(codigo), codigo))
+
+    if candidatos:
+        matriz = vectorized.digitos([c[1] for c in candidatos], 44)
+        sem_dv = vectorized.numpy.delete(matriz, 4, axis=1)
+        ok = vectorized.dv_barcode(sem_dv) == matriz[:, 4]
+        linhas = [n for n, c in enumerate(candidatos) if c[2] is not None]
+        if linhas:
+            dvs = vectorized.dvs_linha_digitavel(matriz[linhas])
+            digitados = vectorized.digitos(
+                [candidatos[n][2][9] + candidatos[n][2][20] +
+                 candidatos[n][2][31] for n in linhas], 3)
+            ok[linhas] &= (dvs == digitados).all(axis=1)
+        for (i, barcode, _), valido in zip(candidatos, ok.tolist()):
+            if valido:
+                resultados[i] = (bloco[i],
+                                 _monta(barcode, detalha, referencia), None)
+
+    # Os demais são decodificados um a um para obter a mensagem de erro
+    for i, codigo in enumerate(bloco):
+        if resultados[i] is None:
+            resultados[i] = _decodifica(codigo, detalha, referencia)
+    return resultados
+
+
+def decodifica_lote(codigos, detalha=True, referencia=None,
+                    tamanho_bloco=10000):
+    """Decodifica uma sequência de códigos de barras e linhas digitáveis
+
+    Os códigos são lidos em blocos de ``tamanho_bloco``, então ``codigos``
+    pode ser um gerador de qualquer tamanho. Se ``referencia`` for omitida
+    vale a data do início da leitura para todos os códigos.
+
+    eg::
+
+        for codigo, boleto, erro in decodifica_lote(arquivo_de_retorno):
+            if erro is not None:
+                rejeita(codigo, erro)
+
+    :return: Gerador de tuplas ``(codigo, decodificado, erro)`` na ordem de
+        ``codigos``. Para cada código exatamente um entre ``decodificado``
+        (:class:`BoletoDecodificado`) e ``erro`` (a exceção) é ``None``.
+    """
+    if referencia is None:
+        referencia = datetime.date.today()
+    bloco = []
+    for codigo in codigos:
+        bloco.append(codigo)
+        if len(bloco) >= tamanho_bloco:
+            for resultado in _resultados(bloco, detalha, referencia):
+                yield resultado
+            bloco = []
+    if bloco:
+        for resultado in _resultados(bloco, detalha, referencia):
+            yield resultado
+
+
+def _resultados(bloco, detalha, referencia):
+    if vectorized is None:
+        return [_decodifica(codigo, detalha, referencia) for codigo in bloco]
+    return _decodifica_bloco(bloco, detalha, referencia)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.duedate
+    ~~~~~~~~~~~~~~~~
+
+    Conversão entre data de vencimento e fator de vencimento.
+
+    O fator de vencimento (posições 06 a 09 do código de barras) é o número
+    de dias desde 07/10/1997. Como só tem 4 dígitos, depois do fator 9999
+    (21/02/2025) a contagem recomeça em 1000 (22/02/2025) e o mesmo fator
+    volta a aparecer a cada 9000 dias.
+
+    As conversões usam tabelas pré-calculadas para todo o período entre
+    07/10/1997 e o fim do segundo ciclo (13/10/2049). Datas posteriores são
+    calculadas com a mesma regra.
+
+    Para voltar de um fator para uma data é preciso escolher um dos ciclos:
+    :func:`data_vencimento` escolhe a data mais próxima de uma data de
+    referência (por padrão hoje). Assim um boleto com fator 9990 pago em
+    março de 2025 vence em 12/02/2025 e um com fator 1010, em 04/03/2025.
+
+"""
+import datetime
+
+from .arrays import vetorizado
+
+DATA_BASE = datetime.date(1997, 10, 7)
+"""Data de fator zero"""
+
+DATA_REINICIO = datetime.date(2025, 2, 22)
+"""Primeiro dia com o fator reiniciado em 1000"""
+
+FATOR_MINIMO = 1000
+FATOR_MAXIMO = 9999
+CICLO = FATOR_MAXIMO - FATOR_MINIMO + 1
+"""Quantidade de dias entre duas ocorrências do mesmo fator"""
+
+_ORDINAL_BASE = DATA_BASE.toordinal()
+_DIAS_TABELA = FATOR_MAXIMO + 1 + CICLO
+
+# Fator de cada dia a partir de DATA_BASE
+_FATORES = list(range(FATOR_MAXIMO + 1)) + \
+    list(range(FATOR_MINIMO, FATOR_MAXIMO + 1))
+
+# Data de cada fator no primeiro e no segundo ciclo
+_DATAS = list(map(datetime.date.fromordinal,
+                  range(_ORDINAL_BASE, _ORDINAL_BASE + FATOR_MAXIMO + 1)))
+_DATAS_REINICIO = list(map(datetime.date.fromordinal,
+                           range(_ORDINAL_BASE + CICLO,
+                                 _ORDINAL_BASE + CICLO + FATOR_MAXIMO + 1)))
+
+
+def fator_vencimento(data_vencimento):
+    """Fator de vencimento (posições 06 a 09 do código de barras)
+
+    :param data_vencimento: :class:`datetime.date`.
+    :exception TypeError: Se a data for anterior a 07/10/1997.
+    """
+    dias = data_vencimento.toordinal() - _ORDINAL_BASE
+    if dias < 0:
+        raise TypeError("Invalid date, must be between 1997/07/01 and now")  # noqa
+    if dias < _DIAS_TABELA:
+        return _FATORES[dias]
+    return FATOR_MINIMO + (dias - FATOR_MINIMO) % CICLO
+
+
+def data_vencimento(fator, referencia=None):
+    """Data de vencimento correspondente a ``fator``
+
+    Dos ciclos em que o fator aparece é escolhido o que fica mais próximo de
+    ``referencia``, ou seja, a data retornada está a no máximo 4500 dias da
+    referência. Fatores menores que 1000 só existem no primeiro ciclo.
+
+    :param fator: ``int`` entre 0 e 9999.
+    :param referencia: :class:`datetime.date` usada para escolher o ciclo.
+        Padrão: hoje.
+    :return: :class:`datetime.date` ou ``None`` para o fator 0 (boleto sem
+        vencimento).
+    :exception ValueError: Se o fator estiver fora do intervalo.
+    """
+    if not 0 <= fator <= FATOR_MAXIMO:
+        raise ValueError("fator must be between 0 and %d, got %r" % (
+            FATOR_MAXIMO, fator))
+    if fator < FATOR_MINIMO:
+        return _DATAS[fator] if fator else None
+    if referencia is None:
+        referencia = datetime.date.today()
+    # Quantos ciclos somar ao fator para ficar mais perto da referência
+    ciclos = (referencia.toordinal() - _ORDINAL_BASE - fator +
+              CICLO // 2) // CICLO
+    if ciclos <= 0:
+        return _DATAS[fator]
+    if ciclos == 1:
+        return _DATAS_REINICIO[fator]
+    return _DATAS[fator] + datetime.timedelta(days=CICLO * ciclos)
+
+
+def fatores_vencimento(datas):
+    """Fatores de vencimento de uma sequência de datas
+
+    Se ``datas`` for um array ``datetime64`` do NumPy o resultado é um
+    array (:func:`pyboleto.vectorized.fatores_vencimento`).
+
+    :rtype: ``list`` de ``int``
+    """
+    vectorized = vetorizado(datas)
+    if vectorized is not None:
+        return vectorized.fatores_vencimento(datas)
+    return [fator_vencimento(data) for data in datas]
+
+
+def datas_vencimento(fatores, referencia=None):
+    """Datas de vencimento de uma sequência de fatores
+
+    Mesma regra de :func:`data_vencimento`, com uma única referência para
+    todos os fatores. Se ``fatores`` for um array do NumPy o resultado é um
+    array ``datetime64[D]`` com ``NaT`` para o fator 0
+    (:func:`pyboleto.vectorized.datas_vencimento`).
+    """
+    if referencia is None:
+        referencia = datetime.date.today()
+    vectorized = vetorizado(fatores)
+    if vectorized is not None:
+        return vectorized.datas_vencimento(fatores, referencia)
+    return [data_vencimento(fator, referencia) for fator in fatores]
@@ -11,30 +11,29 @@
 """
 import os
 import string
-import sys
 import codecs
 import base64
-import locale
-
-from itertools import chain
-if sys.version_info < (3,):
-    from itertools import zip_longest as zip_longest
-    zip_longest  # chamando para evitar erro de nao uso do zip_longest
-else:
-    from itertools import zip_longest
-
-DIGITS = [
-    ['n', 'n', 'w', 'w', 'n'],
-    ['w', 'n', 'n', 'n', 'w'],
-    ['n', 'w', 'n', 'n', 'w'],
-    ['w', 'w', 'n', 'n', 'n'],
-    ['n', 'n', 'w', 'n', 'w'],
-    ['w', 'n', 'w', 'n', 'n'],
-    ['n', 'w', 'w', 'n', 'n'],
-    ['n', 'n', 'n', 'w', 'w'],
-    ['w', 'n', 'n', 'w', 'n'],
-    ['n', 'w', 'n', 'w', 'n'],
-]
+
+from .codigobarras import FIM, INICIO, PADROES, PARES, pares
+from .data import formata_centavos
+
+# Padrões de cada dígito, como listas; mantido por compatibilidade
+DIGITS = [list(padrao) for padrao in PADROES]
+
+
+def _spans(larguras):
+    """Um ``span`` por elemento; os espaços têm também a classe ``s``"""
+    return ''.join(
+        '<span class="{0}{1}"></span>'.format('n' if largura == 1 else 'w',
+                                              ' s' if i % 2 else '')
+        for i, largura in enumerate(larguras))
+
+
+# Início, fim e os 100 pares de dígitos já como HTML; todos têm uma
+# quantidade par de elementos, então cada um começa por uma barra
+_SPANS_INICIO = _spans(INICIO)
+_SPANS_PARES = tuple(_spans(larguras) for larguras in PARES)
+_SPANS_FIM = _spans(FIM)
 
 
 class BoletoHTML(object):
@@ -92,6 +91,7 @@ class BoletoHTML(object):
         :type boletoDados: :class:`pyboleto.data.BoletoData`
 
         """
+        boletoDados = boletoDados.view
         tpl = string.Template(self._load_template('recibo_sacado.html'))
         tpl_data = {}
 
@@ -111,18 +111,15 @@ class BoletoHTML(object):
         tpl_data['agencia_conta_cedente'] = boletoDados.agencia_conta_cedente
         tpl_data['cedente_documento'] = boletoDados.cedente_documento
 
-        data_vencimento = boletoDados.data_vencimento
-        tpl_data['data_vencimento'] = data_vencimento.strftime('%d/%m/%Y')
+        tpl_data['data_vencimento'] = boletoDados.data_vencimento
         tpl_data['sacado'] = boletoDados.sacado[0]
-        tpl_data['nosso_numero_format'] = boletoDados.format_nosso_numero()
+        tpl_data['nosso_numero_format'] = boletoDados.nosso_numero
         tpl_data['numero_documento'] = boletoDados.numero_documento
 
-        data_documento = boletoDados.data_documento
-        tpl_data['data_documento'] = data_documento.strftime('%d/%m/%Y')
+        tpl_data['data_documento'] = boletoDados.data_documento
         tpl_data['cedente_endereco'] = boletoDados.cedente_endereco
 
-        valor_doc = self._formataValorParaExibir(boletoDados.valor_documento)
-        tpl_data['valor_documento'] = valor_doc
+        tpl_data['valor_documento'] = boletoDados.valor_documento
 
         # Demonstrativo
         tpl_data['demonstrativo'] = ''
@@ -142,6 +139,7 @@ class BoletoHTML(object):
         :type boletoDados: :class:`pyboleto.data.BoletoData`
 
         """
+        boletoDados = boletoDados.view
         tpl = string.Template(self._load_template('recibo_caixa.html'))
         tpl_data = {}
 
@@ -158,35 +156,26 @@ class BoletoHTML(object):
         tpl_data['linha_digitavel'] = boletoDados.linha_digitavel
 
         # Corpo
-        data_vencimento = boletoDados.data_vencimento
-        tpl_data['data_vencimento'] = data_vencimento.strftime('%d/%m/%Y')
+        tpl_data['data_vencimento'] = boletoDados.data_vencimento
 
-        # value em unicode em data.py
-        if isinstance(boletoDados.local_pagamento, str):
-            tpl_data['local_pagamento'] = boletoDados.local_pagamento
-        else:
-            tpl_data['local_pagamento'] = boletoDados.local_pagamento.decode()
+        tpl_data['local_pagamento'] = boletoDados.local_pagamento
         tpl_data['cedente'] = boletoDados.cedente
         tpl_data['agencia_conta_cedente'] = boletoDados.agencia_conta_cedente
 
-        data_documento = boletoDados.data_documento
-        tpl_data['data_documento'] = data_documento.strftime('%d/%m/%Y')
+        tpl_data['data_documento'] = boletoDados.data_documento
         tpl_data['numero_documento'] = boletoDados.numero_documento
         tpl_data['especie_documento'] = boletoDados.especie_documento
         tpl_data['aceite'] = boletoDados.aceite
 
-        data_process = boletoDados.data_processamento
-        tpl_data['data_processamento'] = data_process.strftime('%d/%m/%Y')
-        tpl_data['nosso_numero_format'] = boletoDados.format_nosso_numero()
+        tpl_data['data_processamento'] = boletoDados.data_processamento
+        tpl_data['nosso_numero_format'] = boletoDados.nosso_numero
         tpl_data['carteira'] = boletoDados.carteira
         tpl_data['especie'] = boletoDados.especie
         tpl_data['quantidade'] = boletoDados.quantidade
 
-        valor = self._formataValorParaExibir(boletoDados.valor)
-        tpl_data['valor'] = valor
+        tpl_data['valor'] = boletoDados.valor
 
-        valor_doc = self._formataValorParaExibir(boletoDados.valor_documento)
-        tpl_data['valor_documento'] = valor_doc
+        tpl_data['valor_documento'] = boletoDados.valor_documento
 
         # Instruções
         tpl_data['instrucoes'] = ''
@@ -223,9 +212,11 @@ class BoletoHTML(object):
         várias páginas, uma por boleto.
 
         :param boletoDados: Objeto com os dados do boleto a ser preenchido.
-            Deve ser subclasse de :class:`pyboleto.data.BoletoData`
+            Deve ser subclasse de :class:`pyboleto.data.BoletoData` ou uma
+            :class:`pyboleto.view.BoletoView`
         :type boletoDados: :class:`pyboleto.data.BoletoData`
         """
+        boletoDados = boletoDados.view
         self._drawReciboSacado(boletoDados)
         self._drawHorizontalCorteLine()
         self._drawReciboCaixa(boletoDados)
@@ -244,38 +235,17 @@ class BoletoHTML(object):
             with open(self.fileDescr, 'w') as fd:
                 fd.write(self.html)
 
-    def _formataValorParaExibir(self, nfloat):
-        locale.setlocale(locale.LC_ALL, 'pt_BR.UTF-8')
-        if nfloat:
-            nfloat = float(nfloat)
-            txt = locale.currency(nfloat, grouping=True, symbol=None)
-        else:
-            txt = ""
-        return txt
+    def _formataValorParaExibir(self, centavos):
+        if centavos is None:
+            return ""
+        return formata_centavos(centavos)
 
     def _codigoBarraI25(self, code):
         """Imprime Código de barras otimizado para boletos
         http://en.wikipedia.org/wiki/Interleaved_2_of_5
         """
-        digits = ['n', 'n s', 'n', 'n s']
-
-        if len(code) % 2 != 0:
-            code = '0' + code
-
-        for digt1, digt2 in self._grouper(2, code):
-            digt1_repr = DIGITS[int(digt1)]
-            digt2_repr = [x + ' s' for x in DIGITS[int(digt2)]]
-            digits.extend(chain(*list(zip(digt1_repr, digt2_repr))))
-
-        digits.extend(['w', 'n s', 'n'])
-
-        result = []
-        for digit in digits:
-            result.append('<span class="{0}"></span>'.format(digit))
+        result = [_SPANS_INICIO]
+        result.extend(_SPANS_PARES[par] for par in pares(code))
+        result.append(_SPANS_FIM)
 
         return ''.join(result)
-
-    def _grouper(self, n, iterable, fillvalue=None):
-        """grouper(3, 'ABCDEFG', 'x') --> ABC DEF Gxx"""
-        args = [iter(iterable)] * n
-        return zip_longest(fillvalue=fillvalue, *args)
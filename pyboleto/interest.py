@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.interest
+    ~~~~~~~~~~~~~~~~~
+
+    Multa, juros de mora e desconto em lote, em centavos.
+
+    Um :class:`Encargos` guarda as taxas do cedente e calcula o valor
+    atualizado de muitos títulos de uma vez a partir do valor original em
+    centavos e dos dias de atraso:
+
+    * multa: percentual aplicado uma vez sobre o valor;
+    * juros simples: percentual ao dia (``juros_diario``) ou percentual ao
+      mês proporcional aos dias, com mês de 30 dias (``juros_mensal``);
+    * desconto: percentual e/ou valor fixo para pagamento até o
+      vencimento.
+
+    As contas são feitas com inteiros, sem ``float`` nem
+    :class:`decimal.Decimal` por título. Cada encargo é arredondado para o
+    centavo mais próximo (meio centavo para cima) antes de ser somado.
+
+    Se os valores ou os dias forem arrays do NumPy o cálculo é vetorizado
+    (:func:`pyboleto.vectorized.valores_atualizados`) e o resultado é um
+    array. Os totais podem ir direto para a coluna ``valor_centavos`` do
+    :class:`pyboleto.batch.BoletoBatch` ou para :meth:`Encargos.reemite`.
+
+    eg::
+
+        encargos = Encargos(multa='2', juros_mensal='1')
+        totais = encargos.totais(valores_centavos,
+                                 dias_atraso(vencimentos, hoje))
+
+"""
+from collections import namedtuple
+from decimal import Decimal
+from fractions import Fraction
+
+from .arrays import vetorizado
+
+Calculo = namedtuple('Calculo', ['valor', 'multa', 'juros', 'desconto',
+                                 'total'])
+"""Encargos de um título, todos em centavos"""
+
+
+def _percentual(valor, nome):
+    if isinstance(valor, float):
+        valor = Decimal(str(valor))
+    taxa = Fraction(valor) / 100
+    if taxa < 0:
+        raise ValueError("%s must not be negative, got %r" % (nome, valor))
+    return taxa
+
+
+def _arredonda(numerador, denominador):
+    """``numerador / denominador`` arredondado, meio para cima"""
+    return (2 * numerador + denominador) // (2 * denominador)
+
+
+def dias_atraso(vencimentos, data_pagamento, calendario=None):
+    """Dias entre cada vencimento e ``data_pagamento``
+
+    Negativo se o pagamento for antes do vencimento. Se ``vencimentos`` for
+    um array ``datetime64`` o resultado é um array ``int64``.
+
+    :param calendario: Opcional. :class:`pyboleto.businessday.Calendario`.
+        Um título que vence em fim de semana ou feriado e é pago no dia
+        útil seguinte não está em atraso (0 dias); depois disso os dias
+        contam desde o vencimento original.
+    """
+    vectorized = vetorizado(vencimentos)
+    if vectorized is not None:
+        return vectorized.dias_atraso(vencimentos, data_pagamento,
+                                      calendario)
+    vencimentos = list(vencimentos)
+    pagamento = data_pagamento.toordinal()
+    dias = [pagamento - vencimento.toordinal() for vencimento in vencimentos]
+    if calendario is None:
+        return dias
+    prorrogados = calendario.proximos_dias_uteis(vencimentos)
+    return [0 if 0 < dia and data_pagamento <= prorrogado else dia
+            for dia, prorrogado in zip(dias, prorrogados)]
+
+
+class Encargos(object):
+    """Taxas de multa, juros e desconto de um cedente
+
+    Os percentuais podem ser ``str``, ``int``, :class:`decimal.Decimal` ou
+    :class:`fractions.Fraction` (ex. ``'2'`` para 2%, ``'0.033'`` para
+    0,033% ao dia).
+
+    :param multa: Percentual de multa, cobrado uma vez.
+    :param juros_mensal: Percentual de juros ao mês, pro rata die.
+    :param juros_diario: Percentual de juros ao dia. Não pode ser usado
+        junto com ``juros_mensal``.
+    :param desconto: Percentual de desconto para pagamento até o vencimento.
+    :param desconto_centavos: Desconto fixo para pagamento até o vencimento.
+    :param carencia: Dias de atraso sem multa nem juros. Passada a
+        carência os juros contam desde o vencimento.
+
+    """
+
+    def __init__(self, multa=0, juros_mensal=0, juros_diario=0,
+                 desconto=0, desconto_centavos=0, carencia=0):
+        if juros_mensal and juros_diario:
+            raise ValueError(
+                "use either juros_mensal or juros_diario, not both")
+        if type(desconto_centavos) is not int or desconto_centavos < 0:
+            raise TypeError("desconto_centavos must be a non-negative int, "
+                            "got %r" % (desconto_centavos, ))
+        self.multa = _percentual(multa, 'multa')
+        if juros_mensal:
+            self.juros = _percentual(juros_mensal, 'juros_mensal') / 30
+        else:
+            self.juros = _percentual(juros_diario, 'juros_diario')
+        self.desconto = _percentual(desconto, 'desconto')
+        self.desconto_centavos = desconto_centavos
+        self.carencia = carencia
+
+    def detalha(self, valor_centavos, dias):
+        """Encargos de um título
+
+        :param valor_centavos: Valor original em centavos (``int``).
+        :param dias: Dias de atraso, negativo se antes do vencimento.
+        :rtype: :class:`Calculo`
+        """
+        multa = juros = desconto = 0
+        if dias > self.carencia:
+            taxa = self.multa
+            multa = _arredonda(valor_centavos * taxa.numerator,
+                               taxa.denominator)
+            taxa = self.juros
+            juros = _arredonda(valor_centavos * taxa.numerator * dias,
+                               taxa.denominator)
+        elif dias <= 0:
+            taxa = self.desconto
+            desconto = min(valor_centavos, _arredonda(
+                valor_centavos * taxa.numerator, taxa.denominator) +
+                self.desconto_centavos)
+        return Calculo(valor_centavos, multa, juros, desconto,
+                       valor_centavos + multa + juros - desconto)
+
+    def totais(self, valores_centavos, dias):
+        """Valores atualizados de vários títulos, em centavos
+
+        :param valores_centavos: Sequência de ``int`` ou array do NumPy.
+        :param dias: Dias de atraso de cada título (ver
+            :func:`dias_atraso`), ou um único número para todos.
+        :return: ``list`` de ``int``, ou array ``int64`` se algum dos
+            argumentos for um array.
+        """
+        vectorized = vetorizado(valores_centavos) or vetorizado(dias)
+        if vectorized is not None:
+            return vectorized.valores_atualizados(
+                valores_centavos, dias, self.multa, self.juros,
+                self.desconto, self.desconto_centavos, self.carencia)
+        if isinstance(dias, int):
+            dias = [dias] * len(valores_centavos)
+        elif len(dias) != len(valores_centavos):
+            raise ValueError("dias must have %d values, got %d" % (
+                len(valores_centavos), len(dias)))
+        # Mesma conta de detalha(), sem criar um Calculo por título
+        carencia = self.carencia
+        multa_num, multa_den = self.multa.numerator, self.multa.denominator
+        juros_num, juros_den = self.juros.numerator, self.juros.denominator
+        desconto = self.desconto
+        totais = []
+        for valor, dia in zip(valores_centavos, dias):
+            if dia > carencia:
+                valor += ((2 * valor * multa_num + multa_den) //
+                          (2 * multa_den) +
+                          (2 * valor * juros_num * dia + juros_den) //
+                          (2 * juros_den))
+            elif dia <= 0 and (desconto or self.desconto_centavos):
+                valor = self.detalha(valor, dia).total
+            totais.append(valor)
+        return totais
+
+    def reemite(self, boletos, data_vencimento, calendario=None):
+        """Segunda via com o valor atualizado até ``data_vencimento``
+
+        Os dias de atraso são contados do vencimento de cada boleto até o
+        novo vencimento. Veja :meth:`pyboleto.data.BoletoData.copy`.
+
+        :param calendario: Opcional. Leva o novo vencimento para o próximo
+            dia útil e conta os dias como :func:`dias_atraso`.
+        :return: Lista com as cópias, na ordem de ``boletos``.
+        """
+        boletos = list(boletos)
+        if calendario is not None:
+            data_vencimento = calendario.proximo_dia_util(data_vencimento)
+        totais = self.totais(
+            [boleto.valor_documento_centavos for boleto in boletos],
+            dias_atraso([boleto.data_vencimento for boleto in boletos],
+                        data_vencimento, calendario))
+        return [boleto.copy(data_vencimento=data_vencimento,
+                            valor_documento_centavos=total)
+                for boleto, total in zip(boletos, totais)]
+
+    def __repr__(self):
+        return '%s(multa=%s%%, juros=%s%%/dia, desconto=%s%%%s)' % (
+            self.__class__.__name__, self.multa * 100, self.juros * 100,
+            self.desconto * 100,
+            ' + %d centavos' % self.desconto_centavos
+            if self.desconto_centavos else '')
@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.layout
+    ~~~~~~~~~~~~~~~
+
+    Descrição declarativa do campo livre de cada banco.
+
+    O campo livre (posições 20 a 44 do código de barras) é descrito como uma
+    sequência de campos com nome, tamanho e regra de preenchimento, valores
+    fixos e DVs calculados sobre outros campos. Um :class:`Layout` é montado
+    uma única vez, na importação do módulo do banco, e depois serve para:
+
+    * montar o campo livre a partir de um boleto (:meth:`Layout.formata`),
+      usado por :attr:`pyboleto.data.BoletoData.campo_livre` e pelo
+      :class:`pyboleto.batch.BoletoBatch`;
+    * conferir o tamanho dos campos sem criar boletos (:meth:`Layout.erros`);
+    * separar um campo livre já pronto nos seus campos
+      (:meth:`Layout.separa`), usado por :mod:`pyboleto.decoder`.
+
+    eg::
+
+        LAYOUT = Layout([
+            Campo('carteira', 3),
+            Campo('nosso_numero', 8),
+            DV('dv_campo_livre', MODULO10, ['carteira', 'nosso_numero']),
+            Fixo('0' * 13),
+        ])
+
+"""
+import keyword
+from operator import attrgetter
+
+EXATO = 'exato'
+"""O valor deve ter exatamente o tamanho do campo"""
+
+ZEROS = 'zeros'
+"""Completa o valor com zeros à esquerda"""
+
+ESQUERDA = 'esquerda'
+"""Usa os primeiros dígitos do valor"""
+
+DIREITA = 'direita'
+"""Completa com zeros à esquerda e usa os últimos dígitos do valor"""
+
+_AJUSTES = (EXATO, ZEROS, ESQUERDA, DIREITA)
+
+
+class Campo(object):
+    """Campo lido de um atributo do boleto
+
+    :param nome: Nome do campo no layout.
+    :param tamanho: Quantidade de dígitos.
+    :param atributo: Nome do atributo do boleto ou função que recebe o
+        boleto e retorna o valor. Padrão: ``nome``.
+    :param ajuste: Como o valor é ajustado ao tamanho: :data:`EXATO`,
+        :data:`ZEROS`, :data:`ESQUERDA` ou :data:`DIREITA`.
+    :param sem_dv: Descarta o DV informado depois de ``'-'``
+        (ex. ``'1234-5'``).
+    :param somente_digitos: Descarta tudo o que não for dígito.
+
+    """
+
+    def __init__(self, nome, tamanho, atributo=None, ajuste=EXATO,
+                 sem_dv=False, somente_digitos=False):
+        if ajuste not in _AJUSTES:
+            raise ValueError("ajuste must be one of %r, got %r" % (
+                _AJUSTES, ajuste))
+        self.nome = nome
+        self.tamanho = tamanho
+        self.atributo = nome if atributo is None else atributo
+        self.ajuste = ajuste
+        self.sem_dv = sem_dv
+        self.somente_digitos = somente_digitos
+        if callable(self.atributo):
+            self.leitura = self.atributo
+        else:
+            self.leitura = attrgetter(self.atributo)
+
+    def ajusta(self, valor):
+        """Converte ``valor`` para o texto que vai no campo livre
+
+        :exception ValueError: Se o valor não couber no campo.
+        """
+        if type(valor) is not str:
+            valor = str(valor)
+        if self.sem_dv:
+            valor = valor.split('-')[0]
+        if self.somente_digitos:
+            valor = ''.join([c for c in valor if c.isdigit()])
+        tamanho = self.tamanho
+        if len(valor) != tamanho:
+            ajuste = self.ajuste
+            if ajuste == ESQUERDA:
+                valor = valor[:tamanho]
+            elif ajuste != EXATO:
+                valor = valor.zfill(tamanho)
+                if ajuste == DIREITA:
+                    valor = valor[-tamanho:]
+            if len(valor) != tamanho:
+                raise ValueError("%s must have a length of %d, not %r "
+                                 "(len: %d)" % (self.nome, tamanho, valor,
+                                                len(valor)))
+        return valor
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (self.__class__.__name__, self.nome,
+                               self.tamanho)
+
+
+class Fixo(object):
+    """Valor fixo
+
+    :param nome: Opcional. Só os valores com nome aparecem em
+        :meth:`Layout.separa`.
+
+    """
+
+    def __init__(self, valor, nome=None):
+        self.valor = valor
+        self.nome = nome
+        self.tamanho = len(valor)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.valor)
+
+
+class DV(object):
+    """Dígito verificador calculado sobre outros campos do layout
+
+    :param regra: Função que recebe os dígitos e retorna o DV, geralmente um
+        :class:`pyboleto.checksum.Checksum`.
+    :param campos: Nomes dos campos concatenados, na ordem, para o cálculo.
+        Podem ser campos que aparecem depois no layout e DVs anteriores. Se
+        for ``None`` são usados todos os itens anteriores ao DV, inclusive
+        os valores fixos.
+    :param tamanho: Quantidade de dígitos do DV.
+
+    """
+
+    def __init__(self, nome, regra, campos=None, tamanho=1):
+        self.nome = nome
+        self.regra = regra
+        self.campos = None if campos is None else tuple(campos)
+        self.tamanho = tamanho
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (self.__class__.__name__, self.nome,
+                               self.regra)
+
+
+def _ajusta(boleto, campo, valor):
+    try:
+        return campo.ajusta(valor)
+    except ValueError as erro:
+        raise ValueError('%s.%s' % (boleto.__class__.__name__, erro))
+
+
+def _dv_invalido(boleto, dv, texto):
+    raise ValueError("%s.%s must have a length of %d, not %r" % (
+        boleto.__class__.__name__, dv.nome, dv.tamanho, texto))
+
+
+class Layout(object):
+    """Layout do campo livre, compilado a partir da lista de itens
+
+    Os itens são compilados, como faz o :func:`collections.namedtuple`, em
+    funções com uma linha de código para cada campo. Os valores que já têm
+    o tamanho certo não passam pelo :meth:`Campo.ajusta`.
+
+    :param itens: Sequência de :class:`Campo`, :class:`Fixo` e :class:`DV`
+        na ordem em que aparecem no campo livre.
+
+    .. attribute:: valores(boleto)
+
+        Valores de cada campo para ``boleto``, indexados pelo nome. Os
+        campos são textos já ajustados ao tamanho e os DVs ficam como
+        retornados pela regra (geralmente ``int``).
+
+        :exception ValueError: Se algum campo não couber no tamanho.
+
+    .. attribute:: formata(boleto)
+
+        Monta o campo livre de ``boleto``.
+
+        :exception ValueError: Se algum campo não couber no tamanho.
+
+    .. attribute:: junta(valores)
+
+        Monta o campo livre a partir do resultado de :attr:`valores`.
+
+    """
+
+    def __init__(self, itens):
+        self.itens = tuple(itens)
+        self.tamanho = sum(item.tamanho for item in self.itens)
+
+        posicoes = {}
+        for i, item in enumerate(self.itens):
+            if item.nome is None:
+                continue
+            if item.nome in posicoes:
+                raise ValueError("duplicate name %r" % (item.nome, ))
+            posicoes[item.nome] = i
+        self.nomes = tuple(item.nome for item in self.itens
+                           if not isinstance(item, Fixo) and
+                           item.nome is not None)
+        self._campos = tuple(item for item in self.itens
+                             if isinstance(item, Campo))
+
+        fatias = []
+        inicio = 0
+        for item in self.itens:
+            if item.nome is not None:
+                fatias.append((item.nome, inicio, inicio + item.tamanho))
+            inicio += item.tamanho
+        self._fatias = tuple(fatias)
+
+        self.valores, self.formata, self.junta = self._compila(posicoes)
+
+    def _compila(self, posicoes):
+        # Cada item i vira a variável v<i>: o texto do campo, o valor fixo
+        # ou o texto do DV. O valor do DV retornado pela regra fica em d<i>.
+        namespace = {'_ajusta': _ajusta, '_dv_invalido': _dv_invalido}
+        linhas = []
+        variaveis = []
+        for i, item in enumerate(self.itens):
+            v = 'v%d' % i
+            variaveis.append(v)
+            namespace['item%d' % i] = item
+            if isinstance(item, Fixo):
+                linhas.append('%s = %r' % (v, item.valor))
+            elif isinstance(item, Campo):
+                atributo = item.atributo
+                if isinstance(atributo, str) and atributo.isidentifier() \
+                        and not keyword.iskeyword(atributo):
+                    linhas.append('%s = boleto.%s' % (v, atributo))
+                else:
+                    linhas.append('%s = item%d.leitura(boleto)' % (v, i))
+                condicoes = ['type(%s) is not str' % v,
+                             'len(%s) != %d' % (v, item.tamanho)]
+                if item.sem_dv:
+                    condicoes.append("'-' in %s" % v)
+                if item.somente_digitos:
+                    condicoes.append('not %s.isdigit()' % v)
+                linhas.append('if %s:' % ' or '.join(condicoes))
+                linhas.append('    %s = _ajusta(boleto, item%d, %s)' % (
+                    v, i, v))
+
+        # Os DVs são calculados depois de todos os campos, na ordem do
+        # layout, porque podem usar campos que aparecem depois deles
+        for i, item in enumerate(self.itens):
+            if not isinstance(item, DV):
+                continue
+            if item.campos is None:
+                fontes = range(i)
+            else:
+                fontes = []
+                for nome in item.campos:
+                    if nome not in posicoes:
+                        raise ValueError("%s uses unknown field %r" % (
+                            item.nome, nome))
+                    j = posicoes[nome]
+                    if isinstance(self.itens[j], DV) and j >= i:
+                        raise ValueError("%s uses %s, which is computed "
+                                         "later" % (item.nome, nome))
+                    fontes.append(j)
+            linhas.append('d%d = item%d.regra(%s)' % (
+                i, i, ' + '.join(variaveis[j] for j in fontes)))
+            linhas.append('v%d = str(d%d)' % (i, i))
+            linhas.append('if len(v%d) != %d:' % (i, item.tamanho))
+            linhas.append('    _dv_invalido(boleto, item%d, v%d)' % (i, i))
+
+        resultado = []
+        formato = []
+        juncao = []
+        for i, item in enumerate(self.itens):
+            if isinstance(item, Fixo):
+                formato.append(item.valor.replace('%', '%%'))
+                continue
+            formato.append('%s')
+            juncao.append('valores[%r]' % (item.nome, ))
+            if isinstance(item, Campo):
+                resultado.append('%r: v%d' % (item.nome, i))
+            else:
+                resultado.append('%r: d%d' % (item.nome, i))
+        corpo = ''.join('    %s\n' % linha for linha in linhas)
+        codigo = (
+            'def valores(boleto):\n%s    return {%s}\n\n'
+            'def formata(boleto):\n%s    return %s\n\n'
+            'def junta(valores):\n    return %r %% (%s, )\n' % (
+                corpo, ', '.join(resultado),
+                corpo, ' + '.join(variaveis),
+                ''.join(formato), ', '.join(juncao)))
+        exec(codigo, namespace)
+        return namespace['valores'], namespace['formata'], namespace['junta']
+
+    def erros(self, campos):
+        """Confere o tamanho dos campos sem criar um boleto
+
+        eg::
+
+            >>> from pyboleto.bank.itau import LAYOUT
+            >>> LAYOUT.erros({'carteira': '109', 'nosso_numero': '123456789'})
+            ["nosso_numero must have a length of 8, not '123456789' (len: 9)"]
+
+        :param campos: Dicionário com os valores, indexado pelo nome do
+            campo no layout. Campos ausentes e chaves que não fazem parte
+            do layout são ignorados.
+        :return: Lista com as mensagens de erro, vazia se todos os campos
+            forem válidos.
+        """
+        erros = []
+        for campo in self._campos:
+            if campo.nome not in campos:
+                continue
+            try:
+                valor = campo.ajusta(campos[campo.nome])
+            except ValueError as erro:
+                erros.append(str(erro))
+                continue
+            if not valor.isdigit():
+                erros.append("%s must contain only digits, got %r" % (
+                    campo.nome, valor))
+        return erros
+
+    def separa(self, campo_livre):
+        """Separa um campo livre pronto nos campos com nome
+
+        :return: Dicionário ``{nome: texto}``. Valores fixos só aparecem se
+            tiverem nome.
+        """
+        return {nome: campo_livre[i:j] for nome, i, j in self._fatias}
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, list(self.itens))
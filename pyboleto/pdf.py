@@ -11,17 +11,21 @@
 """
 import base64
 import io
-import locale
 import os
 
-from reportlab.graphics.barcode.common import I2of5
-from reportlab.lib.colors import black
-from reportlab.lib.pagesizes import A4, landscape as pagesize_landscape
-from reportlab.lib.units import mm, cm
-from reportlab.pdfbase.pdfmetrics import stringWidth
-from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
-from PIL import Image
+from .codigobarras import ALTURA, largura_estreita, operadores_pdf
+from .data import formata_centavos
+
+# O ReportLab e o Pillow só são importados quando um PDF é gerado, para que
+# importar este módulo (ou o pyboleto) continue rápido para quem só calcula
+# códigos de barras ou gera HTML. As unidades são as de
+# reportlab.lib.units e reportlab.lib.pagesizes.
+cm = 72.0 / 2.54
+mm = cm * 0.1
+A4 = (21 * cm, 29.7 * cm)
+
+# PNG do QR Code do bloco do Pix, em base64
+PIX_QRCODE = "iVBORw0KGgoAAAANSUhEUgAAAPoAAAD6AQAAAACgl2eQAAAC1klEQVR4Xu2XS47rIBBFYSNm/7vopcBG4J1TRG0ng9YbtKsnrkSKDSfSTX0uTlk/x1f5XPmIB9jxADseYMf/Ab2UOusaax5ttll8DxcTgcF79CpZxzxKW9y5mAl014mGSpa9rZtJBUYnR4pckaij/QFAkhoMFfLGLCUDvFmcbrJx1OVnrKcB9uf4jM+u/tz/ZcCYCCRXJKwNqkbj7MgCemQo6sMlI1wonD2cCKjMSjk10bm4CFJTgd62ToYHmS1umZ6zaRMAlJEct6pJimzBqDENYFR6gQipxRQBL4cpD7Bcs+3jBA+jVi6N+MgCwjqax5py27Jox3uxbgc8xzxVD9dH2NewWJkAy9wyK3qXpwl1A7lW83bAVNVIThSset92rdIAvHPQr/TqcICGJgLIwZIH2J8+YGBj6NzJIg5VZgEIZNHkYOdMDmIt1KWa9wMjBqbooGhV3bR/r7/idoBeYZXnXkgu1BjCz19xP2B6Op3SXRsv97CNEgHSNLZ796jacpDGuPyK+4HpWdL0kCPUwiryLFYCYNtao31h93b6p+qoeQBNq4kTtCqdgmTH2W9kAUxtt2d1U8zE+SXon0SANaZVA5lyCNXRPO/zACpUHZ5ptnw5P1Tqu1gJAMOitBJOFpOMmzXxPMDjnP6IfXbsHr9yHd7bAded3kNh1IsHL2t3PdRuB+JER1ZRo1t8vNwsDRj7dG9LR53Uiz/F79XMAFhdkSJONdA9upfhvR9YkSsyBFg0khavs1gJwHRumtZVI01LT8NVzmomADZKMU0y3TFC9XEReT+gZSCKRFGrEikLX/sWmQAYeJcmXuNoVfH74X47oCL2lUW8PFVDTwRsET88WkmZeVOkGvMASoXQ4tD6XyhsXd3JgBliZlBGwlYk7yxWEsBC6z7eQHm4MDru5wG80ee04qNc6mGhOQ+IyrCL0ub0eCVswrKAn+IBdjzAjgfY8QvAP6fWH62SBojlAAAAAElFTkSuQmCC"
 
 
 class BoletoPDF(object):
@@ -37,11 +41,18 @@ class BoletoPDF(object):
     :param file_descr: Um arquivo ou *file-like* class.
     :param landscape: Formato da folha. Usar ``True`` para boleto
         tipo carnê.
+    :param paginas_por_bloco: Opcional. Liga a gravação em blocos: a cada
+        ``paginas_por_bloco`` chamadas de :meth:`nextPage` as páginas
+        prontas são gravadas em ``file_descr`` e descartadas, e a memória
+        usada não cresce com o tamanho do lote
+        (:class:`pyboleto.pdfstream.EscritorPDF`). Basta que
+        ``file_descr`` tenha ``write``. Sem ele o PDF inteiro fica em
+        memória até o :meth:`save`.
 
     """
     # pylint: disable=too-many-instance-attributes
 
-    def __init__(self, file_descr, landscape=False):
+    def __init__(self, file_descr, landscape=False, paginas_por_bloco=None):
         self.width = 190 * mm
         self.width_canhoto = 70 * mm
         self.height_line = 6.5 * mm
@@ -52,27 +63,69 @@ class BoletoPDF(object):
         self.delta_font = self.font_size_value + 1
 
         if landscape:
-            pagesize = pagesize_landscape(A4)
+            self.pagesize = (A4[1], A4[0])
+        else:
+            self.pagesize = A4
+
+        self.file_descr = file_descr
+        self.paginas_por_bloco = paginas_por_bloco
+        self._escritor = None
+        if paginas_por_bloco:
+            from .pdfstream import EscritorPDF
+            self._escritor = EscritorPDF(file_descr)
+        self._novo_canvas()
+
+    def _novo_canvas(self):
+        """Cria o canvas do documento, ou do próximo bloco de páginas"""
+        from reportlab.lib.colors import black
+        from reportlab.pdfgen import canvas
+
+        if self._escritor is None:
+            destino = self.file_descr
         else:
-            pagesize = A4
+            destino = self._bloco = io.BytesIO()
+            self._paginas_no_bloco = 0
+        self.pdf_canvas = canvas.Canvas(destino, pagesize=self.pagesize)
+        if self._escritor is None or not self._escritor.paginas:
+            # Preto já é a cor padrão; nos blocos seguintes ela não é
+            # repetida para que um bloco sem nada desenhado não vire uma
+            # página em branco no save()
+            self.pdf_canvas.setStrokeColor(black)
+        # Nome do form XObject de cada parte fixa já gravada no documento
+        self._formularios = {}
+
+    def _grava_bloco(self):
+        """Entrega as páginas do bloco atual ao EscritorPDF"""
+        self.pdf_canvas.save()
+        self._escritor.adiciona(self._bloco.getvalue())
+        self._bloco = None
 
-        self.pdf_canvas = canvas.Canvas(file_descr, pagesize=pagesize)
-        self.pdf_canvas.setStrokeColor(black)
+    def _formulario(self, chave, desenha, *args):
+        """Desenha a parte fixa de um recibo na origem atual
 
-    def _draw_recibo_sacado_canhoto(self, boleto_dados, x, y):
-        """Imprime o Recibo do Sacado para modelo de carnê
-
-        :param boleto_dados: Objeto com os dados do boleto a ser preenchido.
-            Deve ser subclasse de :class:`pyboleto.data.BoletoData`
-        :type boleto_dados: :class:`pyboleto.data.BoletoData`
-        :param x: Current X coordinate
-        :param y: Current Y coordinate
+        Linhas, títulos, linhas de corte e o logotipo do banco são iguais em
+        todos os boletos. Na primeira vez que ``chave`` aparece no documento
+        ``desenha(*args)`` é gravado como um *form XObject*; depois cada
+        página só referencia o formulário, e apenas os valores e o código de
+        barras são desenhados por boleto.
 
+        :param chave: Identifica o formulário. Deve incluir tudo que
+            ``desenha`` usa além das medidas da classe.
         """
-
-        self.pdf_canvas.saveState()
-        self.pdf_canvas.translate(x, y)
-
+        nome = self._formularios.get(chave)
+        if nome is None:
+            nome = 'Formulario%d' % len(self._formularios)
+            # A BBox cobre a página com a origem em qualquer posição
+            largura, altura = self.pagesize
+            self.pdf_canvas.beginForm(nome, -largura, -altura,
+                                      largura, altura)
+            desenha(*args)
+            self.pdf_canvas.endForm()
+            self._formularios[chave] = nome
+        self.pdf_canvas.doForm(nome)
+
+    def _draw_recibo_sacado_canhoto_formulario(self):
+        """Parte fixa do Recibo do Sacado do carnê"""
         linha_inicial = 12
 
         # Horizontal Lines
@@ -131,23 +184,41 @@ class BoletoPDF(object):
             'Valor Documento'
         )
 
+    def _draw_recibo_sacado_canhoto(self, boleto_dados, x, y):
+        """Imprime o Recibo do Sacado para modelo de carnê
+
+        :param boleto_dados: Objeto com os dados do boleto a ser preenchido.
+            Deve ser subclasse de :class:`pyboleto.data.BoletoData`
+        :type boleto_dados: :class:`pyboleto.data.BoletoData`
+        :param x: Current X coordinate
+        :param y: Current Y coordinate
+
+        """
+        boleto_dados = boleto_dados.view
+
+        self.pdf_canvas.saveState()
+        self.pdf_canvas.translate(x, y)
+
+        linha_inicial = 12
+
+        self._formulario(('canhoto', ),
+                         self._draw_recibo_sacado_canhoto_formulario)
+
         # Values
         self.pdf_canvas.setFont('Helvetica', 9)
         heigh_font = 9 + 1
 
-        valor_documento = self._formataValorParaExibir(
-            boleto_dados.valor_documento
-        )
+        valor_documento = boleto_dados.valor_documento
 
         self.pdf_canvas.drawString(
             self.space,
             (((linha_inicial + 0) * self.height_line)) + self.space,
-            boleto_dados.format_nosso_numero()
+            boleto_dados.nosso_numero
         )
         self.pdf_canvas.drawString(
             self.width_canhoto - (35 * mm) + self.space,
             (((linha_inicial + 0) * self.height_line)) + self.space,
-            boleto_dados.data_vencimento.strftime('%d/%m/%Y')
+            boleto_dados.data_vencimento
         )
         self.pdf_canvas.drawString(
             self.space,
@@ -173,18 +244,9 @@ class BoletoPDF(object):
         return (self.width_canhoto,
                 ((linha_inicial + 2) * self.height_line))
 
-    def _drawReciboSacado(self, boleto_dados, x, y):
-        """Imprime o Recibo do Sacado para modelo de página inteira
-
-        :param boleto_dados: Objeto com os dados do boleto a ser preenchido.
-            Deve ser subclasse de :class:`pyboleto.data.BoletoData`
-        :type boleto_dados: :class:`pyboleto.data.BoletoData`
-
+    def _drawReciboSacadoFormulario(self, logo_image, codigo_dv_banco):
+        """Parte fixa do Recibo do Sacado, com o logotipo e o código do banco
         """
-
-        self.pdf_canvas.saveState()
-        self.pdf_canvas.translate(x, y)
-
         linha_inicial = 15
 
         # Horizontal Lines
@@ -231,8 +293,8 @@ class BoletoPDF(object):
                             (linha_inicial + 3) * self.height_line,
                             self.height_line)
 
-        if boleto_dados.logo_image:
-            image_reportlab = load_image(boleto_dados.logo_image)
+        if logo_image:
+            image_reportlab = load_image(logo_image)
             self.pdf_canvas.drawImage(
                 image_reportlab,
                 0, (linha_inicial + 3) * self.height_line + 3,
@@ -245,7 +307,7 @@ class BoletoPDF(object):
         self.pdf_canvas.drawCentredString(
             50 * mm,
             (linha_inicial + 3) * self.height_line + 3,
-            boleto_dados.codigo_dv_banco
+            codigo_dv_banco
         )
         self.pdf_canvas.setFont('Helvetica-Bold', 11.5)
         self.pdf_canvas.drawRightString(
@@ -321,6 +383,60 @@ class BoletoPDF(object):
             'Demonstrativo'
         )
 
+    def _imagem_pix(self):
+        """QR Code do Pix no formato aceito por ``pdf_canvas.drawImage``"""
+        from PIL import Image
+        from reportlab.lib.utils import ImageReader
+
+        image = Image.open(io.BytesIO(base64.b64decode(PIX_QRCODE)))
+        return ImageReader(image)
+
+    def _drawPixFormulario(self):
+        """QR Code do Pix e as instruções ao lado, com o topo na origem"""
+        self.pdf_canvas.drawImage(
+            self._imagem_pix(),
+            0,
+            -36 * mm,
+            36 * mm,
+            36 * mm,
+            preserveAspectRatio=True,
+            anchor='sw'
+        )
+
+        heigh_font = 9 + 1
+        self.pdf_canvas.setFont('Courier', 9)
+        self.pdf_canvas.drawString(
+            36 * mm + self.space,
+            -6 * mm,
+            'Para realizar o pagamento a qualquer instante, leia o QR Code'
+        )
+
+        self.pdf_canvas.drawString(
+            36 * mm + self.space,
+            -heigh_font - 6 * mm,
+            'no celular e pague por Pix.'
+        )
+
+    def _drawReciboSacado(self, boleto_dados, x, y):
+        """Imprime o Recibo do Sacado para modelo de página inteira
+
+        :param boleto_dados: Objeto com os dados do boleto a ser preenchido.
+            Deve ser subclasse de :class:`pyboleto.data.BoletoData`
+        :type boleto_dados: :class:`pyboleto.data.BoletoData`
+
+        """
+        boleto_dados = boleto_dados.view
+
+        self.pdf_canvas.saveState()
+        self.pdf_canvas.translate(x, y)
+
+        linha_inicial = 15
+
+        self._formulario(
+            ('sacado', boleto_dados.logo_image, boleto_dados.codigo_dv_banco),
+            self._drawReciboSacadoFormulario,
+            boleto_dados.logo_image, boleto_dados.codigo_dv_banco)
+
         # Values
         self.pdf_canvas.setFont('Helvetica', 8)
         heigh_font = 9 + 1
@@ -344,16 +460,12 @@ class BoletoPDF(object):
         self.pdf_canvas.drawString(
             self.width - (30 * mm) + self.space,
             (((linha_inicial + 2) * self.height_line)) + self.space,
-            boleto_dados.data_vencimento.strftime('%d/%m/%Y')
+            boleto_dados.data_vencimento
         )
 
         # Take care of long field
         sacado0 = boleto_dados.sacado[0]
-        while (stringWidth(sacado0,
-                           self.pdf_canvas._fontname,
-                           self.pdf_canvas._fontsize
-                           ) > 8.4 * cm):
-
+        while self.pdf_canvas.stringWidth(sacado0) > 8.4 * cm:
             # sacado0 = sacado0[:-2] + u'\u2026'
             sacado0 = sacado0[:-4] + '...'
 
@@ -365,7 +477,7 @@ class BoletoPDF(object):
         self.pdf_canvas.drawString(
             self.width - (30 * mm) - (35 * mm) - (40 * mm) + self.space,
             (((linha_inicial + 1) * self.height_line)) + self.space,
-            boleto_dados.format_nosso_numero()
+            boleto_dados.nosso_numero
         )
         self.pdf_canvas.drawString(
             self.width - (30 * mm) - (35 * mm) + self.space,
@@ -375,12 +487,10 @@ class BoletoPDF(object):
         self.pdf_canvas.drawString(
             self.width - (30 * mm) + self.space,
             (((linha_inicial + 1) * self.height_line)) + self.space,
-            boleto_dados.data_documento.strftime('%d/%m/%Y')
+            boleto_dados.data_documento
         )
 
-        valor_documento = self._formataValorParaExibir(
-            boleto_dados.valor_documento
-        )
+        valor_documento = boleto_dados.valor_documento
 
         self.pdf_canvas.drawString(
             0 + self.space,
@@ -403,32 +513,14 @@ class BoletoPDF(object):
                 demonstrativo[i])
 
         if boleto_dados.logo_image:
-            base64image = "iVBORw0KGgoAAAANSUhEUgAAAPoAAAD6AQAAAACgl2eQAAAC1klEQVR4Xu2XS47rIBBFYSNm/7vopcBG4J1TRG0ng9YbtKsnrkSKDSfSTX0uTlk/x1f5XPmIB9jxADseYMf/Ab2UOusaax5ttll8DxcTgcF79CpZxzxKW9y5mAl014mGSpa9rZtJBUYnR4pckaij/QFAkhoMFfLGLCUDvFmcbrJx1OVnrKcB9uf4jM+u/tz/ZcCYCCRXJKwNqkbj7MgCemQo6sMlI1wonD2cCKjMSjk10bm4CFJTgd62ToYHmS1umZ6zaRMAlJEct6pJimzBqDENYFR6gQipxRQBL4cpD7Bcs+3jBA+jVi6N+MgCwjqax5py27Jox3uxbgc8xzxVD9dH2NewWJkAy9wyK3qXpwl1A7lW83bAVNVIThSset92rdIAvHPQr/TqcICGJgLIwZIH2J8+YGBj6NzJIg5VZgEIZNHkYOdMDmIt1KWa9wMjBqbooGhV3bR/r7/idoBeYZXnXkgu1BjCz19xP2B6Op3SXRsv97CNEgHSNLZ796jacpDGuPyK+4HpWdL0kCPUwiryLFYCYNtao31h93b6p+qoeQBNq4kTtCqdgmTH2W9kAUxtt2d1U8zE+SXon0SANaZVA5lyCNXRPO/zACpUHZ5ptnw5P1Tqu1gJAMOitBJOFpOMmzXxPMDjnP6IfXbsHr9yHd7bAded3kNh1IsHL2t3PdRuB+JER1ZRo1t8vNwsDRj7dG9LR53Uiz/F79XMAFhdkSJONdA9upfhvR9YkSsyBFg0khavs1gJwHRumtZVI01LT8NVzmomADZKMU0y3TFC9XEReT+gZSCKRFGrEikLX/sWmQAYeJcmXuNoVfH74X47oCL2lUW8PFVDTwRsET88WkmZeVOkGvMASoXQ4tD6XyhsXd3JgBliZlBGwlYk7yxWEsBC6z7eQHm4MDru5wG80ee04qNc6mGhOQ+IyrCL0ub0eCVswrKAn+IBdjzAjgfY8QvAP6fWH62SBojlAAAAAElFTkSuQmCC"
-            image_bytes = base64.b64decode(base64image)
-            image = Image.open(io.BytesIO(image_bytes))
-            image_reportlab = ImageReader(image)
-            self.pdf_canvas.drawImage(
-                image_reportlab,
+            # O bloco do Pix começa logo abaixo do demonstrativo
+            self.pdf_canvas.saveState()
+            self.pdf_canvas.translate(
                 0,
                 (-3 * cm + ((linha_inicial + 0) * self.height_line)) -
-                (len(demonstrativo) * heigh_font) - 36 * mm,
-                36 * mm,
-                36 * mm,
-                preserveAspectRatio=True,
-                anchor='sw'
-            )
-
-            self.pdf_canvas.drawString(36 * mm + self.space,
-                (-3 * cm + ((linha_inicial + 0) * self.height_line)) -
-                (len(demonstrativo) * heigh_font) - 6 * mm,
-                'Para realizar o pagamento a qualquer instante, leia o QR Code'
-            )
-
-            self.pdf_canvas.drawString(36 * mm + self.space,
-                (-3 * cm + ((linha_inicial + 0) * self.height_line)) -
-                (heigh_font * (len(demonstrativo) + 1)) - 6 * mm,
-                'no celular e pague por Pix.'
-            )
+                (len(demonstrativo) * heigh_font))
+            self._formulario(('pix', ), self._drawPixFormulario)
+            self.pdf_canvas.restoreState()
 
         self.pdf_canvas.setFont('Helvetica', 9)
 
@@ -440,34 +532,36 @@ class BoletoPDF(object):
         self.pdf_canvas.saveState()
         self.pdf_canvas.translate(x, y)
 
+        self._formulario(('corte_horizontal', width),
+                         self._drawHorizontalCorteLineFormulario, width)
+
+        self.pdf_canvas.restoreState()
+
+    def _drawHorizontalCorteLineFormulario(self, width):
         self.pdf_canvas.setLineWidth(1)
         self.pdf_canvas.setDash(1, 2)
         self.__horizontalLine(0, 0, width)
 
-        self.pdf_canvas.restoreState()
-
     def _drawVerticalCorteLine(self, x, y, height):
         self.pdf_canvas.saveState()
         self.pdf_canvas.translate(x, y)
 
-        self.pdf_canvas.setLineWidth(1)
-        self.pdf_canvas.setDash(1, 2)
-        self.__verticalLine(0, 0, height)
+        self._formulario(('corte_vertical', height),
+                         self._drawVerticalCorteLineFormulario, height)
 
         self.pdf_canvas.restoreState()
 
-    def _drawReciboCaixa(self, boleto_dados, x, y):
-        """Imprime o Recibo do Caixa
+    def _drawVerticalCorteLineFormulario(self, height):
+        self.pdf_canvas.setLineWidth(1)
+        self.pdf_canvas.setDash(1, 2)
+        self.__verticalLine(0, 0, height)
 
-        :param boleto_dados: Objeto com os dados do boleto a ser preenchido.
-            Deve ser subclasse de :class:`pyboleto.data.BoletoData`
-        :type boleto_dados: :class:`pyboleto.data.BoletoData`
+    def _drawReciboCaixaFormulario(self, logo_image, codigo_dv_banco):
+        """Parte fixa do Recibo do Caixa, com o logotipo e o código do banco
 
+        Percorre as linhas do recibo com as mesmas alturas que
+        :meth:`_drawReciboCaixa`.
         """
-        self.pdf_canvas.saveState()
-
-        self.pdf_canvas.translate(x, y)
-
         # De baixo para cima posicao 0,0 esta no canto inferior esquerdo
         self.pdf_canvas.setFont('Helvetica', self.font_size_title)
 
@@ -490,20 +584,11 @@ class BoletoPDF(object):
 
         y += self.height_line
         self.pdf_canvas.drawString(0, y + self.delta_title, 'Pagador')
-        sacado = boleto_dados.sacado
 
         # Linha grossa dividindo o Sacado
         y += self.height_line
         self.pdf_canvas.setLineWidth(2)
         self.__horizontalLine(0, y, self.width)
-        self.pdf_canvas.setFont('Helvetica', self.font_size_value)
-        for i in range(len(sacado)):
-            self.pdf_canvas.drawString(
-                15 * mm,
-                (y - 10) - (i * self.delta_font),
-                sacado[i]
-            )
-        self.pdf_canvas.setFont('Helvetica', self.font_size_title)
 
         # Linha vertical limitando todos os campos da direita
         self.pdf_canvas.setLineWidth(1)
@@ -552,16 +637,6 @@ class BoletoPDF(object):
             'Instruções'
         )
 
-        self.pdf_canvas.setFont('Helvetica', self.font_size_value)
-        instrucoes = boleto_dados.instrucoes
-        for i in range(len(instrucoes)):
-            self.pdf_canvas.drawString(
-                2 * self.space,
-                y - (i * self.delta_font),
-                instrucoes[i]
-            )
-        self.pdf_canvas.setFont('Helvetica', self.font_size_title)
-
         # Linha horizontal com primeiro campo Uso do Banco
         y += self.height_line
         self.__horizontalLine(0, y, self.width)
@@ -603,40 +678,6 @@ class BoletoPDF(object):
             '(=) Valor documento'
         )
 
-        self.pdf_canvas.setFont('Helvetica', self.font_size_value)
-        self.pdf_canvas.drawString(
-            (30 * mm) + self.space,
-            y + self.space,
-            boleto_dados.carteira
-        )
-        self.pdf_canvas.drawString(
-            ((30 + 20) * mm) + self.space,
-            y + self.space,
-            boleto_dados.especie
-        )
-        self.pdf_canvas.drawString(
-            ((30 + 20 + 20) * mm) + self.space,
-            y + self.space,
-            boleto_dados.quantidade
-        )
-        valor = ''
-        if boleto_dados.valor != '0.00':
-            valor = self._formataValorParaExibir(boleto_dados.valor)
-        self.pdf_canvas.drawString(
-            ((30 + 20 + 20 + 20 + 20) * mm) + self.space,
-            y + self.space,
-            valor
-        )
-        valor_documento = self._formataValorParaExibir(
-            boleto_dados.valor_documento
-        )
-        self.pdf_canvas.drawRightString(
-            self.width - 2 * self.space,
-            y + self.space,
-            valor_documento
-        )
-        self.pdf_canvas.setFont('Helvetica', self.font_size_title)
-
         # Linha horizontal com primeiro campo Data documento
         y += self.height_line
         self.__horizontalLine(0, y, self.width)
@@ -676,11 +717,134 @@ class BoletoPDF(object):
             'Nosso número'
         )
 
+        # Linha horizontal com primeiro campo Cedente
+        y += self.height_line
+        self.__horizontalLine(0, y, self.width)
+        self.pdf_canvas.drawString(0, y + self.delta_title + 10,
+                                   'Beneficiário')
+
+        # Linha horizontal com primeiro campo Local de Pagamento
+        y += self.height_line + 10
+        self.__horizontalLine(0, y, self.width)
+        self.pdf_canvas.drawString(
+            0,
+            y + self.delta_title,
+            'Local de pagamento'
+        )
+        self.pdf_canvas.drawString(
+            self.width - (45 * mm) + self.space,
+            y + self.delta_title,
+            'Vencimento'
+        )
+
+        # Linha grossa com primeiro campo logo tipo do banco
+        self.pdf_canvas.setLineWidth(3)
+        y += self.height_line
+        self.__horizontalLine(0, y, self.width)
+        self.pdf_canvas.setLineWidth(2)
+        self.__verticalLine(40 * mm, y, self.height_line)  # Logo Tipo
+        self.__verticalLine(60 * mm, y, self.height_line)  # Numero do Banco
+
+        if logo_image:
+            logo_image_path = load_image(logo_image)
+            self.pdf_canvas.drawImage(
+                logo_image_path,
+                0,
+                y + self.space + 1,
+                40 * mm,
+                self.height_line,
+                preserveAspectRatio=True,
+                anchor='sw'
+            )
+        self.pdf_canvas.setFont('Helvetica-Bold', 18)
+        self.pdf_canvas.drawCentredString(
+            50 * mm,
+            y + 2 * self.space,
+            codigo_dv_banco
+        )
+
+    def _drawReciboCaixa(self, boleto_dados, x, y):
+        """Imprime o Recibo do Caixa
+
+        :param boleto_dados: Objeto com os dados do boleto a ser preenchido.
+            Deve ser subclasse de :class:`pyboleto.data.BoletoData`
+        :type boleto_dados: :class:`pyboleto.data.BoletoData`
+
+        """
+        boleto_dados = boleto_dados.view
+        self.pdf_canvas.saveState()
+
+        self.pdf_canvas.translate(x, y)
+
+        self._formulario(
+            ('caixa', boleto_dados.logo_image, boleto_dados.codigo_dv_banco),
+            self._drawReciboCaixaFormulario,
+            boleto_dados.logo_image, boleto_dados.codigo_dv_banco)
+
+        # As alturas são as de _drawReciboCaixaFormulario
+        y = 1.5 * self.height_line
+        y += self.height_line
+        y += self.height_line
+
+        # Sacado, abaixo da linha grossa
+        y += self.height_line
         self.pdf_canvas.setFont('Helvetica', self.font_size_value)
+        sacado = boleto_dados.sacado
+        for i in range(len(sacado)):
+            self.pdf_canvas.drawString(
+                15 * mm,
+                (y - 10) - (i * self.delta_font),
+                sacado[i]
+            )
+
+        # Instruções, ao lado dos campos da direita
+        y += 4 * self.height_line
+        instrucoes = boleto_dados.instrucoes
+        for i in range(len(instrucoes)):
+            self.pdf_canvas.drawString(
+                2 * self.space,
+                y - (i * self.delta_font),
+                instrucoes[i]
+            )
+
+        # Linha com primeiro campo Uso do Banco
+        y += self.height_line
+        self.pdf_canvas.drawString(
+            (30 * mm) + self.space,
+            y + self.space,
+            boleto_dados.carteira
+        )
+        self.pdf_canvas.drawString(
+            ((30 + 20) * mm) + self.space,
+            y + self.space,
+            boleto_dados.especie
+        )
+        self.pdf_canvas.drawString(
+            ((30 + 20 + 20) * mm) + self.space,
+            y + self.space,
+            boleto_dados.quantidade
+        )
+        valor = ''
+        if boleto_dados.valor_centavos != 0:
+            valor = boleto_dados.valor
+        self.pdf_canvas.drawString(
+            ((30 + 20 + 20 + 20 + 20) * mm) + self.space,
+            y + self.space,
+            valor
+        )
+        valor_documento = boleto_dados.valor_documento
+        self.pdf_canvas.drawRightString(
+            self.width - 2 * self.space,
+            y + self.space,
+            valor_documento
+        )
+
+        # Linha com primeiro campo Data documento
+        y += self.height_line
         self.pdf_canvas.drawString(
             0,
             y + self.space,
-            boleto_dados.data_documento.strftime('%d/%m/%Y')
+            boleto_dados.data_documento
         )
         self.pdf_canvas.drawString(
             (30 * mm) + self.space,
@@ -700,20 +864,17 @@ class BoletoPDF(object):
         self.pdf_canvas.drawString(
             ((30 + 40 + 40) * mm) + self.space,
             y + self.space,
-            boleto_dados.data_processamento.strftime('%d/%m/%Y')
+            boleto_dados.data_processamento
         )
         self.pdf_canvas.drawRightString(
             self.width - 2 * self.space,
             y + self.space,
-            boleto_dados.format_nosso_numero()
+            boleto_dados.nosso_numero
         )
-        self.pdf_canvas.setFont('Helvetica', self.font_size_title)
 
-        # Linha horizontal com primeiro campo Cedente
+        # Linha com primeiro campo Cedente
         y += self.height_line
-        self.__horizontalLine(0, y, self.width)
-        self.pdf_canvas.drawString(0, y + self.delta_title + 10,
-                                   'Beneficiário')
+        self.pdf_canvas.setFont('Helvetica', self.font_size_title)
         self.pdf_canvas.drawString(
             self.width - (45 * mm) + self.space,
             y + self.delta_title + 10,
@@ -731,23 +892,9 @@ class BoletoPDF(object):
             y + self.space,
             boleto_dados.agencia_conta_cedente
         )
-        self.pdf_canvas.setFont('Helvetica', self.font_size_title)
 
-        # Linha horizontal com primeiro campo Local de Pagamento
+        # Linha com primeiro campo Local de Pagamento
         y += self.height_line + 10
-        self.__horizontalLine(0, y, self.width)
-        self.pdf_canvas.drawString(
-            0,
-            y + self.delta_title,
-            'Local de pagamento'
-        )
-        self.pdf_canvas.drawString(
-            self.width - (45 * mm) + self.space,
-            y + self.delta_title,
-            'Vencimento'
-        )
-
-        self.pdf_canvas.setFont('Helvetica', self.font_size_value)
         self.pdf_canvas.drawString(
             0,
             y + self.space,
@@ -756,35 +903,11 @@ class BoletoPDF(object):
         self.pdf_canvas.drawRightString(
             self.width - 2 * self.space,
             y + self.space,
-            boleto_dados.data_vencimento.strftime('%d/%m/%Y')
+            boleto_dados.data_vencimento
         )
-        self.pdf_canvas.setFont('Helvetica', self.font_size_title)
 
-        # Linha grossa com primeiro campo logo tipo do banco
-        self.pdf_canvas.setLineWidth(3)
+        # Linha com o logotipo e o código do banco
         y += self.height_line
-        self.__horizontalLine(0, y, self.width)
-        self.pdf_canvas.setLineWidth(2)
-        self.__verticalLine(40 * mm, y, self.height_line)  # Logo Tipo
-        self.__verticalLine(60 * mm, y, self.height_line)  # Numero do Banco
-
-        if boleto_dados.logo_image:
-            logo_image_path = load_image(boleto_dados.logo_image)
-            self.pdf_canvas.drawImage(
-                logo_image_path,
-                0,
-                y + self.space + 1,
-                40 * mm,
-                self.height_line,
-                preserveAspectRatio=True,
-                anchor='sw'
-            )
-        self.pdf_canvas.setFont('Helvetica-Bold', 18)
-        self.pdf_canvas.drawCentredString(
-            50 * mm,
-            y + 2 * self.space,
-            boleto_dados.codigo_dv_banco
-        )
         self.pdf_canvas.setFont('Helvetica-Bold', 11.5)
         self.pdf_canvas.drawRightString(
             self.width,
@@ -825,9 +948,11 @@ class BoletoPDF(object):
         drawBoletoCarneDuplo.
 
         :param boleto_dados: Objeto com os dados do boleto a ser preenchido.
-            Deve ser subclasse de :class:`pyboleto.data.BoletoData`
+            Deve ser subclasse de :class:`pyboleto.data.BoletoData` ou uma
+            :class:`pyboleto.view.BoletoView`
         :type boleto_dados: :class:`pyboleto.data.BoletoData`
         """
+        boleto_dados = boleto_dados.view
         x = 15 * mm
         d = self._draw_recibo_sacado_canhoto(boleto_dados, x, y)
         x += d[0] + 8 * mm
@@ -844,9 +969,11 @@ class BoletoPDF(object):
         várias páginas, uma por boleto.
 
         :param boleto_dados: Objeto com os dados do boleto a ser preenchido.
-            Deve ser subclasse de :class:`pyboleto.data.BoletoData`
+            Deve ser subclasse de :class:`pyboleto.data.BoletoData` ou uma
+            :class:`pyboleto.view.BoletoView`
         :type boleto_dados: :class:`pyboleto.data.BoletoData`
         """
+        boleto_dados = boleto_dados.view
         x = 9 * mm  # margem esquerda
         y = 10 * mm  # margem inferior
 
@@ -863,15 +990,47 @@ class BoletoPDF(object):
         y += d[1]
         return (self.width, y)
 
+    def drawBoletos(self, boletos, carne=False):
+        """Imprime uma sequência de boletos, um por página
+
+        ``boletos`` é consumido aos poucos, então pode ser um gerador; com
+        ``paginas_por_bloco`` só o bloco atual fica em memória.
+
+        :param boletos: Iterável de :class:`pyboleto.data.BoletoData` ou
+            :class:`pyboleto.view.BoletoView`.
+        :param carne: Se ``True`` imprime dois boletos por página com
+            :meth:`drawBoletoCarneDuplo`.
+        :return: Quantidade de páginas impressas.
+        """
+        boletos = iter(boletos)
+        paginas = 0
+        for boleto in boletos:
+            if carne:
+                self.drawBoletoCarneDuplo(boleto, next(boletos, None))
+            else:
+                self.drawBoleto(boleto)
+            self.nextPage()
+            paginas += 1
+        return paginas
+
     def nextPage(self):
         """Força início de nova página"""
 
         self.pdf_canvas.showPage()
+        if self._escritor is not None:
+            self._paginas_no_bloco += 1
+            if self._paginas_no_bloco >= self.paginas_por_bloco:
+                self._grava_bloco()
+                self._novo_canvas()
 
     def save(self):
         """Fecha boleto e constroi o arquivo"""
 
-        self.pdf_canvas.save()
+        if self._escritor is None:
+            self.pdf_canvas.save()
+        else:
+            self._grava_bloco()
+            self._escritor.fecha()
 
     def __horizontalLine(self, x, y, width):
         self.pdf_canvas.line(x, y, x + width, y)
@@ -879,43 +1038,25 @@ class BoletoPDF(object):
     def __verticalLine(self, x, y, width):
         self.pdf_canvas.line(x, y, x, y + width)
 
-    def _formataValorParaExibir(self, nfloat):
-        locale.setlocale(locale.LC_ALL, 'pt_BR.UTF-8')
-        if nfloat:
-            nfloat = float(nfloat)
-            txt = locale.currency(nfloat, grouping=True, symbol=None)
-        else:
-            txt = ""
-        return txt
+    def _formataValorParaExibir(self, centavos):
+        if centavos is None:
+            return ""
+        return formata_centavos(centavos)
 
     def _codigoBarraI25(self, num, x, y):
         """Imprime Código de barras otimizado para boletos
 
-        O código de barras é otmizado para que o comprimento seja sempre o
-        estipulado pela Febraban de 103mm.
+        O comprimento é sempre o estipulado pela Febraban, de 103mm: a
+        largura da barra estreita é calculada a partir da quantidade de
+        dígitos e as barras são desenhadas como um único caminho
+        (:mod:`pyboleto.codigobarras`).
 
         """
-        # http://en.wikipedia.org/wiki/Interleaved_2_of_5
-
-        altura = 13 * mm
-        comprimento = 103 * mm
-
-        thin_bar = 0.254320987654 * mm  # Tamanho correto aproximado
-
-        bc = I2of5(num,
-                   barWidth=thin_bar,
-                   ratio=3,
-                   barHeight=altura,
-                   bearers=0,
-                   quiet=0,
-                   checksum=0)
-
-        # Recalcula o tamanho do thin_bar para que o cod de barras tenha o
-        # comprimento correto
-        thin_bar = (thin_bar * comprimento) / bc.width
-        bc.__init__(num, barWidth=thin_bar)
-
-        bc.drawOn(self.pdf_canvas, x, y)
+        self.pdf_canvas.saveState()
+        self.pdf_canvas.transform(largura_estreita(num) * mm, 0, 0,
+                                  ALTURA * mm, x, y)
+        self.pdf_canvas.addLiteral(operadores_pdf(num))
+        self.pdf_canvas.restoreState()
 
 
 def load_image(logo_image):
@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.pdfdireto
+    ~~~~~~~~~~~~~~~~~~
+
+    Geração do boleto em PDF sem o ReportLab.
+
+    :class:`BoletoPDFDireto` desenha exatamente o mesmo layout de
+    :class:`pyboleto.pdf.BoletoPDF` (os métodos de desenho são os mesmos),
+    mas sobre um :class:`CanvasPDF`, que implementa só a parte do canvas do
+    ReportLab que o layout usa e escreve os operadores do PDF direto em
+    ``bytes``:
+
+    * as partes fixas (linhas, títulos, logotipos, QR Code do Pix) viram
+      *form XObjects* uma única vez por documento e já são gravadas
+      comprimidas; cada página só as referencia;
+    * por boleto, cada valor é um trecho ``BT ... Tj ET`` com o texto
+      escapado, e o código de barras junta os retângulos já prontos de cada
+      par de dígitos (:func:`pyboleto.codigobarras.operadores_pdf`);
+    * cada página é gravada assim que termina, com
+      :class:`pyboleto.pdfstream.EscritorPDF`, então a memória não cresce
+      com o tamanho do lote.
+
+    As fontes são as Type 1 padrão (Helvetica, Helvetica-Bold e Courier),
+    que não são embutidas; as larguras usadas para alinhar textos à direita
+    estão em :data:`LARGURAS`. Os textos são gravados em WinAnsi (cp1252),
+    e caracteres fora dele viram ``?``. Logotipos JPEG e PNG (sem canal
+    alfa e sem entrelaçamento) são embutidos sem decodificar; outros
+    formatos precisam do Pillow.
+
+"""
+import base64
+import io
+import struct
+import zlib
+from codecs import charmap_encode
+from encodings.cp1252 import encoding_table
+
+from .pdf import BoletoPDF, PIX_QRCODE
+from .pdfstream import EscritorPDF
+
+LARGURAS = {
+    'Helvetica': (0, ) * 32 + (
+        278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333,
+        278, 278, 556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278,
+        584, 584, 584, 556, 1015, 667, 667, 722, 722, 667, 611, 778, 722, 278,
+        500, 667, 556, 833, 722, 778, 667, 778, 722, 667, 611, 722, 667, 944,
+        667, 667, 611, 278, 278, 278, 469, 556, 333, 556, 556, 500, 556, 556,
+        278, 556, 556, 222, 222, 500, 222, 833, 556, 556, 556, 556, 333, 500,
+        278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584, 350, 556, 0,
+        222, 556, 333, 1000, 556, 556, 333, 1000, 667, 333, 1000, 0, 611, 0, 0,
+        222, 222, 333, 333, 350, 556, 1000, 333, 1000, 500, 333, 944, 0, 500,
+        667, 278, 333, 556, 556, 556, 556, 260, 556, 333, 737, 370, 556, 584,
+        333, 737, 333, 400, 584, 333, 333, 333, 556, 537, 278, 333, 333, 365,
+        556, 834, 834, 834, 611, 667, 667, 667, 667, 667, 667, 1000, 722, 667,
+        667, 667, 667, 278, 278, 278, 278, 722, 722, 778, 778, 778, 778, 778,
+        584, 778, 722, 722, 722, 722, 667, 667, 611, 556, 556, 556, 556, 556,
+        556, 889, 500, 556, 556, 556, 556, 278, 278, 278, 278, 556, 556, 556,
+        556, 556, 556, 556, 584, 611, 556, 556, 556, 556, 500, 556, 500),
+    'Helvetica-Bold': (0, ) * 32 + (
+        278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333,
+        278, 278, 556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333,
+        584, 584, 584, 611, 975, 722, 722, 722, 722, 667, 611, 778, 722, 278,
+        556, 722, 611, 833, 722, 778, 667, 778, 722, 667, 611, 722, 667, 944,
+        667, 667, 611, 333, 278, 333, 584, 556, 333, 556, 611, 556, 611, 556,
+        333, 611, 611, 278, 278, 556, 278, 889, 611, 611, 611, 611, 389, 556,
+        333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584, 350, 556, 0,
+        278, 556, 500, 1000, 556, 556, 333, 1000, 667, 333, 1000, 0, 611, 0, 0,
+        278, 278, 500, 500, 350, 556, 1000, 333, 1000, 556, 333, 944, 0, 500,
+        667, 278, 333, 556, 556, 556, 556, 280, 556, 333, 737, 370, 556, 584,
+        333, 737, 333, 400, 584, 333, 333, 333, 611, 556, 278, 333, 333, 365,
+        556, 834, 834, 834, 611, 722, 722, 722, 722, 722, 722, 1000, 722, 667,
+        667, 667, 667, 278, 278, 278, 278, 722, 722, 778, 778, 778, 778, 778,
+        584, 778, 722, 722, 722, 722, 667, 667, 611, 556, 556, 556, 556, 556,
+        556, 889, 556, 556, 556, 556, 556, 278, 278, 278, 278, 611, 611, 611,
+        611, 611, 611, 611, 584, 611, 611, 611, 611, 611, 556, 611, 556),
+}
+"""Larguras dos caracteres de cada fonte em WinAnsi, em milésimos do tamanho
+
+As mesmas das métricas AFM da Adobe usadas pelo ReportLab. A Courier tem
+largura fixa de 600.
+"""
+
+# Nome de cada fonte nos recursos das páginas e formulários
+_FONTES = (('F1', 'Helvetica'), ('F2', 'Helvetica-Bold'), ('F3', 'Courier'))
+_NOME_FONTE = dict((fonte, nome) for nome, fonte in _FONTES)
+
+
+def _codifica(texto):
+    """Texto em WinAnsi, com ``?`` no lugar dos caracteres que faltam"""
+    # O mesmo que texto.encode('cp1252', 'replace'), sem passar pelo
+    # codec em Python
+    return charmap_encode(texto, 'replace', encoding_table)[0]
+
+
+def _escapa(dados):
+    if b'(' in dados or b')' in dados or b'\\' in dados:
+        dados = dados.replace(b'\\', b'\\\\').replace(
+            b'(', b'\\(').replace(b')', b'\\)')
+    return dados
+
+
+def _stream(entradas, dados):
+    """Objeto stream comprimido: ``(dicionario, stream)``"""
+    dados = zlib.compress(dados)
+    dicionario = b'<< %s /Filter /FlateDecode /Length %d >>' % (
+        entradas, len(dados))
+    return dicionario, dados
+
+
+def _dimensoes_jpeg(dados):
+    """Largura, altura e componentes de um JPEG, pelo marcador SOF"""
+    posicao = 2
+    while posicao < len(dados):
+        if dados[posicao] != 0xFF:
+            posicao += 1
+            continue
+        marcador = dados[posicao + 1]
+        if marcador in (0xD8, 0x01) or 0xD0 <= marcador <= 0xD7 or \
+                marcador == 0xFF:
+            posicao += 1 if marcador == 0xFF else 2
+            continue
+        tamanho = struct.unpack('>H', dados[posicao + 2:posicao + 4])[0]
+        if 0xC0 <= marcador <= 0xCF and marcador not in (0xC4, 0xC8, 0xCC):
+            altura, largura, componentes = struct.unpack(
+                '>HHB', dados[posicao + 5:posicao + 10])
+            return largura, altura, componentes
+        posicao += 2 + tamanho
+    raise ValueError("JPEG image without a SOF marker")
+
+
+def _imagem_jpeg(dados):
+    largura, altura, componentes = _dimensoes_jpeg(dados)
+    cor = {1: b'/DeviceGray', 3: b'/DeviceRGB',
+           4: b'/DeviceCMYK /Decode [1 0 1 0 1 0 1 0]'}[componentes]
+    return largura, altura, (
+        b'<< /Type /XObject /Subtype /Image /Width %d /Height %d '
+        b'/ColorSpace %s /BitsPerComponent 8 /Filter /DCTDecode '
+        b'/Length %d >>' % (largura, altura, cor, len(dados)), dados)
+
+
+def _imagem_png(dados):
+    """Image XObject com os dados do PNG, ou ``None`` se não for possível
+
+    O PDF lê os dados comprimidos do PNG (``IDAT``) com o mesmo preditor,
+    então não é preciso decodificar a imagem. Não servem imagens com canal
+    alfa ou entrelaçadas.
+    """
+    posicao = 8
+    idat = []
+    paleta = b''
+    while posicao < len(dados):
+        tamanho, tipo = struct.unpack('>I4s', dados[posicao:posicao + 8])
+        conteudo = dados[posicao + 8:posicao + 8 + tamanho]
+        if tipo == b'IHDR':
+            largura, altura, bits, tipo_cor, _, _, entrelacado = \
+                struct.unpack('>IIBBBBB', conteudo)
+        elif tipo == b'PLTE':
+            paleta = conteudo
+        elif tipo == b'IDAT':
+            idat.append(conteudo)
+        posicao += 12 + tamanho
+    if entrelacado or tipo_cor not in (0, 2, 3):
+        return None
+    if tipo_cor == 3:
+        cor = b'[/Indexed /DeviceRGB %d <%s>]' % (
+            len(paleta) // 3 - 1, base64.b16encode(paleta))
+    else:
+        cor = b'/DeviceGray' if tipo_cor == 0 else b'/DeviceRGB'
+    cores = 3 if tipo_cor == 2 else 1
+    idat = b''.join(idat)
+    return largura, altura, (
+        b'<< /Type /XObject /Subtype /Image /Width %d /Height %d '
+        b'/ColorSpace %s /BitsPerComponent %d /Filter /FlateDecode '
+        b'/DecodeParms << /Predictor 15 /Colors %d /BitsPerComponent %d '
+        b'/Columns %d >> /Length %d >>' % (
+            largura, altura, cor, bits, cores, bits, largura, len(idat)),
+        idat)
+
+
+def _imagem_pillow(dados):
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ValueError("only JPEG and PNG images are supported "
+                         "without Pillow")
+    try:
+        imagem = Image.open(io.BytesIO(dados)).convert('RGB')
+    except (IOError, OSError):
+        raise ValueError("unsupported image format")
+    largura, altura = imagem.size
+    dicionario, stream = _stream(
+        b'/Type /XObject /Subtype /Image /Width %d /Height %d '
+        b'/ColorSpace /DeviceRGB /BitsPerComponent 8' % (largura, altura),
+        imagem.tobytes())
+    return largura, altura, (dicionario, stream)
+
+
+def le_imagem(dados):
+    """Image XObject a partir do conteúdo de um arquivo de imagem
+
+    :param dados: ``bytes`` de um JPEG, PNG ou, com o Pillow instalado,
+        qualquer formato que ele leia.
+    :return: Tupla ``(largura, altura, (dicionario, stream))``.
+    :exception ValueError: Se a imagem não puder ser embutida.
+    """
+    if dados[:2] == b'\xff\xd8':
+        return _imagem_jpeg(dados)
+    if dados[:8] == b'\x89PNG\r\n\x1a\n':
+        imagem = _imagem_png(dados)
+        if imagem is not None:
+            return imagem
+    return _imagem_pillow(dados)
+
+
+class CanvasPDF(object):
+    """Canvas que escreve os operadores do PDF direto em ``bytes``
+
+    Implementa os métodos do ``reportlab.pdfgen.canvas.Canvas`` usados por
+    :class:`pyboleto.pdf.BoletoPDF`, com os mesmos argumentos, e grava cada
+    página com um :class:`pyboleto.pdfstream.EscritorPDF`.
+
+    :param arquivo: Arquivo ou *file-like* com ``write``.
+    :param pagesize: Tupla ``(largura, altura)`` das páginas.
+
+    """
+
+    def __init__(self, arquivo, pagesize):
+        self.pagesize = pagesize
+        self._escritor = EscritorPDF(arquivo)
+        self._mediabox = b'/MediaBox [0 0 %.4f %.4f]' % pagesize
+        fontes = []
+        for nome, fonte in _FONTES:
+            numero = self._escritor.grava(
+                b'<< /Type /Font /Subtype /Type1 /Name /%s /BaseFont /%s '
+                b'/Encoding /WinAnsiEncoding >>' % (nome.encode(),
+                                                    fonte.encode()))
+            fontes.append(b'/%s %d 0 R' % (nome.encode(), numero))
+        self._fontes = self._escritor.grava(b'<< %s >>' % b' '.join(fontes))
+        # Form e image XObjects já gravados: nome -> número do objeto
+        self._xobjects = {}
+        # Imagens já gravadas: arquivo -> (nome, largura, altura)
+        self._imagens = {}
+        self._formulario = None
+        self._inicia()
+
+    def _inicia(self):
+        self._partes = []
+        self._usados = set()
+        self._pilha = []
+        self.setFont('Helvetica', 12)
+
+    def _recursos(self):
+        xobjects = b' '.join(b'/%s %d 0 R' % (nome.encode(),
+                                              self._xobjects[nome])
+                             for nome in sorted(self._usados))
+        return b'/Resources << /Font %d 0 R /XObject << %s >> >>' % (
+            self._fontes, xobjects)
+
+    # Estado gráfico
+
+    def saveState(self):
+        self._pilha.append((self._fontname, self._fontsize))
+        self._partes.append(b'q\n')
+
+    def restoreState(self):
+        self.setFont(*self._pilha.pop())
+        self._partes.append(b'Q\n')
+
+    def translate(self, dx, dy):
+        self._partes.append(b'1 0 0 1 %.4f %.4f cm\n' % (dx, dy))
+
+    def transform(self, a, b, c, d, e, f):
+        self._partes.append(b'%.6f %.6f %.6f %.6f %.4f %.4f cm\n' % (
+            a, b, c, d, e, f))
+
+    def addLiteral(self, s):
+        """Operadores do PDF, incluídos sem alteração"""
+        self._partes.append(s.encode('ascii') + b'\n')
+
+    def setLineWidth(self, largura):
+        self._partes.append(b'%.4f w\n' % largura)
+
+    def setDash(self, array=(), phase=0):
+        if isinstance(array, (int, float)):
+            array, phase = (array, phase), 0
+        self._partes.append(b'[%s] %.4f d\n' % (
+            b' '.join(b'%.4f' % valor for valor in array), phase))
+
+    # Desenho
+
+    def line(self, x1, y1, x2, y2):
+        self._partes.append(b'%.4f %.4f m %.4f %.4f l S\n' % (
+            x1, y1, x2, y2))
+
+    def rect(self, x, y, width, height, stroke=1, fill=0):
+        operador = (b'n', b'S', b'f', b'B')[bool(stroke) + 2 * bool(fill)]
+        self._partes.append(b'%.4f %.4f %.4f %.4f re %s\n' % (
+            x, y, width, height, operador))
+
+    # Texto
+
+    def setFont(self, psfontname, size):
+        self._fontname = psfontname
+        self._fontsize = size
+        self._texto = b'BT /%s %.4f Tf 1 0 0 1 ' % (
+            _NOME_FONTE[psfontname].encode(), size)
+
+    def _largura(self, dados, fonte, tamanho):
+        if fonte == 'Courier':
+            return 0.6 * len(dados) * tamanho
+        return sum(map(LARGURAS[fonte].__getitem__, dados)) * tamanho / 1000.0
+
+    def stringWidth(self, text, fontName=None, fontSize=None):
+        return self._largura(_codifica(text), fontName or self._fontname,
+                             self._fontsize if fontSize is None else fontSize)
+
+    def _desenha_texto(self, x, y, dados):
+        self._partes.append(self._texto + b'%.4f %.4f Tm (%s) Tj ET\n' % (
+            x, y, _escapa(dados)))
+
+    def drawString(self, x, y, text):
+        if text:
+            self._desenha_texto(x, y, _codifica(text))
+
+    def drawRightString(self, x, y, text):
+        if text:
+            dados = _codifica(text)
+            self._desenha_texto(
+                x - self._largura(dados, self._fontname, self._fontsize),
+                y, dados)
+
+    def drawCentredString(self, x, y, text):
+        if text:
+            dados = _codifica(text)
+            self._desenha_texto(
+                x - self._largura(dados, self._fontname, self._fontsize) / 2.0,
+                y, dados)
+
+    # XObjects
+
+    def drawImage(self, image, x, y, width=None, height=None, mask=None,
+                  preserveAspectRatio=False, anchor='c'):
+        """Desenha uma imagem, gravada no documento uma única vez
+
+        :param image: Caminho de um arquivo ou ``bytes`` da imagem.
+        """
+        imagem = self._imagens.get(image)
+        if imagem is None:
+            if isinstance(image, bytes):
+                dados = image
+            else:
+                with open(image, 'rb') as arquivo:
+                    dados = arquivo.read()
+            largura, altura, objeto = le_imagem(dados)
+            nome = 'Imagem%d' % len(self._imagens)
+            self._xobjects[nome] = self._escritor.grava(*objeto)
+            imagem = self._imagens[image] = (nome, largura, altura)
+        nome, largura, altura = imagem
+
+        if width is None:
+            width = largura
+        if height is None:
+            height = altura
+        if preserveAspectRatio:
+            escala = min(float(width) / largura, float(height) / altura)
+            sobra_x = width - largura * escala
+            sobra_y = height - altura * escala
+            width, height = largura * escala, altura * escala
+            if 'e' in anchor:
+                x += sobra_x
+            elif 'w' not in anchor:
+                x += sobra_x / 2.0
+            if 'n' in anchor:
+                y += sobra_y
+            elif 's' not in anchor:
+                y += sobra_y / 2.0
+        self._usados.add(nome)
+        self._partes.append(b'q %.4f 0 0 %.4f %.4f %.4f cm /%s Do Q\n' % (
+            width, height, x, y, nome.encode()))
+
+    def beginForm(self, name, lowerx=0, lowery=0, upperx=None, uppery=None):
+        if upperx is None:
+            upperx = self.pagesize[0]
+        if uppery is None:
+            uppery = self.pagesize[1]
+        self._formulario = (name, (lowerx, lowery, upperx, uppery),
+                            self._partes, self._usados)
+        self._partes = []
+        self._usados = set()
+
+    def endForm(self):
+        nome, caixa, partes, usados = self._formulario
+        self._xobjects[nome] = self._escritor.grava(*_stream(
+            b'/Type /XObject /Subtype /Form /BBox [%.4f %.4f %.4f %.4f] %s'
+            % (caixa + (self._recursos(), )),
+            b''.join(self._partes)))
+        self._partes, self._usados = partes, usados
+        self._formulario = None
+
+    def doForm(self, name):
+        self._usados.add(name)
+        self._partes.append(b'/%s Do\n' % name.encode())
+
+    # Páginas
+
+    def showPage(self):
+        conteudo = self._escritor.grava(*_stream(b'', b''.join(self._partes)))
+        self._escritor.adiciona_pagina(b'%s %s /Contents %d 0 R' % (
+            self._mediabox, self._recursos(), conteudo))
+        self._inicia()
+
+    def save(self):
+        """Grava a página atual, se houver, e fecha o documento
+
+        Como o ReportLab, um documento sem páginas ganha uma página em
+        branco. O arquivo não é fechado.
+        """
+        if self._partes or not self._escritor.paginas:
+            self.showPage()
+        self._escritor.fecha()
+
+
+class BoletoPDFDireto(BoletoPDF):
+    """Geração do Boleto em PDF sem o ReportLab
+
+    Mesma interface e mesmo desenho de :class:`pyboleto.pdf.BoletoPDF`,
+    sobre um :class:`CanvasPDF`. Cada página é gravada em ``file_descr`` no
+    :meth:`nextPage`.
+
+    eg::
+
+        with open('boletos.pdf', 'wb') as arquivo:
+            pdf = BoletoPDFDireto(arquivo)
+            pdf.drawBoletos(boletos)
+            pdf.save()
+
+    :param file_descr: Um arquivo ou *file-like* com ``write``.
+    :param landscape: Formato da folha. Usar ``True`` para boleto
+        tipo carnê.
+
+    """
+
+    def __init__(self, file_descr, landscape=False):
+        super(BoletoPDFDireto, self).__init__(file_descr, landscape)
+
+    def _novo_canvas(self):
+        self.pdf_canvas = CanvasPDF(self.file_descr, self.pagesize)
+        self._formularios = {}
+
+    def _imagem_pix(self):
+        return base64.b64decode(PIX_QRCODE)
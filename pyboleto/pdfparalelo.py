@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.pdfparalelo
+    ~~~~~~~~~~~~~~~~~~~~
+
+    Geração de um PDF com vários processos.
+
+    O ReportLab roda em um único núcleo. :func:`gera_pdf` divide os boletos
+    em blocos, desenha cada bloco em um documento separado em um
+    :class:`multiprocessing.Pool` e junta os documentos, na ordem original,
+    com :class:`pyboleto.pdfstream.EscritorPDF`, que grava uma única vez as
+    fontes, logotipos e formulários repetidos entre os blocos.
+
+    O processo principal só lê os blocos prontos e copia as páginas para o
+    arquivo final; essa cópia é a parte que não paraleliza (veja
+    ``benchmarks/bench_pdf_paralelo.py``).
+
+"""
+import collections
+import io
+import itertools
+
+from .pdfstream import EscritorPDF
+
+
+def _desenha_bloco(boletos, carne):
+    """Executado nos processos do pool: PDF de um bloco de boletos"""
+    from .pdf import BoletoPDF
+
+    arquivo = io.BytesIO()
+    pdf = BoletoPDF(arquivo, landscape=carne)
+    pdf.drawBoletos(boletos, carne=carne)
+    pdf.save()
+    return arquivo.getvalue()
+
+
+def _blocos(boletos, tamanho):
+    boletos = iter(boletos)
+    while True:
+        bloco = list(itertools.islice(boletos, tamanho))
+        if not bloco:
+            return
+        yield bloco
+
+
+def gera_pdf(boletos, file_descr, processos=None, boletos_por_bloco=100,
+             carne=False):
+    """Gera um PDF com os boletos usando vários processos
+
+    Mesmo conteúdo de :meth:`pyboleto.pdf.BoletoPDF.drawBoletos` seguido
+    de ``save()``, com as páginas na ordem de ``boletos``.
+
+    eg::
+
+        with open('boletos.pdf', 'wb') as arquivo:
+            gera_pdf(boletos, arquivo, processos=8)
+
+    ``boletos`` é consumido aos poucos: no máximo dois blocos por processo
+    ficam pendentes, então a memória não cresce com o tamanho do lote. Os
+    boletos são enviados aos processos com :mod:`pickle`.
+
+    :param boletos: Iterável de :class:`pyboleto.data.BoletoData`.
+    :param file_descr: Um arquivo ou *file-like* com ``write``.
+    :param processos: Quantidade de processos. O padrão é o número de
+        núcleos; com ``1`` os blocos são desenhados no próprio processo.
+    :param boletos_por_bloco: Boletos desenhados por tarefa. Blocos
+        maiores diminuem o custo de juntar os documentos.
+    :param carne: Se ``True`` imprime dois boletos por página com
+        :meth:`pyboleto.pdf.BoletoPDF.drawBoletoCarneDuplo`.
+    :return: Quantidade de páginas gravadas.
+    :exception ValueError: Se ``boletos_por_bloco`` for menor que 1.
+    """
+    if boletos_por_bloco < 1:
+        raise ValueError("boletos_por_bloco must be at least 1")
+    if carne and boletos_por_bloco % 2:
+        # Os dois boletos de uma página do carnê ficam no mesmo bloco
+        boletos_por_bloco += 1
+
+    escritor = EscritorPDF(file_descr)
+    blocos = _blocos(boletos, boletos_por_bloco)
+    if processos == 1:
+        for bloco in blocos:
+            escritor.adiciona(_desenha_bloco(bloco, carne))
+    else:
+        import multiprocessing
+
+        with multiprocessing.Pool(processos) as pool:
+            # Pool.imap consumiria todos os blocos de uma vez; aqui só
+            # 2 * processos ficam na fila
+            limite = 2 * (processos or multiprocessing.cpu_count())
+            pendentes = collections.deque()
+            for bloco in blocos:
+                pendentes.append(pool.apply_async(_desenha_bloco,
+                                                  (bloco, carne)))
+                if len(pendentes) >= limite:
+                    escritor.adiciona(pendentes.popleft().get())
+            while pendentes:
+                escritor.adiciona(pendentes.popleft().get())
+    if not escritor.paginas:
+        # Como o BoletoPDF: um documento sem boletos tem uma página em branco
+        escritor.adiciona(_desenha_bloco([], carne))
+    escritor.fecha()
+    return escritor.paginas
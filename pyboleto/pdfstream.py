@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.pdfstream
+    ~~~~~~~~~~~~~~~~~~
+
+    Gravação de um PDF aos poucos, a partir de vários PDFs menores.
+
+    O canvas do ReportLab guarda todas as páginas até o ``save()``. Para
+    lotes muito grandes :class:`pyboleto.pdf.BoletoPDF` desenha blocos de
+    páginas em documentos separados e entrega cada bloco pronto a um
+    :class:`EscritorPDF`, que copia as páginas para o arquivo final assim
+    que recebe o bloco. Só ficam em memória o bloco atual, a posição de
+    cada objeto já gravado (para a tabela ``xref``) e os recursos
+    compartilhados.
+
+    Fontes, formulários (*form XObjects*) e imagens que se repetem entre os
+    blocos são gravados uma única vez: objetos com o mesmo conteúdo, depois
+    de renumerados, viram o mesmo objeto no arquivo final.
+
+    :class:`pyboleto.pdfdireto.BoletoPDFDireto` usa o mesmo
+    :class:`EscritorPDF` para gravar os objetos e as páginas que ele mesmo
+    monta, com :meth:`EscritorPDF.grava` e
+    :meth:`EscritorPDF.adiciona_pagina`.
+
+    Este módulo não depende do ReportLab. Ele lê apenas PDFs como os que o
+    ReportLab gera: tabela ``xref`` clássica, dicionários sem ``N 0 R``
+    dentro de strings e ``/Length`` direto no dicionário dos streams.
+
+"""
+import re
+from array import array
+
+_REFERENCIA = re.compile(br'(\d+) 0 R')
+_STARTXREF = re.compile(br'startxref\s+(\d+)')
+_CONTENTS = re.compile(br'/Contents (\d+) 0 R')
+_LENGTH = re.compile(br'/Length (\d+)')
+_KIDS = re.compile(br'/Kids \[([^\]]*)\]')
+_PAGES = re.compile(br'/Pages (\d+) 0 R')
+
+CABECALHO = b'%PDF-1.4\n%\x93\x8c\x8b\x9e\n'
+
+# Números reservados no arquivo final; os dois só são gravados no fim
+_CATALOGO = 1
+_PAGINAS = 2
+
+
+def le_objetos(dados):
+    """Objetos de um PDF pela tabela ``xref``
+
+    :param dados: ``bytes`` do PDF.
+    :return: Tupla ``(objetos, raiz)``: ``objetos`` mapeia o número de cada
+        objeto para ``(dicionario, stream)``, com ``stream = None`` se não
+        for um stream; ``raiz`` é o número do catálogo.
+    :exception ValueError: Se o PDF não tiver uma tabela ``xref`` clássica.
+    """
+    inicio_xref = _STARTXREF.findall(dados[-64:])
+    if not inicio_xref or not dados.startswith(b'xref',
+                                               int(inicio_xref[-1])):
+        raise ValueError("PDF without a classic xref table")
+    posicao = int(inicio_xref[-1])
+    linhas = dados[posicao:dados.index(b'trailer', posicao)].split(b'\n')
+    primeiro, quantidade = map(int, linhas[1].split())
+    objetos = {}
+    for numero in range(primeiro, primeiro + quantidade):
+        entrada = linhas[2 + numero - primeiro]
+        if entrada[17:18] != b'n':
+            continue
+        inicio = dados.index(b'obj', int(entrada[:10])) + 4
+        # O dicionário não contém nenhum dos dois; os dados do stream
+        # podem conter ``endobj``, mas vêm depois de ``stream``
+        fim = dados.index(b'endobj', inicio)
+        stream = dados.find(b'\nstream\n', inicio)
+        if not 0 <= stream < fim:
+            objetos[numero] = (dados[inicio:fim].rstrip(), None)
+        else:
+            dicionario = dados[inicio:stream]
+            tamanho = int(_LENGTH.search(dicionario).group(1))
+            objetos[numero] = (dicionario,
+                               dados[stream + 8:stream + 8 + tamanho])
+    trailer = dados[dados.index(b'trailer', posicao):]
+    raiz = int(re.search(br'/Root (\d+) 0 R', trailer).group(1))
+    return objetos, raiz
+
+
+class EscritorPDF(object):
+    """Grava um PDF com as páginas de vários PDFs, na ordem recebida
+
+    eg::
+
+        escritor = EscritorPDF(arquivo)
+        for bloco in blocos:
+            escritor.adiciona(bloco)
+        escritor.fecha()
+
+    :param arquivo: Arquivo ou *file-like* aberto para escrita binária;
+        basta ter ``write``, então serve um socket (``makefile('wb')``).
+
+    Todas as páginas devem usar as mesmas dimensões de cada PDF de origem
+    (o ``/MediaBox`` é copiado de cada página).
+
+    """
+
+    def __init__(self, arquivo):
+        self.arquivo = arquivo
+        self.posicao = 0
+        # Posição de cada objeto no arquivo; o índice é o número do objeto
+        self._posicoes = array('q', [0, 0, 0])
+        self._paginas = array('q')
+        self._compartilhados = {}
+        self._escreve(CABECALHO)
+
+    @property
+    def paginas(self):
+        """Quantidade de páginas gravadas até agora"""
+        return len(self._paginas)
+
+    def _escreve(self, dados):
+        self.arquivo.write(dados)
+        self.posicao += len(dados)
+
+    def _grava(self, dicionario, stream=None, numero=None):
+        if numero is None:
+            numero = len(self._posicoes)
+            self._posicoes.append(self.posicao)
+        else:
+            self._posicoes[numero] = self.posicao
+        if stream is None:
+            self._escreve(b'%d 0 obj\n%s\nendobj\n' % (numero, dicionario))
+        else:
+            self._escreve(b'%d 0 obj\n%s\nstream\n%s\nendstream\nendobj\n' % (
+                numero, dicionario, stream))
+        return numero
+
+    def grava(self, dicionario, stream=None):
+        """Grava um objeto novo no fim do arquivo
+
+        :param dicionario: ``bytes`` do objeto; se for um stream, o
+            dicionário completo, com ``/Length``.
+        :param stream: ``bytes`` do stream, já codificado.
+        :return: Número do objeto, para as referências ``N 0 R``.
+        """
+        return self._grava(dicionario, stream)
+
+    def adiciona_pagina(self, entradas):
+        """Grava uma página nova no fim do arquivo
+
+        :param entradas: ``bytes`` com as entradas do dicionário da
+            página, menos ``/Type`` e ``/Parent``: ``/MediaBox``,
+            ``/Resources`` e ``/Contents``.
+        :return: Número do objeto da página.
+        """
+        numero = self._grava(b'<<\n/Parent %d 0 R /Type /Page %s\n>>' % (
+            _PAGINAS, entradas))
+        self._paginas.append(numero)
+        return numero
+
+    def adiciona(self, dados):
+        """Copia todas as páginas do PDF ``dados`` para o fim do arquivo
+
+        :param dados: ``bytes`` de um PDF gerado pelo ReportLab.
+        :return: Quantidade de páginas copiadas.
+        """
+        objetos, raiz = le_objetos(dados)
+        paginas = int(_PAGES.search(objetos[raiz][0]).group(1))
+        kids = _REFERENCIA.findall(_KIDS.search(objetos[paginas][0]).group(1))
+        copiados = {paginas: _PAGINAS}
+
+        def copia(numero, compartilhado):
+            novo = copiados.get(numero)
+            if novo is not None:
+                return novo
+            dicionario, stream = objetos[numero]
+            conteudo = None
+            if not compartilhado:
+                # Página: o conteúdo é só dela, o resto são recursos
+                conteudo = _CONTENTS.search(dicionario)
+                conteudo = conteudo and int(conteudo.group(1))
+            dicionario = _REFERENCIA.sub(
+                lambda m: b'%d 0 R' % copia(int(m.group(1)),
+                                            int(m.group(1)) != conteudo),
+                dicionario)
+            if compartilhado:
+                chave = (dicionario, stream)
+                novo = self._compartilhados.get(chave)
+                if novo is None:
+                    novo = self._grava(dicionario, stream)
+                    self._compartilhados[chave] = novo
+            else:
+                novo = self._grava(dicionario, stream)
+            copiados[numero] = novo
+            return novo
+
+        for kid in kids:
+            self._paginas.append(copia(int(kid), False))
+        return len(kids)
+
+    def _escreve_em_partes(self, formato, valores, partes=4096):
+        # Um join por parte: a memória não cresce com o tamanho do lote
+        for inicio in range(0, len(valores), partes):
+            self._escreve(b''.join(formato % valor for valor in
+                                   valores[inicio:inicio + partes]))
+
+    def fecha(self):
+        """Grava a árvore de páginas, o catálogo e a tabela ``xref``
+
+        O arquivo não é fechado.
+        """
+        self._posicoes[_PAGINAS] = self.posicao
+        self._escreve(b'%d 0 obj\n<<\n/Count %d /Kids [ ' % (
+            _PAGINAS, len(self._paginas)))
+        self._escreve_em_partes(b'%d 0 R ', self._paginas)
+        self._escreve(b']\n/Type /Pages\n>>\nendobj\n')
+        self._grava(b'<<\n/PageMode /UseNone /Pages %d 0 R /Type /Catalog\n'
+                    b'>>' % _PAGINAS, numero=_CATALOGO)
+        inicio_xref = self.posicao
+        total = len(self._posicoes)
+        self._escreve(b'xref\n0 %d\n0000000000 65535 f \n' % total)
+        self._escreve_em_partes(b'%010d 00000 n \n', self._posicoes[1:])
+        self._escreve(b'trailer\n<<\n/Root %d 0 R /Size %d\n>>\n'
+                      b'startxref\n%d\n%%%%EOF\n' % (_CATALOGO, total,
+                                                     inicio_xref))
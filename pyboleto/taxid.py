@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.taxid
+    ~~~~~~~~~~~~~~
+
+    Validação e normalização de CPF e CNPJ.
+
+    ``cedente_documento`` e ``sacado_documento`` são impressos como foram
+    informados. As funções deste módulo conferem os dígitos verificadores
+    antes de gerar os boletos:
+
+    * :func:`normaliza_documento` tira a pontuação, confere os DVs e
+      retorna só os caracteres do documento, ou levanta ``ValueError``;
+    * :func:`normaliza_documentos` faz o mesmo para uma sequência inteira,
+      sem exceções: documentos inválidos viram ``None``;
+    * :func:`formata_documento` monta a máscara para impressão
+      (``000.000.000-00`` ou ``00.000.000/0000-00``).
+
+    Os DVs usam :class:`pyboleto.checksum.Checksum` (módulo 11, resto 0 ou 1
+    vira 0). O CNPJ alfanumérico (Receita Federal, a partir de julho de 2026)
+    é aceito: as 12 primeiras posições podem ter letras maiúsculas, que
+    valem o código ASCII menos 48 no cálculo, e os dois DVs continuam
+    numéricos. CPF e CNPJ com todos os caracteres iguais são recusados.
+
+    Se os documentos forem um array do NumPy (ex. uma coluna de um
+    ``DataFrame``) :func:`normaliza_documentos` é vetorizada
+    (:func:`pyboleto.vectorized.normaliza_documentos`).
+
+"""
+import string
+from operator import getitem
+
+from .arrays import vetorizado
+from .checksum import DIGITOS, Checksum
+
+CPF = 'CPF'
+CNPJ = 'CNPJ'
+
+TAMANHOS = {CPF: 11, CNPJ: 14}
+"""Tamanho de cada tipo de documento, sem pontuação e com os DVs"""
+
+ALFANUMERICOS = DIGITOS + string.ascii_uppercase
+"""Caracteres aceitos na raiz e na ordem do CNPJ"""
+
+_REGRA = [0, 0] + [11 - resto for resto in range(2, 11)]
+
+DV_CPF = Checksum(range(2, 12), 11, _REGRA)
+"""DVs do CPF: o primeiro sobre 9 dígitos (pesos 2 a 10) e o segundo
+sobre 10 dígitos (pesos 2 a 11)"""
+
+DV_CNPJ = Checksum(range(2, 10), 11, _REGRA, caracteres=ALFANUMERICOS)
+"""DVs do CNPJ: pesos 2 a 9 repetidos, sobre 12 e 13 caracteres"""
+
+_DVS = {11: DV_CPF, 14: DV_CNPJ}
+_TIPOS = {11: CPF, 14: CNPJ}
+
+# Para cada tamanho: tabelas das posições do primeiro e do segundo DV e a
+# regra, para conferir os dois DVs sem passar pelo Checksum.__call__
+_POSICOES = dict(
+    (tamanho, (dv.posicoes(tamanho - 2), dv.posicoes(tamanho - 1), _REGRA))
+    for tamanho, dv in _DVS.items())
+
+PONTUACAO = '.-/ '
+"""Caracteres removidos pela normalização"""
+
+
+def limpa_documento(documento):
+    """``documento`` sem pontuação e em maiúsculas, sem conferir os DVs"""
+    # str.replace é bem mais rápido que str.translate para apagar
+    return documento.replace('.', '').replace('-', '').replace(
+        '/', '').replace(' ', '').upper()
+
+
+def dvs(base):
+    """Os dois DVs de um CPF (9 dígitos) ou CNPJ (12 caracteres)
+
+    :rtype: ``str`` com dois dígitos
+    :exception ValueError: Se a base tiver outro tamanho ou caracteres
+        inválidos.
+    """
+    checksum = _DVS.get(len(base) + 2)
+    if checksum is None:
+        raise ValueError("base must have 9 (CPF) or 12 (CNPJ) characters, "
+                         "got %r" % (base, ))
+    dv1 = checksum(base)
+    return '%d%d' % (dv1, checksum(base + str(dv1)))
+
+
+def _valido(documento):
+    """``True`` se ``documento`` (já limpo) tiver os DVs corretos"""
+    try:
+        posicoes1, posicoes2, regra = _POSICOES[len(documento)]
+        codigos = documento.encode('ascii')
+        dv1 = regra[sum(map(getitem, posicoes1, codigos)) % 11]
+        dv2 = regra[sum(map(getitem, posicoes2, codigos)) % 11]
+    except (KeyError, UnicodeEncodeError, TypeError):
+        return False
+    return (codigos[-2] == 48 + dv1 and codigos[-1] == 48 + dv2 and
+            documento.count(documento[0]) != len(documento))
+
+
+def _completa(documento, tipo):
+    # Zeros à esquerda que se perdem quando o documento passa por um número
+    if tipo is None:
+        return documento
+    return documento.rjust(TAMANHOS[tipo], '0')
+
+
+def tipo_documento(documento):
+    """:data:`CPF` ou :data:`CNPJ` pelo tamanho sem pontuação, ou ``None``
+    """
+    return _TIPOS.get(len(limpa_documento(documento)))
+
+
+def normaliza_documento(documento, tipo=None):
+    """Confere um CPF ou CNPJ e retorna só os seus caracteres
+
+    eg::
+
+        >>> normaliza_documento('123.456.789-09')
+        '12345678909'
+
+    :param documento: ``str`` com ou sem pontuação.
+    :param tipo: Opcional. :data:`CPF` ou :data:`CNPJ`; completa com zeros
+        à esquerda e recusa documentos do outro tipo.
+    :exception ValueError: Se o documento não for válido.
+    """
+    if tipo is not None and tipo not in TAMANHOS:
+        raise ValueError("tipo must be %r or %r, got %r" % (CPF, CNPJ, tipo))
+    limpo = _completa(limpa_documento(documento), tipo)
+    if tipo is not None and len(limpo) != TAMANHOS[tipo]:
+        raise ValueError("%s must have %d characters, got %r" % (
+            tipo, TAMANHOS[tipo], documento))
+    if not _valido(limpo):
+        raise ValueError("%r is not a valid CPF or CNPJ" % (documento, ))
+    return limpo
+
+
+def documento_valido(documento, tipo=None):
+    """``True`` se ``documento`` for um CPF ou CNPJ válido"""
+    try:
+        normaliza_documento(documento, tipo)
+    except ValueError:
+        return False
+    return True
+
+
+def normaliza_documentos(documentos, tipo=None):
+    """:func:`normaliza_documento` de cada documento, sem exceções
+
+    :param documentos: Sequência de ``str`` ou array do NumPy.
+    :param tipo: Opcional. Como em :func:`normaliza_documento`.
+    :return: ``list`` com o documento normalizado ou ``None`` se for
+        inválido; array ``object`` se ``documentos`` for um array.
+    """
+    if tipo is not None and tipo not in TAMANHOS:
+        raise ValueError("tipo must be %r or %r, got %r" % (CPF, CNPJ, tipo))
+    vectorized = vetorizado(documentos)
+    if vectorized is not None:
+        return vectorized.normaliza_documentos(documentos, tipo)
+    tamanho = TAMANHOS.get(tipo)
+    resultado = []
+    for documento in documentos:
+        limpo = documento.replace('.', '').replace('-', '').replace(
+            '/', '').replace(' ', '').upper()
+        if tamanho is not None:
+            limpo = limpo.rjust(tamanho, '0')
+            if len(limpo) != tamanho:
+                limpo = ''
+        resultado.append(limpo if _valido(limpo) else None)
+    return resultado
+
+
+def formata_documento(documento):
+    """CPF ou CNPJ com a máscara de impressão
+
+    eg::
+
+        >>> formata_documento('12345678909')
+        '123.456.789-09'
+
+    :exception ValueError: Se o documento não for válido.
+    """
+    limpo = normaliza_documento(documento)
+    if len(limpo) == 11:
+        return '%s.%s.%s-%s' % (limpo[:3], limpo[3:6], limpo[6:9], limpo[9:])
+    return '%s.%s.%s/%s-%s' % (limpo[:2], limpo[2:5], limpo[5:8],
+                               limpo[8:12], limpo[12:])
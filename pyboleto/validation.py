@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.validation
+    ~~~~~~~~~~~~~~~~~~~
+
+    Validação em lote dos dados dos boletos, sem exceções por campo.
+
+    Atribuir um campo inválido a um :class:`pyboleto.data.BoletoData` ou
+    gerar o código de barras levanta uma exceção no primeiro problema. Para
+    conferir muitos registros antes de gerar os boletos o :class:`Validador`
+    confere cada registro (um dicionário com os mesmos nomes dos atributos
+    do boleto) de uma vez e retorna todos os erros encontrados:
+
+    * tamanho e dígitos dos campos que vão no campo livre, pelo
+      :mod:`pyboleto.layout` do banco, depois dos zeros à esquerda que o
+      boleto acrescentaria, e o tamanho dos atributos que o layout lê em
+      partes (ex. o nosso número da Caixa SIGCB);
+    * tipo e intervalo das datas;
+    * valores que não podem ser convertidos ou não cabem no código de
+      barras;
+    * limites de linhas e caracteres das instruções, do demonstrativo, do
+      sacado e do endereço do cedente;
+    * DVs do CPF ou CNPJ do cedente e do sacado (:mod:`pyboleto.taxid`),
+      quando informados.
+
+    eg::
+
+        validador = Validador(BoletoItau)
+        relatorio = validador.valida_lote(registros)
+        for indice, erros in sorted(relatorio.items()):
+            for erro in erros:
+                print(indice, erro.campo, erro.mensagem)
+
+    As regras de cada atributo são montadas uma única vez por validador;
+    cada registro só executa as regras dos campos que tem.
+
+"""
+import copy
+import datetime
+from collections import namedtuple
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+from .data import (LINHAS_DEMONSTRATIVO, LINHAS_INSTRUCOES, LINHAS_SACADO,
+                   TAMANHO_ENDERECO, VALOR_MAXIMO_CENTAVOS, BoletoException,
+                   CustomProperty, _erro_linhas)
+from .duedate import DATA_BASE
+from .layout import Campo, Layout
+from .taxid import documento_valido
+
+ErroValidacao = namedtuple('ErroValidacao', ['campo', 'mensagem'])
+"""Erro de um campo do registro"""
+
+_CENTAVO = Decimal('0.01')
+
+
+def _confere_data(nome):
+    def regra(valor):
+        if not isinstance(valor, datetime.date):
+            return "%s must be a date, got %r" % (nome, valor)
+    return regra
+
+
+def _confere_vencimento(minimo, maximo):
+    def regra(valor):
+        if not isinstance(valor, datetime.date):
+            return "data_vencimento must be a date, got %r" % (valor, )
+        if valor < minimo:
+            return "data_vencimento must be on or after %s, got %s" % (
+                minimo, valor)
+        if maximo is not None and valor > maximo:
+            return "data_vencimento must be on or before %s, got %s" % (
+                maximo, valor)
+    return regra
+
+
+def _centavos(valor):
+    """Valor em centavos com a mesma conversão do boleto, ou ``None``"""
+    if type(valor) is int:
+        return valor * 100
+    try:
+        if type(valor) is not Decimal:
+            valor = Decimal(str(valor))
+        return int(valor.quantize(_CENTAVO, ROUND_HALF_UP) * 100)
+    except (InvalidOperation, ValueError, OverflowError):
+        return None
+
+
+def _confere_valor(nome, limite):
+    def regra(valor):
+        centavos = _centavos(valor)
+        if centavos is None:
+            return "%s must be a number, got %r" % (nome, valor)
+        if limite and not 0 <= centavos <= VALOR_MAXIMO_CENTAVOS:
+            return "%s must be between 0.00 and 99999999.99, got %s" % (
+                nome, valor)
+    return regra
+
+
+def _confere_centavos(nome, limite):
+    def regra(valor):
+        if type(valor) is not int:
+            return "%s must be an int, got %r" % (nome, valor)
+        if limite and not 0 <= valor <= VALOR_MAXIMO_CENTAVOS:
+            return "%s must be between 0 and %d cents, got %d" % (
+                nome, VALOR_MAXIMO_CENTAVOS, valor)
+    return regra
+
+
+def _confere_linhas(maximo, descricao):
+    def regra(valor):
+        if isinstance(valor, str):
+            valor = valor.splitlines()
+        return _erro_linhas(valor, maximo, descricao)
+    return regra
+
+
+def _confere_sacado(valor):
+    if len(valor) > LINHAS_SACADO:
+        return 'Número de linhas do sacado maior que %d' % LINHAS_SACADO
+
+
+def _confere_endereco(valor):
+    if len(valor) > TAMANHO_ENDERECO:
+        return 'Linha de endereço possui mais que %d caracteres' % (
+            TAMANHO_ENDERECO)
+
+
+def _confere_documento(nome):
+    def regra(valor):
+        if valor and not documento_valido(valor):
+            return "%s is not a valid CPF or CNPJ: %r" % (nome, valor)
+    return regra
+
+
+def _confere_campo(nome, campos, rascunho):
+    """Regra dos campos que vão no campo livre
+
+    O valor é atribuído a ``rascunho``, uma cópia do modelo, para passar
+    pelas mesmas conversões do boleto (ex. zeros à esquerda).
+    """
+    def regra(valor):
+        try:
+            setattr(rascunho, nome, valor)
+            valor = getattr(rascunho, nome)
+        except (TypeError, ValueError, BoletoException) as erro:
+            return "%s is invalid: %s" % (nome, erro)
+        for campo in campos:
+            try:
+                texto = campo.ajusta(valor)
+            except ValueError as erro:
+                return str(erro)
+            if not texto.isdigit():
+                return "%s must contain only digits, got %r" % (
+                    campo.nome, texto)
+    return regra
+
+
+def _confere_tamanho(nome, tamanho, rascunho):
+    """Regra dos atributos lidos em partes pelo layout
+
+    O :class:`pyboleto.data.CustomProperty` completa o valor com zeros,
+    mas não corta o que passar do tamanho; as partes lidas pelo layout
+    perderiam os dígitos a mais sem erro.
+    """
+    def regra(valor):
+        try:
+            setattr(rascunho, nome, valor)
+            valor = getattr(rascunho, nome)
+        except (TypeError, ValueError, BoletoException) as erro:
+            return "%s is invalid: %s" % (nome, erro)
+        valor = valor.split('-')[0]
+        if len(valor) > tamanho:
+            return "%s must have at most %d digits, not %r (len: %d)" % (
+                nome, tamanho, valor, len(valor))
+    return regra
+
+
+class _Leituras(object):
+    """Registra os atributos de ``boleto`` lidos por uma função"""
+
+    def __init__(self, boleto):
+        self._boleto = boleto
+        self.lidos = set()
+
+    def __getattr__(self, nome):
+        self.lidos.add(nome)
+        return getattr(self._boleto, nome)
+
+
+def _atributos_lidos(campos, prototipo):
+    """Atributos que as funções de ``campos`` leem do boleto"""
+    leituras = _Leituras(prototipo)
+    for campo in campos:
+        try:
+            campo.leitura(leituras)
+        except Exception:
+            pass
+    return leituras.lidos
+
+
+def _confere_calculados(campos, prototipo):
+    """Regra dos campos calculados a partir de outros atributos
+
+    Os campos do registro são atribuídos a uma cópia de ``prototipo``.
+    Campos que não podem ser calculados (ex. falta um atributo no
+    registro) não são conferidos.
+    """
+    def regra(registro):
+        boleto = copy.copy(prototipo)
+        for nome, valor in registro.items():
+            try:
+                setattr(boleto, nome, valor)
+            except Exception:
+                pass
+        erros = []
+        for campo in campos:
+            try:
+                valor = campo.atributo(boleto)
+            except Exception:
+                continue
+            try:
+                texto = campo.ajusta(valor)
+            except ValueError as erro:
+                erros.append(ErroValidacao(campo.nome, str(erro)))
+                continue
+            if not texto.isdigit():
+                erros.append(ErroValidacao(
+                    campo.nome, "%s must contain only digits, got %r" % (
+                        campo.nome, texto)))
+        return erros
+    return regra
+
+
+class Validador(object):
+    """Confere registros de um banco sem criar boletos
+
+    :param boleto: Classe do banco ou boleto usado como modelo (ex.
+        ``BoletoBB(7, 2)``, ou o
+        :attr:`pyboleto.cedente.CedenteProfile.prototipo`). O layout do
+        campo livre é o do modelo; nos bancos em que o layout depende da
+        carteira é usada a carteira de cada registro.
+    :param vencimento_minimo: Menor ``data_vencimento`` aceita. Padrão e
+        mínimo: 07/10/1997, a data base do fator de vencimento.
+    :param vencimento_maximo: Opcional. Maior ``data_vencimento`` aceita.
+    :exception BoletoException: Se o banco não tiver layout para a
+        configuração do modelo.
+
+    """
+
+    def __init__(self, boleto, vencimento_minimo=None,
+                 vencimento_maximo=None):
+        if isinstance(boleto, type):
+            boleto = boleto()
+        self.prototipo = boleto
+        self.classe = type(boleto)
+        if vencimento_minimo is None or vencimento_minimo < DATA_BASE:
+            vencimento_minimo = DATA_BASE
+
+        self._regras = {
+            'data_vencimento': _confere_vencimento(vencimento_minimo,
+                                                   vencimento_maximo),
+            'data_documento': _confere_data('data_documento'),
+            'data_processamento': _confere_data('data_processamento'),
+            'valor': _confere_valor('valor', False),
+            'valor_documento': _confere_valor('valor_documento', True),
+            'valor_centavos': _confere_centavos('valor_centavos', False),
+            'valor_documento_centavos': _confere_centavos(
+                'valor_documento_centavos', True),
+            'instrucoes': _confere_linhas(LINHAS_INSTRUCOES, 'instruções'),
+            'demonstrativo': _confere_linhas(LINHAS_DEMONSTRATIVO,
+                                             'demonstrativo'),
+            'sacado': _confere_sacado,
+            'cedente_endereco': _confere_endereco,
+            'cedente_documento': _confere_documento('cedente_documento'),
+            'sacado_documento': _confere_documento('sacado_documento'),
+        }
+        # Cópia do modelo que recebe os valores conferidos, para não alterar
+        # o modelo
+        self._rascunho = copy.copy(boleto)
+        self._layouts = {}
+        # O layout só varia com a carteira se for uma propriedade da classe
+        self._por_carteira = not isinstance(
+            getattr(self.classe, 'layout', None), (Layout, type(None)))
+        self._regras_layout = {}
+        # Confere a configuração do modelo (ex. convênio do BB)
+        self._layout(None)
+
+    def _regras_do_layout(self, layout):
+        try:
+            return self._regras_layout[layout]
+        except KeyError:
+            pass
+        atributos = {}
+        calculados = []
+        if layout is not None:
+            for item in layout.itens:
+                if not isinstance(item, Campo):
+                    continue
+                if isinstance(item.atributo, str):
+                    atributos.setdefault(item.atributo, []).append(item)
+                else:
+                    calculados.append(item)
+        regras = {}
+        for atributo, campos in atributos.items():
+            regras[atributo] = _confere_campo(atributo, campos,
+                                              self._rascunho)
+        for atributo in _atributos_lidos(calculados, self.prototipo):
+            propriedade = getattr(self.classe, atributo, None)
+            if atributo not in regras and \
+                    isinstance(propriedade, CustomProperty):
+                regras[atributo] = _confere_tamanho(
+                    atributo, propriedade.length, self._rascunho)
+        if calculados:
+            calculados = _confere_calculados(calculados, self.prototipo)
+        else:
+            calculados = None
+        resultado = self._regras_layout[layout] = (regras, calculados)
+        return resultado
+
+    def _layout(self, carteira):
+        try:
+            return self._layouts[carteira]
+        except KeyError:
+            pass
+        boleto = self.prototipo
+        if carteira is not None:
+            boleto = self._rascunho
+            boleto.carteira = carteira
+        layout = self._layouts[carteira] = boleto.layout
+        return layout
+
+    def valida(self, registro):
+        """Confere um registro
+
+        :param registro: Dicionário ``{atributo: valor}``. Só os campos
+            presentes são conferidos.
+        :return: Lista de :class:`ErroValidacao`, vazia se o registro for
+            válido.
+        """
+        carteira = registro.get('carteira') if self._por_carteira else None
+        try:
+            layout = self._layout(carteira)
+        except Exception as erro:
+            return [ErroValidacao('carteira', str(erro))]
+        regras_layout, calculados = self._regras_do_layout(layout)
+        regras = self._regras
+        erros = []
+        for nome, valor in registro.items():
+            regra = regras_layout.get(nome)
+            if regra is None:
+                regra = regras.get(nome)
+                if regra is None:
+                    continue
+            try:
+                mensagem = regra(valor)
+            except (TypeError, AttributeError) as erro:
+                mensagem = "%s is invalid: %s" % (nome, erro)
+            if mensagem is not None:
+                erros.append(ErroValidacao(nome, mensagem))
+        if calculados is not None and not erros:
+            erros = calculados(registro)
+        return erros
+
+    def valida_lote(self, registros):
+        """Confere uma sequência de registros
+
+        :return: Dicionário ``{indice: [ErroValidacao, ...]}`` só com os
+            registros que têm erros.
+        """
+        relatorio = {}
+        valida = self.valida
+        for indice, registro in enumerate(registros):
+            erros = valida(registro)
+            if erros:
+                relatorio[indice] = erros
+        return relatorio
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.vectorized
+    ~~~~~~~~~~~~~~~~~~~
+
+    Versões vetorizadas com NumPy dos cálculos de DV.
+
+    As funções recebem matrizes de dígitos (``N x largura``, ``uint8``) em vez
+    de strings e retornam um array com um DV por linha. Também há versões
+    vetorizadas das conversões de :mod:`pyboleto.duedate` e dos encargos de
+    :mod:`pyboleto.interest`. Os resultados são idênticos aos das funções
+    escalares, inclusive nas regras particulares de cada banco.
+
+    O NumPy é uma dependência opcional (``pip install python3-boleto[numpy]``)
+    e só é importado por este módulo.
+
+"""
+import datetime
+
+import numpy
+
+from . import duedate
+from .checksum import DIGITOS, DV_BARCODE, MODULO10, modulo11 as _modulo11
+
+
+def digitos(numeros, largura=None):
+    """Converte uma sequência de strings de mesmo tamanho numa matriz
+
+    :param numeros: Sequência de strings contendo apenas dígitos.
+    :param largura: Tamanho das strings. Se omitido usa o da primeira.
+    :rtype: :class:`numpy.ndarray` ``uint8`` com uma linha por número
+    :exception ValueError: Se alguma string tiver outro tamanho ou contiver
+        algo além de dígitos.
+    """
+    numeros = list(numeros)
+    if largura is None:
+        largura = len(numeros[0]) if numeros else 0
+    if set(map(len, numeros)) - set([largura]):
+        raise ValueError("all numbers must have %d digits" % (largura, ))
+    try:
+        buf = ''.join(numeros).encode('ascii')
+    except UnicodeEncodeError:
+        raise ValueError("numbers must contain only digits")
+    matriz = numpy.frombuffer(buf, dtype=numpy.uint8) - ord('0')
+    if (matriz > 9).any():
+        raise ValueError("numbers must contain only digits")
+    return matriz.reshape(len(numeros), largura)
+
+
+def texto(matriz):
+    """Converte uma matriz de dígitos de volta para uma lista de strings"""
+    matriz = numpy.asarray(matriz, dtype=numpy.uint8)
+    linhas, largura = matriz.shape
+    buf = (matriz + ord('0')).tobytes().decode('ascii')
+    return [buf[i:i + largura] for i in range(0, linhas * largura, largura)]
+
+
+def _pesos(checksum, largura):
+    # pesos alinhados à direita, como no cálculo escalar
+    pesos = checksum.pesos
+    return numpy.array([pesos[(largura - 1 - i) % len(pesos)]
+                        for i in range(largura)], dtype=numpy.int32)
+
+
+def restos(checksum, matriz):
+    """Resto da soma ponderada de cada linha de ``matriz``
+
+    :param checksum: :class:`pyboleto.checksum.Checksum` a aplicar.
+    :param matriz: Matriz ``N x largura`` de dígitos.
+    """
+    matriz = numpy.asarray(matriz)
+    pesos = _pesos(checksum, matriz.shape[1])
+    if not checksum.soma_digitos:
+        return matriz.astype(numpy.int32).dot(pesos) % checksum.modulo
+    # Cada produto é no máximo 9 * 9, cabe em uint8
+    produtos = matriz.astype(numpy.uint8) * pesos.astype(numpy.uint8)
+    produtos = produtos // 10 + produtos % 10
+    return produtos.sum(axis=1, dtype=numpy.int32) % checksum.modulo
+
+
+def checksum(checksum, matriz):
+    """Aplica um :class:`pyboleto.checksum.Checksum` a cada linha
+
+    Quando a regra do checksum contém valores que não são inteiros (ex. o
+    ``'X'`` do Banco do Brasil ou o ``'P'`` do Bradesco) o array retornado
+    tem ``dtype=object`` com exatamente os mesmos valores da versão escalar.
+    """
+    resto = restos(checksum, matriz)
+    if checksum.regra is None:
+        return resto
+    regra = checksum.regra
+    if all(type(dv) is int for dv in regra):
+        return numpy.array(regra, dtype=numpy.int64)[resto]
+    return numpy.array(regra, dtype=object)[resto]
+
+
+def modulo10(matriz):
+    """Equivalente vetorizado de :meth:`pyboleto.data.BoletoData.modulo10`"""
+    return checksum(MODULO10, matriz)
+
+
+def modulo11(matriz, base=9, r=0):
+    """Equivalente vetorizado de :meth:`pyboleto.data.BoletoData.modulo11`"""
+    return checksum(_modulo11(base, r), matriz)
+
+
+def dv_barcode(matriz):
+    """DV geral do código de barras
+
+    :param matriz: Matriz ``N x 43`` com o código de barras sem o DV.
+    """
+    return checksum(DV_BARCODE, matriz)
+
+
+def insere_dv_barcode(matriz):
+    """Calcula o DV e monta os códigos de barras completos
+
+    :param matriz: Matriz ``N x 43`` com o código de barras sem o DV.
+    :rtype: Matriz ``N x 44``
+    """
+    matriz = numpy.asarray(matriz, dtype=numpy.uint8)
+    dv = dv_barcode(matriz).astype(numpy.uint8)
+    return numpy.concatenate((matriz[:, :4], dv[:, None], matriz[:, 4:]),
+                             axis=1)
+
+
+def dvs_linha_digitavel(matriz):
+    """DVs (módulo 10) dos três primeiros campos da linha digitável
+
+    :param matriz: Matriz ``N x 44`` com os códigos de barras.
+    :rtype: Matriz ``N x 3``
+    """
+    matriz = numpy.asarray(matriz)
+    campo1 = numpy.concatenate((matriz[:, 0:4], matriz[:, 19:24]), axis=1)
+    return numpy.stack((modulo10(campo1),
+                        modulo10(matriz[:, 24:34]),
+                        modulo10(matriz[:, 34:44])), axis=1)
+
+
+def dv_campo_livre_banrisul(matriz):
+    """Duplo DV do campo livre do Banrisul
+
+    Equivalente a ``BoletoBanrisul._dv_campo_livre``: o primeiro DV
+    (módulo 10) é incrementado enquanto o resto do módulo 11 base 7 for 1.
+
+    :param matriz: Matriz ``N x 23`` com o campo livre sem os DVs.
+    :return: Tupla ``(dv1, dv2)``. Como na versão escalar ``dv2`` é
+        ``11 - resto``, ou 0 quando o resto for 0.
+    """
+    matriz = numpy.asarray(matriz, dtype=numpy.uint8)
+    dv1 = modulo10(matriz)
+    resto11 = _modulo11(7, 1)
+    pesos = _pesos(resto11, matriz.shape[1] + 1)
+    soma = matriz.astype(numpy.int32).dot(pesos[:-1])
+    resto = (soma + dv1 * pesos[-1]) % 11
+    # O DV só pode ser incrementado 10 vezes antes de voltar ao início
+    for _ in range(10):
+        pendente = resto == 1
+        if not pendente.any():
+            break
+        dv1 = numpy.where(pendente, (dv1 + 1) % 10, dv1)
+        resto = numpy.where(pendente, (soma + dv1 * pesos[-1]) % 11, resto)
+    return dv1, (11 - resto) % 11
+
+
+def is_array(valores):
+    """``True`` se ``valores`` for um :class:`numpy.ndarray`"""
+    return isinstance(valores, numpy.ndarray)
+
+
+def fatores_vencimento(datas):
+    """Equivalente vetorizado de :func:`pyboleto.duedate.fator_vencimento`
+
+    :param datas: Array ``datetime64``.
+    :rtype: Array ``int32``
+    :exception TypeError: Se alguma data for anterior a 07/10/1997.
+    """
+    base = numpy.datetime64(duedate.DATA_BASE, 'D')
+    dias = (numpy.asarray(datas, dtype='datetime64[D]') - base).astype(
+        numpy.int32)
+    if (dias < 0).any():
+        raise TypeError("Invalid date, must be between 1997/07/01 and now")  # noqa
+    reiniciado = duedate.FATOR_MINIMO + (dias - duedate.FATOR_MINIMO) % \
+        duedate.CICLO
+    return numpy.where(dias > duedate.FATOR_MAXIMO, reiniciado, dias)
+
+
+def datas_vencimento(fatores, referencia):
+    """Equivalente vetorizado de :func:`pyboleto.duedate.data_vencimento`
+
+    :param fatores: Array de inteiros entre 0 e 9999.
+    :param referencia: :class:`datetime.date` usada para escolher o ciclo.
+    :rtype: Array ``datetime64[D]``, com ``NaT`` para o fator 0.
+    """
+    fatores = numpy.asarray(fatores, dtype=numpy.int32)
+    if ((fatores < 0) | (fatores > duedate.FATOR_MAXIMO)).any():
+        raise ValueError("fator must be between 0 and %d" % (
+            duedate.FATOR_MAXIMO, ))
+    dias_referencia = (referencia.toordinal() -
+                       duedate.DATA_BASE.toordinal())
+    ciclos = (dias_referencia - fatores + duedate.CICLO // 2) // duedate.CICLO
+    ciclos = numpy.where(fatores < duedate.FATOR_MINIMO, 0,
+                         numpy.maximum(ciclos, 0))
+    dias = fatores + ciclos * duedate.CICLO
+    datas = numpy.datetime64(duedate.DATA_BASE, 'D') + dias.astype(
+        'timedelta64[D]')
+    datas[fatores == 0] = numpy.datetime64('NaT')
+    return datas
+
+
+def dias_atraso(vencimentos, data_pagamento, calendario=None):
+    """Equivalente vetorizado de :func:`pyboleto.interest.dias_atraso`
+
+    :rtype: Array ``int64``
+    """
+    vencimentos = numpy.asarray(vencimentos, dtype='datetime64[D]')
+    pagamento = numpy.datetime64(data_pagamento, 'D')
+    dias = (pagamento - vencimentos).astype(numpy.int64)
+    if calendario is None:
+        return dias
+    prorrogados = proximos_dias_uteis(calendario, vencimentos)
+    return numpy.where((dias > 0) & (pagamento <= prorrogados), 0, dias)
+
+
+def _arredonda(numerador, denominador):
+    return (2 * numerador + denominador) // (2 * denominador)
+
+
+def valores_atualizados(valores, dias, multa, juros, desconto,
+                        desconto_centavos, carencia):
+    """Equivalente vetorizado de :meth:`pyboleto.interest.Encargos.totais`
+
+    As taxas são :class:`fractions.Fraction`. As contas são feitas em
+    ``int64``; se puderem passar do limite são feitas com inteiros do
+    Python (array ``object``), com o mesmo resultado.
+
+    :rtype: Array ``int64``
+    """
+    valores = numpy.asarray(valores, dtype=numpy.int64)
+    dias = numpy.broadcast_to(numpy.asarray(dias, dtype=numpy.int64),
+                              valores.shape)
+    if valores.size:
+        maior = int(numpy.abs(valores).max()) * max(
+            multa.numerator, juros.numerator * int(numpy.abs(dias).max()),
+            desconto.numerator)
+        denominador = max(multa.denominator, juros.denominator,
+                          desconto.denominator)
+        if 2 * maior + denominador >= 2 ** 62:
+            valores = valores.astype(object)
+            dias = dias.astype(object)
+
+    atraso = dias > carencia
+    valor_multa = _arredonda(valores * multa.numerator, multa.denominator)
+    valor_juros = _arredonda(valores * juros.numerator * dias,
+                             juros.denominator)
+    valor_desconto = numpy.minimum(valores, _arredonda(
+        valores * desconto.numerator, desconto.denominator) +
+        desconto_centavos)
+    total = valores + numpy.where(atraso, valor_multa + valor_juros, 0) - \
+        numpy.where(dias <= 0, valor_desconto, 0)
+    return total.astype(numpy.int64)
+
+
+def _indices_calendario(calendario, datas):
+    """Arrays das tabelas de ``calendario`` e o índice de cada data"""
+    if calendario._arrays is None:
+        proximo, acumulado = calendario.tabelas()[:2]
+        calendario._arrays = (numpy.array(proximo, dtype=numpy.int64),
+                              numpy.array(acumulado, dtype=numpy.int64))
+    base = numpy.datetime64(datetime.date(calendario.inicio, 1, 1), 'D')
+    indices = (numpy.asarray(datas, dtype='datetime64[D]') - base).astype(
+        numpy.int64)
+    if indices.size and not (0 <= indices.min() and
+                             indices.max() < calendario._dias):
+        raise ValueError("dates must be between %d and %d" % (
+            calendario.inicio, calendario.fim))
+    return calendario._arrays, indices, base
+
+
+def proximos_dias_uteis(calendario, datas):
+    """Equivalente vetorizado de
+    :meth:`pyboleto.businessday.Calendario.proximos_dias_uteis`
+
+    :rtype: Array ``datetime64[D]``
+    """
+    (proximo, _), indices, base = _indices_calendario(calendario, datas)
+    return base + proximo[indices]
+
+
+def contagens_dias_uteis(calendario, inicios, fim):
+    """Equivalente vetorizado de
+    :meth:`pyboleto.businessday.Calendario.contagens_dias_uteis`
+
+    :rtype: Array ``int64``
+    """
+    (_, acumulado), indices, _ = _indices_calendario(calendario, inicios)
+    return acumulado[calendario._indice(fim) + 1] - acumulado[indices + 1]
+
+
+def _documentos_validos(limpos, largura, dv):
+    """Máscara dos documentos de ``limpos`` (todos com ``largura``
+    caracteres) com os DVs corretos"""
+    buf = ''.join(limpos).encode('ascii', 'replace')
+    valores = (numpy.frombuffer(buf, dtype=numpy.uint8).astype(numpy.int16) -
+               ord('0')).reshape(len(limpos), largura)
+    base = valores[:, :-2]
+    numericos = (valores[:, -2:] >= 0) & (valores[:, -2:] <= 9)
+    if dv.caracteres == DIGITOS:
+        permitidos = (base >= 0) & (base <= 9)
+    else:
+        permitidos = ((base >= 0) & (base <= 9)) | ((base >= 17) &
+                                                    (base <= 42))
+    validos = permitidos.all(axis=1) & numericos.all(axis=1)
+    validos &= ~(valores == valores[:, :1]).all(axis=1)
+    valores = numpy.where(validos[:, None], valores, 0)
+    validos &= checksum(dv, valores[:, :-2]) == valores[:, -2]
+    validos &= checksum(dv, valores[:, :-1]) == valores[:, -1]
+    return validos
+
+
+def normaliza_documentos(documentos, tipo=None):
+    """Equivalente vetorizado de :func:`pyboleto.taxid.normaliza_documentos`
+
+    A limpeza (pontuação e maiúsculas) é feita numa única string com todos
+    os documentos; os DVs de todos os CPFs e de todos os CNPJs são
+    conferidos de uma vez.
+
+    :rtype: Array ``object`` com ``str`` ou ``None``
+    """
+    from . import taxid
+    documentos = [str(documento) for documento in documentos]
+    limpos = taxid.limpa_documento('\n'.join(documentos)).split('\n')
+    if len(limpos) != len(documentos):
+        # Algum documento tem quebra de linha
+        limpos = list(map(taxid.limpa_documento, documentos))
+    if tipo is not None:
+        tamanho = taxid.TAMANHOS[tipo]
+        limpos = [limpo.rjust(tamanho, '0') for limpo in limpos]
+    resultado = numpy.empty(len(limpos), dtype=object)
+    tamanhos = numpy.fromiter(map(len, limpos), dtype=numpy.int64,
+                              count=len(limpos))
+    for largura, dv in sorted(taxid._DVS.items()):
+        if tipo is not None and largura != taxid.TAMANHOS[tipo]:
+            continue
+        indices = numpy.flatnonzero(tamanhos == largura)
+        if not indices.size:
+            continue
+        grupo = [limpos[i] for i in indices.tolist()]
+        validos = _documentos_validos(grupo, largura, dv)
+        resultado[indices[validos]] = numpy.array(
+            grupo, dtype=object)[validos]
+    return resultado
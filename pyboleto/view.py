@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+    pyboleto.view
+    ~~~~~~~~~~~~~
+
+    Campos do boleto já formatados para exibição.
+
+    Os renderizadores (:mod:`pyboleto.pdf` e :mod:`pyboleto.html`) exibem as
+    mesmas datas, valores, nosso número e linha digitável em mais de um
+    recibo. Uma :class:`BoletoView` formata cada um desses campos uma única
+    vez e é imutável, então pode ser passada a vários renderizadores.
+
+    ``boleto.view`` (:attr:`pyboleto.data.BoletoData.view`) guarda a view no
+    cache do boleto, descartado quando algum atributo do boleto é alterado.
+    As listas do boleto (ex. ``boleto.instrucoes.append(...)``) são
+    conferidas a cada leitura de ``boleto.view``; uma view já obtida não
+    muda.
+
+    eg::
+
+        view = boleto.view
+        pdf.drawBoleto(view)
+        html.drawBoleto(view)
+
+"""
+from collections import namedtuple
+
+from .data import formata_centavos
+
+CAMPOS_VIEW = (
+    'codigo_dv_banco', 'linha_digitavel', 'barcode', 'logo_image',
+    'cedente', 'cedente_documento', 'cedente_endereco',
+    'agencia_conta_cedente', 'label_cedente', 'local_pagamento',
+    'data_vencimento', 'data_documento', 'data_processamento',
+    'nosso_numero', 'numero_documento', 'especie_documento', 'aceite',
+    'carteira', 'especie', 'quantidade', 'valor', 'valor_centavos',
+    'valor_documento', 'sacado', 'demonstrativo', 'instrucoes',
+)
+"""Campos de :class:`BoletoView`, na ordem da tupla"""
+
+
+def formata_data(data):
+    """``dd/mm/aaaa``, sem passar pelo ``strftime``. Vazio sem data."""
+    if not data:
+        return ''
+    return '%02d/%02d/%04d' % (data.day, data.month, data.year)
+
+
+def formata_valor(centavos):
+    """Valor para exibição, vazio se ``centavos`` for ``None``"""
+    if centavos is None:
+        return ''
+    return formata_centavos(centavos)
+
+
+class BoletoView(namedtuple('BoletoView', CAMPOS_VIEW)):
+    """Campos de um boleto formatados para exibição
+
+    As datas estão no formato ``dd/mm/aaaa``, ``nosso_numero`` é o
+    resultado de :meth:`pyboleto.data.BoletoData.format_nosso_numero`,
+    ``valor`` e ``valor_documento`` vêm de
+    :func:`pyboleto.data.formata_centavos` e ``sacado``, ``demonstrativo``
+    e ``instrucoes`` são tuplas. ``valor_centavos`` é o valor sem
+    formatação.
+
+    Use :meth:`de_boleto` ou :attr:`pyboleto.data.BoletoData.view`.
+
+    """
+    __slots__ = ()
+
+    @classmethod
+    def de_boleto(cls, boleto):
+        """Formata os campos de ``boleto``
+
+        :type boleto: :class:`pyboleto.data.BoletoData`
+        """
+        local_pagamento = boleto.local_pagamento
+        if not isinstance(local_pagamento, str):
+            local_pagamento = local_pagamento.decode()
+        valor_centavos = boleto.valor_centavos
+        return cls(
+            boleto.codigo_dv_banco,
+            boleto.linha_digitavel,
+            boleto.barcode,
+            boleto.logo_image,
+            boleto.cedente,
+            boleto.cedente_documento,
+            boleto.cedente_endereco,
+            boleto.agencia_conta_cedente,
+            boleto.label_cedente,
+            local_pagamento,
+            formata_data(boleto.data_vencimento),
+            formata_data(boleto.data_documento),
+            formata_data(boleto.data_processamento),
+            boleto.format_nosso_numero(),
+            boleto.numero_documento,
+            boleto.especie_documento,
+            boleto.aceite,
+            boleto.carteira,
+            boleto.especie,
+            boleto.quantidade,
+            formata_valor(valor_centavos),
+            valor_centavos,
+            formata_valor(boleto.valor_documento_centavos),
+            tuple(boleto.sacado or ()),
+            tuple(boleto.demonstrativo),
+            tuple(boleto.instrucoes),
+        )
+
+    @property
+    def view(self):
+        """A própria view, para ser usada no lugar do boleto"""
+        return self
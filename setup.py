@@ -64,6 +64,9 @@ setup(
     install_requires=[
         'reportlab'
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     tests_require=[
         'pylint',
         'tox',
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyboleto.allocator import (AlocadorNossoNumero, chave_cedente,
+                                tamanho_nosso_numero)
+from pyboleto.bank.bancodobrasil import BoletoBB
+from pyboleto.bank.bradesco import BoletoBradesco
+from pyboleto.bank.caixa_sigcb import BoletoCaixaSigcb
+from pyboleto.bank.itau import BoletoItau
+from pyboleto.data import BoletoException
+
+from .testutils import boleto_itau
+
+
+def aloca(argumentos):
+    caminho, quantidade = argumentos
+    alocador = AlocadorNossoNumero(caminho, boleto_itau(), tamanho_lote=7)
+    numeros = [alocador.proximo().nosso_numero for _ in range(quantidade)]
+    alocador.close()
+    return numeros
+
+
+class TestAlocadorNossoNumero(unittest.TestCase):
+    def setUp(self):
+        self.diretorio = tempfile.mkdtemp()
+        self.caminho = os.path.join(self.diretorio, 'nosso_numero.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.diretorio)
+
+    def alocador(self, boleto=None, **kwargs):
+        alocador = AlocadorNossoNumero(self.caminho, boleto or boleto_itau(),
+                                       **kwargs)
+        self.addCleanup(alocador.close)
+        return alocador
+
+    def test_sequencia(self):
+        alocador = self.alocador(tamanho_lote=3)
+        numeros = [alocador.proximo() for _ in range(5)]
+        self.assertEqual([n.nosso_numero for n in numeros],
+                         ['0000000%d' % i for i in range(1, 6)])
+        for numero in numeros:
+            boleto = boleto_itau()
+            boleto.nosso_numero = numero.nosso_numero
+            self.assertEqual(numero.dv, boleto.dv_nosso_numero)
+
+    def test_faixas_disjuntas(self):
+        primeiro = self.alocador(tamanho_lote=10)
+        segundo = self.alocador(tamanho_lote=10)
+        self.assertEqual(primeiro.proximo().nosso_numero, '00000001')
+        self.assertEqual(segundo.proximo().nosso_numero, '00000011')
+        self.assertEqual(primeiro.proximo().nosso_numero, '00000002')
+
+    def test_reinicio(self):
+        alocador = self.alocador(tamanho_lote=10)
+        alocador.proximo()
+        alocador.close()
+        # A faixa reservada antes não é reutilizada
+        self.assertEqual(self.alocador(tamanho_lote=10).proximo(
+            ).nosso_numero, '00000011')
+
+    def test_contador_por_cedente(self):
+        self.alocador().proximo()
+        outro = self.alocador(boleto_itau(conta_cedente='01329'), inicio=500)
+        self.assertEqual(outro.proximo().nosso_numero, '00000500')
+        self.assertNotEqual(chave_cedente(boleto_itau()),
+                            chave_cedente(boleto_itau(conta_cedente='01329')))
+
+    def test_tamanho(self):
+        self.assertEqual(tamanho_nosso_numero(BoletoItau()), 8)
+        self.assertEqual(tamanho_nosso_numero(BoletoBradesco()), 11)
+        self.assertEqual(tamanho_nosso_numero(BoletoBB(6, 2)), 17)
+        self.assertEqual(tamanho_nosso_numero(BoletoBB(7, 2)), 10)
+        self.assertEqual(tamanho_nosso_numero(BoletoCaixaSigcb()), 17)
+
+    def test_prefixo(self):
+        alocador = self.alocador(BoletoCaixaSigcb(), prefixo='24')
+        self.assertEqual(alocador.proximo().nosso_numero,
+                         '24000000000000001')
+        self.assertRaises(BoletoException, self.alocador, BoletoItau(),
+                          prefixo='1' * 8)
+
+    def test_esgotado(self):
+        alocador = self.alocador(prefixo='999999', tamanho_lote=50)
+        numeros = [alocador.proximo().nosso_numero for _ in range(99)]
+        self.assertEqual(numeros[-1], '99999999')
+        self.assertEqual(len(set(numeros)), 99)
+        self.assertRaises(BoletoException, alocador.proximo)
+
+    def test_tamanho_invalido(self):
+        # O banco não aceita 9 dígitos
+        self.assertRaises(BoletoException, self.alocador, tamanho=9)
+
+    def test_fork(self):
+        alocador = self.alocador(tamanho_lote=10)
+        alocador.proximo()
+        # Simula o processo filho herdando a faixa do pai
+        alocador._pid = -1
+        self.assertEqual(alocador.proximo().nosso_numero, '00000011')
+
+    def test_processos(self):
+        processos = multiprocessing.Pool(3)
+        try:
+            resultados = processos.map(aloca, [(self.caminho, 40)] * 6)
+        finally:
+            processos.close()
+            processos.join()
+        numeros = [n for resultado in resultados for n in resultado]
+        self.assertEqual(len(numeros), 240)
+        self.assertEqual(len(set(numeros)), 240)
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestAlocadorNossoNumero)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -46,6 +46,9 @@ class TestBancoItau(BoletoTestCase):
 
     def test_dv_agencia_conta_cedente(self):
         self.assertEqual(self.dados[0].dv_agencia_conta_cedente, 0)
+        # Só depende da agência e da conta, não do campo livre
+        self.dados[1].nosso_numero = '123456789'
+        self.assertEqual(self.dados[1].agencia_conta_cedente, '0293/01328-0')
 
 suite = unittest.TestLoader().loadTestsFromTestCase(TestBancoItau)
 
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from pyboleto import bank
+from pyboleto.bank import (BANCOS_IMPLEMENTADOS, carrega_bancos,
+                           get_class_for_codigo, registra_banco)
+from pyboleto.bank.caixa_sigcb import BoletoCaixaSigcb
+from pyboleto.bank.cecred import BoletoCecred
+from pyboleto.bank.hsbc import BoletoHsbc, BoletoHsbcComRegistro
+from pyboleto.bank.itau import BoletoItau
+from pyboleto.data import BoletoData, BoletoException
+
+
+class EntryPoint(object):
+    def __init__(self, name, classe=None, erro=None):
+        self.name = name
+        self.classe = classe
+        self.erro = erro
+
+    def load(self):
+        if self.erro is not None:
+            raise self.erro
+        return self.classe
+
+
+class BoletoTerceiro(BoletoData):
+    pass
+
+
+class TestRegistroBancos(unittest.TestCase):
+    def setUp(self):
+        self.classes = dict(bank._CLASSES)
+        self.entry_points = bank._ENTRY_POINTS
+        self.implementados = dict(BANCOS_IMPLEMENTADOS)
+        bank._CLASSES.clear()
+
+    def tearDown(self):
+        bank._CLASSES.clear()
+        bank._CLASSES.update(self.classes)
+        bank._ENTRY_POINTS = self.entry_points
+        BANCOS_IMPLEMENTADOS.clear()
+        BANCOS_IMPLEMENTADOS.update(self.implementados)
+
+    def test_todos_os_bancos(self):
+        classes = carrega_bancos(list(BANCOS_IMPLEMENTADOS))
+        for codigo, classe in classes.items():
+            self.assertTrue(issubclass(classe, BoletoData), codigo)
+        self.assertIs(classes['085'], BoletoCecred)
+        self.assertIs(classes['0851'], BoletoCecred)
+        self.assertIs(classes['104-sigcb'], BoletoCaixaSigcb)
+        self.assertIs(classes['399'], BoletoHsbc)
+        self.assertIs(classes['399-registro'], BoletoHsbcComRegistro)
+
+    def test_cache(self):
+        self.assertIs(get_class_for_codigo('341'), BoletoItau)
+        self.assertIs(bank._CLASSES['341'], BoletoItau)
+        # O caminho não é consultado de novo
+        BANCOS_IMPLEMENTADOS['341'] = 'inexistente.BoletoItau'
+        self.assertIs(get_class_for_codigo('341'), BoletoItau)
+
+    def test_banco_desconhecido(self):
+        bank._ENTRY_POINTS = {}
+        with self.assertRaises(BoletoException) as contexto:
+            get_class_for_codigo('999')
+        self.assertIn("'999'", str(contexto.exception))
+        self.assertRaises(BoletoException, get_class_for_codigo, '356')
+
+    def test_modulo_inexistente(self):
+        BANCOS_IMPLEMENTADOS['356'] = 'real.BoletoReal'
+        with self.assertRaises(BoletoException) as contexto:
+            get_class_for_codigo('356')
+        self.assertIn('pyboleto.bank.real', str(contexto.exception))
+        self.assertRaises(BoletoException, carrega_bancos)
+
+        BANCOS_IMPLEMENTADOS['356'] = 'itau.BoletoReal'
+        with self.assertRaises(BoletoException) as contexto:
+            get_class_for_codigo('356')
+        self.assertIn('BoletoReal', str(contexto.exception))
+
+    def test_entry_points(self):
+        bank._ENTRY_POINTS = {
+            '077': EntryPoint('077', BoletoTerceiro),
+            '341': EntryPoint('341', BoletoTerceiro),
+            '290': EntryPoint('290', erro=ImportError('sem módulo')),
+        }
+        self.assertIs(get_class_for_codigo('077'), BoletoTerceiro)
+        # Os bancos implementados têm precedência
+        self.assertIs(get_class_for_codigo('341'), BoletoItau)
+        with self.assertRaises(BoletoException) as contexto:
+            get_class_for_codigo('290')
+        self.assertIn('sem módulo', str(contexto.exception))
+
+    def test_registra_banco(self):
+        registra_banco('341', BoletoTerceiro)
+        self.assertIs(get_class_for_codigo('341'), BoletoTerceiro)
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestRegistroBancos)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+import datetime
+import random
+import unittest
+from decimal import Decimal
+
+from pyboleto.bank.bancodobrasil import BoletoBB
+from pyboleto.bank.itau import BoletoItau
+from pyboleto.bank.santander import BoletoSantander
+from pyboleto.bank.sicoob import BoletoSicoob
+from pyboleto import batch as batch_module
+from pyboleto.batch import BoletoBatch, linha_digitavel, reemite
+
+
+def registros(quantidade=200, seed=3):
+    rnd = random.Random(seed)
+    inicio = datetime.date(2000, 1, 1)
+    for _ in range(quantidade):
+        yield {
+            'agencia_cedente': '%04d' % rnd.randrange(10 ** 4),
+            'conta_cedente': '%05d' % rnd.randrange(10 ** 5),
+            'nosso_numero': '%07d' % rnd.randrange(10 ** 7),
+            'data_vencimento': inicio + datetime.timedelta(
+                days=rnd.randrange(15000)),
+            'valor_centavos': rnd.randrange(10 ** 9),
+        }
+
+
+def lote(codigo_banco, dados, **kwargs):
+    return BoletoBatch(
+        [codigo_banco] * len(dados),
+        [d['agencia_cedente'] for d in dados],
+        [d['conta_cedente'] for d in dados],
+        [d['nosso_numero'] for d in dados],
+        [d['data_vencimento'] for d in dados],
+        [d['valor_centavos'] for d in dados],
+        **kwargs)
+
+
+class TestBoletoBatch(unittest.TestCase):
+    def _boletos(self, fabrica, dados, **campos):
+        boletos = []
+        for d in dados:
+            boleto = fabrica()
+            for nome in ('agencia_cedente', 'conta_cedente', 'nosso_numero',
+                         'data_vencimento'):
+                setattr(boleto, nome, d[nome])
+            boleto.valor_documento = '%d.%02d' % divmod(d['valor_centavos'],
+                                                        100)
+            for nome, valor in campos.items():
+                setattr(boleto, nome, valor)
+            boletos.append(boleto)
+        return boletos
+
+    def _assert_igual(self, batch, boletos):
+        barcodes, linhas = batch.calcula()
+        self.assertEqual(barcodes, [b.barcode for b in boletos])
+        self.assertEqual(linhas, [b.linha_digitavel for b in boletos])
+
+    def test_santander(self):
+        dados = list(registros())
+        self._assert_igual(lote('033', dados),
+                           self._boletos(BoletoSantander, dados))
+
+    def test_itau(self):
+        dados = list(registros())
+        self._assert_igual(
+            lote('341', dados, carteira=['109'] * len(dados)),
+            self._boletos(BoletoItau, dados, carteira='109'))
+
+    def test_colunas_e_prototipo(self):
+        dados = list(registros())
+        prototipo = BoletoBB(7, 2)
+        prototipo.convenio = '1234567'
+        prototipo.carteira = '18'
+        self._assert_igual(
+            lote('001', dados, prototipos={'001': prototipo}),
+            self._boletos(lambda: BoletoBB(7, 2), dados, carteira='18',
+                          convenio='1234567'))
+        self.assertEqual(prototipo.nosso_numero, '')
+
+        beneficiarios = ['%07d' % i for i in range(len(dados))]
+        batch = lote('756', dados, carteira=['1'] * len(dados),
+                     colunas={'codigo_beneficiario': beneficiarios},
+                     prototipos={'756': BoletoSicoob()})
+        boletos = self._boletos(BoletoSicoob, dados, carteira='1')
+        for boleto, beneficiario in zip(boletos, beneficiarios):
+            boleto.codigo_beneficiario = beneficiario
+        self._assert_igual(batch, boletos)
+
+    def test_varios_bancos(self):
+        dados = list(registros(20))
+        codigos = ['033', '341'] * 10
+        batch = BoletoBatch(
+            codigos,
+            [d['agencia_cedente'] for d in dados],
+            [d['conta_cedente'] for d in dados],
+            [d['nosso_numero'] for d in dados],
+            [d['data_vencimento'] for d in dados],
+            [d['valor_centavos'] for d in dados],
+            carteira=['102', '109'] * 10)
+        boletos = []
+        for codigo, d in zip(codigos, dados):
+            if codigo == '033':
+                boletos.extend(self._boletos(BoletoSantander, [d],
+                                             carteira='102'))
+            else:
+                boletos.extend(self._boletos(BoletoItau, [d],
+                                             carteira='109'))
+        self._assert_igual(batch, boletos)
+
+    def test_sem_numpy(self):
+        dados = list(registros())
+        vectorized = batch_module.vectorized
+        batch_module.vectorized = None
+        try:
+            self._assert_igual(lote('033', dados),
+                               self._boletos(BoletoSantander, dados))
+        finally:
+            batch_module.vectorized = vectorized
+
+    def test_vazio(self):
+        self.assertEqual(BoletoBatch([], [], [], [], [], []).calcula(),
+                         ([], []))
+
+    def test_linha_digitavel(self):
+        self.assertEqual(
+            linha_digitavel('03395540200002952959070707700000123456790102'),
+            '03399.07073 07700.000123 34567.901029 5 54020000295295')
+
+    def test_erros(self):
+        dados = list(registros(3))
+        self.assertRaises(ValueError, BoletoBatch, ['033'], ['1333'] * 2,
+                          [], [], [], [])
+        dados[1]['valor_centavos'] = 10 ** 10
+        self.assertRaises(ValueError, lote('033', dados).barcodes)
+        dados[1]['valor_centavos'] = 100
+        dados[2]['data_vencimento'] = datetime.date(1997, 1, 1)
+        self.assertRaises(TypeError, lote('033', dados).barcodes)
+
+    def test_valor_centavos_inteiro(self):
+        dados = list(registros(3))
+        for valor in (2952.95, Decimal('10.5'), '100', True):
+            dados[1]['valor_centavos'] = valor
+            with self.assertRaisesRegex(TypeError, 'record 1: '):
+                lote('033', dados).calcula()
+        try:
+            import numpy
+        except ImportError:
+            return
+        dados[1]['valor_centavos'] = numpy.int64(295295)
+        esperado = self._boletos(BoletoSantander, dados)
+        self._assert_igual(lote('033', dados), esperado)
+
+    def test_reemite(self):
+        dados = list(registros(20))
+        boletos = self._boletos(BoletoSantander, dados)
+        vencimento = datetime.date(2020, 3, 2)
+        for d in dados:
+            d['data_vencimento'] = vencimento
+            d['valor_centavos'] += 1
+        valores = [Decimal(d['valor_centavos']) / 100 for d in dados]
+        segundas_vias = reemite(boletos, vencimento, valores)
+        self._assert_igual(lote('033', dados), segundas_vias)
+        self.assertNotEqual(boletos[0].data_vencimento, vencimento)
+
+        datas = [vencimento + datetime.timedelta(days=i) for i in range(20)]
+        segundas_vias = reemite(boletos, datas, quantidade='1')
+        self.assertEqual([b.data_vencimento for b in segundas_vias], datas)
+        self.assertEqual(segundas_vias[0].quantidade, '1')
+        self.assertRaises(ValueError, reemite, boletos, datas[:3])
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestBoletoBatch)
+
+if __name__ == '__main__':
+    unittest.main()
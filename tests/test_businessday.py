@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+import datetime
+import random
+import unittest
+from decimal import Decimal
+
+from pyboleto.batch import reemite
+from pyboleto.businessday import (NACIONAL, Calendario, feriados_nacionais,
+                                  pascoa)
+from pyboleto.duedate import fator_vencimento
+from pyboleto.interest import Encargos, dias_atraso
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .testutils import boleto_itau
+
+D = datetime.date
+UM_DIA = datetime.timedelta(days=1)
+
+
+def datas_aleatorias(quantidade=2000, seed=4):
+    rnd = random.Random(seed)
+    return [D(1997, 2, 1) + datetime.timedelta(days=rnd.randrange(37000))
+            for _ in range(quantidade)]
+
+
+class TestCalendario(unittest.TestCase):
+    def setUp(self):
+        self.sao_paulo = Calendario(feriados=[(1, 25), (7, 9), (11, 20)])
+
+    def _util(self, calendario, data):
+        return (data.weekday() < 5 and
+                data not in calendario.datas_feriados(data.year))
+
+    def test_pascoa(self):
+        self.assertEqual(pascoa(2000), D(2000, 4, 23))
+        self.assertEqual(pascoa(2024), D(2024, 3, 31))
+        self.assertEqual(pascoa(2025), D(2025, 4, 20))
+        self.assertEqual(pascoa(2038), D(2038, 4, 25))
+
+    def test_feriados_nacionais(self):
+        feriados = feriados_nacionais(2025)
+        for data in [D(2025, 3, 3), D(2025, 3, 4), D(2025, 4, 18),
+                     D(2025, 6, 19), D(2025, 11, 20), D(2025, 12, 31)]:
+            self.assertIn(data, feriados)
+        self.assertEqual(feriados, sorted(feriados))
+        self.assertNotIn(D(2023, 11, 20), feriados_nacionais(2023))
+
+    def test_dia_util(self):
+        self.assertTrue(NACIONAL.dia_util(D(2025, 3, 5)))
+        self.assertFalse(NACIONAL.dia_util(D(2025, 3, 4)))
+        self.assertFalse(NACIONAL.dia_util(D(2025, 3, 1)))
+        self.assertTrue(NACIONAL.dia_util(D(2025, 1, 24)))
+
+    def test_proximo_dia_util(self):
+        # Sábado antes do Carnaval
+        self.assertEqual(NACIONAL.proximo_dia_util(D(2025, 3, 1)),
+                         D(2025, 3, 5))
+        self.assertEqual(NACIONAL.proximo_dia_util(D(2025, 3, 5)),
+                         D(2025, 3, 5))
+        # Aniversário de São Paulo num sábado
+        self.assertEqual(self.sao_paulo.proximo_dia_util(D(2025, 1, 25)),
+                         D(2025, 1, 27))
+        self.assertEqual(self.sao_paulo.proximo_dia_util(D(2022, 1, 25)),
+                         D(2022, 1, 26))
+        self.assertEqual(NACIONAL.proximo_dia_util(D(2022, 1, 25)),
+                         D(2022, 1, 25))
+
+    def test_aleatorio(self):
+        for calendario in (NACIONAL, self.sao_paulo):
+            for data in datas_aleatorias(300):
+                self.assertEqual(calendario.dia_util(data),
+                                 self._util(calendario, data))
+                proximo = data
+                while not self._util(calendario, proximo):
+                    proximo += UM_DIA
+                self.assertEqual(calendario.proximo_dia_util(data), proximo)
+
+                fim = data + datetime.timedelta(days=45)
+                uteis = [data + UM_DIA * i for i in range(1, 46)
+                         if self._util(calendario, data + UM_DIA * i)]
+                self.assertEqual(calendario.dias_uteis(data, fim),
+                                 len(uteis))
+                self.assertEqual(calendario.dias_uteis(fim, data),
+                                 -len(uteis))
+                for n, esperado in enumerate(uteis[:10], 1):
+                    self.assertEqual(calendario.soma_dias_uteis(data, n),
+                                     esperado)
+                    self.assertEqual(
+                        calendario.soma_dias_uteis(esperado, -n + 1),
+                        calendario.soma_dias_uteis(data, 1))
+
+    def test_soma_dias_uteis(self):
+        self.assertEqual(NACIONAL.soma_dias_uteis(D(2025, 2, 28), 1),
+                         D(2025, 3, 5))
+        self.assertEqual(NACIONAL.soma_dias_uteis(D(2025, 3, 5), -1),
+                         D(2025, 2, 28))
+        self.assertEqual(NACIONAL.soma_dias_uteis(D(2025, 3, 1), 0),
+                         D(2025, 3, 5))
+
+    def test_fora_do_calendario(self):
+        self.assertRaises(ValueError, NACIONAL.proximo_dia_util,
+                          D(1996, 12, 31))
+        self.assertRaises(ValueError, NACIONAL.dia_util, D(2100, 1, 1))
+        self.assertRaises(ValueError, NACIONAL.soma_dias_uteis,
+                          D(2099, 12, 30), 5)
+        self.assertRaises(ValueError, Calendario, inicio=2030, fim=2020)
+
+    def test_feriados_municipais(self):
+        avulso = D(2021, 3, 3)
+        calendario = NACIONAL.com_feriados(
+            avulso, lambda ano: [pascoa(ano) - 46 * UM_DIA])
+        self.assertFalse(calendario.dia_util(avulso))
+        self.assertTrue(NACIONAL.dia_util(avulso))
+        # Quarta-feira de cinzas
+        self.assertFalse(calendario.dia_util(D(2025, 3, 5)))
+        self.assertFalse(Calendario(nacionais=False).dia_util(D(2025, 3, 1)))
+        self.assertTrue(Calendario(nacionais=False).dia_util(D(2025, 3, 4)))
+
+    def test_lote(self):
+        datas = datas_aleatorias()
+        self.assertEqual(self.sao_paulo.proximos_dias_uteis(datas),
+                         [self.sao_paulo.proximo_dia_util(d) for d in datas])
+        fim = D(2030, 1, 1)
+        self.assertEqual(NACIONAL.contagens_dias_uteis(datas, fim),
+                         [NACIONAL.dias_uteis(d, fim) for d in datas])
+
+    @unittest.skipIf(numpy is None, "numpy não está instalado")
+    def test_numpy(self):
+        datas = datas_aleatorias()
+        array = numpy.array(datas, dtype='datetime64[D]')
+        resultado = self.sao_paulo.proximos_dias_uteis(array)
+        self.assertEqual(resultado.dtype, numpy.dtype('datetime64[D]'))
+        self.assertEqual(resultado.tolist(),
+                         self.sao_paulo.proximos_dias_uteis(datas))
+        fim = D(2030, 1, 1)
+        self.assertEqual(NACIONAL.contagens_dias_uteis(array, fim).tolist(),
+                         NACIONAL.contagens_dias_uteis(datas, fim))
+        self.assertRaises(ValueError, NACIONAL.proximos_dias_uteis,
+                          numpy.array(['1996-12-31'], dtype='datetime64[D]'))
+
+
+class TestIntegracao(unittest.TestCase):
+    def test_dias_atraso(self):
+        vencimentos = [D(2025, 3, 1), D(2025, 3, 1), D(2025, 3, 5)]
+        self.assertEqual(dias_atraso(vencimentos, D(2025, 3, 5)),
+                         [4, 4, 0])
+        self.assertEqual(dias_atraso(vencimentos, D(2025, 3, 5), NACIONAL),
+                         [0, 0, 0])
+        self.assertEqual(dias_atraso(vencimentos, D(2025, 3, 6), NACIONAL),
+                         [5, 5, 1])
+        self.assertEqual(dias_atraso(vencimentos, D(2025, 2, 28), NACIONAL),
+                         [-1, -1, -5])
+
+    @unittest.skipIf(numpy is None, "numpy não está instalado")
+    def test_dias_atraso_numpy(self):
+        vencimentos = datas_aleatorias()
+        array = numpy.array(vencimentos, dtype='datetime64[D]')
+        for pagamento in datas_aleatorias(20, seed=9):
+            self.assertEqual(
+                dias_atraso(array, pagamento, NACIONAL).tolist(),
+                dias_atraso(vencimentos, pagamento, NACIONAL))
+
+    def test_reemite(self):
+        boleto = boleto_itau(data_vencimento=D(2025, 2, 21),
+                             valor_documento=Decimal('100.00'),
+                             nosso_numero='157')
+        sabado = D(2025, 3, 1)
+        segunda_via, = reemite([boleto], sabado, calendario=NACIONAL)
+        self.assertEqual(segunda_via.data_vencimento, D(2025, 3, 5))
+        # O vencimento é levado para o dia útil antes de montar o boleto,
+        # então o código de barras e a data impressa são os mesmos
+        self.assertEqual(segunda_via.barcode[5:9],
+                         str(fator_vencimento(D(2025, 3, 5))))
+
+        encargos = Encargos(juros_diario='1')
+        segunda_via, = encargos.reemite([boleto], sabado, NACIONAL)
+        self.assertEqual(segunda_via.data_vencimento, D(2025, 3, 5))
+        self.assertEqual(segunda_via.valor_documento_centavos, 11200)
+
+
+suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(TestCalendario),
+    unittest.TestLoader().loadTestsFromTestCase(TestIntegracao),
+])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+import datetime
+import pickle
+import unittest
+from decimal import Decimal
+
+from pyboleto.bank.bancodobrasil import BoletoBB
+from pyboleto.bank.itau import BoletoItau
+from pyboleto.bank.sicredi import BoletoSicredi
+from pyboleto.cedente import CedenteProfile
+from pyboleto.data import BoletoException
+
+from . import testutils
+
+CONTA_ITAU = dict(testutils.CONTA_ITAU, cedente='Empresa de Testes Ltda',
+                  cedente_cidade='São Paulo')
+
+
+def variaveis(nosso_numero='157'):
+    return {
+        'nosso_numero': nosso_numero,
+        'data_vencimento': datetime.date(2012, 7, 22),
+        'data_documento': datetime.date(2012, 7, 1),
+        'data_processamento': datetime.date(2012, 7, 1),
+        'valor_documento': Decimal('2952.95'),
+        'sacado_nome': 'Cliente',
+    }
+
+
+def sem_perfil(boleto, **campos):
+    for nome, valor in campos.items():
+        setattr(boleto, nome, valor)
+    return boleto
+
+
+class TestCedenteProfile(unittest.TestCase):
+    def assertBoletoIgual(self, boleto, esperado):
+        for nome in ('barcode', 'linha_digitavel', 'agencia_conta_cedente',
+                     'codigo_dv_banco', 'cedente', 'cedente_cidade',
+                     'sacado_nome', 'format_nosso_numero'):
+            valor = getattr(boleto, nome)
+            if callable(valor):
+                valor = valor()
+                esperado_valor = getattr(esperado, nome)()
+            else:
+                esperado_valor = getattr(esperado, nome)
+            self.assertEqual(valor, esperado_valor, nome)
+
+    def test_itau(self):
+        perfil = CedenteProfile(BoletoItau, **CONTA_ITAU)
+        self.assertEqual(perfil.derivados, {
+            'agencia_conta_cedente': '0293/01328-0',
+            'codigo_dv_banco': '341-7',
+            'dv_agencia_conta_cedente': 0})
+        for nosso_numero in ('157', '12345678'):
+            boleto = perfil.boleto(**variaveis(nosso_numero))
+            esperado = testutils.boleto_itau(**dict(
+                CONTA_ITAU, **variaveis(nosso_numero)))
+            self.assertBoletoIgual(boleto, esperado)
+
+    def test_prototipo_configurado(self):
+        bb = BoletoBB(7, 2)
+        bb.convenio = '1234567'
+        perfil = CedenteProfile(bb, agencia_cedente='1172',
+                                conta_cedente='403005')
+        # O modelo não é alterado
+        self.assertEqual(bb.agencia_cedente, '0000')
+        self.assertEqual(perfil.derivados['agencia_conta_cedente'],
+                         '1172-0 / 00403005-2')
+
+        esperado = BoletoBB(7, 2)
+        esperado.convenio = '1234567'
+        sem_perfil(esperado, agencia_cedente='1172', conta_cedente='403005',
+                   **variaveis('87654'))
+        self.assertBoletoIgual(perfil.boleto(**variaveis('87654')), esperado)
+
+    def test_sicredi(self):
+        conta = {'agencia_cedente': '0434', 'conta_cedente': '36699',
+                 'posto': '18', 'convenio': '36699'}
+        perfil = CedenteProfile(BoletoSicredi, **conta)
+        boleto = perfil.boleto(**variaveis('00003'))
+        esperado = sem_perfil(BoletoSicredi(), **dict(conta,
+                                                      **variaveis('00003')))
+        self.assertBoletoIgual(boleto, esperado)
+
+    def test_boletos_independentes(self):
+        perfil = CedenteProfile(BoletoItau, **CONTA_ITAU)
+        b1 = perfil.boleto(**variaveis('1'))
+        b2 = perfil.boleto(**variaveis('2'))
+        b1.instrucoes.append('Não receber após o vencimento')
+        b1.cedente = 'Outra Empresa'
+        self.assertEqual(b2.instrucoes, [])
+        self.assertEqual(b2.cedente, 'Empresa de Testes Ltda')
+        self.assertEqual(perfil.prototipo.instrucoes, [])
+        self.assertNotEqual(b1.barcode, b2.barcode)
+
+    def test_sacado_independente(self):
+        itau = BoletoItau()
+        itau.sacado = ['Cliente', 'Rua Um, 1', 'São Paulo - SP']
+        perfil = CedenteProfile(itau, **CONTA_ITAU)
+        b1 = perfil.boleto(**variaveis('1'))
+        b2 = perfil.boleto(**variaveis('2'))
+        b1.sacado.append('CEP 01000-000')
+        self.assertEqual(len(b2.sacado), 3)
+        self.assertEqual(len(perfil.prototipo.sacado), 3)
+        self.assertEqual(len(itau.sacado), 3)
+
+    def test_altera_conta(self):
+        perfil = CedenteProfile(BoletoItau, **CONTA_ITAU)
+        # Campos da conta no boleto não usam os valores do perfil
+        boleto = perfil.boleto(conta_cedente='45678', **variaveis())
+        esperado = testutils.boleto_itau(**dict(
+            CONTA_ITAU, conta_cedente='45678', **variaveis()))
+        self.assertBoletoIgual(boleto, esperado)
+
+        boleto = perfil.boleto(**variaveis())
+        self.assertEqual(boleto.agencia_conta_cedente, '0293/01328-0')
+        boleto.agencia_cedente = '0057'
+        esperado = testutils.boleto_itau(**dict(
+            CONTA_ITAU, agencia_cedente='0057', **variaveis()))
+        self.assertBoletoIgual(boleto, esperado)
+
+    def test_conta_invalida(self):
+        with self.assertRaises(BoletoException) as contexto:
+            CedenteProfile(BoletoItau, carteira='109',
+                           conta_cedente='1234567')
+        self.assertIn('conta_cedente', str(contexto.exception))
+
+    def test_pickle(self):
+        perfil = CedenteProfile(BoletoItau, **CONTA_ITAU)
+        boleto = perfil.boleto(**variaveis())
+        copia = pickle.loads(pickle.dumps(boleto))
+        self.assertBoletoIgual(copia, boleto)
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestCedenteProfile)
+
+if __name__ == '__main__':
+    unittest.main()
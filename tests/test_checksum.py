@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+
+from pyboleto.checksum import Checksum, DV_BARCODE, MODULO10, modulo11
+
+
+def modulo10_loop(num):
+    soma = 0
+    peso = 2
+    for c in reversed(num):
+        parcial = int(c) * peso
+        if parcial > 9:
+            parcial = parcial // 10 + parcial % 10
+        soma += parcial
+        peso = 1 if peso == 2 else 2
+    return (10 - soma % 10) % 10
+
+
+def modulo11_loop(num, base=9, r=0):
+    soma = 0
+    fator = 2
+    for c in reversed(num):
+        soma += int(c) * fator
+        if fator == base:
+            fator = 1
+        fator += 1
+    if r == 0:
+        digito = soma * 10 % 11
+        return 0 if digito == 10 else digito
+    return soma % 11
+
+
+class TestChecksum(unittest.TestCase):
+    def setUp(self):
+        rnd = random.Random(42)
+        self.numeros = [
+            ''.join(rnd.choice('0123456789')
+                    for _ in range(rnd.randint(1, 60)))
+            for _ in range(500)
+        ]
+
+    def test_modulo10(self):
+        for num in self.numeros:
+            self.assertEqual(MODULO10(num), modulo10_loop(num))
+
+    def test_modulo11(self):
+        for base in (7, 9):
+            for r in (0, 1):
+                checksum = modulo11(base, r)
+                for num in self.numeros:
+                    self.assertEqual(checksum(num),
+                                     modulo11_loop(num, base, r))
+
+    def test_dv_barcode(self):
+        self.assertEqual(
+            DV_BARCODE('0019373700000001000500940144816060680935031'), 3)
+
+    def test_regra(self):
+        checksum = Checksum((2, 3), 5, 'abcde')
+        self.assertEqual(checksum('12'), 'c')
+        self.assertEqual(checksum.resto('12'), 2)
+
+    def test_numero_longo(self):
+        num = '7' * 200
+        self.assertEqual(MODULO10(num), modulo10_loop(num))
+
+    def test_erros(self):
+        self.assertRaises(TypeError, MODULO10, 123)
+        self.assertRaises(ValueError, MODULO10, '12a4')
+        self.assertRaises(ValueError, MODULO10, '12 4')
+        self.assertRaises(ValueError, MODULO10, '12\xe34')
+        self.assertRaises(ValueError, modulo11, 9, 2)
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestChecksum)
+
+if __name__ == '__main__':
+    unittest.main()
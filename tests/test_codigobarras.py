@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import io
+import re
+import unittest
+
+from pyboleto.bank.itau import BoletoItau
+from pyboleto.codigobarras import (ALTURA, COMPRIMENTO, ESTREITA_MINIMA,
+                                   PADROES, PARES, RAZAO, elementos,
+                                   estreitas, largura_estreita,
+                                   operadores_pdf)
+from pyboleto.html import BoletoHTML
+
+from .testutils import cria_boleto
+from .test_pdfdireto import streams
+
+
+def retangulos(operadores):
+    """(x, largura) de cada ``re``, em estreitas"""
+    return [(int(x), int(largura)) for x, largura in
+            re.findall(r'(\d+) 0 (\d+) 1 re\n', operadores)]
+
+
+class TestCodigoBarras(unittest.TestCase):
+    def setUp(self):
+        self.codigo = cria_boleto(BoletoItau, 1).barcode
+
+    def test_pares(self):
+        for par, larguras in enumerate(PARES):
+            self.assertEqual(len(larguras), 10)
+            # Dois elementos largos em cada dígito
+            self.assertEqual(sum(larguras), 2 * (2 * RAZAO + 3))
+            self.assertEqual(
+                ''.join('w' if n == RAZAO else 'n' for n in larguras[::2]),
+                PADROES[par // 10])
+            self.assertEqual(
+                ''.join('w' if n == RAZAO else 'n' for n in larguras[1::2]),
+                PADROES[par % 10])
+
+    def test_reportlab(self):
+        try:
+            from reportlab.graphics.barcode.common import I2of5
+        except ImportError:
+            self.skipTest("reportlab não está instalado")
+        for codigo in (self.codigo, '12345', '0' * 44):
+            bc = I2of5(codigo, ratio=RAZAO, bearers=0, quiet=0, checksum=0)
+            bc.validate()
+            bc.encode()
+            bc.decompose()
+            self.assertEqual(
+                ''.join('1' if c in 'bs' else str(RAZAO)
+                        for c in bc.decomposed),
+                ''.join(str(n) for n in elementos(codigo)))
+
+    def test_dimensoes(self):
+        self.assertEqual(len(self.codigo), 44)
+        self.assertEqual(estreitas(self.codigo), 405)
+        self.assertEqual(sum(elementos(self.codigo)), 405)
+        estreita = largura_estreita(self.codigo)
+        self.assertAlmostEqual(estreita * 405, COMPRIMENTO)
+        self.assertGreaterEqual(estreita, ESTREITA_MINIMA)
+        self.assertGreaterEqual(largura_estreita(self.codigo, 120), estreita)
+        self.assertRaises(ValueError, largura_estreita, self.codigo, 100)
+        self.assertRaises(ValueError, largura_estreita, '1' * 60)
+
+    def test_operadores_pdf(self):
+        operadores = operadores_pdf(self.codigo)
+        # Um único caminho: só retângulos e um preenchimento no fim
+        self.assertTrue(operadores.endswith('\nf'))
+        self.assertEqual(operadores.count('f'), 1)
+        esperado = []
+        x = 0
+        for i, largura in enumerate(elementos(self.codigo)):
+            if i % 2 == 0:
+                esperado.append((x, largura))
+            x += largura
+        self.assertEqual(retangulos(operadores), esperado)
+        self.assertEqual(sum(esperado[-1]), 405)
+        # A tabela por posição não muda o resultado da segunda vez
+        self.assertEqual(operadores_pdf(self.codigo), operadores)
+        self.assertEqual(retangulos(operadores_pdf('1')),
+                         retangulos(operadores_pdf('01')))
+
+    def test_pdf(self):
+        from pyboleto.pdfdireto import BoletoPDFDireto
+
+        classes = [BoletoPDFDireto]
+        try:
+            from pyboleto.pdf import BoletoPDF
+            import reportlab  # noqa
+            classes.append(BoletoPDF)
+        except ImportError:
+            pass
+        for classe in classes:
+            arquivo = io.BytesIO()
+            pdf = classe(arquivo)
+            if classe is not BoletoPDFDireto:
+                pdf.pdf_canvas.setPageCompression(0)
+            pdf.drawBoleto(cria_boleto(BoletoItau, 1))
+            pdf.save()
+            conteudo = streams(arquivo.getvalue()).decode('latin-1')
+            escala = re.search(r'([\d.]+) 0(?:\.0+)? 0(?:\.0+)? ([\d.]+) '
+                               r'[\d.]+ [\d.]+ cm\n0 0 1 1 re\n', conteudo)
+            # 103 mm por 13 mm, com a precisão gravada no PDF
+            self.assertAlmostEqual(float(escala.group(1)) * 405,
+                                   COMPRIMENTO * 72 / 25.4, places=2)
+            self.assertAlmostEqual(float(escala.group(2)),
+                                   ALTURA * 72 / 25.4, places=4)
+            self.assertIn(operadores_pdf(self.codigo), conteudo)
+
+    def test_html(self):
+        html = BoletoHTML(io.StringIO())._codigoBarraI25('12')
+        self.assertEqual(
+            re.findall(r'class="([^"]*)"', html),
+            ['n', 'n s', 'n', 'n s',
+             'w', 'n s', 'n', 'w s', 'n', 'n s', 'n', 'n s', 'w', 'w s',
+             'w', 'n s', 'n'])
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestCodigoBarras)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+import copy
+import datetime
+import gc
+import pickle
+import unittest
+import weakref
+from decimal import Decimal
+
+from pyboleto.bank.banrisul import BoletoBanrisul
+from pyboleto.bank.bradesco import BoletoBradesco
+from pyboleto.bank.bancodobrasil import BoletoBB
+from pyboleto.bank.caixa import BoletoCaixa
+from pyboleto.bank.caixa_sigcb import BoletoCaixaSigcb
+from pyboleto.bank.cecred import BoletoCecred
+from pyboleto.bank.hsbc import BoletoHsbc, BoletoHsbcComRegistro
+from pyboleto.bank.itau import BoletoItau
+from pyboleto.bank.santander import BoletoSantander
+from pyboleto.bank.sicoob import BoletoSicoob
+from pyboleto.bank.sicredi import BoletoSicredi
+from pyboleto.data import BoletoException, formata_centavos
+
+
+class TestCustomProperty(unittest.TestCase):
+    def test_valor_por_instancia(self):
+        d1 = BoletoBradesco()
+        d2 = BoletoBradesco()
+        d1.nosso_numero = '123'
+        self.assertEqual(d1.nosso_numero, '00000000123')
+        self.assertEqual(d2.nosso_numero, '00000000000')
+
+    def test_mantem_dv(self):
+        d = BoletoBradesco()
+        d.conta_cedente = '1234-5'
+        self.assertEqual(d.conta_cedente, '0001234-5')
+
+    def test_boleto_liberado(self):
+        d = BoletoBradesco()
+        d.nosso_numero = '123'
+        ref = weakref.ref(d)
+        del d
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_slots(self):
+        d = BoletoBB(7, 1)
+        self.assertNotIn('codigo_banco', d.__dict__)
+        self.assertNotIn('format_convenio', d.__dict__)
+        self.assertEqual(d.format_convenio, 7)
+
+
+class TestPickle(unittest.TestCase):
+    classes = [BoletoBanrisul, BoletoBradesco, BoletoCaixa, BoletoCaixaSigcb,
+               BoletoCecred, BoletoHsbc, BoletoHsbcComRegistro, BoletoItau,
+               BoletoSantander, BoletoSicoob]
+
+    def _preenche(self, d):
+        d.agencia_cedente = '1234'
+        d.conta_cedente = '5678'
+        d.nosso_numero = '42'
+        d.data_vencimento = datetime.date(2016, 5, 6)
+        d.valor_documento = 97.50
+        d.instrucoes = ['Não receber após o vencimento']
+        return d
+
+    def _assert_roundtrip(self, d, *attrs):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            e = pickle.loads(pickle.dumps(d, protocol))
+            self.assertIs(type(e), type(d))
+            for attr in attrs:
+                self.assertEqual(getattr(e, attr), getattr(d, attr))
+            self.assertEqual(e.campo_livre, d.campo_livre)
+        return e
+
+    def test_bancos(self):
+        for cls in self.classes:
+            d = self._preenche(cls())
+            self._assert_roundtrip(d, 'agencia_cedente', 'conta_cedente',
+                                   'nosso_numero', 'valor_documento',
+                                   'data_vencimento', 'instrucoes',
+                                   'codigo_banco', 'carteira')
+
+    def test_banco_do_brasil(self):
+        d = self._preenche(BoletoBB(6, 2))
+        d.convenio = '123456'
+        d.carteira = '18'
+        self._assert_roundtrip(d, 'format_convenio', 'format_nnumero',
+                               'convenio', 'nosso_numero')
+
+    def test_sicredi(self):
+        d = self._preenche(BoletoSicredi())
+        d.posto = '08'
+        d.convenio = '12345'
+        self._assert_roundtrip(d, 'posto', 'convenio', 'nosso_numero')
+
+    def test_slot_vazio(self):
+        d = BoletoBB(7, 1)
+        del d.format_nnumero
+        e = pickle.loads(pickle.dumps(d))
+        self.assertFalse(hasattr(e, 'format_nnumero'))
+        self.assertEqual(e.format_convenio, 7)
+
+    def test_copy(self):
+        d = self._preenche(BoletoBradesco())
+        e = copy.copy(d)
+        e.nosso_numero = '43'
+        self.assertEqual(d.nosso_numero, '00000000042')
+        self.assertEqual(e.nosso_numero, '00000000043')
+
+
+class TestMemoized(unittest.TestCase):
+    def setUp(self):
+        d = BoletoSantander()
+        d.agencia_cedente = '1333'
+        d.conta_cedente = '0707077'
+        d.data_vencimento = datetime.date(2012, 7, 22)
+        d.valor_documento = 2952.95
+        d.nosso_numero = '1234567'
+        self.dados = d
+
+    def test_cache(self):
+        d = self.dados
+        self.assertIs(d.barcode, d.barcode)
+        self.assertIn('barcode', d._cache)
+        self.assertIn('campo_livre', d._cache)
+        self.assertIs(d.format_nosso_numero(), d.format_nosso_numero())
+
+    def _assert_recalcula(self, attr, value):
+        d = self.dados
+        antes = (d.barcode, d.linha_digitavel, d.format_nosso_numero())
+        setattr(d, attr, value)
+        depois = (d.barcode, d.linha_digitavel, d.format_nosso_numero())
+        novo = pickle.loads(pickle.dumps(d))
+        novo._cache.clear()
+        self.assertNotEqual(antes, depois)
+        self.assertEqual(depois, (novo.barcode, novo.linha_digitavel,
+                                  novo.format_nosso_numero()))
+
+    def test_invalida_custom_property(self):
+        self._assert_recalcula('nosso_numero', '7654321')
+
+    def test_invalida_valor_documento(self):
+        self._assert_recalcula('valor_documento', 10)
+
+    def test_invalida_data_vencimento(self):
+        self._assert_recalcula('data_vencimento', datetime.date(2013, 1, 1))
+
+    def test_invalida_slot_da_subclasse(self):
+        self._assert_recalcula('ios', '7')
+
+    def test_sicredi_ano(self):
+        d = BoletoSicredi()
+        d.agencia_cedente = '1234'
+        d.convenio = '12345'
+        d.nosso_numero = '123'
+        d.data_vencimento = datetime.date(2014, 1, 1)
+        self.assertTrue(d.format_nosso_numero().startswith('14/'))
+        d.data_vencimento = datetime.date(2015, 1, 1)
+        self.assertTrue(d.format_nosso_numero().startswith('15/'))
+
+    def test_excecao_nao_fica_no_cache(self):
+        d = BoletoBradesco()
+        self.assertRaises(TypeError, getattr, d, 'barcode')
+        self.assertNotIn('barcode', d._cache)
+
+    def test_somente_leitura(self):
+        self.assertRaises(AttributeError, setattr, self.dados, 'barcode', '1')
+
+    def test_copy_nao_compartilha_cache(self):
+        d = self.dados
+        d.barcode
+        e = copy.copy(d)
+        self.assertIsNot(e._cache, d._cache)
+        e.nosso_numero = '1'
+        self.assertNotEqual(e.barcode, d.barcode)
+
+
+class TestReemissao(unittest.TestCase):
+    def _boleto(self, classe):
+        d = classe()
+        d.agencia_cedente = '1172'
+        d.conta_cedente = '0403005'
+        d.nosso_numero = '1234'
+        d.data_vencimento = datetime.date(2012, 7, 22)
+        d.valor_documento = Decimal('2952.95')
+        d.instrucoes = ['Não receber após o vencimento']
+        return d
+
+    def _assert_segunda_via(self, d):
+        d.linha_digitavel
+        d.format_nosso_numero()
+        vencimento = datetime.date(2012, 8, 10)
+        e = d.copy(data_vencimento=vencimento,
+                   valor_documento=Decimal('3010.12'))
+        esperado = copy.copy(d)
+        esperado.data_vencimento = vencimento
+        esperado.valor_documento = Decimal('3010.12')
+        self.assertEqual(e.barcode, esperado.barcode)
+        self.assertEqual(e.linha_digitavel, esperado.linha_digitavel)
+        self.assertEqual(e.format_nosso_numero(),
+                         esperado.format_nosso_numero())
+        self.assertEqual(e.campo_livre, esperado.campo_livre)
+        self.assertNotEqual(e.barcode, d.barcode)
+        return e
+
+    def test_reaproveita_derivados(self):
+        d = self._boleto(BoletoSantander)
+        d.agencia_conta_cedente
+        e = self._assert_segunda_via(d)
+        self.assertIs(e.campo_livre, d.campo_livre)
+        self.assertIn('agencia_conta_cedente', e._cache)
+
+    def test_vencimento_no_campo_livre(self):
+        self._assert_segunda_via(self._boleto(BoletoHsbc))
+        d = self._boleto(BoletoSicredi)
+        d.convenio = '12345'
+        d.data_vencimento = datetime.date(2012, 12, 31)
+        e = self._assert_segunda_via(d)
+        self.assertTrue(e.format_nosso_numero().startswith('12/'))
+        f = d.copy(data_vencimento=datetime.date(2013, 1, 10))
+        self.assertTrue(f.format_nosso_numero().startswith('13/'))
+
+    def test_outros_campos(self):
+        d = self._boleto(BoletoSantander)
+        d.barcode
+        e = d.copy(nosso_numero='4321')
+        self.assertEqual(e._cache, {})
+        self.assertNotEqual(e.barcode, d.barcode)
+
+    def test_nao_altera_original(self):
+        d = self._boleto(BoletoSantander)
+        barcode = d.barcode
+        e = d.copy(data_vencimento=datetime.date(2012, 8, 10))
+        e.instrucoes.append('Multa de 2%')
+        self.assertEqual(d.barcode, barcode)
+        self.assertEqual(d.data_vencimento, datetime.date(2012, 7, 22))
+        self.assertEqual(len(d.instrucoes), 1)
+
+
+class BoletoSantanderCentavos(BoletoSantander):
+    valor_em_centavos = True
+
+
+class TestValorCentavos(unittest.TestCase):
+    def _preenche(self, d):
+        d.agencia_cedente = '1333'
+        d.conta_cedente = '0707077'
+        d.nosso_numero = '000000000123'
+        d.data_vencimento = datetime.date(2012, 7, 22)
+        return d
+
+    def test_formata_centavos(self):
+        self.assertEqual(formata_centavos(0), '0,00')
+        self.assertEqual(formata_centavos(5), '0,05')
+        self.assertEqual(formata_centavos(295295), '2.952,95')
+        self.assertEqual(formata_centavos(123456789012), '1.234.567.890,12')
+        self.assertEqual(formata_centavos(-100000), '-1.000,00')
+
+    def test_modo_decimal(self):
+        d = BoletoSantander()
+        d.valor_documento = 2952.95
+        self.assertEqual(d.valor_documento, '2952.95')
+        self.assertEqual(d.valor_documento_centavos, 295295)
+        d.valor_documento_centavos = 100
+        self.assertEqual(d.valor_documento, '1.00')
+        self.assertIsNone(d.valor_centavos)
+
+    def test_modo_centavos(self):
+        d = BoletoSantanderCentavos()
+        d.valor_documento = '2952.95'
+        self.assertEqual(d._valor_documento, 295295)
+        self.assertEqual(d.valor_documento, '2952.95')
+        d.valor = 10
+        self.assertEqual(d.valor_centavos, 1000)
+        self.assertEqual(d.valor, '10.00')
+        d.valor = Decimal('2.675')
+        self.assertEqual(d.valor_centavos, 268)
+        d.valor_centavos = -5
+        self.assertEqual(d.valor, '-0.05')
+
+        e = BoletoSantander()
+        e.valor_em_centavos = True
+        e.valor_documento = 0.125
+        self.assertEqual(e.valor_documento_centavos, 13)
+
+    def test_mesmo_barcode(self):
+        d = self._preenche(BoletoSantander())
+        d.valor_documento = 2952.95
+        c = self._preenche(BoletoSantanderCentavos())
+        c.valor_documento_centavos = 295295
+        self.assertEqual(c.barcode, d.barcode)
+        self.assertEqual(c.linha_digitavel, d.linha_digitavel)
+
+    def test_mesmo_arredondamento(self):
+        # Meio centavo é arredondado para cima nos dois modos
+        for valor, centavos in (('2.675', 268), ('1.005', 101),
+                                ('0.125', 13)):
+            d = self._preenche(BoletoSantander())
+            d.valor_documento = Decimal(valor)
+            c = self._preenche(BoletoSantanderCentavos())
+            c.valor_documento = Decimal(valor)
+            self.assertEqual(d.valor_documento_centavos, centavos)
+            self.assertEqual(c.valor_documento_centavos, centavos)
+            self.assertEqual(d.valor_documento, c.valor_documento)
+            self.assertEqual(d.barcode, c.barcode)
+            self.assertIn('%010d' % centavos, d.barcode)
+
+    def test_limite(self):
+        c = BoletoSantanderCentavos()
+        self.assertRaises(BoletoException, setattr, c,
+                          'valor_documento', '100000000.00')
+        self.assertRaises(BoletoException, setattr, c,
+                          'valor_documento_centavos', -1)
+        c.valor_documento_centavos = 9999999999
+
+        d = self._preenche(BoletoSantander())
+        d.valor_documento = '100000000.00'
+        self.assertRaises(BoletoException, getattr, d, 'barcode')
+
+    def test_centavos_inteiros(self):
+        d = BoletoSantander()
+        self.assertRaises(TypeError, setattr, d, 'valor_documento_centavos',
+                          1.5)
+        self.assertRaises(TypeError, setattr, d, 'valor_centavos', '150')
+
+    def test_pickle(self):
+        c = self._preenche(BoletoSantanderCentavos())
+        c.valor_documento_centavos = 295295
+        e = pickle.loads(pickle.dumps(c))
+        self.assertEqual(e.valor_documento_centavos, 295295)
+        self.assertEqual(e.barcode, c.barcode)
+
+
+suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(TestCustomProperty),
+    unittest.TestLoader().loadTestsFromTestCase(TestPickle),
+    unittest.TestLoader().loadTestsFromTestCase(TestMemoized),
+    unittest.TestLoader().loadTestsFromTestCase(TestReemissao),
+    unittest.TestLoader().loadTestsFromTestCase(TestValorCentavos),
+])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import datetime
+import unittest
+
+from pyboleto import decoder
+from pyboleto.bank.itau import BoletoItau
+from pyboleto.bank.santander import BoletoSantander
+from pyboleto.data import BoletoException
+
+
+class TestDecoder(unittest.TestCase):
+    def setUp(self):
+        d = BoletoSantander()
+        d.agencia_cedente = '1333'
+        d.conta_cedente = '0707077'
+        d.data_vencimento = datetime.date(2012, 7, 22)
+        d.valor_documento = 2952.95
+        d.nosso_numero = '1234567'
+        self.santander = d
+
+        d = BoletoItau()
+        d.carteira = '109'
+        d.agencia_cedente = '0293'
+        d.conta_cedente = '01328'
+        d.data_vencimento = datetime.date(2009, 10, 19)
+        d.valor_documento = 29.80
+        d.nosso_numero = '157'
+        self.itau = d
+
+    def test_barcode(self):
+        boleto = decoder.decodifica_barcode(
+            self.santander.barcode, referencia=datetime.date(2012, 7, 1))
+        self.assertEqual(boleto.barcode, self.santander.barcode)
+        self.assertEqual(boleto.codigo_banco, '033')
+        self.assertEqual(boleto.banco, 'santander.BoletoSantander')
+        self.assertEqual(boleto.moeda, '9')
+        self.assertEqual(boleto.fator_vencimento, 5402)
+        self.assertEqual(boleto.data_vencimento, datetime.date(2012, 7, 22))
+        self.assertEqual(boleto.valor_centavos, 295295)
+        self.assertEqual(boleto.campo_livre, self.santander.campo_livre)
+        self.assertEqual(boleto.campos, {
+            'conta_cedente': '0707077',
+            'nosso_numero': '000001234567',
+            'dv_nosso_numero': '9',
+            'ios': '0',
+            'carteira': '102',
+        })
+
+    def test_linha_digitavel(self):
+        boleto = decoder.decodifica_linha(self.itau.linha_digitavel)
+        self.assertEqual(boleto.barcode, self.itau.barcode)
+        self.assertEqual(boleto.campos['nosso_numero'], '00000157')
+        self.assertEqual(boleto.campos['dv_nosso_numero'],
+                         str(self.itau.dv_nosso_numero))
+        self.assertEqual(
+            decoder.decodifica(self.itau.linha_digitavel.replace(' ', '')),
+            boleto)
+        self.assertIsNone(
+            decoder.decodifica(self.itau.barcode, detalha=False).campos)
+
+    def test_dvs(self):
+        barcode = self.santander.barcode
+        errado = barcode[:4] + str((int(barcode[4]) + 1) % 10) + barcode[5:]
+        self.assertRaises(BoletoException, decoder.decodifica_barcode,
+                          errado)
+        linha = self.santander.linha_digitavel
+        for posicao in (10, 22, 35):
+            digito = str((int(linha[posicao]) + 1) % 10)
+            errada = linha[:posicao] + digito + linha[posicao + 1:]
+            self.assertRaises(BoletoException, decoder.decodifica_linha,
+                              errada)
+        self.assertRaises(BoletoException, decoder.decodifica_barcode,
+                          barcode[:-1])
+        self.assertRaises(BoletoException, decoder.decodifica_barcode,
+                          barcode[:-1] + 'x')
+
+    def test_lote(self):
+        codigos = [self.santander.barcode, '123', None,
+                   self.itau.linha_digitavel,
+                   self.itau.linha_digitavel.replace('1', '2')] * 3
+        resultados = list(decoder.decodifica_lote(codigos, tamanho_bloco=4))
+        self.assertEqual([r[0] for r in resultados], codigos)
+        for codigo, boleto, erro in resultados:
+            self.assertTrue((boleto is None) != (erro is None))
+            if boleto is not None:
+                self.assertEqual(boleto, decoder.decodifica(codigo))
+        self.assertEqual([r[1] is not None for r in resultados],
+                         [True, False, False, True, False] * 3)
+        self.assertIsInstance(resultados[2][2], TypeError)
+
+        vectorized = decoder.vectorized
+        decoder.vectorized = None
+        try:
+            self.assertEqual(
+                [r[:2] for r in decoder.decodifica_lote(codigos)],
+                [r[:2] for r in resultados])
+        finally:
+            decoder.vectorized = vectorized
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestDecoder)
+
+if __name__ == '__main__':
+    unittest.main()
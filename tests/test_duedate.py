@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import datetime
+import unittest
+
+from pyboleto import duedate
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def dia(n):
+    return duedate.DATA_BASE + datetime.timedelta(days=n)
+
+
+class TestDueDate(unittest.TestCase):
+    def test_fator_vencimento(self):
+        self.assertEqual(duedate.fator_vencimento(dia(0)), 0)
+        self.assertEqual(
+            duedate.fator_vencimento(datetime.date(2012, 7, 22)), 5402)
+        self.assertEqual(
+            duedate.fator_vencimento(datetime.date(2025, 2, 21)), 9999)
+        self.assertEqual(duedate.fator_vencimento(duedate.DATA_REINICIO),
+                         1000)
+        # Fim do segundo ciclo e depois da tabela
+        self.assertEqual(duedate.fator_vencimento(dia(18999)), 9999)
+        self.assertEqual(duedate.fator_vencimento(dia(19000)), 1000)
+        self.assertEqual(duedate.fator_vencimento(dia(28001)), 1001)
+        self.assertEqual(
+            duedate.fator_vencimento(datetime.datetime(2012, 7, 22, 10)),
+            5402)
+        self.assertRaises(TypeError, duedate.fator_vencimento,
+                          datetime.date(1997, 10, 6))
+
+    def test_data_vencimento(self):
+        self.assertIsNone(duedate.data_vencimento(0))
+        self.assertEqual(duedate.data_vencimento(500), dia(500))
+        self.assertEqual(
+            duedate.data_vencimento(5402, datetime.date(2012, 7, 1)),
+            datetime.date(2012, 7, 22))
+        self.assertRaises(ValueError, duedate.data_vencimento, 10000)
+        self.assertRaises(ValueError, duedate.data_vencimento, -1)
+
+    def test_reinicio(self):
+        pagamento = datetime.date(2025, 3, 1)
+        self.assertEqual(duedate.data_vencimento(9990, pagamento),
+                         datetime.date(2025, 2, 12))
+        self.assertEqual(duedate.data_vencimento(1010, pagamento),
+                         datetime.date(2025, 3, 4))
+        self.assertEqual(duedate.data_vencimento(1000, pagamento),
+                         duedate.DATA_REINICIO)
+        antes = datetime.date(2024, 12, 1)
+        self.assertEqual(duedate.data_vencimento(1000, antes),
+                         duedate.DATA_REINICIO)
+        self.assertEqual(duedate.data_vencimento(1000,
+                                                 datetime.date(2001, 1, 1)),
+                         dia(1000))
+
+    def test_ida_e_volta(self):
+        for n in range(0, 30000, 7):
+            data = dia(n)
+            fator = duedate.fator_vencimento(data)
+            self.assertEqual(duedate.data_vencimento(fator, data),
+                             data if fator else None)
+
+    def test_lote(self):
+        datas = [dia(n) for n in range(1, 25000, 13)]
+        fatores = duedate.fatores_vencimento(datas)
+        self.assertEqual(fatores,
+                         [duedate.fator_vencimento(d) for d in datas])
+        referencia = datetime.date(2025, 3, 1)
+        self.assertEqual(
+            duedate.datas_vencimento(fatores, referencia),
+            [duedate.data_vencimento(f, referencia) for f in fatores])
+
+    @unittest.skipIf(numpy is None, "numpy não está instalado")
+    def test_lote_numpy(self):
+        datas = [dia(n) for n in range(0, 30000, 11)]
+        fatores = duedate.fatores_vencimento(
+            numpy.array(datas, dtype='datetime64[D]'))
+        self.assertIsInstance(fatores, numpy.ndarray)
+        self.assertEqual(fatores.tolist(),
+                         duedate.fatores_vencimento(datas))
+        self.assertRaises(TypeError, duedate.fatores_vencimento,
+                          numpy.array(['1997-10-06'], dtype='datetime64[D]'))
+
+        referencia = datetime.date(2025, 3, 1)
+        resultado = duedate.datas_vencimento(fatores, referencia)
+        esperado = duedate.datas_vencimento(fatores.tolist(), referencia)
+        self.assertEqual([d if d == d else None
+                          for d in resultado.astype(object)], esperado)
+        self.assertRaises(ValueError, duedate.datas_vencimento,
+                          numpy.array([10000]), referencia)
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestDueDate)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import os
+import subprocess
+import sys
+import unittest
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+PESADOS = ('reportlab', 'PIL', 'numpy')
+
+
+def importados(codigo):
+    """Dependências pesadas importadas ao executar ``codigo``"""
+    saida = subprocess.check_output(
+        [sys.executable, '-c', '%s\nimport sys\nprint(",".join('
+         'm for m in %r if m in sys.modules))' % (codigo, PESADOS)],
+        env=dict(os.environ, PYTHONPATH=RAIZ), cwd=RAIZ)
+    return [m for m in saida.decode().strip().split(',') if m]
+
+
+class TestImportacao(unittest.TestCase):
+    def test_modulos_leves(self):
+        for modulo in ('pyboleto', 'pyboleto.data', 'pyboleto.html',
+                       'pyboleto.pdf', 'pyboleto.bank.itau',
+                       'pyboleto.cedente', 'pyboleto.layout',
+                       'pyboleto.view', 'pyboleto.interest',
+                       'pyboleto.businessday', 'pyboleto.taxid',
+                       'pyboleto.pdfstream', 'pyboleto.pdfparalelo',
+                       'pyboleto.pdfdireto', 'pyboleto.codigobarras',
+                       'pyboleto.arrays'):
+            self.assertEqual(importados('import %s' % modulo), [], modulo)
+
+    def test_bancos(self):
+        self.assertEqual(importados(
+            'from pyboleto.bank import carrega_bancos\ncarrega_bancos()'),
+            [])
+
+    def test_pdfdireto(self):
+        self.assertEqual(importados(
+            'import io\n'
+            'from pyboleto.bank.santander import BoletoSantander\n'
+            'from pyboleto.pdfdireto import BoletoPDFDireto\n'
+            'from tests.testutils import cria_boleto\n'
+            'pdf = BoletoPDFDireto(io.BytesIO())\n'
+            'pdf.drawBoleto(cria_boleto(BoletoSantander, 1,\n'
+            '                           "logo_santander.png"))\n'
+            'pdf.save()'), [])
+
+    def test_pdf_importa_reportlab(self):
+        try:
+            import reportlab  # noqa
+        except ImportError:
+            self.skipTest("reportlab não está instalado")
+        self.assertIn('reportlab', importados(
+            'import io\n'
+            'from pyboleto.pdf import BoletoPDF\n'
+            'BoletoPDF(io.BytesIO())'))
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestImportacao)
+
+if __name__ == '__main__':
+    unittest.main()
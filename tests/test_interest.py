@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+import datetime
+import random
+import unittest
+from decimal import Decimal, ROUND_HALF_UP
+
+from pyboleto.interest import Encargos, dias_atraso
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .testutils import boleto_itau
+
+
+def total_decimal(valor_centavos, dias, multa, juros_diario):
+    """Cálculo de referência, título a título com Decimal"""
+    centavo = Decimal('0.01')
+    valor = Decimal(valor_centavos) / 100
+    total = valor
+    if dias > 0:
+        total += (valor * Decimal(multa) / 100).quantize(
+            centavo, ROUND_HALF_UP)
+        total += (valor * Decimal(juros_diario) / 100 * dias).quantize(
+            centavo, ROUND_HALF_UP)
+    return int(total * 100)
+
+
+def boleto_numero(i):
+    return boleto_itau(data_documento=datetime.date(2012, 7, 1),
+                       data_vencimento=datetime.date(2012, 7, 22),
+                       valor_documento=Decimal('2952.95') + i,
+                       nosso_numero=str(157 + i),
+                       numero_documento=str(i))
+
+
+class TestEncargos(unittest.TestCase):
+    def test_multa_juros(self):
+        encargos = Encargos(multa='2', juros_diario='0.033')
+        calculo = encargos.detalha(295295, 10)
+        # 2% de 2952,95 = 59,059; 0,33% = 9,744735
+        self.assertEqual(calculo.multa, 5906)
+        self.assertEqual(calculo.juros, 974)
+        self.assertEqual(calculo.desconto, 0)
+        self.assertEqual(calculo.total, 295295 + 5906 + 974)
+        self.assertEqual(encargos.detalha(295295, 0).total, 295295)
+
+    def test_juros_mensal(self):
+        # 1% ao mês = 1/30% ao dia
+        mensal = Encargos(juros_mensal='1')
+        self.assertEqual(mensal.detalha(300000, 30).juros, 3000)
+        self.assertEqual(mensal.detalha(300000, 1).juros, 100)
+        self.assertEqual(mensal.detalha(100, 1).juros, 0)
+        self.assertRaises(ValueError, Encargos, juros_mensal='1',
+                          juros_diario='0.033')
+
+    def test_arredondamento(self):
+        # Meio centavo arredonda para cima
+        self.assertEqual(Encargos(multa='2').detalha(25, 1).multa, 1)
+        self.assertEqual(Encargos(multa='2').detalha(24, 1).multa, 0)
+        self.assertEqual(Encargos(multa=2.5).detalha(20, 1).multa, 1)
+        self.assertEqual(Encargos(multa=2.5).detalha(19, 1).multa, 0)
+
+    def test_decimal(self):
+        rnd = random.Random(3)
+        for _ in range(2000):
+            valor = rnd.randrange(10 ** rnd.randint(1, 9))
+            dias = rnd.randint(-5, 400)
+            multa = rnd.choice(['0', '2', '2.5', '10'])
+            juros = rnd.choice(['0', '0.033', '0.1', '0.0333'])
+            encargos = Encargos(multa=multa, juros_diario=juros)
+            esperado = total_decimal(valor, dias, multa, juros)
+            self.assertEqual(encargos.detalha(valor, dias).total, esperado,
+                             (valor, dias, multa, juros))
+            self.assertEqual(encargos.totais([valor], [dias]), [esperado])
+
+    def test_carencia(self):
+        encargos = Encargos(multa='2', juros_diario='1', carencia=3)
+        self.assertEqual(encargos.detalha(10000, 3).total, 10000)
+        # Passada a carência os juros contam desde o vencimento
+        calculo = encargos.detalha(10000, 4)
+        self.assertEqual((calculo.multa, calculo.juros), (200, 400))
+
+    def test_desconto(self):
+        encargos = Encargos(multa='2', desconto='5', desconto_centavos=100)
+        self.assertEqual(encargos.detalha(10000, 0).desconto, 600)
+        self.assertEqual(encargos.detalha(10000, -3).total, 9400)
+        self.assertEqual(encargos.detalha(10000, 1).desconto, 0)
+        # O desconto não passa do valor
+        self.assertEqual(encargos.detalha(50, 0).total, 0)
+        self.assertRaises(TypeError, Encargos, desconto_centavos=Decimal(1))
+        self.assertRaises(ValueError, Encargos, multa='-1')
+
+    def test_totais(self):
+        encargos = Encargos(multa='2', juros_mensal='1')
+        self.assertEqual(encargos.totais([10000, 20000], [0, 30]),
+                         [10000, 20600])
+        self.assertEqual(encargos.totais([10000, 20000], 30),
+                         [10300, 20600])
+        self.assertRaises(ValueError, encargos.totais, [10000], [1, 2])
+
+    def test_dias_atraso(self):
+        pagamento = datetime.date(2012, 8, 1)
+        self.assertEqual(dias_atraso([datetime.date(2012, 7, 22),
+                                      datetime.date(2012, 8, 3)], pagamento),
+                         [10, -2])
+
+    def test_reemite(self):
+        encargos = Encargos(multa='2', juros_mensal='1')
+        boletos = [boleto_numero(i) for i in range(5)]
+        vencimento = datetime.date(2012, 8, 21)
+        segundas_vias = encargos.reemite(boletos, vencimento)
+        for i, (original, boleto) in enumerate(zip(boletos, segundas_vias)):
+            esperado = boleto_numero(i)
+            esperado.data_vencimento = vencimento
+            esperado.valor_documento_centavos = encargos.detalha(
+                original.valor_documento_centavos, 30).total
+            self.assertEqual(boleto.valor_documento_centavos,
+                             esperado.valor_documento_centavos)
+            self.assertEqual(boleto.barcode, esperado.barcode)
+            self.assertEqual(boleto.linha_digitavel,
+                             esperado.linha_digitavel)
+
+    @unittest.skipIf(numpy is None, "numpy não está instalado")
+    def test_numpy(self):
+        rnd = random.Random(5)
+        valores = [rnd.randrange(10 ** rnd.randint(1, 10))
+                   for _ in range(2000)]
+        dias = [rnd.randint(-30, 4000) for _ in range(2000)]
+        for encargos in [Encargos(multa='2', juros_mensal='0.99'),
+                         Encargos(multa='10', juros_diario='0.033',
+                                  carencia=3),
+                         Encargos(desconto='0.5', desconto_centavos=100)]:
+            esperado = encargos.totais(valores, dias)
+            resultado = encargos.totais(numpy.array(valores),
+                                        numpy.array(dias))
+            self.assertEqual(resultado.dtype, numpy.int64)
+            self.assertEqual(resultado.tolist(), esperado)
+            self.assertEqual(
+                encargos.totais(numpy.array(valores), 15).tolist(),
+                encargos.totais(valores, 15))
+
+    @unittest.skipIf(numpy is None, "numpy não está instalado")
+    def test_numpy_grandes(self):
+        # Passaria do limite do int64
+        encargos = Encargos(juros_diario='123.456789')
+        self.assertEqual(
+            encargos.totais(numpy.array([9999999999]), 99999).tolist(),
+            encargos.totais([9999999999], 99999))
+
+    @unittest.skipIf(numpy is None, "numpy não está instalado")
+    def test_numpy_dias_atraso(self):
+        vencimentos = [datetime.date(2012, 7, 22), datetime.date(2012, 8, 3)]
+        pagamento = datetime.date(2012, 8, 1)
+        resultado = dias_atraso(
+            numpy.array(vencimentos, dtype='datetime64[D]'), pagamento)
+        self.assertEqual(resultado.tolist(),
+                         dias_atraso(vencimentos, pagamento))
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestEncargos)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+import datetime
+import unittest
+
+from pyboleto import decoder
+from pyboleto.bank import banrisul, itau
+from pyboleto.bank.bancodobrasil import LAYOUTS as LAYOUTS_BB
+from pyboleto.bank.bradesco import BoletoBradesco
+from pyboleto.bank.caixa import LAYOUT as LAYOUT_CAIXA
+from pyboleto.bank.caixa_sigcb import LAYOUT as LAYOUT_SIGCB
+from pyboleto.bank.cecred import LAYOUT as LAYOUT_CECRED
+from pyboleto.bank.cecred import BoletoCecred
+from pyboleto.bank.hsbc import LAYOUT_CNR, LAYOUT_REGISTRO
+from pyboleto.bank.itau import BoletoItau
+from pyboleto.bank.santander import LAYOUT as LAYOUT_SANTANDER
+from pyboleto.bank.sicoob import LAYOUT as LAYOUT_SICOOB
+from pyboleto.bank.sicredi import LAYOUT as LAYOUT_SICREDI
+from pyboleto.bank.sicredi import BoletoSicredi
+from pyboleto.checksum import MODULO10
+from pyboleto.layout import (DIREITA, DV, ESQUERDA, ZEROS, Campo, Fixo,
+                             Layout)
+
+
+class Registro(object):
+    def __init__(self, **campos):
+        self.__dict__.update(campos)
+
+
+class TestLayout(unittest.TestCase):
+    def setUp(self):
+        self.layout = Layout([
+            Campo('carteira', 3),
+            Campo('nosso_numero', 8, ajuste=ZEROS),
+            DV('dv', MODULO10, ['carteira', 'nosso_numero']),
+            Fixo('00'),
+            Campo('conta', 5, atributo='conta_cedente', sem_dv=True),
+            DV('dv_geral', MODULO10),
+        ])
+
+    def test_formata(self):
+        registro = Registro(carteira='109', nosso_numero='157',
+                            conta_cedente='01328-1')
+        self.assertEqual(self.layout.tamanho, 20)
+        campo_livre = self.layout.formata(registro)
+        self.assertEqual(campo_livre[:12], '109000001577')
+        self.assertEqual(campo_livre[12:19], '0001328')
+        self.assertEqual(int(campo_livre[19]), MODULO10(campo_livre[:19]))
+
+        valores = self.layout.valores(registro)
+        self.assertEqual(valores['nosso_numero'], '00000157')
+        self.assertEqual(valores['dv'], 7)
+        self.assertEqual(self.layout.junta(valores), campo_livre)
+        self.assertEqual(self.layout.separa(campo_livre), {
+            'carteira': '109', 'nosso_numero': '00000157', 'dv': '7',
+            'conta': '01328', 'dv_geral': campo_livre[19]})
+
+    def test_tamanho_invalido(self):
+        registro = Registro(carteira='1090', nosso_numero='157',
+                            conta_cedente='01328')
+        with self.assertRaises(ValueError) as contexto:
+            self.layout.formata(registro)
+        self.assertIn('Registro.carteira', str(contexto.exception))
+
+        registro.carteira = '109'
+        registro.nosso_numero = '123456789'
+        self.assertRaises(ValueError, self.layout.formata, registro)
+
+    def test_ajustes(self):
+        self.assertEqual(Campo('x', 4, ajuste=ZEROS).ajusta(12), '0012')
+        self.assertEqual(Campo('x', 2, ajuste=ESQUERDA).ajusta('18-019'),
+                         '18')
+        self.assertEqual(Campo('x', 7, ajuste=DIREITA).ajusta('123456789'),
+                         '3456789')
+        self.assertEqual(Campo('x', 7, ajuste=DIREITA).ajusta('1234'),
+                         '0001234')
+        self.assertEqual(
+            Campo('x', 8, somente_digitos=True).ajusta('1234567-8'),
+            '12345678')
+        self.assertRaises(ValueError, Campo('x', 4).ajusta, '123')
+        self.assertRaises(ValueError, Campo, 'x', 4, ajuste='centro')
+
+    def test_erros(self):
+        self.assertEqual(self.layout.erros({
+            'carteira': '109', 'nosso_numero': '157', 'outro': 'x'}), [])
+        erros = self.layout.erros({'carteira': '10', 'nosso_numero': '1a',
+                                   'conta': '123456'})
+        self.assertEqual(len(erros), 3)
+        self.assertIn('carteira', erros[0])
+        self.assertIn('digits', erros[1])
+        self.assertEqual(itau.LAYOUT.erros({'nosso_numero': '123456789'}), [
+            "nosso_numero must have a length of 8, not '123456789' (len: 9)"])
+
+    def test_definicao_invalida(self):
+        self.assertRaises(ValueError, Layout, [
+            Campo('a', 1), DV('dv', MODULO10, ['b'])])
+        self.assertRaises(ValueError, Layout, [
+            Campo('a', 1), DV('dv', MODULO10, ['dv2']),
+            DV('dv2', MODULO10, ['a'])])
+        self.assertRaises(ValueError, Layout, [Campo('a', 1), Campo('a', 2)])
+
+
+class TestLayoutsBancos(unittest.TestCase):
+    def test_tamanho(self):
+        layouts = [LAYOUT_CAIXA, LAYOUT_SIGCB, LAYOUT_CECRED, LAYOUT_CNR,
+                   LAYOUT_REGISTRO, LAYOUT_SANTANDER, LAYOUT_SICOOB,
+                   LAYOUT_SICREDI, BoletoBradesco.layout, banrisul.LAYOUT,
+                   itau.LAYOUT, itau.LAYOUT_15_DIGITOS]
+        layouts.extend(LAYOUTS_BB.values())
+        for layout in layouts:
+            self.assertEqual(layout.tamanho, 25, layout)
+
+    def test_itau_15_digitos(self):
+        d = BoletoItau()
+        d.carteira = '198'
+        d.agencia_cedente = '0293'
+        d.conta_cedente = '01328'
+        d.nosso_numero = '12345678'
+        d.numero_documento = '4321'
+        d.codigo_cliente = '98765'
+        d.data_vencimento = datetime.date(2020, 1, 6)
+        d.valor_documento = 10
+        self.assertIs(d.layout, itau.LAYOUT_15_DIGITOS)
+        dac = MODULO10('198' '12345678' '0004321' '98765')
+        self.assertEqual(d.campo_livre,
+                         '198' '12345678' '0004321' '98765' + str(dac) + '0')
+        boleto = decoder.decodifica(d.linha_digitavel)
+        self.assertEqual(boleto.campos, {
+            'carteira': '198', 'nosso_numero': '12345678',
+            'seu_numero': '0004321', 'codigo_cliente': '98765',
+            'dv_campo_livre': str(dac)})
+        # O DV do nosso número continua disponível para exibição
+        self.assertEqual(d.format_nosso_numero(),
+                         '198/12345678-%s' % d.dv_nosso_numero)
+
+    def test_banrisul_resto_zero(self):
+        # Resto 0 no módulo 11 gera o segundo DV 0, não 11
+        self.assertEqual(banrisul.dv_campo_livre('21151400000080009942340'),
+                         '70')
+        d = banrisul.BoletoBanrisul()
+        d.agencia_cedente = '1514'
+        d.conta_cedente = '8'
+        d.nosso_numero = '99423'
+        self.assertEqual(d.campo_livre, '2115140000008000994234070')
+
+    def test_cecred_conta_com_zeros(self):
+        # A conta de 6 dígitos ocupa 8 posições completadas com zeros, não
+        # com espaços, e o código de barras só tem dígitos
+        d = BoletoCecred()
+        d.codigo_beneficiario = '123456'
+        d.agencia_cedente = '0101'
+        d.conta_cedente = '123456'
+        d.nosso_numero = '12345678'
+        d.carteira = '1'
+        d.data_vencimento = datetime.date(2012, 7, 22)
+        d.valor_documento = 2952.95
+        self.assertEqual(d.campo_livre,
+                         '123456' '00123456' '012345678' '01')
+        self.assertEqual(d.barcode,
+                         '08593540200002952951234560012345601234567801')
+        self.assertTrue(d.barcode.isdigit())
+
+    def test_sicredi_sem_campo_livre(self):
+        d = BoletoSicredi()
+        d.format_nnumero = 2
+        self.assertEqual(d.campo_livre, '')
+
+
+suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(TestLayout),
+    unittest.TestLoader().loadTestsFromTestCase(TestLayoutsBancos),
+])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import io
+import re
+import unittest
+
+from pyboleto.bank.caixa import BoletoCaixa
+from pyboleto.bank.itau import BoletoItau
+from pyboleto.pdf import BoletoPDF
+
+from .testutils import cria_boleto
+
+
+class TestBoletoPDF(unittest.TestCase):
+    def _gera(self, boletos, carne=False):
+        arquivo = io.BytesIO()
+        pdf = BoletoPDF(arquivo, landscape=carne)
+        pdf.pdf_canvas.setPageCompression(0)
+        if carne:
+            for i in range(0, len(boletos), 2):
+                pdf.drawBoletoCarneDuplo(boletos[i], boletos[i + 1])
+                pdf.nextPage()
+        else:
+            for boleto in boletos:
+                pdf.drawBoleto(boleto)
+                pdf.nextPage()
+        pdf.save()
+        return pdf, arquivo.getvalue()
+
+    def test_formularios(self):
+        boletos = [cria_boleto(BoletoItau, i, 'logo_itau.jpg')
+                   for i in range(4)]
+        boletos += [cria_boleto(BoletoCaixa, i) for i in range(4)]
+        pdf, conteudo = self._gera(boletos)
+        # Recibos do caixa e do sacado para cada banco, a linha de corte e
+        # o bloco do Pix de quem tem logotipo
+        self.assertEqual(len(pdf._formularios), 6)
+        formularios = re.findall(br'/Subtype /Form', conteudo)
+        self.assertEqual(len(formularios), 6)
+        # Duas linhas de corte e os dois recibos por página, e o Pix no Itaú
+        self.assertEqual(len(re.findall(br'/FormXob\.Formulario\d+ Do',
+                                        conteudo)), 4 * 5 + 4 * 4)
+        # Títulos só aparecem no formulário de cada banco
+        self.assertEqual(conteudo.count(b'(Local de pagamento) Tj'), 2)
+        self.assertEqual(conteudo.count(b'(Cliente Teste 3) Tj'), 4)
+
+    def test_carne(self):
+        boletos = [cria_boleto(BoletoItau, i) for i in range(4)]
+        pdf, conteudo = self._gera(boletos, carne=True)
+        self.assertEqual(sorted(chave[0] for chave in pdf._formularios),
+                         ['caixa', 'canhoto', 'corte_vertical'])
+        self.assertEqual(conteudo.count(b'(Nosso N\\372mero) Tj'), 1)
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestBoletoPDF)
+
+if __name__ == '__main__':
+    unittest.main()
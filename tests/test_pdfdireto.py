@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import io
+import re
+import unittest
+import zlib
+
+from pyboleto.bank.caixa import BoletoCaixa
+from pyboleto.bank.itau import BoletoItau
+from pyboleto.bank.santander import BoletoSantander
+from pyboleto.pdf import BoletoPDF
+from pyboleto.pdfdireto import BoletoPDFDireto, le_imagem
+from pyboleto.pdfstream import le_objetos
+
+from .testutils import cria_boleto
+
+
+def boletos():
+    resultado = [cria_boleto(BoletoItau, i, 'logo_itau.jpg')
+                 for i in range(3)]
+    resultado += [cria_boleto(BoletoCaixa, i) for i in range(3)]
+    resultado[1].sacado = ['Cliente (Teste) \\ %s' % ('X' * 80), 'Rua']
+    resultado[4].demonstrativo = ['Multa de 2%', 'Juros de mora']
+    return resultado
+
+
+def streams(dados):
+    """Conteúdo das páginas e formulários, descomprimido"""
+    resultado = []
+    for dicionario, stream in le_objetos(dados)[0].values():
+        if stream is None or b'/Subtype /Image' in dicionario:
+            continue
+        if b'/FlateDecode' in dicionario:
+            stream = zlib.decompress(stream)
+        resultado.append(stream)
+    return b''.join(resultado)
+
+
+def textos(conteudo):
+    """Textos dos operadores ``Tj``, sem os escapes"""
+    def sem_escape(m):
+        escape = m.group(1)
+        if escape[:1].isdigit():
+            return bytes([int(escape, 8)])
+        return escape
+
+    return sorted(re.sub(br'\\([0-7]{1,3}|.)', sem_escape, texto)
+                  for texto in re.findall(br'\(((?:[^()\\]|\\.)*)\) Tj',
+                                          conteudo))
+
+
+def gera(classe, carne=False):
+    arquivo = io.BytesIO()
+    pdf = classe(arquivo, landscape=carne)
+    if classe is BoletoPDF:
+        pdf.pdf_canvas.setPageCompression(0)
+    pdf.drawBoletos(boletos(), carne=carne)
+    pdf.save()
+    return arquivo.getvalue()
+
+
+class TestBoletoPDFDireto(unittest.TestCase):
+    def _compara(self, carne):
+        reportlab = streams(gera(BoletoPDF, carne))
+        direto = streams(gera(BoletoPDFDireto, carne))
+        # Os mesmos textos, incluindo os cortados pela largura, e as mesmas
+        # barras
+        self.assertEqual(textos(direto), textos(reportlab))
+        self.assertEqual(direto.count(b're f'), reportlab.count(b're f'))
+
+    def test_folha(self):
+        self._compara(carne=False)
+        dados = gera(BoletoPDFDireto)
+        self.assertEqual(len(re.findall(br'/Type /Page\b(?!s)', dados)), 6)
+        # Recibos de cada banco, linha de corte, Pix e as duas imagens
+        self.assertEqual(dados.count(b'/Subtype /Form'), 6)
+        self.assertEqual(dados.count(b'/Subtype /Image'), 2)
+
+    def test_carne(self):
+        self._compara(carne=True)
+
+    def test_vazio(self):
+        arquivo = io.BytesIO()
+        pdf = BoletoPDFDireto(arquivo)
+        pdf.save()
+        le_objetos(arquivo.getvalue())
+        self.assertIn(b'/Count 1 ', arquivo.getvalue())
+
+    def test_imagens(self):
+        from pyboleto.pdf import load_image
+
+        with open(load_image('logo_itau.jpg'), 'rb') as arquivo:
+            largura, altura, (dicionario, _) = le_imagem(arquivo.read())
+        self.assertEqual((largura, altura), (150, 40))
+        self.assertIn(b'/DCTDecode', dicionario)
+        with open(load_image('logo_santander.png'), 'rb') as arquivo:
+            largura, altura, (dicionario, _) = le_imagem(arquivo.read())
+        self.assertEqual((largura, altura), (150, 40))
+        self.assertIn(b'/Indexed /DeviceRGB', dicionario)
+        self.assertRaises(ValueError, le_imagem, b'GIF89a')
+
+        arquivo = io.BytesIO()
+        pdf = BoletoPDFDireto(arquivo)
+        pdf.drawBoleto(cria_boleto(BoletoSantander, 1, 'logo_santander.png'))
+        pdf.save()
+        self.assertEqual(arquivo.getvalue().count(b'/Subtype /Image'), 2)
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestBoletoPDFDireto)
+
+if __name__ == '__main__':
+    unittest.main()
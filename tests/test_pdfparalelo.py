@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import base64
+import io
+import re
+import unittest
+import zlib
+
+from pyboleto.pdfparalelo import gera_pdf
+from pyboleto.pdfstream import le_objetos
+
+from .test_pdfstream import boletos, gera, paginas
+
+
+def sacados(dados):
+    """Sacados na ordem das páginas"""
+    objetos, raiz = le_objetos(dados)
+    arvore = re.search(br'/Pages (\d+) 0 R', objetos[raiz][0]).group(1)
+    kids = re.search(br'/Kids \[([^\]]*)\]', objetos[int(arvore)][0])
+    resultado = []
+    for pagina in re.findall(br'(\d+) 0 R', kids.group(1)):
+        conteudo = re.search(br'/Contents (\d+) 0 R',
+                             objetos[int(pagina)][0]).group(1)
+        stream = objetos[int(conteudo)][1]
+        texto = zlib.decompress(base64.a85decode(stream.rstrip()[:-2]))
+        resultado.extend(re.findall(br'\(Cliente Teste (\d+)\) Tj', texto))
+    return [int(i) for i in resultado]
+
+
+def gera_paralelo(quantidade, **kwargs):
+    arquivo = io.BytesIO()
+    total = gera_pdf(boletos(quantidade), arquivo, **kwargs)
+    return total, arquivo.getvalue()
+
+
+class TestGeraPDF(unittest.TestCase):
+    def test_ordem(self):
+        total, sequencial = gera_paralelo(7, processos=1,
+                                          boletos_por_bloco=2)
+        self.assertEqual(total, 7)
+        # Cada página tem o sacado no recibo do sacado e no do caixa
+        self.assertEqual(sacados(sequencial),
+                         [i for i in range(7) for _ in range(2)])
+        total, paralelo = gera_paralelo(7, processos=3, boletos_por_bloco=2)
+        self.assertEqual(total, 7)
+        self.assertEqual(paralelo, sequencial)
+
+    def test_recursos(self):
+        documento = gera(7)
+        total, dados = gera_paralelo(7, processos=2, boletos_por_bloco=1)
+        self.assertEqual(paginas(dados), 7)
+        for tipo in (b'/Subtype /Form', b'/Subtype /Image',
+                     b'/Subtype /Type1'):
+            self.assertEqual(dados.count(tipo), documento.count(tipo))
+
+    def test_carne(self):
+        # O bloco é arredondado para não separar os boletos de uma página
+        total, dados = gera_paralelo(5, processos=2, boletos_por_bloco=3,
+                                     carne=True)
+        self.assertEqual(total, 3)
+        self.assertEqual(paginas(dados), 3)
+
+    def test_vazio(self):
+        total, dados = gera_paralelo(0, processos=2)
+        self.assertEqual(total, 1)
+        self.assertEqual(paginas(dados), 1)
+        self.assertRaises(ValueError, gera_paralelo, 1, boletos_por_bloco=0)
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestGeraPDF)
+
+if __name__ == '__main__':
+    unittest.main()
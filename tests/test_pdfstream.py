@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import io
+import re
+import unittest
+
+from pyboleto.bank.caixa import BoletoCaixa
+from pyboleto.bank.itau import BoletoItau
+from pyboleto.pdf import BoletoPDF
+from pyboleto.pdfstream import EscritorPDF, le_objetos
+
+from .testutils import cria_boleto
+
+
+class SoEscrita(object):
+    """Saída só com ``write``, como um socket"""
+
+    def __init__(self):
+        self.partes = []
+
+    def write(self, dados):
+        self.partes.append(bytes(dados))
+
+    def getvalue(self):
+        return b''.join(self.partes)
+
+
+def boletos(quantidade, saida=None, escritas=None):
+    for i in range(quantidade):
+        if saida is not None:
+            # Quantas vezes a saída foi escrita antes deste boleto
+            escritas.append(len(saida.partes))
+        yield cria_boleto([BoletoItau, BoletoCaixa][i % 2], i,
+                          'logo_itau.jpg' if i % 3 else '')
+
+
+def paginas(dados):
+    return len(re.findall(br'/Type /Page\b(?!s)', dados))
+
+
+def gera(quantidade, **kwargs):
+    arquivo = io.BytesIO()
+    pdf = BoletoPDF(arquivo, **kwargs)
+    pdf.drawBoletos(boletos(quantidade))
+    pdf.save()
+    return arquivo.getvalue()
+
+
+class TestEscritorPDF(unittest.TestCase):
+    def _confere_xref(self, dados):
+        objetos = le_objetos(dados)[0]
+        posicao = int(re.findall(br'startxref\s+(\d+)', dados)[-1])
+        linhas = dados[posicao:].split(b'\n')
+        for numero in objetos:
+            inicio = int(linhas[2 + numero][:10])
+            self.assertTrue(dados.startswith(b'%d 0 obj\n' % numero, inicio))
+
+    def test_blocos(self):
+        documento = gera(7)
+        for bloco in (1, 3, 100):
+            dados = gera(7, paginas_por_bloco=bloco)
+            self._confere_xref(dados)
+            self.assertEqual(paginas(dados), 7)
+            # Fontes, formulários e imagens não se repetem entre os blocos
+            for tipo in (b'/Subtype /Form', b'/Subtype /Image',
+                         b'/Subtype /Type1'):
+                self.assertEqual(dados.count(tipo), documento.count(tipo))
+
+    def test_gerador(self):
+        saida = SoEscrita()
+        escritas = []
+        pdf = BoletoPDF(saida, paginas_por_bloco=2)
+        self.assertEqual(pdf.drawBoletos(boletos(6, saida, escritas)), 6)
+        # Cada bloco é gravado antes de o gerador produzir o próximo boleto
+        self.assertEqual(escritas[0], escritas[1])
+        self.assertLess(escritas[1], escritas[2])
+        self.assertLess(escritas[3], escritas[4])
+        pdf.save()
+        self._confere_xref(saida.getvalue())
+
+    def test_vazio(self):
+        # Como o ReportLab: um documento sem boletos tem uma página em branco
+        dados = gera(0, paginas_por_bloco=10)
+        self._confere_xref(dados)
+        self.assertEqual(paginas(dados), 1)
+
+    def test_adiciona(self):
+        saida = io.BytesIO()
+        escritor = EscritorPDF(saida)
+        self.assertEqual(escritor.adiciona(gera(3)), 3)
+        self.assertEqual(escritor.adiciona(gera(2)), 2)
+        self.assertEqual(escritor.paginas, 5)
+        escritor.fecha()
+        dados = saida.getvalue()
+        self._confere_xref(dados)
+        self.assertIn(b'/Count 5 ', dados)
+        self.assertRaises(ValueError, le_objetos, b'%PDF-1.4\n')
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestEscritorPDF)
+
+if __name__ == '__main__':
+    unittest.main()
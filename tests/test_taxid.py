@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+
+from pyboleto.taxid import (ALFANUMERICOS, CNPJ, CPF, DV_CNPJ, dvs,
+                            documento_valido, formata_documento,
+                            normaliza_documento, normaliza_documentos,
+                            tipo_documento)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def documentos(quantidade=5000, seed=3):
+    """CPFs e CNPJs válidos, com e sem máscara, e alguns alterados"""
+    rnd = random.Random(seed)
+    resultado = []
+    for _ in range(quantidade):
+        if rnd.random() < 0.5:
+            base = ''.join(rnd.choice('0123456789') for _ in range(9))
+        else:
+            base = ''.join(rnd.choice(ALFANUMERICOS) for _ in range(12))
+        documento = base + dvs(base)
+        if rnd.random() < 0.3:
+            documento = formata_documento(documento)
+        if rnd.random() < 0.3:
+            i = rnd.randrange(len(documento))
+            documento = documento[:i] + rnd.choice('0123456789Ab./') + \
+                documento[i + 1:]
+        resultado.append(documento)
+    return resultado
+
+
+class TestTaxId(unittest.TestCase):
+    def test_cpf(self):
+        self.assertEqual(normaliza_documento('123.456.789-09'),
+                         '12345678909')
+        self.assertEqual(dvs('123456789'), '09')
+        self.assertEqual(formata_documento('12345678909'), '123.456.789-09')
+        self.assertEqual(tipo_documento('123.456.789-09'), CPF)
+        self.assertFalse(documento_valido('123.456.789-08'))
+
+    def test_cnpj(self):
+        self.assertEqual(normaliza_documento('11.222.333/0001-81'),
+                         '11222333000181')
+        self.assertEqual(formata_documento('11222333000181'),
+                         '11.222.333/0001-81')
+        self.assertEqual(tipo_documento('11.222.333/0001-81'), CNPJ)
+        self.assertFalse(documento_valido('11.222.333/0001-82'))
+
+    def test_cnpj_alfanumerico(self):
+        # Exemplo da Receita Federal
+        self.assertEqual(normaliza_documento('12.ABC.345/01DE-35'),
+                         '12ABC34501DE35')
+        self.assertEqual(normaliza_documento('12.abc.345/01de-35'),
+                         '12ABC34501DE35')
+        self.assertEqual(dvs('12ABC34501DE'), '35')
+        self.assertEqual(DV_CNPJ.soma('A'), 17 * 2)
+        # DVs são sempre numéricos e CPF não tem letras
+        self.assertFalse(documento_valido('12ABC34501DE3A'))
+        self.assertFalse(documento_valido('1234567890A'))
+
+    def test_invalidos(self):
+        for documento in ['', '1234', '00000000000', '11111111111111',
+                          '123.456.789-0', 'Á23456789-09']:
+            self.assertFalse(documento_valido(documento), documento)
+            self.assertRaises(ValueError, normaliza_documento, documento)
+        self.assertRaises(ValueError, dvs, '1234')
+
+    def test_tipo(self):
+        # Zeros à esquerda perdidos numa planilha
+        self.assertEqual(normaliza_documento('1234567890', CPF),
+                         '01234567890')
+        self.assertFalse(documento_valido('123.456.789-09', CNPJ))
+        self.assertRaises(ValueError, normaliza_documento, '12345678909',
+                          'RG')
+
+    def test_lote(self):
+        lote = documentos()
+        resultado = normaliza_documentos(lote)
+        self.assertEqual(resultado, [
+            normaliza_documento(d) if documento_valido(d) else None
+            for d in lote])
+        self.assertTrue(any(resultado))
+        self.assertIn(None, resultado)
+        self.assertEqual(normaliza_documentos(['1234567890'], CPF),
+                         ['01234567890'])
+
+    @unittest.skipIf(numpy is None, "numpy não está instalado")
+    def test_numpy(self):
+        lote = documentos()
+        for tipo in (None, CPF, CNPJ):
+            resultado = normaliza_documentos(numpy.array(lote, dtype=object),
+                                             tipo)
+            self.assertEqual(resultado.dtype, numpy.dtype(object))
+            self.assertEqual(resultado.tolist(),
+                             normaliza_documentos(lote, tipo))
+        self.assertEqual(normaliza_documentos(
+            numpy.array(['123.456.789-09', 'Á'])).tolist(),
+            ['12345678909', None])
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestTaxId)
+
+if __name__ == '__main__':
+    unittest.main()
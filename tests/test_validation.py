@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+import copy
+import datetime
+import unittest
+from decimal import Decimal
+
+from pyboleto.bank.bancodobrasil import BoletoBB
+from pyboleto.bank.caixa_sigcb import BoletoCaixaSigcb
+from pyboleto.bank.itau import BoletoItau
+from pyboleto.data import BoletoException
+from pyboleto.validation import ErroValidacao, Validador
+
+
+def registro(**campos):
+    dados = {
+        'carteira': '109',
+        'agencia_cedente': '0293',
+        'conta_cedente': '01328',
+        'nosso_numero': '157',
+        'numero_documento': '1',
+        'data_vencimento': datetime.date(2012, 7, 22),
+        'data_documento': datetime.date(2012, 7, 1),
+        'valor_documento': Decimal('2952.95'),
+        'sacado': ['Cliente', 'Rua 1', 'São Paulo - SP'],
+    }
+    dados.update(campos)
+    return dados
+
+
+def boleto_valido(prototipo, dados):
+    """Confere o registro criando o boleto"""
+    boleto = copy.copy(prototipo)
+    try:
+        for nome, valor in dados.items():
+            setattr(boleto, nome, valor)
+        boleto.linha_digitavel
+    except Exception:
+        return False
+    return True
+
+
+class TestValidador(unittest.TestCase):
+    def setUp(self):
+        self.validador = Validador(BoletoItau)
+
+    def campos(self, **campos):
+        return [erro.campo for erro in self.validador.valida(
+            registro(**campos))]
+
+    def test_registro_valido(self):
+        self.assertEqual(self.validador.valida(registro()), [])
+
+    def test_todos_os_erros(self):
+        erros = self.validador.valida(registro(
+            nosso_numero='123456789',
+            conta_cedente='12a45',
+            data_vencimento='2012-07-22',
+            valor_documento='R$ 10',
+            instrucoes=['linha'] * 8,
+        ))
+        self.assertEqual(sorted(erro.campo for erro in erros), [
+            'conta_cedente', 'data_vencimento', 'instrucoes',
+            'nosso_numero', 'valor_documento'])
+        for erro in erros:
+            self.assertIsInstance(erro, ErroValidacao)
+
+    def test_campos_do_layout(self):
+        # Os zeros à esquerda são acrescentados como no boleto
+        self.assertEqual(self.campos(nosso_numero='1'), [])
+        self.assertEqual(self.campos(nosso_numero='123456789'),
+                         ['nosso_numero'])
+        self.assertEqual(self.campos(agencia_cedente='02x3'),
+                         ['agencia_cedente'])
+        self.assertEqual(self.campos(nosso_numero=157), ['nosso_numero'])
+
+    def test_carteira(self):
+        # Na carteira 198 o seu número vai no campo livre
+        self.assertEqual(self.campos(numero_documento='12345678'), [])
+        self.assertEqual(self.campos(carteira='198',
+                                     numero_documento='12345678'),
+                         ['numero_documento'])
+        self.assertEqual(self.campos(carteira='198',
+                                     numero_documento='1234567'), [])
+
+    def test_vencimento(self):
+        self.assertEqual(self.campos(
+            data_vencimento=datetime.date(1997, 10, 6)), ['data_vencimento'])
+        validador = Validador(
+            BoletoItau, vencimento_minimo=datetime.date(2012, 7, 1),
+            vencimento_maximo=datetime.date(2012, 7, 31))
+        for dia in (1, 15, 31):
+            self.assertEqual(validador.valida(registro(
+                data_vencimento=datetime.date(2012, 7, dia))), [])
+        for data in (datetime.date(2012, 6, 30), datetime.date(2012, 8, 1)):
+            self.assertEqual(validador.valida(registro(
+                data_vencimento=data))[0].campo, 'data_vencimento')
+
+    def test_valor(self):
+        self.assertEqual(self.campos(valor_documento='99999999.99'), [])
+        self.assertEqual(self.campos(valor_documento='100000000.00'),
+                         ['valor_documento'])
+        self.assertEqual(self.campos(valor_documento=-1),
+                         ['valor_documento'])
+        self.assertEqual(self.campos(valor_documento=None),
+                         ['valor_documento'])
+        self.assertEqual(self.campos(valor_documento_centavos=10.5),
+                         ['valor_documento_centavos'])
+
+    def test_linhas(self):
+        self.assertEqual(self.campos(demonstrativo=['x'] * 12), [])
+        self.assertEqual(self.campos(demonstrativo=['x'] * 13),
+                         ['demonstrativo'])
+        self.assertEqual(self.campos(instrucoes=['x' * 91]), ['instrucoes'])
+        self.assertEqual(self.campos(sacado=['x'] * 4), ['sacado'])
+        self.assertEqual(self.campos(cedente_endereco='x' * 81),
+                         ['cedente_endereco'])
+        self.assertEqual(self.campos(sacado=None), ['sacado'])
+
+    def test_documentos(self):
+        self.assertEqual(self.campos(sacado_documento='123.456.789-09',
+                                     cedente_documento='12.ABC.345/01DE-35'),
+                         [])
+        self.assertEqual(self.campos(sacado_documento=''), [])
+        self.assertEqual(sorted(self.campos(
+            sacado_documento='123.456.789-00',
+            cedente_documento='11111111111')),
+            ['cedente_documento', 'sacado_documento'])
+
+    def test_valida_lote(self):
+        registros = [registro(), registro(nosso_numero='x'), registro(),
+                     registro(valor_documento='?', nosso_numero='1' * 9)]
+        relatorio = self.validador.valida_lote(registros)
+        self.assertEqual(sorted(relatorio), [1, 3])
+        self.assertEqual(len(relatorio[3]), 2)
+
+    def test_nao_altera_modelo(self):
+        prototipo = BoletoItau()
+        prototipo.carteira = '175'
+        nosso_numero = prototipo.nosso_numero
+        validador = Validador(prototipo)
+        validador.valida(registro(carteira='198', nosso_numero='999'))
+        self.assertEqual(prototipo.carteira, '175')
+        self.assertEqual(prototipo.nosso_numero, nosso_numero)
+
+    def test_convenio_bb(self):
+        # nosso_numero e convenio do BB são preenchidos conforme o convênio
+        for formato, nosso_numero, invalido in ((4, '1234567', '12345678'),
+                                                (6, '12345', '123456'),
+                                                (7, '1234567890',
+                                                 '12345678901')):
+            prototipo = BoletoBB(formato, 1)
+            validador = Validador(prototipo)
+            dados = registro(carteira='18', convenio='1' * formato,
+                             nosso_numero=nosso_numero)
+            self.assertEqual(validador.valida(dados), [])
+            self.assertTrue(boleto_valido(prototipo, dados))
+            dados['nosso_numero'] = invalido
+            self.assertEqual([e.campo for e in validador.valida(dados)],
+                             ['nosso_numero'])
+            self.assertFalse(boleto_valido(prototipo, dados))
+
+    def test_campos_calculados(self):
+        validador = Validador(BoletoCaixaSigcb)
+        dados = registro(conta_cedente='123456',
+                         nosso_numero='24000000000000157')
+        self.assertEqual(validador.valida(dados), [])
+        dados['nosso_numero'] = '2400000000000015x'
+        self.assertEqual([e.campo for e in validador.valida(dados)],
+                         ['nosso_numero_9_17'])
+
+    def test_tamanho_dos_campos_calculados(self):
+        # O nosso número só chega ao layout em partes, mas tem 17 dígitos;
+        # o boleto cortaria os 3 dígitos a mais sem erro
+        validador = Validador(BoletoCaixaSigcb)
+        erros = validador.valida({'nosso_numero': '1' * 20,
+                                  'conta_cedente': '123456'})
+        self.assertEqual([e.campo for e in erros], ['nosso_numero'])
+        self.assertEqual(validador.valida({'nosso_numero': '1' * 17,
+                                           'conta_cedente': '123456'}), [])
+        self.assertEqual(validador.valida({'nosso_numero': '157'}), [])
+
+    def test_modelo_invalido(self):
+        self.assertRaises(BoletoException, Validador, BoletoBB(5, 1))
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestValidador)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+
+from pyboleto.arrays import vetorizado
+from pyboleto.bank.bancodobrasil import DV_NOSSO_NUMERO as DV_BB
+from pyboleto.bank.banrisul import BoletoBanrisul
+from pyboleto.bank.bradesco import DV_NOSSO_NUMERO as DV_BRADESCO
+from pyboleto.bank.caixa import DV_NOSSO_NUMERO as DV_CAIXA
+from pyboleto.bank.hsbc import DV_NOSSO_NUMERO_REGISTRO as DV_HSBC
+from pyboleto.bank.sicoob import DV_NOSSO_NUMERO as DV_SICOOB
+from pyboleto.data import BoletoData
+
+try:
+    from pyboleto import vectorized
+except ImportError:
+    vectorized = None
+
+
+def numeros(largura, quantidade=2000, seed=7):
+    rnd = random.Random(seed)
+    return [''.join(rnd.choice('0123456789') for _ in range(largura))
+            for _ in range(quantidade)]
+
+
+@unittest.skipIf(vectorized is None, "numpy não está instalado")
+class TestVectorized(unittest.TestCase):
+    def _assert_igual(self, escalar, vetorial, largura):
+        nums = numeros(largura)
+        resultado = vetorial(vectorized.digitos(nums))
+        self.assertEqual(list(resultado), [escalar(n) for n in nums])
+
+    def test_digitos(self):
+        nums = numeros(11, 10)
+        self.assertEqual(vectorized.texto(vectorized.digitos(nums)), nums)
+        self.assertRaises(ValueError, vectorized.digitos, ['123', '12'])
+        self.assertRaises(ValueError, vectorized.digitos, ['123', '1a3'])
+
+    def test_modulo10(self):
+        self._assert_igual(BoletoData.modulo10, vectorized.modulo10, 10)
+
+    def test_modulo11(self):
+        for base in (7, 9):
+            for r in (0, 1):
+                self._assert_igual(
+                    lambda n: BoletoData.modulo11(n, base, r),
+                    lambda m: vectorized.modulo11(m, base, r), 25)
+
+    def test_dv_barcode(self):
+        self._assert_igual(BoletoData().calculate_dv_barcode,
+                           vectorized.dv_barcode, 43)
+
+    def test_insere_dv_barcode(self):
+        nums = numeros(43, 50)
+        barcodes = vectorized.texto(
+            vectorized.insere_dv_barcode(vectorized.digitos(nums)))
+        calculate = BoletoData().calculate_dv_barcode
+        self.assertEqual(barcodes,
+                         [n[:4] + str(calculate(n)) + n[4:] for n in nums])
+
+    def test_dvs_linha_digitavel(self):
+        nums = numeros(44, 50)
+        dvs = vectorized.dvs_linha_digitavel(vectorized.digitos(nums))
+        for num, dv in zip(nums, dvs):
+            self.assertEqual(list(dv), [
+                BoletoData.modulo10(num[0:4] + num[19:24]),
+                BoletoData.modulo10(num[24:34]),
+                BoletoData.modulo10(num[34:44])])
+
+    def test_regras_dos_bancos(self):
+        self._assert_igual(DV_BB, lambda m: vectorized.checksum(DV_BB, m), 17)
+        self._assert_igual(DV_BRADESCO,
+                           lambda m: vectorized.checksum(DV_BRADESCO, m), 13)
+        self._assert_igual(DV_CAIXA,
+                           lambda m: vectorized.checksum(DV_CAIXA, m), 10)
+        self._assert_igual(DV_HSBC,
+                           lambda m: vectorized.checksum(DV_HSBC, m), 10)
+        self._assert_igual(DV_SICOOB,
+                           lambda m: vectorized.checksum(DV_SICOOB, m), 21)
+
+    def test_banrisul(self):
+        boleto = BoletoBanrisul()
+        nums = numeros(23)
+        dv1, dv2 = vectorized.dv_campo_livre_banrisul(
+            vectorized.digitos(nums))
+        self.assertEqual(['%d%d' % dvs for dvs in zip(dv1, dv2)],
+                         [boleto._dv_campo_livre(n) for n in nums])
+
+    def test_vetorizado(self):
+        import numpy
+        self.assertIs(vetorizado(numpy.arange(3)), vectorized)
+        self.assertIsNone(vetorizado([0, 1, 2]))
+        self.assertIsNone(vetorizado(numpy.int64(3)))
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestVectorized)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import datetime
+import io
+import unittest
+from decimal import Decimal
+
+from pyboleto.html import BoletoHTML
+from pyboleto.view import BoletoView, formata_data
+
+from .testutils import boleto_itau
+
+
+def boleto_view():
+    return boleto_itau(
+        data_vencimento=datetime.date(2009, 10, 19),
+        data_documento=datetime.date(2009, 10, 1),
+        data_processamento=datetime.date(2009, 10, 2),
+        valor_documento=Decimal('2952.95'),
+        nosso_numero='157',
+        numero_documento='456',
+        sacado=['Cliente', 'Rua 1', 'São Paulo - SP'],
+        instrucoes=['Não receber após o vencimento'])
+
+
+def html(boleto):
+    saida = io.StringIO()
+    renderizador = BoletoHTML(saida)
+    renderizador.drawBoleto(boleto)
+    renderizador.save()
+    return saida.getvalue()
+
+
+class TestBoletoView(unittest.TestCase):
+    def setUp(self):
+        self.boleto = boleto_view()
+
+    def test_campos(self):
+        view = self.boleto.view
+        self.assertIsInstance(view, BoletoView)
+        self.assertEqual(view.data_vencimento, '19/10/2009')
+        self.assertEqual(view.data_documento, '01/10/2009')
+        self.assertEqual(view.data_processamento, '02/10/2009')
+        self.assertEqual(view.nosso_numero,
+                         self.boleto.format_nosso_numero())
+        self.assertEqual(view.valor_documento, '2.952,95')
+        self.assertEqual(view.valor, '')
+        self.assertIsNone(view.valor_centavos)
+        self.assertEqual(view.linha_digitavel, self.boleto.linha_digitavel)
+        self.assertEqual(view.barcode, self.boleto.barcode)
+        self.assertEqual(view.sacado[0], 'Cliente')
+        self.assertEqual(view.instrucoes,
+                         ('Não receber após o vencimento', ))
+
+    def test_formata_data(self):
+        data = datetime.date(2012, 7, 2)
+        self.assertEqual(formata_data(data), data.strftime('%d/%m/%Y'))
+        self.assertEqual(formata_data(''), '')
+        self.assertEqual(formata_data(None), '')
+
+    def test_imutavel(self):
+        view = self.boleto.view
+        self.assertRaises(AttributeError, setattr, view, 'nosso_numero', '1')
+        self.assertIs(view.view, view)
+
+    def test_cache(self):
+        view = self.boleto.view
+        self.assertIs(self.boleto.view, view)
+        self.boleto.nosso_numero = '158'
+        self.assertIsNot(self.boleto.view, view)
+        self.assertEqual(self.boleto.view.nosso_numero,
+                         self.boleto.format_nosso_numero())
+
+    def test_listas_alteradas(self):
+        # Alterar as listas no lugar não passa pelo boleto, mas a segunda
+        # renderização mostra o conteúdo novo
+        primeiro = html(self.boleto)
+        view = self.boleto.view
+        self.boleto.instrucoes.append('Multa de 2%')
+        self.boleto.demonstrativo.append('Mensalidade')
+        self.boleto.sacado[1] = 'Rua 2'
+        self.assertEqual(self.boleto.view.instrucoes[-1], 'Multa de 2%')
+        self.assertEqual(self.boleto.view.demonstrativo, ('Mensalidade', ))
+        self.assertEqual(self.boleto.view.sacado[1], 'Rua 2')
+        self.assertIs(self.boleto.view, self.boleto.view)
+        self.assertEqual(view.instrucoes, ('Não receber após o vencimento', ))
+        segundo = html(self.boleto)
+        self.assertNotEqual(segundo, primeiro)
+        self.assertIn('Multa de 2%', segundo)
+
+    def test_renderizadores(self):
+        # A view gera o mesmo HTML que o boleto
+        self.assertEqual(html(self.boleto.view), html(boleto_view()))
+
+    def test_local_pagamento_bytes(self):
+        self.boleto.local_pagamento = 'Pagável'.encode('utf-8')
+        self.assertEqual(self.boleto.view.local_pagamento, 'Pagável')
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestBoletoView)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import with_statement
 
+import datetime
 import difflib
 import fnmatch
 import os
@@ -12,6 +13,7 @@ import unittest
 from xml.etree.ElementTree import fromstring, tostring
 
 import pyboleto
+from pyboleto.bank.itau import BoletoItau
 from pyboleto.pdf import BoletoPDF
 from pyboleto.html import BoletoHTML
 
@@ -147,6 +149,45 @@ def pdftoxml(filename, output):
         f.write(tostring(root))
 
 
+# Itaú account used by the tests that don't depend on a particular bank
+CONTA_ITAU = {
+    'carteira': '109',
+    'agencia_cedente': '0293',
+    'conta_cedente': '01328',
+}
+
+
+def boleto_itau(classe=BoletoItau, **campos):
+    """Returns a boleto for the test Itaú account
+    :param classe: bank class, BoletoItau by default
+    :param campos: other fields, set after the account ones
+    """
+    boleto = classe()
+    for nome in ('carteira', 'agencia_cedente', 'conta_cedente'):
+        setattr(boleto, nome, campos.pop(nome, CONTA_ITAU[nome]))
+    for nome, valor in campos.items():
+        setattr(boleto, nome, valor)
+    return boleto
+
+
+def cria_boleto(classe, i, logo_image=''):
+    """Returns the i-th boleto of a batch for the test Itaú account
+    :param classe: bank class
+    :param i: index of the boleto, used for nosso_numero and sacado
+    :param logo_image: bank logo file name
+    """
+    return boleto_itau(classe,
+                       data_vencimento=datetime.date(2012, 7, 22),
+                       data_documento=datetime.date(2012, 7, 17),
+                       data_processamento=datetime.date(2012, 7, 17),
+                       valor_documento=2952.95,
+                       nosso_numero=str(157 + i),
+                       numero_documento=str(i),
+                       cedente='Empresa ACME LTDA',
+                       sacado=['Cliente Teste %d' % i],
+                       logo_image=logo_image)
+
+
 class BoletoTestCase(unittest.TestCase):
     def _get_expected(self, bank, generated, f_type='xml'):
         fname = os.path.join(